@@ -0,0 +1,5 @@
+"""성능 벤치마크 스크립트 모음
+
+Usage:
+    uv run python -m benchmarks.<module>
+"""
@@ -0,0 +1,72 @@
+"""그래프 생성 오버헤드 벤치마크
+
+요청마다 create_graph()로 그래프를 재구성하던 방식(before)과
+GraphRegistry에서 컴파일된 그래프를 재사용하는 방식(after)의
+요청당 그래프 준비 비용을 비교합니다.
+
+Usage:
+    uv run python -m benchmarks.bench_graph_construction [--iterations 200]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import time
+
+# Settings 로드를 위한 기본값 (실제 LLM/OCR 호출은 하지 않음)
+os.environ.setdefault("GOOGLE_API_KEY", "benchmark")
+
+
+def _measure(fn, iterations: int) -> dict:
+    """fn을 iterations회 실행하여 호출당 소요 시간(ms) 통계 반환"""
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return {
+        "mean_ms": round(statistics.fmean(samples), 4),
+        "p50_ms": round(samples[len(samples) // 2], 4),
+        "p99_ms": round(samples[min(len(samples) - 1, int(len(samples) * 0.99))], 4),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    # 그래프 모듈 import 비용 (콜드 스타트 시 첫 요청이 부담하던 비용)
+    start = time.perf_counter()
+    from src.graphs import chatbot, compare_products, summarize_page
+    from src.graphs.registry import GraphRegistry
+    import_ms = round((time.perf_counter() - start) * 1000, 2)
+
+    factories = {
+        "summarize_page": summarize_page.create_graph,
+        "compare_products": compare_products.create_graph,
+        "chatbot": chatbot.create_graph,
+    }
+
+    registry = GraphRegistry()
+    for name, factory in factories.items():
+        registry.register(name, factory)
+    warm_up = registry.warm_up()
+
+    report = {"graph_module_import_ms": import_ms, "graphs": {}}
+    for name, factory in factories.items():
+        report["graphs"][name] = {
+            "warm_up_compile_s": warm_up[name],
+            "before_create_graph_per_request": _measure(factory, args.iterations),
+            "after_registry_get_per_request": _measure(
+                lambda: registry.get(name), args.iterations
+            ),
+        }
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""HTML 파싱 비용 벤치마크
+
+요청마다 추출기/파서가 각자 BeautifulSoup 트리를 생성하던 방식(before)과
+HTMLDocument로 1회만 파싱하여 공유하는 방식(after)의
+요청당 CPU 시간과 최대 메모리 사용량을 비교합니다.
+
+- generic 경로: extract_texts + extract_images (before: 파싱 2회)
+- naver_brand 경로: NaverBrandParser.parse
+  (full_soup: 페이지 전체 BeautifulSoup 트리 생성 비용, region_xpath: lxml 트리 + XPath 영역 조회로 파싱 전체)
+- extract_texts: 파싱된 트리에서 leaf 텍스트 추출(단일 DFS)만 측정
+
+Usage:
+    uv run python -m benchmarks.bench_html_parsing [--iterations 10] [--html PATH]
+"""
+
+import argparse
+import gc
+import json
+import os
+import statistics
+import time
+import tracemalloc
+from pathlib import Path
+
+# Settings 로드를 위한 기본값 (실제 LLM/OCR 호출은 하지 않음)
+os.environ.setdefault("GOOGLE_API_KEY", "benchmark")
+
+DEFAULT_HTML = Path(__file__).parents[1] / "tests" / "fixtures" / "html" / "naver_brand_product.html"
+NAVER_BRAND_URL = "https://brand.naver.com/melkin/products/7514837282"
+
+
+def _measure(fn, iterations: int) -> dict:
+    """fn을 iterations회 실행하여 호출당 CPU 시간(ms)과 최대 메모리(MB) 통계 반환"""
+    cpu_samples = []
+    peak_samples = []
+    for _ in range(iterations):
+        gc.collect()
+        tracemalloc.start()
+        start = time.process_time()
+        fn()
+        cpu_samples.append((time.process_time() - start) * 1000)
+        peak_samples.append(tracemalloc.get_traced_memory()[1] / (1024 * 1024))
+        tracemalloc.stop()
+    return {
+        "cpu_mean_ms": round(statistics.fmean(cpu_samples), 2),
+        "cpu_min_ms": round(min(cpu_samples), 2),
+        "peak_memory_mb": round(statistics.fmean(peak_samples), 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument("--html", type=Path, default=DEFAULT_HTML)
+    args = parser.parse_args()
+
+    from bs4 import BeautifulSoup
+
+    from src.graphs.summarize_page.domain_parsers.naver_brand import NaverBrandParser
+    from src.utils.html_document import HTMLDocument
+    from src.utils.html_parser import HTMLContentExtractor
+
+    html = args.html.read_text(encoding="utf-8")
+    naver_brand = NaverBrandParser()
+
+    def generic_before():
+        HTMLContentExtractor.extract_texts(html, min_length=0, base_url=NAVER_BRAND_URL)
+        HTMLContentExtractor.extract_images(html, base_url=NAVER_BRAND_URL)
+
+    def generic_after():
+        document = HTMLDocument(html)
+        HTMLContentExtractor.extract_texts(document, min_length=0, base_url=NAVER_BRAND_URL)
+        HTMLContentExtractor.extract_images(document, base_url=NAVER_BRAND_URL)
+
+    def naver_brand_full_soup():
+        # 영역 조회 이전 방식의 하한 (추출 없이 트리 생성만)
+        BeautifulSoup(html, "lxml")
+
+    def naver_brand_region_xpath():
+        naver_brand.parse(url=NAVER_BRAND_URL, title="", html_body=HTMLDocument(html))
+
+    # 트리 파싱 비용을 제외하고 텍스트 추출 엔진만 측정
+    parsed = HTMLDocument(html)
+    parsed.soup
+
+    def extract_texts_dfs():
+        HTMLContentExtractor.extract_texts(parsed, min_length=0)
+
+    report = {
+        "html_bytes": len(html.encode("utf-8")),
+        "iterations": args.iterations,
+        "generic": {
+            "before_parse_per_extractor": _measure(generic_before, args.iterations),
+            "after_shared_document": _measure(generic_after, args.iterations),
+        },
+        "naver_brand": {
+            "full_soup_tree_only": _measure(naver_brand_full_soup, args.iterations),
+            "region_xpath_parse": _measure(naver_brand_region_xpath, args.iterations),
+        },
+        "extract_texts": {
+            "single_pass_dfs": _measure(extract_texts_dfs, args.iterations),
+        },
+    }
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+"""파서 벤치마크 스위트
+
+HTMLContentExtractor, GenericParser, 도메인 파서별 parse()를
+fixture 페이지와 합성 코퍼스(benchmarks.corpus, 50KB ~ 20MB)에 대해 측정하고
+커밋 간 비교 가능한 JSON으로 출력합니다.
+
+케이스마다 새 프로세스(spawn)에서 실행하여 peak RSS가 다른 케이스의 영향을 받지 않습니다.
+
+측정 항목 (케이스별):
+- wall_ms: 반복 실행 wall time (mean / p50 / min)
+- alloc_peak_mb / alloc_blocks: tracemalloc 기준 최대 할당량 / 종료 시점 할당 블록 수 (별도 1회 실행)
+- peak_rss_mb: 프로세스 최대 RSS (baseline_rss_mb: 입력 준비 후 측정 시작 전 RSS)
+
+Usage:
+    uv run python -m benchmarks.bench_parsers --output bench.json
+    uv run python -m benchmarks.bench_parsers --sizes 50KB,500KB --targets coupang --iterations 3
+    uv run python -m benchmarks.bench_parsers --compare baseline.json --output bench.json
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+# Settings 로드를 위한 기본값 (실제 LLM/OCR 호출은 하지 않음)
+os.environ.setdefault("GOOGLE_API_KEY", "benchmark")
+
+FIXTURES_DIR = Path(__file__).parents[1] / "tests" / "fixtures" / "html"
+
+DEFAULT_SIZES = "50KB,500KB,2MB,20MB"
+
+# 측정 대상 -> 입력 레이아웃 (합성 코퍼스 / fixture 선택 기준)
+TARGET_LAYOUTS = {
+    "extract_texts": "generic",
+    "extract_images": "generic",
+    "generic": "generic",
+    "naver_brand": "naver_brand",
+    "naver_smartstore": "naver_smartstore",
+    "coupang": "coupang",
+}
+
+# fixture 파일 -> 레이아웃 (*_synthetic.html은 실제 캡처가 아닌 benchmarks.corpus 생성 페이지)
+FIXTURE_LAYOUTS = {
+    "naver_brand_product.html": "naver_brand",
+    "naver_smart_store_product_synthetic.html": "naver_smartstore",
+    "coupang_product_synthetic.html": "coupang",
+}
+
+
+def _rss_mb() -> float:
+    """현재 프로세스 최대 RSS (MB, Linux는 KB 단위 / macOS는 바이트 단위)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 1)
+
+
+def _make_runner(target: str):
+    """측정 대상 호출 함수 생성 (html, url을 받아 결과 반환)"""
+    from src.graphs.summarize_page.domain_parsers.coupang_product import CoupangProductParser
+    from src.graphs.summarize_page.domain_parsers.generic import GenericParser
+    from src.graphs.summarize_page.domain_parsers.naver_brand import NaverBrandParser
+    from src.graphs.summarize_page.domain_parsers.naver_smartstore import NaverSmartstoreParser
+    from src.utils.html_parser import HTMLContentExtractor
+
+    if target == "extract_texts":
+        return lambda html, url: HTMLContentExtractor.extract_texts(html, min_length=0, base_url=url)
+    if target == "extract_images":
+        return lambda html, url: HTMLContentExtractor.extract_images(html, base_url=url)
+    parser = {
+        "generic": GenericParser,
+        "naver_brand": NaverBrandParser,
+        "naver_smartstore": NaverSmartstoreParser,
+        "coupang": CoupangProductParser,
+    }[target]()
+    return lambda html, url: parser.parse(url=url, title="OptiPick 벤치마크 : 테스트스토어", html_body=html)
+
+
+def _run_case(case: dict, iterations: int) -> dict:
+    """케이스 1개 측정 (전용 워커 프로세스에서 실행)"""
+    from benchmarks.corpus import LAYOUT_URLS, generate_page, parse_size
+
+    layout = TARGET_LAYOUTS[case["target"]]
+    if case["source"] == "fixture":
+        html = (FIXTURES_DIR / case["input"]).read_text(encoding="utf-8")
+    else:
+        html = generate_page(layout, case["profile"], parse_size(case["input"]))
+    url = LAYOUT_URLS[layout]
+    run = _make_runner(case["target"])
+
+    # import / lazy 초기화 비용 제외를 위한 예열 (작은 입력)
+    run(generate_page(layout, "deep_nesting", 4 * 1024), url)
+    baseline_rss = _rss_mb()
+
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        run(html, url)
+        samples.append((time.perf_counter() - start) * 1000)
+    peak_rss = _rss_mb()
+
+    tracemalloc.start()
+    run(html, url)
+    _, alloc_peak = tracemalloc.get_traced_memory()
+    alloc_blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics("filename"))
+    tracemalloc.stop()
+
+    return {
+        **case,
+        "html_bytes": len(html.encode("utf-8")),
+        "wall_ms": {
+            "mean": round(statistics.fmean(samples), 2),
+            "p50": round(statistics.median(samples), 2),
+            "min": round(min(samples), 2),
+        },
+        "alloc_peak_mb": round(alloc_peak / (1024 * 1024), 2),
+        "alloc_blocks": alloc_blocks,
+        "baseline_rss_mb": baseline_rss,
+        "peak_rss_mb": peak_rss,
+    }
+
+
+def _case_id(case: dict) -> str:
+    parts = [case["target"], case["source"], case.get("profile", ""), case["input"]]
+    return "/".join(part for part in parts if part)
+
+
+def _build_cases(targets: list[str], profiles: list[str], sizes: list[str]) -> list[dict]:
+    """측정 케이스 목록 (fixture + 합성 코퍼스)"""
+    cases = []
+    for target in targets:
+        layout = TARGET_LAYOUTS[target]
+        for fixture, fixture_layout in FIXTURE_LAYOUTS.items():
+            if (FIXTURES_DIR / fixture).exists() and (layout == fixture_layout or layout == "generic"):
+                cases.append({"target": target, "source": "fixture", "input": fixture})
+        for profile in profiles:
+            for size in sizes:
+                cases.append({"target": target, "source": "synthetic", "profile": profile, "input": size})
+    return cases
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except Exception:
+        return "unknown"
+
+
+def _compare(results: list[dict], baseline_path: Path, threshold: float) -> list[dict]:
+    """
+    baseline JSON 대비 wall time(p50) / peak RSS 변화율 계산
+
+    Returns:
+        list[dict]: 케이스별 변화율 (threshold 초과 시 regression=True)
+    """
+    baseline = {result["id"]: result for result in json.loads(baseline_path.read_text())["results"]}
+    comparison = []
+    for result in results:
+        before = baseline.get(result["id"])
+        if before is None:
+            continue
+        wall_ratio = result["wall_ms"]["p50"] / max(before["wall_ms"]["p50"], 1e-9)
+        rss_ratio = result["peak_rss_mb"] / max(before["peak_rss_mb"], 1e-9)
+        comparison.append({
+            "id": result["id"],
+            "wall_p50_ratio": round(wall_ratio, 3),
+            "peak_rss_ratio": round(rss_ratio, 3),
+            "regression": wall_ratio > 1 + threshold or rss_ratio > 1 + threshold,
+        })
+    return comparison
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--targets", default=",".join(TARGET_LAYOUTS), help="쉼표 구분 측정 대상")
+    parser.add_argument("--profiles", default="deep_nesting,many_images,many_reviews")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="합성 페이지 크기 (예: 50KB,2MB)")
+    parser.add_argument("--iterations", type=int, default=3)
+    parser.add_argument("--output", type=Path, help="결과 JSON 저장 경로 (생략 시 stdout)")
+    parser.add_argument("--compare", type=Path, help="비교할 이전 결과 JSON")
+    parser.add_argument("--threshold", type=float, default=0.1, help="regression 판정 변화율 (기본 10%%)")
+    args = parser.parse_args()
+
+    targets = [t for t in args.targets.split(",") if t]
+    unknown = set(targets) - set(TARGET_LAYOUTS)
+    if unknown:
+        parser.error(f"Unknown targets: {sorted(unknown)} (supported: {list(TARGET_LAYOUTS)})")
+
+    cases = _build_cases(targets, args.profiles.split(","), args.sizes.split(","))
+    results = []
+    context = multiprocessing.get_context("spawn")
+    for case in cases:
+        # 케이스마다 새 프로세스 (peak RSS 격리)
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            result = executor.submit(_run_case, case, args.iterations).result()
+        result["id"] = _case_id(case)
+        results.append(result)
+        print(
+            f"{result['id']}: p50={result['wall_ms']['p50']}ms "
+            f"alloc_peak={result['alloc_peak_mb']}MB peak_rss={result['peak_rss_mb']}MB",
+            file=sys.stderr,
+        )
+
+    report = {
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": datetime.now().isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "iterations": args.iterations,
+        },
+        "results": results,
+    }
+    if args.compare:
+        report["comparison"] = _compare(results, args.compare, args.threshold)
+
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        args.output.write_text(output, encoding="utf-8")
+    else:
+        print(output)
+
+    if args.compare and any(item["regression"] for item in report["comparison"]):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""프롬프트 인코딩별 토큰 비용 프로파일러
+
+fixture 페이지와 합성 코퍼스(benchmarks.corpus)를 실제 파서로 파싱한 뒤
+analyze_product / validate_page 메시지(시스템 + 사용자)를 인코딩별(csv, grouped, compact)로 생성하여
+문자 수와 추정 토큰 수를 비교합니다. LLM 호출은 하지 않습니다.
+
+- analyze: 도메인 파서 결과(제품명/가격/설명 텍스트)로 만든 analyze_product 프롬프트
+- validate: extract_content_from_html 텍스트로 만든 validate_page 프롬프트
+- 시스템 프롬프트도 인코딩별 입력 형식 설명이 달라지므로 비용에 포함합니다 (system_tokens는 그중 시스템 몫)
+- 토큰 수는 src.prompts.token_budget.estimate_tokens 추정값 (토크나이저 미사용)
+- fixture/합성 페이지에는 OCR 결과가 없으므로 OCR 섹션은 비어 있는 상태로 측정됩니다
+
+Usage:
+    uv run python -m benchmarks.bench_prompt_encodings
+    uv run python -m benchmarks.bench_prompt_encodings --sizes 200KB,1MB --output encodings.json
+"""
+
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+
+# Settings 로드를 위한 기본값 (실제 LLM/OCR 호출은 하지 않음)
+os.environ.setdefault("GOOGLE_API_KEY", "benchmark")
+
+FIXTURES_DIR = Path(__file__).parents[1] / "tests" / "fixtures" / "html"
+
+# fixture 파일 -> 레이아웃 (*_synthetic.html은 실제 캡처가 아닌 benchmarks.corpus 생성 페이지)
+FIXTURE_LAYOUTS = {
+    "naver_brand_product.html": "naver_brand",
+    "naver_smart_store_product_synthetic.html": "naver_smartstore",
+    "coupang_product_synthetic.html": "coupang",
+}
+
+# 리뷰가 많은 합성 페이지 (리뷰 텍스트는 인코딩별 행 오버헤드 차이가 가장 큼)
+SYNTHETIC_PROFILE = "many_reviews"
+
+PAGE_TITLE = "OptiPick 벤치마크 : 테스트스토어"
+
+
+def _load_pages(sizes: list[str]) -> list[dict]:
+    """측정 페이지 목록 (fixture + 합성 코퍼스)"""
+    from benchmarks.corpus import LAYOUT_URLS, generate_page, parse_size
+
+    pages = []
+    for fixture, layout in FIXTURE_LAYOUTS.items():
+        path = FIXTURES_DIR / fixture
+        if path.exists():
+            pages.append(
+                {
+                    "id": f"fixture/{fixture}",
+                    "layout": layout,
+                    "url": LAYOUT_URLS[layout],
+                    "html": path.read_text(encoding="utf-8"),
+                }
+            )
+    for size in sizes:
+        for layout in FIXTURE_LAYOUTS.values():
+            pages.append(
+                {
+                    "id": f"synthetic/{layout}/{SYNTHETIC_PROFILE}/{size}",
+                    "layout": layout,
+                    "url": LAYOUT_URLS[layout],
+                    "html": generate_page(layout, SYNTHETIC_PROFILE, parse_size(size)),
+                }
+            )
+    return pages
+
+
+def _cost(messages: list[dict]) -> dict:
+    """전체 메시지(시스템 + 사용자) 문자 수와 추정 토큰 수"""
+    from src.prompts.token_budget import estimate_tokens
+
+    tokens = {message["role"]: estimate_tokens(message["content"]) for message in messages}
+    return {
+        "chars": sum(len(message["content"]) for message in messages),
+        "tokens": sum(tokens.values()),
+        "system_tokens": tokens.get("system", 0),
+    }
+
+
+def _profile_page(page: dict, encodings: list[str]) -> dict:
+    """페이지 1개의 인코딩별 analyze/validate 프롬프트 비용"""
+    from src.graphs.summarize_page.domain_parsers import get_parser_registry
+    from src.graphs.summarize_page.nodes.analyze_product_node import build_structured_texts
+    from src.prompts import analyze_product, validate_page
+    from src.utils.html_document import HTMLDocument
+    from src.utils.html_parser import extract_content_from_html
+
+    document = HTMLDocument(page["html"])
+    parser = get_parser_registry().get_parser(page["url"])
+    parsed_content = parser.parse(url=page["url"], title=PAGE_TITLE, html_body=document)
+    analyze_texts = build_structured_texts(parsed_content)
+    validate_texts, _ = extract_content_from_html(document, base_url=page["url"])
+
+    result = {
+        "id": page["id"],
+        "parser": parser.domain_type,
+        "html_bytes": len(page["html"].encode("utf-8")),
+        "analyze_texts": len(analyze_texts),
+        "validate_texts": len(validate_texts),
+        "encodings": {},
+    }
+    for encoding in encodings:
+        result["encodings"][encoding] = {
+            "analyze": _cost(analyze_product.build_messages(analyze_texts, [], PAGE_TITLE, encoding)),
+            "validate": _cost(validate_page.build_messages(page["url"], PAGE_TITLE, validate_texts, encoding)),
+        }
+    return result
+
+
+def _summarize(results: list[dict], encodings: list[str]) -> dict:
+    """인코딩별 전체 토큰 합계와 csv 대비 절감률"""
+    totals = {}
+    for encoding in encodings:
+        totals[encoding] = {
+            prompt: sum(result["encodings"][encoding][prompt]["tokens"] for result in results)
+            for prompt in ("analyze", "validate")
+        }
+
+    baseline = totals.get("csv")
+    if baseline:
+        for encoding, total in totals.items():
+            total["saving_vs_csv"] = {
+                prompt: round(1 - total[prompt] / baseline[prompt], 3) if baseline[prompt] else 0.0
+                for prompt in ("analyze", "validate")
+            }
+    return totals
+
+
+def main():
+    from src.prompts.encoders import ENCODERS
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--encodings", default=",".join(ENCODERS), help="쉼표 구분 인코딩")
+    parser.add_argument("--sizes", default="200KB", help="합성 페이지 크기 (예: 200KB,1MB, 빈 값이면 fixture만)")
+    parser.add_argument("--output", type=Path, help="결과 JSON 저장 경로 (생략 시 stdout)")
+    args = parser.parse_args()
+
+    encodings = [e for e in args.encodings.split(",") if e]
+    unknown = set(encodings) - set(ENCODERS)
+    if unknown:
+        parser.error(f"Unknown encodings: {sorted(unknown)} (supported: {list(ENCODERS)})")
+
+    results = []
+    for page in _load_pages([s for s in args.sizes.split(",") if s]):
+        result = _profile_page(page, encodings)
+        results.append(result)
+        costs = " ".join(
+            f"{encoding}={cost['analyze']['tokens']}/{cost['validate']['tokens']}"
+            for encoding, cost in result["encodings"].items()
+        )
+        print(f"{result['id']} (analyze/validate tokens): {costs}", file=sys.stderr)
+
+    report = {"results": results, "totals": _summarize(results, encodings)}
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        args.output.write_text(output, encoding="utf-8")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
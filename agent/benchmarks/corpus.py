@@ -0,0 +1,236 @@
+"""파서 벤치마크용 합성 HTML 코퍼스
+
+도메인 파서가 실제로 탐색하는 구조(리뷰 영역, 상세 이미지 컨테이너 등)를 갖춘 페이지를
+원하는 크기(50KB ~ 20MB)로 생성합니다. 같은 인자와 seed면 항상 같은 HTML이 생성됩니다.
+
+- layout: 페이지 구조 ("generic", "naver_brand", "naver_smartstore", "coupang")
+- profile: 크기를 채우는 콘텐츠 비중
+    - deep_nesting: 깊게 중첩된 div 블록 위주
+    - many_images: 상세 설명 이미지(img + srcset) 위주
+    - many_reviews: 리뷰 항목 위주
+
+Usage:
+    uv run python -m benchmarks.corpus --layout coupang --profile many_reviews --size 500KB > page.html
+"""
+
+import argparse
+import random
+import sys
+
+LAYOUTS = ("generic", "naver_brand", "naver_smartstore", "coupang")
+PROFILES = ("deep_nesting", "many_images", "many_reviews")
+
+# 레이아웃별 대표 URL (파서 선택용)
+LAYOUT_URLS = {
+    "generic": "https://shop.example.com/products/1234",
+    "naver_brand": "https://brand.naver.com/optipick/products/1234",
+    "naver_smartstore": "https://smartstore.naver.com/optipick/products/1234",
+    "coupang": "https://www.coupang.com/vp/products/1234",
+}
+
+# profile별 (중첩 블록, 이미지, 리뷰) 생성 비중
+_PROFILE_WEIGHTS = {
+    "deep_nesting": (8, 1, 1),
+    "many_images": (1, 8, 1),
+    "many_reviews": (1, 1, 8),
+}
+
+_NESTING_DEPTH = 40
+
+_WORDS = (
+    "배송", "포장", "가성비", "재구매", "만족", "품질", "사이즈", "색상", "디자인", "튼튼",
+    "가볍고", "생각보다", "정말", "추천", "합니다", "아주", "빠르게", "도착", "했어요", "좋아요",
+    "quality", "fast", "delivery", "recommend", "great", "value", "battery", "screen",
+)
+
+
+def parse_size(value: str) -> int:
+    """
+    "50KB", "2MB" 형식의 크기 문자열을 바이트 수로 변환
+
+    Args:
+        value: 크기 문자열 (단위 생략 시 바이트)
+
+    Returns:
+        int: 바이트 수
+    """
+    value = value.strip().upper()
+    for unit, factor in (("KB", 1024), ("MB", 1024 * 1024), ("B", 1)):
+        if value.endswith(unit):
+            return int(float(value[: -len(unit)]) * factor)
+    return int(value)
+
+
+class _PageBuilder:
+    """레이아웃별 페이지 조각 생성기"""
+
+    def __init__(self, layout: str, seed: int):
+        self.layout = layout
+        self.rng = random.Random(seed)
+
+    def _sentence(self, words: int) -> str:
+        return " ".join(self.rng.choice(_WORDS) for _ in range(words))
+
+    # ========== 공통 영역 ==========
+
+    def head(self) -> str:
+        return (
+            "<!DOCTYPE html><html lang=\"ko\"><head><meta charset=\"utf-8\">"
+            "<title>OptiPick 벤치마크 상품 : 테스트스토어</title>"
+            "<style>.product{margin:0}</style><script>window.__STATE__={};</script>"
+            "</head><body>"
+            "<header><div class=\"logo\"><span>테스트스토어 헤더 영역</span></div></header>"
+            "<nav><ul>" + "".join(f"<li><a href=\"/c/{i}\">카테고리 메뉴 {i}</a></li>" for i in range(10)) + "</ul></nav>"
+        )
+
+    def tail(self) -> str:
+        return (
+            "<div class=\"ad\">광고 영역 텍스트입니다</div>"
+            "<footer><p>사업자 정보 및 고객센터 안내 문구입니다</p></footer>"
+            "</body></html>"
+        )
+
+    def product(self) -> str:
+        price = f"{self.rng.randint(1, 999):,},{self.rng.randint(0, 999):03d}"
+        if self.layout == "coupang":
+            return (
+                "<div class=\"prod-atf\">"
+                "<img alt=\"Product image\" src=\"//thumbnail.coupangcdn.com/product/main.jpg\">"
+                "<h1 class=\"product-title\">백설 햄스빌 굿베이컨 120g 2개</h1>"
+                f"<div class=\"price-amount\">{price}원</div>"
+                f"<div class=\"final-price-amount\">{price}원</div>"
+                "</div>"
+            )
+        return (
+            "<div id=\"content\"><div class=\"product\">"
+            "<img alt=\"대표이미지\" src=\"https://shop-phinf.pstatic.net/product/main.jpg\">"
+            "<h3>OptiPick 벤치마크 무선 이어폰 노이즈캔슬링</h3>"
+            f"<div><span class=\"blind\">상품 가격</span><span>{price}</span><span>원</span></div>"
+            "</div></div>"
+        )
+
+    def nesting_block(self, index: int) -> str:
+        depth = self.rng.randint(_NESTING_DEPTH // 2, _NESTING_DEPTH)
+        inner = f"<span>{self._sentence(8)} 상세 설명 {index}</span><p>{self._sentence(12)}</p>"
+        return "<div class=\"depth\">" * depth + inner + "</div>" * depth
+
+    def image(self, index: int) -> str:
+        src = f"https://cdn.example.com/detail/{index}.jpg"
+        if self.layout == "naver_brand":
+            return (
+                "<div class=\"se-module se-module-image\">"
+                f"<img class=\"se-image-resource\" src=\"{src}\" alt=\"상세 이미지 {index}\" width=\"860\" height=\"1200\">"
+                "</div>"
+            )
+        return (
+            f"<img src=\"{src}\" alt=\"상세 이미지 {index}\" width=\"860\" height=\"1200\" "
+            f"srcset=\"{src}?w=430 430w, {src}?w=860 860w\">"
+        )
+
+    def review(self, index: int) -> str:
+        text = f"{self._sentence(self.rng.randint(12, 40))} 리뷰 {index}"
+        if self.layout == "coupang":
+            return (
+                "<article class=\"sdp-review__article__list\">"
+                "<div class=\"rating\"><span>5점</span></div>"
+                f"<span class=\"twc-bg-white\">{text}<br>{self._sentence(6)}</span>"
+                "</article>"
+            )
+        return (
+            "<li><div class=\"review\">"
+            f"<div><span>user{index:04d}</span><span>24.01.01.</span></div>"
+            f"<div><span>{text}</span></div>"
+            "</div></li>"
+        )
+
+    # ========== 레이아웃별 컨테이너 ==========
+
+    def detail_section(self, blocks: str) -> str:
+        if self.layout == "naver_brand":
+            return f"<div class=\"se-main-container\">{blocks}</div>"
+        if self.layout == "naver_smartstore":
+            # //*[@id="INTRODUCE"]/div/div[5]/div
+            return (
+                "<div id=\"INTRODUCE\"><div>"
+                + "<div><span>상세정보 탭</span></div>" * 4
+                + f"<div><div>{blocks}</div></div>"
+                + "</div></div>"
+            )
+        if self.layout == "coupang":
+            return f"<div class=\"product-detail-content\">{blocks}</div>"
+        return f"<main><article class=\"product-detail\">{blocks}</article></main>"
+
+    def review_section(self, items: str) -> str:
+        if self.layout == "coupang":
+            return f"<section class=\"product-review\">{items}</section>"
+        if self.layout == "generic":
+            return f"<section class=\"reviews\"><ul>{items}</ul></section>"
+        return f"<div id=\"REVIEW\"><ul>{items}</ul></div>"
+
+
+def generate_page(layout: str, profile: str, target_bytes: int, seed: int = 0) -> str:
+    """
+    합성 상품 페이지 생성
+
+    Args:
+        layout: 페이지 구조 (LAYOUTS 중 하나)
+        profile: 콘텐츠 비중 (PROFILES 중 하나)
+        target_bytes: 목표 크기 (UTF-8 바이트, 실제 크기는 약간 클 수 있음)
+        seed: 난수 seed
+
+    Returns:
+        str: HTML 문자열
+
+    Raises:
+        ValueError: 지원하지 않는 layout/profile인 경우
+    """
+    if layout not in LAYOUTS:
+        raise ValueError(f"Unsupported layout: {layout} (supported: {LAYOUTS})")
+    if profile not in PROFILES:
+        raise ValueError(f"Unsupported profile: {profile} (supported: {PROFILES})")
+
+    builder = _PageBuilder(layout, seed)
+    head, product, tail = builder.head(), builder.product(), builder.tail()
+    size = sum(len(part.encode("utf-8")) for part in (head, product, tail))
+
+    detail_blocks: list[str] = []
+    reviews: list[str] = []
+    makers = (
+        (builder.nesting_block, detail_blocks),
+        (builder.image, detail_blocks),
+        (builder.review, reviews),
+    )
+    weights = _PROFILE_WEIGHTS[profile]
+
+    index = 0
+    while size < target_bytes:
+        make, target = builder.rng.choices(makers, weights=weights)[0]
+        block = make(index)
+        target.append(block)
+        size += len(block.encode("utf-8"))
+        index += 1
+
+    return "".join(
+        (
+            head,
+            product,
+            builder.detail_section("".join(detail_blocks)),
+            builder.review_section("".join(reviews)),
+            tail,
+        )
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--layout", choices=LAYOUTS, default="generic")
+    parser.add_argument("--profile", choices=PROFILES, default="deep_nesting")
+    parser.add_argument("--size", default="500KB")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    sys.stdout.write(generate_page(args.layout, args.profile, parse_size(args.size), args.seed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""FastAPI lifespan - 서버 시작 시 warm-up, 종료 시 리소스 정리"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
+
+from src.config.base import BaseSettings
+from src.graphs.registry import get_graph_registry
+from src.graphs.summarize_page.config import SummarizePageSettings
+from src.graphs.summarize_page.domain_parsers import get_parser_registry
+from src.graphs.summarize_page.parse_executor import close_parse_executor, get_parse_executor
+from src.graphs.summarize_page.result_cache import close_result_cache
+from src.services.ocr import close_ocr_cache, close_ocr_services, get_ocr_service
+from src.utils.llm.audit_log import close_audit_log_writer
+from src.utils.llm.cache import close_llm_cache
+from src.utils.llm.pool import get_llm_pool
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# OCR 커넥션 warm-up 최대 대기 시간 (엔드포인트 응답이 없어도 서버 시작이 지연되지 않도록)
+_OCR_WARM_UP_TIMEOUT_SECONDS = 5.0
+
+
+def _warm_up_llm(settings: BaseSettings):
+    """
+    노드에서 사용하는 LLM 클라이언트를 풀에 미리 생성
+
+    init_chat_model은 최초 호출 시 provider 통합 모듈을 import하므로,
+    첫 요청이 그 비용을 부담하지 않도록 시작 시점에 풀을 채워 둡니다.
+    """
+    pool = get_llm_pool()
+    try:
+        # analyze_product_node
+        pool.get_client(
+            provider=settings.default_llm_provider,
+            model=settings.default_llm_model,
+            temperature=0.5,
+            max_tokens=settings.default_max_tokens,
+            timeout=settings.default_llm_timeout,
+        )
+        # validate_page_node
+        pool.get_client(
+            provider=settings.default_llm_provider,
+            model=settings.default_llm_model,
+            temperature=0.3,
+            max_tokens=settings.default_max_tokens,
+            timeout=settings.default_llm_timeout,
+        )
+        # analyze_products_node, generate_report_node
+        pool.get_client(
+            provider=settings.default_llm_provider,
+            model=settings.default_llm_model,
+            temperature=0.3,
+        )
+        # Google Search grounding (generic 분석 / chatbot)
+        pool.get_search_model(settings.default_llm_model, temperature=0.5)
+        pool.get_search_model(settings.default_llm_model, temperature=0.7)
+    except Exception as e:
+        # warm-up 실패는 서버 시작을 막지 않음 (실제 요청에서 다시 오류 처리)
+        logger.warning(f"LLM warm-up failed: {str(e)}")
+
+
+async def _warm_up_ocr():
+    """
+    OCR 서비스를 미리 생성하고 provider 엔드포인트에 커넥션을 열어 둠
+
+    첫 요청이 HTTP 클라이언트 생성과 DNS/TLS handshake 비용을 부담하지 않도록 합니다.
+    """
+    settings = SummarizePageSettings()
+    try:
+        service = get_ocr_service(settings)
+        await asyncio.wait_for(service.warm_up(), timeout=_OCR_WARM_UP_TIMEOUT_SECONDS)
+    except Exception as e:
+        # warm-up 실패(자격 증명 미설정, 네트워크 오류 등)는 서버 시작을 막지 않음
+        logger.warning(f"OCR warm-up failed: {str(e)}")
+
+
+async def warm_up():
+    """그래프 컴파일, 파서 레지스트리, 파싱 워커, LLM provider, OCR 커넥션을 미리 초기화"""
+    start_time = time.perf_counter()
+    settings = BaseSettings()
+
+    get_graph_registry().warm_up()
+    get_parser_registry()
+    try:
+        await get_parse_executor().warm_up()
+    except Exception as e:
+        # 워커 기동 실패는 서버 시작을 막지 않음 (실제 요청에서 다시 오류 처리)
+        logger.warning(f"HTML parse executor warm-up failed: {str(e)}")
+    _warm_up_llm(settings)
+    await _warm_up_ocr()
+
+    logger.info(
+        "Warm-up completed",
+        extra={"elapsed_seconds": round(time.perf_counter() - start_time, 2)},
+    )
+
+
+async def shut_down():
+    """종료 시 공유 리소스 정리"""
+    await close_ocr_services()
+    close_ocr_cache()
+    close_result_cache()
+    close_parse_executor()
+    await get_llm_pool().aclose()
+    close_llm_cache()
+    close_audit_log_writer()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """서버 lifespan 훅 (startup -> yield -> shutdown)"""
+    await warm_up()
+    logger.info("OptiPick Agent API server started")
+
+    yield
+
+    await shut_down()
+    logger.info("OptiPick Agent API server shutdown")
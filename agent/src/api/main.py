@@ -4,9 +4,11 @@ from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
+from src.config.base import BaseSettings
 from src.utils.logger import get_logger
 
-from .routers import summarize_page, compare_products, chatbot
+from .lifespan import lifespan
+from .routers import summarize_page, compare_products, chatbot, metrics, cache, debug
 
 logger = get_logger(__name__)
 
@@ -15,6 +17,7 @@ app = FastAPI(
     title="OptiPick Agent API",
     description="LangGraph-based agent for product analysis",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # CORS 설정 (Extension 통신용)
@@ -52,16 +55,10 @@ async def health_check():
 app.include_router(summarize_page.router)
 app.include_router(compare_products.router)
 app.include_router(chatbot.router)
+app.include_router(metrics.router)
+app.include_router(cache.router)
 
+# 디버그 캡처 조회 API는 캡처 원문(html_body, LLM 입력)을 그대로 반환하므로 설정으로 활성화한 경우에만 등록
+if BaseSettings().debug_capture_enabled:
+    app.include_router(debug.router)
 
-# 서버 시작 로깅
-@app.on_event("startup")
-async def startup_event():
-    """서버 시작 시 실행"""
-    logger.info("OptiPick Agent API server started")
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """서버 종료 시 실행"""
-    logger.info("OptiPick Agent API server shutdown")
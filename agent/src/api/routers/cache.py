@@ -0,0 +1,40 @@
+"""캐시 관리 라우터 - 캐시 무효화 API"""
+
+from typing import Optional
+
+from fastapi import APIRouter
+
+from src.graphs.summarize_page.result_cache import get_result_cache
+from src.services.ocr import get_ocr_cache
+
+router = APIRouter(prefix="/cache", tags=["cache"])
+
+
+@router.delete("/ocr")
+async def invalidate_ocr_cache(image_url: Optional[str] = None):
+    """
+    OCR 결과 캐시 무효화
+
+    Args:
+        image_url: 무효화할 이미지 URL (생략 시 전체 삭제)
+
+    Returns:
+        - deleted: 삭제된 항목 수 (메모리/디스크 합산)
+    """
+    deleted = await get_ocr_cache().invalidate(image_url)
+    return {"deleted": deleted}
+
+
+@router.delete("/summarize-page")
+async def invalidate_summarize_page_cache(url: Optional[str] = None):
+    """
+    SummarizePage 결과 캐시 무효화
+
+    Args:
+        url: 무효화할 페이지 URL (생략 시 전체 삭제)
+
+    Returns:
+        - deleted: 삭제된 항목 수 (메모리/디스크 합산)
+    """
+    deleted = await get_result_cache().invalidate(url)
+    return {"deleted": deleted}
@@ -10,7 +10,8 @@ from fastapi.responses import StreamingResponse
 from langchain_core.messages import HumanMessage, AIMessage
 
 from src.exceptions.base import ConfigurationError
-from src.graphs.chatbot import create_graph, get_checkpointer
+from src.graphs.chatbot import get_checkpointer
+from src.graphs.registry import get_graph
 from src.prompts.chatbot import build_welcome_message
 from src.utils.logger import get_logger
 
@@ -51,8 +52,8 @@ async def start_chatbot(request: ChatbotStartRequest):
             },
         )
 
-        # 그래프 생성
-        graph = create_graph()
+        # 그래프 조회 (프로세스당 1회 컴파일된 인스턴스)
+        graph = get_graph("chatbot")
 
         # Config 생성 (thread_id 포함)
         config = {"configurable": {"thread_id": thread_id}}
@@ -122,8 +123,8 @@ async def send_message(thread_id: str, request: ChatbotMessageRequest):
             },
         )
 
-        # 그래프 생성
-        graph = create_graph()
+        # 그래프 조회 (프로세스당 1회 컴파일된 인스턴스)
+        graph = get_graph("chatbot")
 
         # Config 생성
         config = {"configurable": {"thread_id": thread_id}}
@@ -209,8 +210,8 @@ async def stream_message(
                 },
             )
 
-            # 그래프 생성
-            graph = create_graph()
+            # 그래프 조회 (프로세스당 1회 컴파일된 인스턴스)
+            graph = get_graph("chatbot")
 
             # Config 생성
             config = {"configurable": {"thread_id": thread_id}}
@@ -295,8 +296,8 @@ async def get_history(thread_id: str):
             extra={"thread_id": thread_id},
         )
 
-        # 그래프 생성
-        graph = create_graph()
+        # 그래프 조회 (프로세스당 1회 컴파일된 인스턴스)
+        graph = get_graph("chatbot")
 
         # Config 생성
         config = {"configurable": {"thread_id": thread_id}}
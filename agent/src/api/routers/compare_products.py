@@ -6,7 +6,7 @@ import time
 from fastapi import APIRouter, HTTPException
 
 from src.exceptions.base import ConfigurationError
-from src.graphs.compare_products import create_graph
+from src.graphs.registry import get_graph
 from src.utils.logger import get_logger
 
 from ..schemas import (
@@ -55,8 +55,8 @@ async def start_compare_products(request: CompareProductsStartRequest):
             "products": [product.model_dump() for product in request.products],
         }
 
-        # 그래프 생성
-        graph = create_graph()
+        # 그래프 조회 (프로세스당 1회 컴파일된 인스턴스)
+        graph = get_graph("compare_products")
 
         # Config 생성 (thread_id 포함)
         config = {"configurable": {"thread_id": thread_id}}
@@ -126,8 +126,8 @@ async def continue_compare_products(
             },
         )
 
-        # 그래프 생성
-        graph = create_graph()
+        # 그래프 조회 (프로세스당 1회 컴파일된 인스턴스)
+        graph = get_graph("compare_products")
 
         # Config 생성
         config = {"configurable": {"thread_id": thread_id}}
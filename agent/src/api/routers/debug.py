@@ -0,0 +1,59 @@
+"""디버그 라우터 - 디버그 캡처 조회 API"""
+
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import PlainTextResponse
+
+from src.utils.debug_capture import get_debug_capture_store
+
+router = APIRouter(prefix="/debug", tags=["debug"])
+
+
+@router.get("/captures")
+async def list_debug_captures():
+    """
+    메모리에 보관 중인 최근 디버그 캡처 목록 (최신순)
+
+    Returns:
+        - captures: capture_id, url, created_at, artifacts(이름별 길이) 목록
+    """
+    return {"captures": get_debug_capture_store().recent()}
+
+
+@router.get("/captures/{capture_id}")
+async def get_debug_capture(capture_id: str):
+    """
+    디버그 캡처 조회 (산출물 본문 포함)
+
+    Args:
+        capture_id: 응답 X-Debug-Capture-Id 헤더 값
+
+    Returns:
+        - capture_id, url, created_at, artifacts(이름별 내용)
+    """
+    capture = await get_debug_capture_store().aget(capture_id)
+    if capture is None:
+        raise HTTPException(status_code=404, detail=f"Debug capture not found: {capture_id}")
+    return {
+        "capture_id": capture.capture_id,
+        "url": capture.url,
+        "created_at": capture.created_at,
+        "artifacts": capture.artifacts,
+    }
+
+
+@router.get("/captures/{capture_id}/{name}", response_class=PlainTextResponse)
+async def get_debug_capture_artifact(capture_id: str, name: str):
+    """
+    디버그 캡처 산출물 원문 조회
+
+    Args:
+        capture_id: 캡처 ID
+        name: 산출물 이름 (예: "parsed.html", "processed_source.txt")
+
+    Returns:
+        산출물 원문 (text/plain)
+    """
+    capture = await get_debug_capture_store().aget(capture_id)
+    if capture is None or name not in capture.artifacts:
+        raise HTTPException(status_code=404, detail=f"Debug artifact not found: {name}")
+    return capture.artifacts[name]
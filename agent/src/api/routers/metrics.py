@@ -0,0 +1,57 @@
+"""런타임 지표 라우터 - 공유 리소스(커넥션 풀 등) 사용 현황 조회"""
+
+from fastapi import APIRouter
+
+from src.graphs.summarize_page.parse_executor import get_parse_executor
+from src.graphs.summarize_page.prevalidator import get_page_prevalidator
+from src.graphs.summarize_page.result_cache import get_result_cache
+from src.services.ocr import (
+    get_ocr_cache,
+    get_ocr_concurrency_stats,
+    get_ocr_failover_stats,
+    get_ocr_pool_stats,
+    get_ocr_scheduler,
+)
+from src.utils.debug_capture import get_debug_capture_store
+from src.utils.llm.audit_log import get_audit_log_writer
+from src.utils.llm.cache import get_llm_cache
+from src.utils.llm.pool import get_llm_pool
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics")
+async def get_metrics():
+    """
+    공유 리소스 사용 현황
+
+    Returns:
+        - ocr_pools: OCR provider별 HTTP 커넥션 풀 통계 (failover 조합은 서킷 브레이커 상태 포함)
+        - ocr_cache: OCR 결과 캐시 hit/miss 통계
+        - ocr_scheduler: OCR 스케줄러 실행/대기 현황, 대기 시간/실행 시간 분리 통계
+        - ocr_concurrency: 적응형(AIMD) 동시 실행 상한 현황
+        - ocr_failover: 서킷 브레이커 상태 및 provider 전환/hedging 통계
+        - summarize_page_cache: SummarizePage 결과 캐시 hit/stale/miss 통계
+        - html_parse: HTML 파싱 실행기 대기/파싱 시간 통계
+        - page_prevalidation: 페이지 사전 검증 판정 경로(휴리스틱 적합/부적합, LLM 검증)별 통계
+        - llm_pool: LLM 클라이언트 풀 통계
+        - llm_cache: LLM 응답 캐시 hit/miss/coalesced 통계 (비활성화 시 빈 dict)
+        - llm_audit_log: LLM 감사 로그 writer 기록/버림 통계 (비활성화 시 빈 dict)
+        - debug_capture: 디버그 캡처 링 버퍼 통계
+    """
+    llm_cache = get_llm_cache()
+    audit_log_writer = get_audit_log_writer()
+    return {
+        "ocr_pools": get_ocr_pool_stats(),
+        "ocr_cache": get_ocr_cache().stats(),
+        "ocr_scheduler": get_ocr_scheduler().stats(),
+        "ocr_concurrency": get_ocr_concurrency_stats(),
+        "ocr_failover": get_ocr_failover_stats(),
+        "summarize_page_cache": get_result_cache().stats(),
+        "html_parse": get_parse_executor().stats(),
+        "page_prevalidation": get_page_prevalidator().stats(),
+        "llm_pool": get_llm_pool().stats(),
+        "llm_cache": llm_cache.stats() if llm_cache is not None else {},
+        "llm_audit_log": audit_log_writer.stats() if audit_log_writer is not None else {},
+        "debug_capture": get_debug_capture_store().stats(),
+    }
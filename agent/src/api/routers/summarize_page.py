@@ -1,21 +1,82 @@
 """SummarizePage 그래프 라우터"""
 
+import asyncio
+import json
 import time
+from typing import AsyncGenerator, Optional
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Header, HTTPException, Response
+from fastapi.responses import StreamingResponse
 
 from src.exceptions.base import ConfigurationError
-from src.graphs.summarize_page import create_graph
+from src.graphs.registry import get_graph
+from src.graphs.summarize_page.config import SummarizePageSettings
+from src.graphs.summarize_page.result_cache import (
+    CACHE_MISS,
+    CACHE_STALE,
+    SummarizePageResultCache,
+    get_result_cache,
+)
+from src.graphs.summarize_page.streaming import SummarizePageStream
+from src.utils.debug_capture import debug_capture
 from src.utils.logger import get_logger
 
-from ..schemas import ProductAnalysisSchema, SummarizePageRequest, SummarizePageResponse
+from ..schemas import (
+    ProductAnalysisSchema,
+    SummarizePageBatchRequest,
+    SummarizePageRequest,
+    SummarizePageResponse,
+)
 
 logger = get_logger(__name__)
 router = APIRouter(prefix="/graphs", tags=["graphs"])
+settings = SummarizePageSettings()
+
+# stale 응답 재계산 태스크 (GC 방지용 참조 유지)
+_background_tasks: set[asyncio.Task] = set()
+
+
+def _is_truthy_header(value: Optional[str]) -> bool:
+    """플래그 헤더 값 판정 ("1", "true", "yes")"""
+    return bool(value) and value.lower() in ("1", "true", "yes")
+
+
+def _should_bypass_cache(cache_control: Optional[str], x_cache_bypass: Optional[str]) -> bool:
+    """Cache-Control: no-cache / X-Cache-Bypass 헤더로 캐시 우회 여부 판단"""
+    if _is_truthy_header(x_cache_bypass):
+        return True
+    if cache_control and "no-cache" in cache_control.lower():
+        return True
+    return False
+
+
+def _cache_key(request: SummarizePageRequest) -> Optional[str]:
+    """
+    결과 캐시 키 생성
+
+    URL 정규화에 실패하는 요청(예: 범위를 벗어난 포트)은 캐시 없이 실행하도록 None 반환
+
+    Returns:
+        Optional[str]: 캐시 키 (생성할 수 없으면 None)
+    """
+    try:
+        return get_result_cache(settings).make_key(request.url, request.html_body)
+    except ValueError as e:
+        logger.warning(
+            f"SummarizePage cache key unavailable, running uncached: {str(e)}",
+            extra={"url": request.url},
+        )
+        return None
 
 
 @router.post("/summarize-page", response_model=SummarizePageResponse)
-async def execute_summarize_page(request: SummarizePageRequest):
+async def execute_summarize_page(
+    request: SummarizePageRequest,
+    response: Response,
+    cache_control: Optional[str] = Header(None),
+    x_cache_bypass: Optional[str] = Header(None),
+    x_debug_capture: Optional[str] = Header(None),
+):
     """
     SummarizePage 그래프 실행
 
@@ -24,122 +85,353 @@ async def execute_summarize_page(request: SummarizePageRequest):
     2. 이미지 필터링: LLM으로 유용한 이미지 선별
     3. 제품 분석: 텍스트와 이미지 정보로 제품 분석 수행
 
+    동일한 URL + html_body 요청은 결과 캐시에서 응답합니다.
+    (Cache-Control: no-cache 또는 X-Cache-Bypass: 1 헤더로 우회, 응답 X-Cache 헤더로 상태 확인)
+
+    debug_capture_enabled 설정 시 X-Debug-Capture: 1 헤더 요청은 결과 캐시를 우회하여 그래프를 실행하고
+    파싱된 HTML, LLM 입력 등 디버그 산출물을 수집합니다.
+    응답 X-Debug-Capture-Id 헤더의 ID로 GET /debug/captures/{capture_id}에서 조회할 수 있습니다.
+
     Returns:
         - valid_images: OCR 결과가 포함된 유효한 이미지 목록
         - product_analysis: 제품 분석 결과
     """
-    start_time = time.time()
+    debug = settings.debug_capture_enabled and _is_truthy_header(x_debug_capture)
+    key = _cache_key(request) if settings.summarize_cache_enabled else None
+    if key is None:
+        result, _ = await _run_captured(request, response, debug)
+        return result
+
+    cache = get_result_cache(settings)
+    # 디버그 캡처 요청은 캐시 hit으로 캡처가 누락되지 않도록 캐시 우회
+    if debug or _should_bypass_cache(cache_control, x_cache_bypass):
+        cache.record_bypass()
+        response.headers["X-Cache"] = "BYPASS"
+    else:
+        cached, status = await _lookup_cache(key, request)
+        response.headers["X-Cache"] = status
+        if cached is not None:
+            return cached
 
+    result, cacheable = await _run_captured(request, response, debug)
+    if cacheable:
+        await _store_result(key, result)
+    return result
+
+
+@router.post("/summarize-page/stream")
+async def stream_summarize_page(
+    request: SummarizePageRequest,
+    cache_control: Optional[str] = Header(None),
+    x_cache_bypass: Optional[str] = Header(None),
+):
+    """
+    SummarizePage 그래프 스트리밍 실행 (SSE)
+
+    전체 분석이 끝나기 전에 확정된 결과를 먼저 전송합니다.
+    결과 캐시 hit이면 done 이벤트만 바로 전송합니다.
+
+    Returns:
+        SSE 스트림 (data: JSON, type 필드로 구분)
+        - route: 라우팅 결과 (domain_type)
+        - parsed: 도메인 파서 결과 (product_name, price, thumbnail)
+        - validated: 페이지 검증 결과 (is_valid_page, error)
+        - ocr_progress: OCR 진행 상황 (completed, total)
+        - done: 최종 결과 (result: /graphs/summarize-page 응답과 동일, cache: 캐시 상태)
+        - error: 오류 메시지 (content)
+    """
+    bypass_cache = _should_bypass_cache(cache_control, x_cache_bypass)
+    return StreamingResponse(
+        _generate_summarize_events(request, bypass_cache),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+
+def _sse(event: dict) -> str:
+    """SSE data 프레임 생성"""
+    return f"data: {json.dumps(event, ensure_ascii=False)}\n\n"
+
+
+async def _generate_summarize_events(
+    request: SummarizePageRequest, bypass_cache: bool
+) -> AsyncGenerator[str, None]:
+    """그래프 진행 이벤트를 SSE 프레임으로 전송하고 마지막에 done 이벤트 전송"""
     try:
+        cache_status = None
+        key = _cache_key(request) if settings.summarize_cache_enabled else None
+        if key is not None:
+            cache = get_result_cache(settings)
+            if bypass_cache:
+                cache.record_bypass()
+                cache_status = "BYPASS"
+            else:
+                cached, cache_status = await _lookup_cache(key, request)
+                if cached is not None:
+                    yield _sse({"type": "done", "cache": cache_status, "result": cached.model_dump()})
+                    return
+
+        start_time = time.time()
         logger.info(
-            "SummarizePage graph execution started",
-            extra={
-                "url": request.url,
-                "title": request.title,
-                "html_body_length": len(request.html_body),
-            },
+            "SummarizePage streaming started",
+            extra={"url": request.url, "html_body_length": len(request.html_body)},
         )
 
-        # Request → State 변환
-        state_input = {
-            "url": request.url,
-            "title": request.title,
-            "html_body": request.html_body,
-            "og_image": request.og_image,
-            "timestamp": request.timestamp,
-        }
+        stream = SummarizePageStream(get_graph("summarize_page"), _build_state_input(request))
+        async for event in stream.events():
+            yield _sse(event)
 
-        # 그래프 실행
-        graph = create_graph()
-        result = await graph.ainvoke(state_input)
+        result = _build_response(request, stream.final_state, start_time)
+        if key is not None and _is_cacheable(stream.final_state):
+            await _store_result(key, result)
+        yield _sse({"type": "done", "cache": cache_status, "result": result.model_dump()})
+
+    except Exception as e:
+        logger.error(
+            f"SummarizePage streaming error: {str(e)}",
+            extra={"error_type": type(e).__name__, "url": request.url},
+        )
+        yield _sse({"type": "error", "content": str(e)})
+
+
+@router.post("/summarize-page/batch")
+async def batch_summarize_page(
+    request: SummarizePageBatchRequest,
+    cache_control: Optional[str] = Header(None),
+    x_cache_bypass: Optional[str] = Header(None),
+):
+    """
+    SummarizePage 배치 실행 (SSE)
+
+    여러 페이지를 최대 summarize_batch_concurrency개씩 동시에 분석하고 끝나는 순서대로 결과를 전송합니다.
+    - OCR/LLM 호출은 프로세스 전역 스케줄러와 클라이언트 풀을 다른 요청과 함께 사용
+    - 같은 URL(정규화 기준)과 html_body의 항목(결과 캐시 키가 같은 항목)은 첫 번째 항목으로 1번만 분석하여 결과를 공유
+    - URL을 정규화할 수 없는 항목은 item_error로 응답
+    - 여러 페이지에 겹치는 상세 이미지는 OCR 서비스에서 1번만 처리
+    - 항목별 결과 캐시 조회/저장은 단건 요청과 동일
+
+    Returns:
+        SSE 스트림 (data: JSON, type 필드로 구분)
+        - item: 항목 결과 (indices: 요청 items 인덱스 목록, cache: 캐시 상태, result: 단건 응답과 동일)
+        - item_error: 항목 실패 (indices, content: 오류 메시지)
+        - done: 전체 완료 (total: 항목 수, unique: 실제 분석 수, failed: 실패 항목 수)
+    """
+    if len(request.items) > settings.summarize_batch_max_items:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many items: {len(request.items)} (max {settings.summarize_batch_max_items})",
+        )
+
+    bypass_cache = _should_bypass_cache(cache_control, x_cache_bypass)
+    return StreamingResponse(
+        _generate_batch_events(request.items, bypass_cache),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
+        },
+    )
 
-        # 페이지 검증 실패 시 에러 응답
-        if not result.get("is_valid_page", False):
-            validation_error = result.get("validation_error", "페이지 검증에 실패했습니다")
+
+async def _generate_batch_events(
+    items: list[SummarizePageRequest], bypass_cache: bool
+) -> AsyncGenerator[str, None]:
+    """배치 항목을 제한된 동시성으로 실행하고 완료 순서대로 SSE 프레임 전송"""
+    # 결과 캐시 키가 같은 항목 묶기 (첫 번째 항목으로 분석)
+    # SSE 응답 시작 후이므로 키를 만들 수 없는 항목은 예외 대신 해당 항목만 실패 처리
+    groups: dict[str, list[int]] = {}
+    invalid: list[dict] = []
+    for index, item in enumerate(items):
+        try:
+            key = SummarizePageResultCache.make_key(item.url, item.html_body)
+        except ValueError as e:
             logger.warning(
-                "Page validation failed",
-                extra={
-                    "url": request.url,
-                    "error": validation_error,
-                },
+                f"SummarizePage batch item has invalid URL: {str(e)}",
+                extra={"url": item.url, "indices": [index]},
             )
-            return SummarizePageResponse(
-                url=result["url"],
-                title=result["title"],
-                error=validation_error,
-                valid_images=[],
-                product_analysis=None,
-                timestamp=result["timestamp"],
-                llm_input_content=None,
+            invalid.append(
+                {"type": "item_error", "indices": [index], "content": f"Invalid URL: {str(e)}"}
             )
+            continue
+        groups.setdefault(key, []).append(index)
 
-        # 실행 결과 상세 로깅
-        valid_images = result.get("valid_images", [])
-        product_analysis = result.get("product_analysis", {})
+    semaphore = asyncio.Semaphore(max(1, settings.summarize_batch_concurrency))
 
-        # 도메인 파서에서 추출한 thumbnail (없으면 None)
-        parsed_content = result.get("parsed_content", {})
-        thumbnail = parsed_content.get("thumbnail")
+    async def run(indices: list[int]) -> dict:
+        async with semaphore:
+            try:
+                result, cache_status = await _summarize_cached(items[indices[0]], bypass_cache)
+                return {"type": "item", "indices": indices, "cache": cache_status, "result": result.model_dump()}
+            except Exception as e:
+                content = e.detail if isinstance(e, HTTPException) else str(e)
+                logger.warning(
+                    f"SummarizePage batch item failed: {content}",
+                    extra={"url": items[indices[0]].url, "indices": indices},
+                )
+                return {"type": "item_error", "indices": indices, "content": content}
 
-        # 디버그: 유효한 이미지 정보 로깅
-        logger.debug(
-            "Valid images after filtering",
-            extra={
-                "valid_images_count": len(valid_images),
-            },
-        )
+    logger.info(
+        "SummarizePage batch started",
+        extra={"total_items": len(items), "unique_items": len(groups)},
+    )
 
-        # 디버그: 각 유효 이미지의 OCR 결과 로깅
-        for idx, img in enumerate(valid_images):
-            ocr_text = img.get("ocr_result", "")
-            logger.debug(
-                f"Valid image #{idx + 1}",
-                extra={
-                    "src": img.get("src", "")[:100],  # URL 길이 제한
-                    "alt": img.get("alt", "")[:100],
-                    "ocr_result_length": len(ocr_text),
-                    "ocr_result_preview": ocr_text[:200] if ocr_text else "[empty]",
-                },
-            )
+    tasks = [asyncio.create_task(run(indices)) for indices in groups.values()]
+    failed = len(invalid)
+    try:
+        for event in invalid:
+            yield _sse(event)
+        for next_done in asyncio.as_completed(tasks):
+            event = await next_done
+            if event["type"] == "item_error":
+                failed += len(event["indices"])
+            yield _sse(event)
+        yield _sse({"type": "done", "total": len(items), "unique": len(groups), "failed": failed})
+    finally:
+        # 클라이언트 연결 종료 시 남은 항목 취소
+        for task in tasks:
+            task.cancel()
 
-        # 제품 분석 결과 로깅
-        execution_time = time.time() - start_time
+
+async def _summarize_cached(
+    request: SummarizePageRequest, bypass_cache: bool
+) -> tuple[SummarizePageResponse, Optional[str]]:
+    """
+    결과 캐시를 거쳐 그래프 실행 (배치 항목용)
+
+    Returns:
+        tuple: (응답, 캐시 상태 - 캐시 비활성화 또는 캐시 키를 만들 수 없으면 None)
+    """
+    key = _cache_key(request) if settings.summarize_cache_enabled else None
+    if key is None:
+        result, _ = await _run_summarize_page(request)
+        return result, None
+
+    cache = get_result_cache(settings)
+    if bypass_cache:
+        cache.record_bypass()
+        cache_status = "BYPASS"
+    else:
+        cached, cache_status = await _lookup_cache(key, request)
+        if cached is not None:
+            return cached, cache_status
+
+    result, cacheable = await _run_summarize_page(request)
+    if cacheable:
+        await _store_result(key, result)
+    return result, cache_status
+
+
+async def _lookup_cache(
+    key: str, request: SummarizePageRequest
+) -> tuple[Optional[SummarizePageResponse], str]:
+    """
+    결과 캐시 조회 (stale이면 백그라운드 재계산 시작)
+
+    Returns:
+        tuple: (캐시된 응답 또는 None, 캐시 상태)
+    """
+    cache = get_result_cache(settings)
+    cached, status = await cache.get(key)
+    if cached is None:
+        return None, CACHE_MISS
+
+    if status == CACHE_STALE and cache.try_begin_refresh(key):
+        task = asyncio.create_task(_revalidate(key, request))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+
+    logger.info(
+        "SummarizePage served from cache",
+        extra={"url": request.url, "cache_status": status},
+    )
+    # 요청마다 달라지는 값은 현재 요청 기준으로 채움 (같은 html_body라도 URL의 추적 파라미터/요청 시각은 다름)
+    return (
+        SummarizePageResponse(
+            **{**cached, "url": request.url, "title": request.title, "timestamp": request.timestamp}
+        ),
+        status,
+    )
+
+
+async def _run_captured(
+    request: SummarizePageRequest, response: Response, force_capture: bool
+) -> tuple[SummarizePageResponse, bool]:
+    """디버그 캡처 범위 안에서 그래프 실행 (캡처 대상이면 X-Debug-Capture-Id 헤더 설정)"""
+    with debug_capture(request.url, force=force_capture) as capture:
+        if capture is not None:
+            response.headers["X-Debug-Capture-Id"] = capture.capture_id
+        return await _run_summarize_page(request)
+
+
+def _is_cacheable(result: dict) -> bool:
+    """
+    그래프 최종 state가 결과 캐시에 저장할 수 있는 완전한 결과인지 판정
+
+    다음 결과는 저장하지 않습니다 (다음 요청에서 다시 분석).
+    - 페이지 검증 실패
+    - LLM 분석 실패로 기본값(unknown) 분석이 반환된 결과
+    - OCR 마감 시간 초과로 일부 이미지 OCR 결과 없이 분석된 결과
+
+    Args:
+        result: 그래프 최종 state
+
+    Returns:
+        bool: 캐시 저장 가능 여부
+    """
+    return (
+        result.get("is_valid_page", False)
+        and not result.get("analysis_failed", False)
+        and not result.get("ocr_dropped_images")
+    )
+
+
+async def _store_result(key: str, result: SummarizePageResponse):
+    """응답을 결과 캐시에 저장 (저장 가능 여부는 호출 측에서 _is_cacheable로 판단)"""
+    await get_result_cache(settings).set(key, result.model_dump())
+
+
+async def _revalidate(key: str, request: SummarizePageRequest):
+    """stale 항목 백그라운드 재계산"""
+    cache = get_result_cache(settings)
+    try:
+        result, cacheable = await _run_summarize_page(request)
+        if cacheable:
+            await _store_result(key, result)
+    except Exception as e:
+        logger.warning(f"SummarizePage cache revalidation failed: {str(e)}")
+    finally:
+        cache.end_refresh(key)
+
+
+async def _run_summarize_page(request: SummarizePageRequest) -> tuple[SummarizePageResponse, bool]:
+    """
+    SummarizePage 그래프 실행 및 응답 생성
+
+    Returns:
+        tuple: (응답, 결과 캐시 저장 가능 여부)
+    """
+    start_time = time.time()
+
+    try:
         logger.info(
-            "SummarizePage graph execution completed",
+            "SummarizePage graph execution started",
             extra={
                 "url": request.url,
-                "valid_images_count": len(valid_images),
-                "product_name": product_analysis.get("product_name", "unknown"),
-                "has_price": product_analysis.get("price") != "unknown",
-                "features_count": len(product_analysis.get("key_features", [])),
-                "pros_count": len(product_analysis.get("pros", [])),
-                "cons_count": len(product_analysis.get("cons", [])),
-                "execution_time_seconds": round(execution_time, 2),
+                "title": request.title,
+                "html_body_length": len(request.html_body),
             },
         )
 
-        # 디버그: 제품 분석 상세 정보
-        logger.debug(
-            "Product analysis details",
-            extra={
-                "product_name": product_analysis.get("product_name"),
-                "summary": product_analysis.get("summary", "")[:200],
-                "price": product_analysis.get("price"),
-                "key_features": product_analysis.get("key_features", []),
-                "recommended_for": product_analysis.get("recommended_for"),
-            },
-        )
+        # 그래프 실행
+        graph = get_graph("summarize_page")
+        result = await graph.ainvoke(_build_state_input(request))
 
-        # Response 생성
-        return SummarizePageResponse(
-            url=result["url"],
-            title=result["title"],
-            thumbnail=thumbnail,
-            valid_images=valid_images,
-            product_analysis=ProductAnalysisSchema(**product_analysis),
-            timestamp=result["timestamp"],
-            llm_input_content=result.get("llm_input_content"),
-        )
+        return _build_response(request, result, start_time), _is_cacheable(result)
 
     except ConfigurationError as e:
         logger.critical(f"Configuration error: {e.message}", extra=e.details)
@@ -153,3 +445,109 @@ async def execute_summarize_page(request: SummarizePageRequest):
             extra={"error_type": type(e).__name__},
         )
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
+def _build_state_input(request: SummarizePageRequest) -> dict:
+    """Request → State 변환"""
+    return {
+        "url": request.url,
+        "title": request.title,
+        "html_body": request.html_body,
+        "og_image": request.og_image,
+        "og_type": request.og_type or "",
+        "json_ld_types": request.json_ld_types,
+        "timestamp": request.timestamp,
+    }
+
+
+def _build_response(
+    request: SummarizePageRequest, result: dict, start_time: float
+) -> SummarizePageResponse:
+    """그래프 최종 state로 응답 생성 (일반 실행 / 스트리밍 실행 공용)"""
+    # 페이지 검증 실패 시 에러 응답
+    if not result.get("is_valid_page", False):
+        validation_error = result.get("validation_error", "페이지 검증에 실패했습니다")
+        logger.warning(
+            "Page validation failed",
+            extra={
+                "url": request.url,
+                "error": validation_error,
+            },
+        )
+        return SummarizePageResponse(
+            url=result["url"],
+            title=result["title"],
+            error=validation_error,
+            valid_images=[],
+            product_analysis=None,
+            timestamp=result["timestamp"],
+            llm_input_content=None,
+        )
+
+    # 실행 결과 상세 로깅
+    valid_images = result.get("valid_images", [])
+    product_analysis = result.get("product_analysis", {})
+
+    # 도메인 파서에서 추출한 thumbnail (없으면 None)
+    parsed_content = result.get("parsed_content", {})
+    thumbnail = parsed_content.get("thumbnail")
+
+    # 디버그: 유효한 이미지 정보 로깅
+    logger.debug(
+        "Valid images after filtering",
+        extra={
+            "valid_images_count": len(valid_images),
+        },
+    )
+
+    # 디버그: 각 유효 이미지의 OCR 결과 로깅
+    for idx, img in enumerate(valid_images):
+        ocr_text = img.get("ocr_result", "")
+        logger.debug(
+            f"Valid image #{idx + 1}",
+            extra={
+                "src": img.get("src", "")[:100],  # URL 길이 제한
+                "alt": img.get("alt", "")[:100],
+                "ocr_result_length": len(ocr_text),
+                "ocr_result_preview": ocr_text[:200] if ocr_text else "[empty]",
+            },
+        )
+
+    # 제품 분석 결과 로깅
+    execution_time = time.time() - start_time
+    logger.info(
+        "SummarizePage graph execution completed",
+        extra={
+            "url": request.url,
+            "valid_images_count": len(valid_images),
+            "product_name": product_analysis.get("product_name", "unknown"),
+            "has_price": product_analysis.get("price") != "unknown",
+            "features_count": len(product_analysis.get("key_features", [])),
+            "pros_count": len(product_analysis.get("pros", [])),
+            "cons_count": len(product_analysis.get("cons", [])),
+            "execution_time_seconds": round(execution_time, 2),
+        },
+    )
+
+    # 디버그: 제품 분석 상세 정보
+    logger.debug(
+        "Product analysis details",
+        extra={
+            "product_name": product_analysis.get("product_name"),
+            "summary": product_analysis.get("summary", "")[:200],
+            "price": product_analysis.get("price"),
+            "key_features": product_analysis.get("key_features", []),
+            "recommended_for": product_analysis.get("recommended_for"),
+        },
+    )
+
+    # Response 생성
+    return SummarizePageResponse(
+        url=result["url"],
+        title=result["title"],
+        thumbnail=thumbnail,
+        valid_images=valid_images,
+        product_analysis=ProductAnalysisSchema(**product_analysis),
+        timestamp=result["timestamp"],
+        llm_input_content=result.get("llm_input_content"),
+    )
@@ -48,9 +48,21 @@ class SummarizePageRequest(BaseModel):
     title: str = Field(..., description="페이지 제목")
     html_body: str = Field(..., description="정제된 HTML body")
     og_image: Optional[str] = Field(None, description="og:image 메타 태그에서 추출한 대표 이미지 URL")
+    og_type: Optional[str] = Field(None, description="og:type 메타 태그 값 (예: product)")
+    json_ld_types: list[str] = Field(
+        default_factory=list,
+        max_length=100,
+        description="JSON-LD 구조화 데이터의 @type 목록 (정제된 html_body에는 script 태그가 없으므로 별도 전달)",
+    )
     timestamp: int = Field(..., description="추출 시각 (Unix timestamp)")
 
 
+class SummarizePageBatchRequest(BaseModel):
+    """SummarizePage 배치 요청 (여러 탭을 한 번에 분석)"""
+
+    items: list[SummarizePageRequest] = Field(..., min_length=1, description="페이지 요청 목록")
+
+
 class SummarizePageResponse(BaseModel):
     """SummarizePage 그래프 응답"""
 
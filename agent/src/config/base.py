@@ -33,6 +33,26 @@ class BaseSettings(PydanticBaseSettings):
     default_max_tokens: int = 2048
     default_llm_timeout: int = 60
 
+    # LLM 감사 로그 설정 (백그라운드 writer, logs/<날짜>/llm_audit.jsonl)
+    llm_audit_log_enabled: bool = True
+    llm_audit_log_queue_size: int = 1000  # 대기 큐 크기 (가득 차면 항목을 버림)
+    llm_audit_log_sample_rate: float = 1.0  # 성공 로그 기록 비율 (실패 로그는 항상 기록)
+    llm_audit_log_max_file_bytes: int = 50 * 1024 * 1024  # 파일 rotation 크기 (50MB)
+    llm_audit_log_compress: bool = False  # gzip 압축 여부
+
+    # 디버그 캡처 설정 (X-Debug-Capture: 1 헤더 요청 또는 샘플링된 요청만 수집)
+    # 캡처에는 html_body와 LLM 입력 원문이 포함되므로 활성화한 경우에만 수집하고 /debug 라우터를 등록
+    debug_capture_enabled: bool = False
+    debug_capture_sample_rate: float = 0.0  # 헤더 없이 캡처할 요청 비율 (0이면 헤더 요청만)
+    debug_capture_max_entries: int = 20  # 메모리에 유지할 최근 캡처 수
+    debug_capture_spill_to_disk: bool = True  # logs/debug_captures/에 백그라운드 기록 여부
+
+    # LLM 응답 캐시 설정 (opt-in: 활성화 + invoke(use_cache=True) 호출만 캐시)
+    llm_cache_enabled: bool = False
+    llm_cache_memory_max_bytes: int = 32 * 1024 * 1024  # 메모리 계층 최대 크기 (32MB)
+    llm_cache_path: str = ".cache/llm_cache.sqlite3"  # 디스크 계층 경로 (빈 문자열이면 메모리 전용)
+    llm_cache_ttl_seconds: int = 24 * 60 * 60  # 디스크 계층 TTL (1일)
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
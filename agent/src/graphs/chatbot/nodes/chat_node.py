@@ -1,13 +1,12 @@
 """챗봇 메인 노드 - LLM 호출 및 응답 생성"""
 
-import os
 import re
 from typing import Any
 
 from langchain_core.messages import AIMessage, SystemMessage
-from langchain_google_genai import ChatGoogleGenerativeAI, HarmBlockThreshold, HarmCategory
 
 from src.config.base import BaseSettings
+from src.utils.llm.pool import get_llm_pool
 from src.utils.logger import get_logger
 from src.prompts.chatbot import build_system_prompt
 from ..state import ChatbotState
@@ -16,32 +15,6 @@ logger = get_logger(__name__)
 settings = BaseSettings()
 
 
-def _create_llm_with_search() -> ChatGoogleGenerativeAI:
-    """Google Search grounding이 활성화된 Gemini LLM 생성
-
-    Returns:
-        ChatGoogleGenerativeAI 인스턴스
-    """
-    google_api_key = os.getenv("GOOGLE_API_KEY")
-    if not google_api_key:
-        raise ValueError("GOOGLE_API_KEY not found in environment variables")
-
-    # Safety filters 해제
-    safety_settings = {
-        HarmCategory.HARM_CATEGORY_HARASSMENT: HarmBlockThreshold.BLOCK_NONE,
-        HarmCategory.HARM_CATEGORY_HATE_SPEECH: HarmBlockThreshold.BLOCK_NONE,
-        HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT: HarmBlockThreshold.BLOCK_NONE,
-        HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: HarmBlockThreshold.BLOCK_NONE,
-    }
-
-    return ChatGoogleGenerativeAI(
-        model=settings.default_llm_model,
-        api_key=google_api_key,
-        temperature=0.7,
-        safety_settings=safety_settings,
-    )
-
-
 def _extract_sources_from_response(response: Any) -> list[str]:
     """LLM 응답에서 출처 정보 추출
 
@@ -158,26 +131,12 @@ async def chat_node(state: ChatbotState) -> dict:
             full_messages = [full_messages[0]] + full_messages[-(MAX_HISTORY):]
             logger.info(f"  Trimmed messages to {len(full_messages)}")
 
-        # LLM 생성 (Google Search grounding 포함)
-        llm = _create_llm_with_search()
-
-        # Google Search tool 추가
-        # Gemini 2.0 이상에서는 google_search tool 사용
-        try:
-            from google.ai.generativelanguage_v1beta.types import Tool as GenAITool
-
-            tools = [GenAITool(google_search={})]
-            logger.info("  Google Search grounding enabled")
-        except ImportError:
-            logger.warning("  Google Search grounding not available, using LLM only")
-            tools = None
+        # LLM 조회 (Google Search grounding 포함, 풀에서 재사용)
+        llm = get_llm_pool().get_search_model(settings.default_llm_model, temperature=0.7)
 
         # LLM 호출
         logger.info("  Calling LLM...")
-        if tools:
-            response = await llm.ainvoke(full_messages, tools=tools)
-        else:
-            response = await llm.ainvoke(full_messages)
+        response = await llm.ainvoke(full_messages)
 
         # 응답 내용 추출 및 인용 태그 제거
         response_content = response.content if hasattr(response, "content") else str(response)
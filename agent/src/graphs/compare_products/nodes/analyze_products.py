@@ -3,7 +3,7 @@
 from pydantic import BaseModel, Field
 
 from src.config.base import BaseSettings
-from src.utils.llm.client import LLMClient
+from src.utils.llm.pool import get_llm_client
 from src.utils.logger import get_logger
 from src.prompts.compare_products import build_analyze_products_messages
 from ..state import CompareProductsState
@@ -57,8 +57,8 @@ async def analyze_products_node(state: CompareProductsState) -> dict:
             logger.error("  No products to analyze")
             return {"extracted_criteria": []}
 
-        # LLM 클라이언트 초기화
-        llm_client = LLMClient(
+        # LLM 클라이언트 조회 (풀에서 재사용)
+        llm_client = get_llm_client(
             provider=settings.default_llm_provider,
             model=settings.default_llm_model,
             temperature=0.3,  # 일관성 중시
@@ -72,7 +72,7 @@ async def analyze_products_node(state: CompareProductsState) -> dict:
         # LLM 호출
         logger.info("  Calling LLM to extract comparison criteria...")
         result = await llm_client.invoke(
-            messages=messages, output_format=ExtractedCriteriaOutput
+            messages=messages, output_format=ExtractedCriteriaOutput, use_cache=True
         )
 
         # 결과 추출
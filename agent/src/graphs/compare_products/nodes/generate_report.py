@@ -3,7 +3,7 @@
 from pydantic import BaseModel, Field
 
 from src.config.base import BaseSettings
-from src.utils.llm.client import LLMClient
+from src.utils.llm.pool import get_llm_client
 from src.utils.logger import get_logger
 from src.prompts.compare_products import build_generate_report_messages
 from ..state import CompareProductsState, ProductComparison
@@ -81,8 +81,8 @@ async def generate_report_node(state: CompareProductsState) -> dict:
             logger.error("  Insufficient data for report generation")
             return {"comparison_report": None}
 
-        # LLM 클라이언트 초기화
-        llm_client = LLMClient(
+        # LLM 클라이언트 조회 (풀에서 재사용)
+        llm_client = get_llm_client(
             provider=settings.default_llm_provider,
             model=settings.default_llm_model,
             temperature=0.3,  # 객관적인 스펙 추출
@@ -0,0 +1,121 @@
+"""그래프 레지스트리 - 컴파일된 LangGraph를 프로세스당 1회만 생성하여 재사용"""
+
+import time
+from typing import Callable, Optional
+
+from langgraph.graph.state import CompiledStateGraph
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class GraphRegistry:
+    """컴파일된 그래프 레지스트리 (싱글톤)
+
+    요청마다 create_graph()로 StateGraph를 재구성/재컴파일하지 않도록
+    그래프 이름별로 컴파일 결과를 캐싱합니다.
+    HITL 그래프(compare_products, chatbot)는 모듈 레벨 checkpointer를 공유하므로
+    컴파일된 인스턴스를 재사용해도 thread_id 기반 상태 추적이 동일하게 동작합니다.
+    """
+
+    def __init__(self):
+        self._factories: dict[str, Callable[[], CompiledStateGraph]] = {}
+        self._graphs: dict[str, CompiledStateGraph] = {}
+
+    def register(self, name: str, factory: Callable[[], CompiledStateGraph]):
+        """
+        그래프 팩토리 등록
+
+        Args:
+            name: 그래프 이름 (예: "summarize_page")
+            factory: 컴파일된 그래프를 반환하는 함수 (각 패키지의 create_graph)
+        """
+        self._factories[name] = factory
+        self._graphs.pop(name, None)
+
+    @property
+    def names(self) -> list[str]:
+        """등록된 그래프 이름 목록"""
+        return list(self._factories)
+
+    def get(self, name: str) -> CompiledStateGraph:
+        """
+        컴파일된 그래프 반환 (최초 호출 시 1회 컴파일)
+
+        Args:
+            name: 그래프 이름
+
+        Returns:
+            CompiledStateGraph: 컴파일된 그래프
+
+        Raises:
+            KeyError: 등록되지 않은 그래프 이름인 경우
+        """
+        graph = self._graphs.get(name)
+        if graph is None:
+            if name not in self._factories:
+                raise KeyError(f"Unknown graph: {name}")
+            graph = self._factories[name]()
+            self._graphs[name] = graph
+        return graph
+
+    def warm_up(self) -> dict[str, float]:
+        """
+        등록된 모든 그래프를 미리 컴파일
+
+        Returns:
+            dict[str, float]: 그래프별 컴파일 소요 시간 (초)
+        """
+        timings: dict[str, float] = {}
+        for name in self._factories:
+            start = time.perf_counter()
+            self.get(name)
+            timings[name] = round(time.perf_counter() - start, 4)
+        logger.info(f"Compiled graphs: {timings}")
+        return timings
+
+
+# 싱글톤 인스턴스
+_registry: Optional[GraphRegistry] = None
+
+
+def get_graph_registry() -> GraphRegistry:
+    """
+    그래프 레지스트리 싱글톤 인스턴스 반환
+
+    Returns:
+        GraphRegistry: 레지스트리 인스턴스
+    """
+    global _registry
+    if _registry is None:
+        _registry = GraphRegistry()
+        _register_all_graphs(_registry)
+    return _registry
+
+
+def get_graph(name: str) -> CompiledStateGraph:
+    """
+    컴파일된 그래프 반환 (get_graph_registry().get() 단축 함수)
+
+    Args:
+        name: 그래프 이름 ("summarize_page", "compare_products", "chatbot")
+
+    Returns:
+        CompiledStateGraph: 컴파일된 그래프
+    """
+    return get_graph_registry().get(name)
+
+
+def _register_all_graphs(registry: GraphRegistry):
+    """
+    모든 그래프 등록
+
+    Args:
+        registry: 그래프를 등록할 레지스트리
+    """
+    from src.graphs import chatbot, compare_products, summarize_page
+
+    registry.register("summarize_page", summarize_page.create_graph)
+    registry.register("compare_products", compare_products.create_graph)
+    registry.register("chatbot", chatbot.create_graph)
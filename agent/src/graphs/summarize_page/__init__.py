@@ -15,7 +15,7 @@ from .state import SummarizePageState
 
 def route_by_domain(state: SummarizePageState) -> str:
     """
-    URL을 기반으로 도메인 체크하여 라우팅
+    route 노드가 결정한 domain_type으로 라우팅
 
     Args:
         state: SummarizePageState
@@ -23,12 +23,8 @@ def route_by_domain(state: SummarizePageState) -> str:
     Returns:
         str: "domain_specific" 또는 "generic"
     """
-    url = state.get("url", "")
-    registry = get_parser_registry()
-    parser = registry.get_parser(url)
-
     # generic 파서가 아니면 도메인 특화 파서 사용
-    if parser.domain_type != "generic":
+    if state.get("domain_type", "generic") != "generic":
         return "domain_specific"
     return "generic"
 
@@ -49,8 +45,17 @@ def should_continue_after_parsing(state: SummarizePageState) -> str:
 
 
 def route_node(state: SummarizePageState) -> dict:
-    """라우팅 전용 노드 - state를 변경하지 않음"""
-    return {}
+    """
+    라우팅 노드 - URL에 맞는 파서를 1회 선택하여 state에 기록
+
+    Args:
+        state: SummarizePageState
+
+    Returns:
+        dict: domain_type 업데이트 (이후 분기/도메인 파서 노드에서 재사용)
+    """
+    parser = get_parser_registry().get_parser(state.get("url", ""))
+    return {"domain_type": parser.domain_type}
 
 
 def create_graph() -> StateGraph:
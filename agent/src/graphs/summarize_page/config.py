@@ -8,6 +8,13 @@ class SummarizePageSettings(BaseSettings):
 
     # OCR Provider 설정
     ocr_provider: str = "clova"  # OCR 제공자 선택: "clova" 또는 "ocrspace"
+    ocr_fallback_provider: str = ""  # 장애 시 전환할 OCR 제공자 (빈 문자열이면 전환 없음)
+
+    # OCR 서킷 브레이커 / hedging 설정 (ocr_fallback_provider 설정 시 사용)
+    ocr_breaker_failure_threshold: int = 5  # 연속 실패 시 회로 open 임계값
+    ocr_breaker_recovery_seconds: float = 30.0  # open 후 시험 요청까지 대기 시간 (초)
+    ocr_hedging_enabled: bool = False  # primary 지연 시 secondary에 중복 요청
+    ocr_hedge_min_delay_seconds: float = 2.0  # hedge 최소 대기 시간 (p95 샘플 부족 시 사용)
 
     # OCR 엔진 설정 (OcrSpace 전용)
     ocr_engine: int = 2  # Engine 2: 자동 언어 감지, 복잡한 배경 인식 우수
@@ -16,5 +23,67 @@ class SummarizePageSettings(BaseSettings):
     ocr_is_table: bool = True  # 테이블 구조 인식 모드 (스펙표/가격표 줄바꿈 보존)
     ocr_scale: bool = False  # 업스케일링 비활성화 (처리 속도 우선)
 
-    # 병렬 처리 설정
-    ocr_max_concurrent: int = 30  # 동시 OCR 요청 최대 개수
+    # 병렬 처리 설정 (프로세스 전역 OCR 스케줄러)
+    ocr_max_concurrent: int = 30  # 프로세스 전체 동시 OCR 요청 최대 개수 (모든 요청 합산)
+    ocr_queue_max_size: int = 1000  # 슬롯 대기 작업 최대 개수 (초과 시 OCRQueueFullError)
+
+    # OCR 마감 시간 (요청 단위) - 초과 시 끝난 이미지 결과만으로 분석 진행
+    ocr_deadline_seconds: float = 20.0  # 마감 시간 (초, 0이면 모든 이미지 대기)
+    ocr_deadline_background: bool = True  # 마감 후 남은 OCR을 백그라운드에서 끝까지 실행 (캐시 저장/로깅)
+
+    # 적응형 동시 실행 제어 (AIMD) - 활성화 시 ocr_max_concurrent는 초기값으로 사용
+    ocr_adaptive_concurrency: bool = True  # 429/5xx, 지연 시간 기반 상한 자동 조정
+    ocr_concurrency_min: int = 2  # 상한 최솟값
+    ocr_concurrency_max: int = 60  # 상한 최댓값
+    ocr_concurrency_decrease_factor: float = 0.5  # 과부하 시 감소 배율
+    ocr_latency_spike_ratio: float = 2.0  # 지연 시간 기준선(EWMA) 대비 급증 판정 배율
+
+    # HTML 파싱 실행기 설정 (BeautifulSoup/lxml 파싱을 이벤트 루프 밖에서 실행)
+    parse_executor: str = "process"  # "process" | "thread" | "inline" (inline은 이벤트 루프에서 직접 실행)
+    parse_workers: int = 2  # 워커 수
+    parse_queue_max_size: int = 32  # 워커 대기 작업 최대 개수 (초과 시 ParseQueueFullError)
+
+    # OCR HTTP 커넥션 풀 설정 (서비스당 1개 클라이언트를 프로세스 전체에서 공유)
+    ocr_http2: bool = True  # HTTP/2 사용 여부 (h2 패키지 미설치 시 HTTP/1.1로 대체)
+    ocr_pool_max_connections: int = 50  # 최대 동시 커넥션 수
+    ocr_pool_max_keepalive: int = 20  # 유지할 keep-alive 커넥션 수
+    ocr_pool_keepalive_expiry: float = 30.0  # 유휴 keep-alive 커넥션 만료 시간 (초)
+
+    # OCR 결과 캐시 설정 (메모리 LRU + SQLite TTL)
+    ocr_cache_enabled: bool = True  # OCR 결과 캐시 사용 여부
+    ocr_cache_memory_max_bytes: int = 32 * 1024 * 1024  # 메모리 계층 최대 크기 (32MB)
+    ocr_cache_path: str = ".cache/ocr_cache.sqlite3"  # 디스크 계층 경로 (빈 문자열이면 메모리 전용)
+    ocr_cache_ttl_seconds: int = 7 * 24 * 60 * 60  # 디스크 계층 TTL (7일)
+
+    # Clova OCR 배치 설정 (V2 images 배열에 여러 이미지를 담아 요청)
+    # Clova 문서상 현재 요청당 이미지 1개만 지원하므로 기본값은 1 (지원 범위 확대 시 상향)
+    clova_batch_size: int = 1  # 요청당 최대 이미지 수
+    clova_batch_max_bytes: int = 64 * 1024  # 요청 바디 images 배열 최대 크기 (바이트)
+
+    # SummarizePage 결과 캐시 설정 (URL + html_body 해시 + 파서/프롬프트 버전)
+    summarize_cache_enabled: bool = True  # 결과 캐시 사용 여부
+    summarize_cache_ttl_seconds: int = 6 * 60 * 60  # 결과 유효 시간 (6시간)
+    summarize_cache_stale_seconds: int = 24 * 60 * 60  # TTL 이후 stale 응답 허용 시간 (재계산은 백그라운드)
+    summarize_cache_memory_max_bytes: int = 64 * 1024 * 1024  # 메모리 계층 최대 크기 (64MB)
+    summarize_cache_path: str = ".cache/summarize_page_cache.sqlite3"  # 디스크 계층 경로 (빈 문자열이면 메모리 전용)
+
+    # SummarizePage 배치 요청 설정 (/graphs/summarize-page/batch)
+    summarize_batch_max_items: int = 20  # 요청당 최대 페이지 수
+    summarize_batch_concurrency: int = 3  # 배치 내 동시 실행 페이지 수 (OCR/LLM 동시 실행 상한은 프로세스 전역 설정 공유)
+
+    # 근사 중복 텍스트 제거 (리뷰/반복 배너 OCR 등 거의 같은 텍스트를 프롬프트 구성 전에 제거)
+    text_dedup_enabled: bool = True  # 근사 중복 제거 사용 여부
+    text_dedup_threshold: float = 0.7  # 근사 중복으로 판정할 유사도 (단어 bigram Jaccard, 0~1)
+
+    # 제품 분석 프롬프트 토큰 예산 (텍스트/OCR/리뷰를 우선순위 순으로 예산만큼 포함)
+    analyze_prompt_token_budget: int = 12000  # 입력 데이터 토큰 예산 (0이면 제한 없음)
+
+    # 프롬프트 입력 인코딩 ("csv": 행마다 tag/position 포함, "grouped": 섹션별 묶음, "compact": 줄 단위)
+    analyze_prompt_encoding: str = "csv"  # analyze_product 텍스트/OCR 인코딩
+    validate_prompt_encoding: str = "csv"  # validate_page 텍스트 인코딩
+
+    # 페이지 사전 검증 (휴리스틱으로 명확한 페이지는 validate_page LLM 호출 생략)
+    prevalidation_enabled: bool = True  # 사전 검증 사용 여부
+    prevalidation_listing_min_prices: int = 10  # 리스팅 페이지로 의심할 최소 가격 텍스트 수
+    prevalidation_listing_price_ratio: float = 0.15  # 리스팅 페이지로 의심할 가격 텍스트 비율
+    prevalidation_invalid_max_texts: int = 15  # 제품 신호 없이 부적합으로 판정할 최대 텍스트 수 (초과 시 LLM 검증)
@@ -4,4 +4,7 @@ from .registry import get_parser_registry
 from .base import BaseDomainParser
 from ..state import ParsedContent
 
-__all__ = ["get_parser_registry", "BaseDomainParser", "ParsedContent"]
+# 파서 버전 - 파싱/추출 결과가 달라지는 변경 시 올려야 이전 결과 캐시가 재사용되지 않음
+PARSER_VERSION = "1"
+
+__all__ = ["get_parser_registry", "BaseDomainParser", "ParsedContent", "PARSER_VERSION"]
@@ -1,6 +1,9 @@
 """도메인별 파서 베이스 클래스 및 인터페이스"""
 
 from abc import ABC, abstractmethod
+from typing import Union
+
+from src.utils.html_document import HTMLDocument
 
 from ..state import ParsedContent, ExtractedText, ExtractedImage
 
@@ -8,6 +11,11 @@ from ..state import ParsedContent, ExtractedText, ExtractedImage
 class BaseDomainParser(ABC):
     """도메인별 파서 베이스 클래스"""
 
+    # 레지스트리 색인용 호스트 (서브도메인 포함 매칭, 비어 있으면 can_parse로 순차 검사)
+    hosts: tuple[str, ...] = ()
+    # 호스트 내 경로 prefix (비어 있으면 호스트 전체)
+    path_prefixes: tuple[str, ...] = ()
+
     @abstractmethod
     def can_parse(self, url: str) -> bool:
         """
@@ -26,7 +34,7 @@ class BaseDomainParser(ABC):
         self,
         url: str,
         title: str,
-        html_body: str,
+        html_body: Union[str, HTMLDocument],
     ) -> ParsedContent:
         """
         페이지 파싱 로직 실행
@@ -34,7 +42,7 @@ class BaseDomainParser(ABC):
         Args:
             url: 페이지 URL
             title: 페이지 제목
-            html_body: 정제된 HTML body
+            html_body: 정제된 HTML body (문자열 또는 요청 단위로 1회 파싱된 HTMLDocument)
 
         Returns:
             ParsedContent: 파싱 결과
@@ -8,14 +8,28 @@ HTML에서 제품 정보를 추출하는 함수들
 """
 
 import re
+from typing import Optional
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
+from lxml import etree
+
+from src.utils.html_document import element_text, xpath_all, xpath_first, xpath_has_class
 
 from ...state import ExtractedText, ExtractedImage
 
+# ========== 추출 영역 (컴파일된 XPath) ==========
+# 페이지 전체를 BeautifulSoup 트리로 만들지 않고 lxml 트리에서 필요한 영역만 조회
+
+_PRODUCT_NAME_XPATH = etree.XPath(f"(//h1[{xpath_has_class('product-title')}])[1]")
+_FINAL_PRICE_XPATH = etree.XPath(f"(//div[{xpath_has_class('final-price-amount')}])[1]")
+_PRICE_XPATH = etree.XPath(f"(//div[{xpath_has_class('price-amount')}])[1]")
+_THUMBNAIL_XPATH = etree.XPath('(//img[@alt="Product image"])[1]')
+_REVIEW_SPANS_XPATH = etree.XPath(f"//span[{xpath_has_class('twc-bg-white')}]")
+# div.product-detail-content 안의 이미지
+_DESCRIPTION_IMAGES_XPATH = etree.XPath(f"(//div[{xpath_has_class('product-detail-content')}])[1]//img")
+
 
-def extract_product_name(soup: BeautifulSoup, title: str) -> str:
+def extract_product_name(tree: Optional[etree._Element], title: str) -> str:
     """
     제품명 추출
 
@@ -24,23 +38,23 @@ def extract_product_name(soup: BeautifulSoup, title: str) -> str:
     2. Fallback: 페이지 title
 
     Args:
-        soup: BeautifulSoup 객체
+        tree: lxml 트리 (HTMLDocument.tree)
         title: 페이지 제목
 
     Returns:
         str: 제품명
     """
     # h1.product-title에서 추출
-    h1 = soup.find("h1", class_="product-title")
-    if h1:
-        text = h1.get_text(strip=True)
+    h1 = xpath_first(_PRODUCT_NAME_XPATH, tree)
+    if h1 is not None:
+        text = element_text(h1)
         if text:
             return text
 
     return title
 
 
-def extract_price(soup: BeautifulSoup) -> str:
+def extract_price(tree: Optional[etree._Element]) -> str:
     """
     가격 추출
 
@@ -49,25 +63,25 @@ def extract_price(soup: BeautifulSoup) -> str:
     2. div.price-amount (일반 가격)
 
     Args:
-        soup: BeautifulSoup 객체
+        tree: lxml 트리 (HTMLDocument.tree)
 
     Returns:
         str: 가격 문자열 (예: "1,990원")
     """
     # final-price-amount 우선
-    price_elem = soup.find("div", class_="final-price-amount")
-    if not price_elem:
-        price_elem = soup.find("div", class_="price-amount")
+    price_elem = xpath_first(_FINAL_PRICE_XPATH, tree)
+    if price_elem is None:
+        price_elem = xpath_first(_PRICE_XPATH, tree)
 
-    if price_elem:
-        text = price_elem.get_text(strip=True)
+    if price_elem is not None:
+        text = element_text(price_elem)
         if text:
             return text
 
     return ""
 
 
-def extract_thumbnail(soup: BeautifulSoup, base_url: str) -> str:
+def extract_thumbnail(tree: Optional[etree._Element], base_url: str) -> str:
     """
     대표 이미지(썸네일) URL 추출
 
@@ -75,14 +89,14 @@ def extract_thumbnail(soup: BeautifulSoup, base_url: str) -> str:
     1. alt="Product image" 속성을 가진 img 태그
 
     Args:
-        soup: BeautifulSoup 객체
+        tree: lxml 트리 (HTMLDocument.tree)
         base_url: 기준 URL
 
     Returns:
         str: 썸네일 이미지 URL
     """
-    product_img = soup.find("img", alt="Product image")
-    if product_img:
+    product_img = xpath_first(_THUMBNAIL_XPATH, tree)
+    if product_img is not None:
         src = product_img.get("src") or product_img.get("data-src")
         if src:
             return urljoin(base_url, src)
@@ -90,15 +104,15 @@ def extract_thumbnail(soup: BeautifulSoup, base_url: str) -> str:
     return ""
 
 
-def extract_review_texts(soup: BeautifulSoup) -> list[ExtractedText]:
+def extract_review_texts(tree: Optional[etree._Element]) -> list[ExtractedText]:
     """
     리뷰 텍스트 추출
 
     span.twc-bg-white 요소에서 리뷰 본문 텍스트 추출
-    br 태그는 공백으로 치환
+    텍스트 노드별로 strip하여 이어 붙임 (br 태그는 무시)
 
     Args:
-        soup: BeautifulSoup 객체
+        tree: lxml 트리 (HTMLDocument.tree)
 
     Returns:
         list[ExtractedText]: 리뷰 텍스트 배열
@@ -108,14 +122,11 @@ def extract_review_texts(soup: BeautifulSoup) -> list[ExtractedText]:
     position = 0
 
     # span.twc-bg-white 요소들에서 리뷰 본문 추출
-    review_spans = soup.find_all("span", class_="twc-bg-white")
+    review_spans = xpath_all(_REVIEW_SPANS_XPATH, tree)
 
     for span in review_spans:
-        # br 태그를 공백으로 치환
-        for br in span.find_all("br"):
-            br.replace_with(" ")
-
-        text = span.get_text(strip=True)
+        # br 태그는 텍스트가 없으므로 strip 후 이어 붙이면 제거됨 (트리는 수정하지 않음)
+        text = element_text(span)
         # 연속 공백 정리
         text = re.sub(r"\s+", " ", text)
 
@@ -134,14 +145,14 @@ def extract_review_texts(soup: BeautifulSoup) -> list[ExtractedText]:
     return texts
 
 
-def extract_description_images(soup: BeautifulSoup, base_url: str) -> list[ExtractedImage]:
+def extract_description_images(tree: Optional[etree._Element], base_url: str) -> list[ExtractedImage]:
     """
     제품 상세 설명 이미지 추출
 
     div.product-detail-content 안의 img 태그들 추출
 
     Args:
-        soup: BeautifulSoup 객체
+        tree: lxml 트리 (HTMLDocument.tree)
         base_url: 기준 URL
 
     Returns:
@@ -150,12 +161,9 @@ def extract_description_images(soup: BeautifulSoup, base_url: str) -> list[Extra
     images: list[ExtractedImage] = []
     seen_urls: set[str] = set()
 
-    detail_content = soup.find("div", class_="product-detail-content")
-    if not detail_content:
-        return images
-
+    # 컨테이너가 없으면 빈 목록
     idx = 0
-    for img in detail_content.find_all("img"):
+    for img in xpath_all(_DESCRIPTION_IMAGES_XPATH, tree):
         src = img.get("src") or img.get("data-src") or ""
 
         # base64 이미지 제외
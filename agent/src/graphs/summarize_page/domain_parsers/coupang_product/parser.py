@@ -1,8 +1,9 @@
 """쿠팡 상품 파서"""
 
 import logging
+from typing import Union
 
-from bs4 import BeautifulSoup
+from src.utils.html_document import HTMLDocument
 
 from ..base import BaseDomainParser
 from ...state import ParsedContent
@@ -20,6 +21,9 @@ logger = logging.getLogger(__name__)
 class CoupangProductParser(BaseDomainParser):
     """쿠팡 상품 파서 (coupang.com/vp/products)"""
 
+    hosts = ("coupang.com",)
+    path_prefixes = ("/vp/products",)
+
     @property
     def domain_type(self) -> str:
         return "coupang"
@@ -32,31 +36,32 @@ class CoupangProductParser(BaseDomainParser):
         self,
         url: str,
         title: str,
-        html_body: str,
+        html_body: Union[str, HTMLDocument],
     ) -> ParsedContent:
         """
         쿠팡 상품 페이지 파싱
 
         파싱 전략:
-        CSS selector 기반 직접 파싱으로 제품명, 가격, 썸네일, 리뷰 추출
+        컴파일된 XPath로 필요한 영역만 조회하여 제품명, 가격, 썸네일, 리뷰 추출
         이미지는 div.product-detail-content 하위에서 추출
 
         Args:
             url: 페이지 URL
             title: 페이지 제목
-            html_body: HTML body
+            html_body: HTML body (문자열 또는 파싱된 HTMLDocument)
 
         Returns:
             ParsedContent: 파싱 결과
         """
-        soup = BeautifulSoup(html_body, "lxml")
+        # lxml 트리에서 필요한 영역만 조회 (페이지 전체 BeautifulSoup 트리는 생성하지 않음)
+        tree = HTMLDocument.of(html_body).tree
 
         # 각 필드 추출
-        product_name = extract_product_name(soup, title)
-        price = extract_price(soup)
-        thumbnail = extract_thumbnail(soup, url)
-        description_texts = extract_review_texts(soup)
-        description_images = extract_description_images(soup, url)
+        product_name = extract_product_name(tree, title)
+        price = extract_price(tree)
+        thumbnail = extract_thumbnail(tree, url)
+        description_texts = extract_review_texts(tree)
+        description_images = extract_description_images(tree, url)
 
         logger.info(
             f"CoupangProductParser: product_name={product_name[:30] if product_name else ''}..., price={price}"
@@ -1,7 +1,10 @@
 """일반 페이지 파서 (Fallback)"""
 
+from typing import Union
+
 from ..base import BaseDomainParser
 from ...state import ParsedContent, ExtractedText
+from src.utils.html_document import HTMLDocument
 from src.utils.html_parser import HTMLContentExtractor
 
 
@@ -20,7 +23,7 @@ class GenericParser(BaseDomainParser):
         self,
         url: str,
         title: str,
-        html_body: str,
+        html_body: Union[str, HTMLDocument],
     ) -> ParsedContent:
         """
         일반 페이지 파싱
@@ -36,7 +39,7 @@ class GenericParser(BaseDomainParser):
         Args:
             url: 페이지 URL
             title: 페이지 제목
-            html_body: 정제된 HTML body
+            html_body: 정제된 HTML body (문자열 또는 파싱된 HTMLDocument)
 
         Returns:
             ParsedContent: 파싱 결과
@@ -6,14 +6,30 @@ HTML에서 제품 정보를 추출하는 함수들
 """
 
 import re
+from typing import Optional
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
+from lxml import etree
+
+from src.utils.html_document import element_text, xpath_all, xpath_first, xpath_has_class
 
 from ...state import ExtractedText, ExtractedImage
 
+# ========== 추출 영역 (컴파일된 XPath) ==========
+# 페이지 전체를 BeautifulSoup 트리로 만들지 않고 lxml 트리에서 필요한 영역만 조회
+
+# div#content 내부의 첫 번째 h3 (상품명 영역)
+_PRODUCT_NAME_XPATH = etree.XPath('((//*[@id="content"])[1]//h3)[1]')
+# "상품 가격" blind 라벨 (형제 요소에 숫자 + "원")
+_PRICE_LABEL_XPATH = etree.XPath(f"(//span[{xpath_has_class('blind')}][. = '상품 가격'])[1]")
+_THUMBNAIL_XPATH = etree.XPath('(//img[@alt="대표이미지"])[1]')
+# #REVIEW 영역의 리뷰 아이템
+_REVIEW_ITEMS_XPATH = etree.XPath('(//*[@id="REVIEW"])[1]//li')
+# 상세 설명 컨테이너(div.se-main-container)의 본문 이미지
+_DESCRIPTION_IMAGES_XPATH = etree.XPath(f"(//div[{xpath_has_class('se-main-container')}])[1]//img[{xpath_has_class('se-image-resource')}]")
+
 
-def extract_product_name(soup: BeautifulSoup, title: str) -> str:
+def extract_product_name(tree: Optional[etree._Element], title: str) -> str:
     """
     제품명 추출
 
@@ -22,20 +38,18 @@ def extract_product_name(soup: BeautifulSoup, title: str) -> str:
     2. Fallback: 페이지 title
 
     Args:
-        soup: BeautifulSoup 객체
+        tree: lxml 트리 (HTMLDocument.tree)
         title: 페이지 제목
 
     Returns:
         str: 제품명
     """
     # div#content 내부의 첫 번째 h3 태그에서 상품명 추출
-    content = soup.find(id="content")
-    if content:
-        h3 = content.find("h3")
-        if h3:
-            text = h3.get_text(strip=True)
-            if text and len(text) > 5:
-                return text
+    h3 = xpath_first(_PRODUCT_NAME_XPATH, tree)
+    if h3 is not None:
+        text = element_text(h3)
+        if text and len(text) > 5:
+            return text
 
     # Fallback: 페이지 title에서 스토어명 제거
     if title and " : " in title:
@@ -44,35 +58,42 @@ def extract_product_name(soup: BeautifulSoup, title: str) -> str:
     return title
 
 
-def extract_price(soup: BeautifulSoup) -> str:
+def extract_price(tree: Optional[etree._Element], html: Optional[str] = None) -> str:
     """
     가격 추출
 
     전략:
     1. "상품 가격" 라벨 다음의 숫자 + 원 조합
-    2. HTML에서 정규표현식으로 가격 패턴 추출
+    2. 가격 영역(라벨의 부모 요소) HTML에서 정규표현식으로 가격 패턴 추출
 
     Args:
-        soup: BeautifulSoup 객체
+        tree: lxml 트리 (HTMLDocument.tree)
+        html: 원본 HTML 문자열 (가격 라벨이 없을 때만 정규표현식 검색에 사용)
 
     Returns:
         str: 가격 문자열 (예: "22,000원")
     """
     # 1. "상품 가격" blind 라벨 다음의 형제 요소에서 추출
-    price_label = soup.find("span", class_="blind", string="상품 가격")
-    if price_label:
+    price_label = xpath_first(_PRICE_LABEL_XPATH, tree)
+    if price_label is not None:
         # 다음 형제 요소들에서 숫자와 "원" 조합
         price_num = ""
-        for sibling in price_label.find_next_siblings():
-            text = sibling.get_text(strip=True)
+        for sibling in price_label.itersiblings():
+            # 주석 노드 제외
+            if not isinstance(sibling.tag, str):
+                continue
+            text = element_text(sibling)
             if text.replace(",", "").isdigit():
                 price_num = text
             elif text == "원" and price_num:
                 return f"{price_num}원"
 
-    # 2. HTML 문자열에서 정규표현식으로 추출
+    # 2. 가격 영역(라벨이 없으면 원본 HTML)에서 정규표현식으로 추출
     # 패턴: >숫자,숫자</span><span ...>원<
-    html_str = str(soup)
+    if price_label is not None:
+        html_str = etree.tostring(price_label.getparent(), encoding="unicode", method="html", with_tail=False)
+    else:
+        html_str = html or ""
     price_pattern = re.compile(r'>(\d{1,3}(?:,\d{3})+|\d+)</span><span[^>]*>원<')
     match = price_pattern.search(html_str)
     if match:
@@ -81,7 +102,7 @@ def extract_price(soup: BeautifulSoup) -> str:
     return ""
 
 
-def extract_thumbnail(soup: BeautifulSoup, base_url: str) -> str:
+def extract_thumbnail(tree: Optional[etree._Element], base_url: str) -> str:
     """
     대표 이미지(썸네일) URL 추출
 
@@ -89,15 +110,15 @@ def extract_thumbnail(soup: BeautifulSoup, base_url: str) -> str:
     1. alt="대표이미지" 속성을 가진 img 태그
 
     Args:
-        soup: BeautifulSoup 객체
+        tree: lxml 트리 (HTMLDocument.tree)
         base_url: 기준 URL
 
     Returns:
         str: 썸네일 이미지 URL
     """
     # alt="대표이미지" 속성으로 찾기
-    img = soup.find("img", alt="대표이미지")
-    if img:
+    img = xpath_first(_THUMBNAIL_XPATH, tree)
+    if img is not None:
         src = img.get("src") or img.get("data-src")
         if src:
             return urljoin(base_url, src)
@@ -105,7 +126,7 @@ def extract_thumbnail(soup: BeautifulSoup, base_url: str) -> str:
     return ""
 
 
-def extract_review_texts(soup: BeautifulSoup) -> list[ExtractedText]:
+def extract_review_texts(tree: Optional[etree._Element]) -> list[ExtractedText]:
     """
     리뷰 텍스트 추출
 
@@ -113,7 +134,7 @@ def extract_review_texts(soup: BeautifulSoup) -> list[ExtractedText]:
     각 리뷰 li에서 가장 긴 텍스트 블록만 추출 (실제 리뷰 내용)
 
     Args:
-        soup: BeautifulSoup 객체
+        tree: lxml 트리 (HTMLDocument.tree)
 
     Returns:
         list[ExtractedText]: 리뷰 텍스트 배열
@@ -122,21 +143,16 @@ def extract_review_texts(soup: BeautifulSoup) -> list[ExtractedText]:
     seen_texts: set[str] = set()  # 중복 제거용
     position = 0
 
-    # #REVIEW 영역 찾기 (안정적인 ID)
-    review_section = soup.find(id="REVIEW")
-    if not review_section:
-        return texts
-
-    # 리뷰 아이템들 (li 태그)
-    review_items = review_section.find_all("li")
+    # #REVIEW 영역의 리뷰 아이템들 (li 태그, 영역이 없으면 빈 목록)
+    review_items = xpath_all(_REVIEW_ITEMS_XPATH, tree)
 
     for item in review_items:
         # 각 li에서 가장 긴 텍스트 블록을 찾음 (실제 리뷰 내용)
         longest_text = ""
-        for element in item.find_all(["div", "span"]):
+        for element in item.iterdescendants("div", "span"):
             # 자식 요소가 없는 말단 노드만 검사
-            if element.find(["div", "span"]) is None:
-                text = element.get_text(strip=True)
+            if next(element.iterdescendants("div", "span"), None) is None:
+                text = element_text(element)
                 if text and len(text) > len(longest_text):
                     longest_text = text
 
@@ -161,14 +177,14 @@ def extract_review_texts(soup: BeautifulSoup) -> list[ExtractedText]:
     return texts
 
 
-def extract_description_images(soup: BeautifulSoup, base_url: str) -> list[ExtractedImage]:
+def extract_description_images(tree: Optional[etree._Element], base_url: str) -> list[ExtractedImage]:
     """
     제품 상세 설명 이미지 추출
 
     div.se-main-container 내부의 img.se-image-resource 추출
 
     Args:
-        soup: BeautifulSoup 객체
+        tree: lxml 트리 (HTMLDocument.tree)
         base_url: 기준 URL (상대 경로 변환용)
 
     Returns:
@@ -176,28 +192,24 @@ def extract_description_images(soup: BeautifulSoup, base_url: str) -> list[Extra
     """
     images: list[ExtractedImage] = []
 
-    # 상세 설명 컨테이너 찾기
-    detail_container = soup.find("div", class_="se-main-container")
-
-    if detail_container:
-        # se-image-resource 클래스의 이미지만 추출
-        img_tags = detail_container.find_all("img", class_="se-image-resource")
-        for idx, img in enumerate(img_tags):
-            src = img.get("src") or img.get("data-src")
-            if not src:
-                continue
-
-            absolute_url = urljoin(base_url, src)
-
-            images.append(
-                ExtractedImage(
-                    src=absolute_url,
-                    alt=img.get("alt", ""),
-                    width=parse_dimension(img.get("width")),
-                    height=parse_dimension(img.get("height")),
-                    position=float(idx),
-                )
+    # 상세 설명 컨테이너의 se-image-resource 클래스 이미지만 추출
+    img_tags = xpath_all(_DESCRIPTION_IMAGES_XPATH, tree)
+    for idx, img in enumerate(img_tags):
+        src = img.get("src") or img.get("data-src")
+        if not src:
+            continue
+
+        absolute_url = urljoin(base_url, src)
+
+        images.append(
+            ExtractedImage(
+                src=absolute_url,
+                alt=img.get("alt", ""),
+                width=parse_dimension(img.get("width")),
+                height=parse_dimension(img.get("height")),
+                position=float(idx),
             )
+        )
 
     return images
 
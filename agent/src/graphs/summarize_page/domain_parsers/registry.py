@@ -1,18 +1,68 @@
 """파서 레지스트리 - 도메인별 파서 선택 및 관리"""
 
 import logging
+from functools import lru_cache
 from typing import Optional
+from urllib.parse import urlsplit
 
 from .base import BaseDomainParser
 
 logger = logging.getLogger(__name__)
 
+# URL -> 파서 라우팅 결과 메모이제이션 크기
+_ROUTE_CACHE_SIZE = 1024
+
+
+class _PathTrie:
+    """경로 세그먼트 기반 prefix trie (가장 긴 prefix에 등록된 파서 반환)"""
+
+    def __init__(self):
+        self.children: dict[str, "_PathTrie"] = {}
+        self.parser: Optional[BaseDomainParser] = None
+
+    def insert(self, segments: list[str], parser: BaseDomainParser):
+        node = self
+        for segment in segments:
+            node = node.children.setdefault(segment, _PathTrie())
+        # 같은 prefix는 먼저 등록된 파서 우선
+        if node.parser is None:
+            node.parser = parser
+
+    def longest_match(self, segments: list[str]) -> Optional[BaseDomainParser]:
+        node = self
+        matched = node.parser
+        for segment in segments:
+            node = node.children.get(segment)
+            if node is None:
+                break
+            if node.parser is not None:
+                matched = node.parser
+        return matched
+
+
+def _split_path(path: str) -> list[str]:
+    """경로를 세그먼트 목록으로 변환 ("/vp/products/1" -> ["vp", "products", "1"])"""
+    return [segment for segment in path.split("/") if segment]
+
 
 class ParserRegistry:
-    """파서 레지스트리 (싱글톤)"""
+    """파서 레지스트리 (싱글톤)
+
+    파서가 선언한 hosts / path_prefixes로 호스트 맵 + 경로 prefix trie를 구성하여
+    URL을 1회 분해한 뒤 호스트 suffix 조회(서브도메인 포함)와 경로 trie 탐색만으로 파서를 선택합니다.
+    hosts를 선언하지 않은 파서는 기존처럼 can_parse()로 순차 검사합니다.
+    URL별 선택 결과는 메모이제이션되며, 매칭이 없으면 GenericParser 싱글톤을 반환합니다.
+    """
 
     def __init__(self):
         self._parsers: list[BaseDomainParser] = []
+        self._by_domain_type: dict[str, BaseDomainParser] = {}
+        # host -> 경로 trie
+        self._host_index: dict[str, _PathTrie] = {}
+        # hosts 미선언 파서 (can_parse 순차 검사)
+        self._unindexed: list[BaseDomainParser] = []
+        self._fallback: Optional[BaseDomainParser] = None
+        self._route = lru_cache(maxsize=_ROUTE_CACHE_SIZE)(self._resolve)
 
     def register(self, parser: BaseDomainParser):
         """
@@ -22,6 +72,28 @@ class ParserRegistry:
             parser: 등록할 파서 인스턴스
         """
         self._parsers.append(parser)
+        self._by_domain_type.setdefault(parser.domain_type, parser)
+
+        if parser.hosts:
+            prefixes = parser.path_prefixes or ("",)
+            for host in parser.hosts:
+                trie = self._host_index.setdefault(host.lower(), _PathTrie())
+                for prefix in prefixes:
+                    trie.insert(_split_path(prefix), parser)
+        else:
+            self._unindexed.append(parser)
+
+        self._route.cache_clear()
+
+    @property
+    def fallback(self) -> BaseDomainParser:
+        """매칭 파서가 없을 때 사용하는 GenericParser (싱글톤)"""
+        if self._fallback is None:
+            from .generic import GenericParser
+
+            self._fallback = GenericParser()
+            self._by_domain_type.setdefault(self._fallback.domain_type, self._fallback)
+        return self._fallback
 
     def get_parser(self, url: str) -> BaseDomainParser:
         """
@@ -33,16 +105,46 @@ class ParserRegistry:
         Returns:
             BaseDomainParser: 매칭된 파서 (없으면 GenericParser)
         """
-        for parser in self._parsers:
+        return self._route(url)
+
+    def get_parser_by_domain_type(self, domain_type: str) -> BaseDomainParser:
+        """
+        라우팅 결과(domain_type)로 파서 반환 (URL 재분석 없음)
+
+        Args:
+            domain_type: 파서 도메인 타입 (예: "naver_brand", "generic")
+
+        Returns:
+            BaseDomainParser: 해당 파서 (등록되지 않은 타입이면 GenericParser)
+        """
+        return self._by_domain_type.get(domain_type) or self.fallback
+
+    def _resolve(self, url: str) -> BaseDomainParser:
+        """URL 분해 후 호스트 맵 / 경로 trie / 미색인 파서 순으로 파서 선택"""
+        parts = urlsplit(url if "//" in url else f"//{url}")
+        host = (parts.hostname or "").lower()
+
+        # 호스트 suffix 조회 (m.brand.naver.com -> brand.naver.com -> naver.com)
+        if self._host_index and host:
+            segments = _split_path(parts.path)
+            labels = host.split(".")
+            for i in range(len(labels) - 1):
+                trie = self._host_index.get(".".join(labels[i:]))
+                if trie is None:
+                    continue
+                parser = trie.longest_match(segments)
+                if parser is not None:
+                    logger.debug(f"Selected parser: {parser.__class__.__name__} for domain_type={parser.domain_type}")
+                    return parser
+
+        for parser in self._unindexed:
             if parser.can_parse(url):
-                logger.info(f"Selected parser: {parser.__class__.__name__} for domain_type={parser.domain_type}")
+                logger.debug(f"Selected parser: {parser.__class__.__name__} for domain_type={parser.domain_type}")
                 return parser
 
         # Fallback: Generic Parser
-        from .generic import GenericParser
-
-        logger.info("No matching parser found, using GenericParser")
-        return GenericParser()
+        logger.debug("No matching parser found, using GenericParser")
+        return self.fallback
 
 
 # 싱글톤 인스턴스
@@ -1,6 +1,6 @@
 """SummarizePage 그래프 전용 예외"""
 
-from src.exceptions.base import ExternalAPIError, ValidationError
+from src.exceptions.base import AgentBaseException, ExternalAPIError, ValidationError
 
 
 class OCRError(ExternalAPIError):
@@ -21,6 +21,18 @@ class OCRParseError(OCRError):
     pass
 
 
+class OCRQueueFullError(OCRError):
+    """OCR 스케줄러 대기열 초과 (과부하)"""
+
+    pass
+
+
+class ParseQueueFullError(AgentBaseException):
+    """HTML 파싱 실행기 대기열 초과 (과부하)"""
+
+    pass
+
+
 class ImageValidationError(ValidationError):
     """이미지 유효성 검증 실패"""
 
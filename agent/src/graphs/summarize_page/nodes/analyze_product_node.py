@@ -1,23 +1,25 @@
 """제품 분석 노드 - LLM을 사용하여 텍스트와 이미지 정보로부터 제품 분석 수행"""
 
 import json
-import os
 import re
-from datetime import datetime
-from pathlib import Path
 from typing import List
 
 from langchain_core.messages import HumanMessage, SystemMessage
-from langchain_google_genai import ChatGoogleGenerativeAI, HarmBlockThreshold, HarmCategory
 from pydantic import BaseModel, Field
 
-from src.config.base import BaseSettings
 from src.prompts import analyze_product
-from src.utils.llm.client import LLMClient
+from src.prompts.token_budget import fit_to_budget
+from src.utils.debug_capture import capture_artifact
+from src.utils.llm.pool import get_llm_client, get_llm_pool
 from src.utils.logger import get_logger
+from src.utils.near_duplicates import NearDuplicateFilter
 
+from ..config import SummarizePageSettings
 from ..state import ExtractedImage, ExtractedText, ProductAnalysis, SummarizePageState
 
+logger = get_logger(__name__)
+settings = SummarizePageSettings()
+
 
 def extract_pure_content(texts: List[ExtractedText], images: List[ExtractedImage]) -> str:
     """순수 텍스트 내용만 추출 (CSV 헤더, 형식 설명, 구분자 모두 제외)
@@ -46,13 +48,6 @@ def extract_pure_content(texts: List[ExtractedText], images: List[ExtractedImage
 
     return "\n".join(lines)
 
-logger = get_logger(__name__)
-settings = BaseSettings()
-
-# logs 디렉토리 경로 (agent/logs/)
-LOGS_DIR = Path(__file__).parent.parent.parent.parent.parent / "logs"
-LOGS_DIR.mkdir(exist_ok=True)
-
 
 class ProductAnalysisOutput(BaseModel):
     """LLM 출력 - 제품 분석 결과"""
@@ -124,6 +119,53 @@ class ProductAnalysisOutput(BaseModel):
     )
 
 
+def build_structured_texts(parsed_content: dict) -> List[ExtractedText]:
+    """도메인 특화 파서 결과를 ExtractedText 리스트로 변환
+
+    Args:
+        parsed_content: 도메인 파서 결과 (product_name, price, description_texts)
+
+    Returns:
+        List[ExtractedText]: 제품명(h1), 가격(h2), 설명 텍스트 순의 텍스트 리스트
+    """
+    texts: List[ExtractedText] = []
+
+    # 제품명 추가 (h1 태그로)
+    product_name = parsed_content.get("product_name", "")
+    if product_name and product_name != "TODO":
+        texts.append({"content": f"제품명: {product_name}", "tagName": "h1", "position": 0})
+
+    # 가격 추가 (h2 태그로)
+    price = parsed_content.get("price", "")
+    if price and price != "TODO":
+        texts.append({"content": f"가격: {price}", "tagName": "h2", "position": 100})
+
+    # 텍스트 설명/특징 추가 (description_texts는 list[ExtractedText] 형식)
+    texts.extend(parsed_content.get("description_texts", []))
+    return texts
+
+
+def remove_near_duplicates(
+    texts: List[ExtractedText], images: List[ExtractedImage], threshold: float
+) -> tuple[List[ExtractedText], List[ExtractedImage], dict]:
+    """근사 중복 텍스트/OCR 결과 제거 (텍스트를 먼저 남기고, 텍스트와 겹치는 OCR 결과는 제거)
+
+    Args:
+        texts: 추출된 텍스트 리스트
+        images: OCR 결과가 포함된 이미지 리스트
+        threshold: 근사 중복으로 판정할 유사도 (0~1)
+
+    Returns:
+        tuple: (남은 텍스트, 남은 이미지, 제거 통계)
+    """
+    near_duplicates = NearDuplicateFilter(threshold=threshold)
+    kept_texts = [text for text in texts if near_duplicates.add(text.get("content", ""))]
+    kept_images = [
+        image
+        for image in images
+        if not image.get("ocr_result", "").strip() or near_duplicates.add(image["ocr_result"])
+    ]
+    return kept_texts, kept_images, near_duplicates.stats()
 
 
 def create_default_analysis() -> ProductAnalysis:
@@ -146,32 +188,6 @@ def create_default_analysis() -> ProductAnalysis:
 # ============================================================================
 
 
-def _create_llm_with_search() -> ChatGoogleGenerativeAI:
-    """Google Search grounding이 활성화된 Gemini LLM 생성
-
-    Returns:
-        ChatGoogleGenerativeAI 인스턴스
-    """
-    google_api_key = os.getenv("GOOGLE_API_KEY")
-    if not google_api_key:
-        raise ValueError("GOOGLE_API_KEY not found in environment variables")
-
-    # Safety filters 해제
-    safety_settings = {
-        HarmCategory.HARM_CATEGORY_HARASSMENT: HarmBlockThreshold.BLOCK_NONE,
-        HarmCategory.HARM_CATEGORY_HATE_SPEECH: HarmBlockThreshold.BLOCK_NONE,
-        HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT: HarmBlockThreshold.BLOCK_NONE,
-        HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: HarmBlockThreshold.BLOCK_NONE,
-    }
-
-    return ChatGoogleGenerativeAI(
-        model=settings.default_llm_model,
-        api_key=google_api_key,
-        temperature=0.5,
-        safety_settings=safety_settings,
-    )
-
-
 def _parse_json_from_response(response_content: str) -> dict:
     """LLM 응답에서 JSON 추출 및 파싱
 
@@ -208,8 +224,8 @@ async def _analyze_with_web_search(title: str, url: str, page_text: str = "") ->
         logger.info(f"  Page text length: {len(page_text)} chars")
 
     try:
-        # 1. Google Search grounding이 활성화된 LLM 생성
-        llm = _create_llm_with_search()
+        # 1. Google Search grounding이 활성화된 LLM 조회 (풀에서 재사용)
+        llm = get_llm_pool().get_search_model(settings.default_llm_model, temperature=0.5)
 
         # 2. 프롬프트 구성 (페이지 텍스트 포함)
         messages = analyze_product.build_web_search_messages(title, url, page_text)
@@ -218,24 +234,11 @@ async def _analyze_with_web_search(title: str, url: str, page_text: str = "") ->
             HumanMessage(content=messages[1]["content"]),
         ]
 
-        # 3. Google Search tool 추가
-        try:
-            from google.ai.generativelanguage_v1beta.types import Tool as GenAITool
-
-            tools = [GenAITool(google_search={})]
-            logger.info("    Google Search grounding enabled")
-        except ImportError:
-            logger.warning("    Google Search grounding not available")
-            tools = None
-
-        # 4. LLM 호출
+        # 3. LLM 호출 (google_search tool은 풀에서 바인딩됨)
         logger.info("    Calling LLM with web search...")
-        if tools:
-            response = await llm.ainvoke(full_messages, tools=tools)
-        else:
-            response = await llm.ainvoke(full_messages)
+        response = await llm.ainvoke(full_messages)
 
-        # 5. 응답 파싱
+        # 4. 응답 파싱
         response_content = response.content if hasattr(response, "content") else str(response)
         logger.info(f"    Response length: {len(response_content)} chars")
 
@@ -253,7 +256,7 @@ async def _analyze_with_web_search(title: str, url: str, page_text: str = "") ->
             if not web_search_queries and not grounding_chunks:
                 logger.warning("    No web search grounding detected - LLM may have used internal knowledge only")
 
-        # 6. JSON 추출 및 ProductAnalysis 변환
+        # 5. JSON 추출 및 ProductAnalysis 변환
         try:
             result_dict = _parse_json_from_response(response_content)
 
@@ -299,8 +302,11 @@ async def analyze_product_node(state: SummarizePageState) -> dict:
             logger.info("  Using web search based analysis for generic parser")
             page_url = state.get("url", "")
 
-            # 페이지 텍스트 추출 (parsed_content.texts에서)
+            # 페이지 텍스트 추출 (parsed_content.texts에서, 근사 중복 제거)
             texts = parsed_content.get("texts", [])
+            if settings.text_dedup_enabled:
+                texts, _, dedup_stats = remove_near_duplicates(texts, [], settings.text_dedup_threshold)
+                logger.info(f"  Dedup: {dedup_stats}")
             page_text_lines = []
             for text in sorted(texts, key=lambda t: t.get("position", 0)):
                 content = text.get("content", "").strip()
@@ -316,29 +322,17 @@ async def analyze_product_node(state: SummarizePageState) -> dict:
             # llm_input_content: 페이지 텍스트 포함
             llm_input_content = f"제품명: {page_title}\nURL: {page_url}\n\n{page_text}"
 
-            return {"product_analysis": product_analysis, "llm_input_content": llm_input_content}
+            return {
+                "product_analysis": product_analysis,
+                "llm_input_content": llm_input_content,
+                # 웹 검색 분석은 실패 시 기본값 분석을 반환
+                "analysis_failed": product_analysis == create_default_analysis(),
+            }
 
         # 2. 도메인 특화 파서: 기존 로직 사용
         else:
             # 도메인 특화 파서: 구조화된 데이터를 ExtractedText 형태로 변환
-            texts = []
-
-            # 제품명 추가 (h1 태그로)
-            product_name = parsed_content.get("product_name", "")
-            if product_name and product_name != "TODO":
-                texts.append(
-                    {"content": f"제품명: {product_name}", "tagName": "h1", "position": 0}
-                )
-
-            # 가격 추가 (h2 태그로)
-            price = parsed_content.get("price", "")
-            if price and price != "TODO":
-                texts.append({"content": f"가격: {price}", "tagName": "h2", "position": 100})
-
-            # 텍스트 설명/특징 추가
-            # description_texts는 이제 list[ExtractedText] 형식
-            description_texts = parsed_content.get("description_texts", [])
-            texts.extend(description_texts)
+            texts = build_structured_texts(parsed_content)
 
             # 도메인 특화 파서의 경우 images는 이미 OCR이 수행된 상태
             # parsed_content의 description_images와 state의 images는 동일
@@ -350,33 +344,41 @@ async def analyze_product_node(state: SummarizePageState) -> dict:
         # 입력 데이터 검증
         if not texts and not images:
             logger.warning("  No data available, returning default analysis")
-            return {"product_analysis": create_default_analysis(), "llm_input_content": ""}
+            return {
+                "product_analysis": create_default_analysis(),
+                "llm_input_content": "",
+                "analysis_failed": True,
+            }
 
-        # 2. 프롬프트 구성 및 입력 데이터 저장
-        messages = analyze_product.build_messages(texts, images, page_title)
+        # 2. 근사 중복 제거 및 토큰 예산 적용 (제목/가격/스펙 -> 설명 -> OCR -> 리뷰 순으로 포함)
+        if settings.text_dedup_enabled:
+            texts, images, dedup_stats = remove_near_duplicates(
+                texts, images, settings.text_dedup_threshold
+            )
+            logger.info(f"  Dedup: {dedup_stats}")
+
+        budgeted = fit_to_budget(texts, images, settings.analyze_prompt_token_budget)
+        texts, images = budgeted.texts, budgeted.images
+        if budgeted.dropped_count:
+            logger.warning(
+                f"  Prompt budget: dropped {budgeted.dropped_count} items ({budgeted.dropped_tokens} tokens)",
+                extra={
+                    "token_budget": settings.analyze_prompt_token_budget,
+                    "used_tokens": budgeted.used_tokens,
+                    "dropped": budgeted.dropped,
+                },
+            )
 
-        # 디버깅: LLM 입력 데이터를 logs/YYYY-MM-DD/processed_source.txt에 저장
-        try:
-            today = datetime.now().strftime("%Y-%m-%d")
-            date_dir = LOGS_DIR / today
-            date_dir.mkdir(exist_ok=True)
-
-            processed_source_path = date_dir / "processed_source.txt"
-            # user 메시지에서 CSV 데이터 추출 (messages[1]이 user prompt)
-            user_prompt = messages[1]["content"]
-
-            with open(processed_source_path, "w", encoding="utf-8") as f:
-                f.write(f"# LLM Input Data for analyze_product_node\n")
-                f.write(f"# Timestamp: {datetime.now().isoformat()}\n")
-                f.write(f"# Domain Type: {domain_type}\n\n")
-                f.write(user_prompt)
-
-            logger.info(f"  Saved LLM input data to: {processed_source_path}")
-        except Exception as e:
-            logger.warning(f"  Failed to save processed source: {e}")
-
-        # 3. LLM 호출 (structured output)
-        llm_client = LLMClient(
+        # 3. 프롬프트 구성 및 입력 데이터 저장
+        messages = analyze_product.build_messages(
+            texts, images, page_title, encoding=settings.analyze_prompt_encoding
+        )
+
+        # 디버그 캡처: LLM 입력 데이터 (user 메시지, 캡처 요청인 경우에만 보관)
+        capture_artifact("processed_source.txt", messages[1]["content"])
+
+        # 4. LLM 호출 (structured output, 풀에서 클라이언트 재사용)
+        llm_client = get_llm_client(
             provider=settings.default_llm_provider,
             model=settings.default_llm_model,
             temperature=0.5,
@@ -389,7 +391,7 @@ async def analyze_product_node(state: SummarizePageState) -> dict:
             output_format=ProductAnalysisOutput,
         )
 
-        # 4. Pydantic 모델을 TypedDict로 변환
+        # 5. Pydantic 모델을 TypedDict로 변환
         product_analysis: ProductAnalysis = {
             "product_name": result.product_name,
             "summary": result.summary,
@@ -410,12 +412,20 @@ async def analyze_product_node(state: SummarizePageState) -> dict:
             f"Pros: {len(result.pros)}, Cons: {len(result.cons)}"
         )
 
-        # 5. 순수 텍스트 내용 추출 (Extension 저장용)
+        # 6. 순수 텍스트 내용 추출 (Extension 저장용)
         llm_input_content = extract_pure_content(texts, images)
 
-        return {"product_analysis": product_analysis, "llm_input_content": llm_input_content}
+        return {
+            "product_analysis": product_analysis,
+            "llm_input_content": llm_input_content,
+            "analysis_failed": False,
+        }
 
     except Exception as e:
         logger.error(f"✗ Analyze product node failed: {str(e)}")
         logger.warning("  Fallback: returning default analysis")
-        return {"product_analysis": create_default_analysis(), "llm_input_content": ""}
+        return {
+            "product_analysis": create_default_analysis(),
+            "llm_input_content": "",
+            "analysis_failed": True,
+        }
@@ -3,6 +3,7 @@
 from src.utils.logger import get_logger
 
 from ..domain_parsers import get_parser_registry
+from ..parse_executor import get_parse_executor
 from ..state import SummarizePageState, ParsedContent
 
 logger = get_logger(__name__)
@@ -27,15 +28,14 @@ async def domain_parser_node(state: SummarizePageState) -> dict:
         logger.info(f"  URL: {url}")
         logger.info(f"  HTML body length: {len(html_body)} chars")
 
-        # 1. 파서 레지스트리에서 적절한 파서 선택
-        registry = get_parser_registry()
-        parser = registry.get_parser(url)
+        # 1. route 노드의 라우팅 결과 사용 (없으면 URL로 선택)
+        domain_type = state.get("domain_type") or get_parser_registry().get_parser(url).domain_type
 
-        logger.info(f"  Selected Parser: {parser.domain_type}")
+        logger.info(f"  Selected Parser: {domain_type}")
 
-        # 2. 파서 실행
-        parsed_content: ParsedContent = parser.parse(
-            url=url, title=title, html_body=html_body
+        # 2. 파서 실행 (이벤트 루프를 막지 않도록 워커 풀에서 실행, html_body는 1회만 파싱)
+        parsed_content: ParsedContent = await get_parse_executor().parse_domain(
+            url=url, title=title, html_body=html_body, domain_type=domain_type
         )
 
         logger.info(f"  Output: domain_type={parsed_content.get('domain_type')}")
@@ -7,6 +7,7 @@ from src.utils.logger import get_logger
 
 from ..config import SummarizePageSettings
 from ..state import SummarizePageState
+from ..streaming import EVENT_OCR_PROGRESS, get_progress_writer
 
 logger = get_logger(__name__)
 settings = SummarizePageSettings()
@@ -33,9 +34,19 @@ async def ocr_node(state: SummarizePageState) -> dict:
             logger.info("  No images to process, skipping OCR")
             return {"images": []}
 
-        # OCR 서비스로 모든 이미지 처리
+        # OCR 서비스로 모든 이미지 처리 (스트리밍 실행 시 진행 상황 전송)
+        # 마감 시간을 넘긴 이미지는 OCR 결과 없이 분석으로 넘김
+        write_progress = get_progress_writer()
         ocr_service = get_ocr_service(settings)
-        processed_images = await ocr_service.process_images(images)
+        dropped_images: list = []
+        processed_images = await ocr_service.process_images(
+            images,
+            on_progress=lambda completed, total: write_progress(
+                {"type": EVENT_OCR_PROGRESS, "completed": completed, "total": total}
+            ),
+            deadline=settings.ocr_deadline_seconds or None,
+            on_dropped=dropped_images.extend,
+        )
 
         # 통계 로깅
         ocr_texts = [
@@ -51,10 +62,14 @@ async def ocr_node(state: SummarizePageState) -> dict:
                 "successful_extractions": len(ocr_texts),
                 "total_characters": total_chars,
                 "avg_chars_per_image": total_chars // len(ocr_texts) if ocr_texts else 0,
+                "dropped_images": len(dropped_images),
             },
         )
 
-        return {"images": processed_images}
+        return {
+            "images": processed_images,
+            "ocr_dropped_images": [image["src"] for image in dropped_images],
+        }
 
     except ConfigurationError as e:
         # 설정 오류는 fail fast
@@ -1,25 +1,19 @@
 """HTML 파싱 노드 - HTML에서 texts와 images를 추출"""
 
-from datetime import datetime
-from pathlib import Path
-
-from src.utils.html_parser import HTMLContentExtractor
+from src.utils.debug_capture import capture_artifact
 from src.utils.logger import get_logger
 
+from ..parse_executor import get_parse_executor
 from ..state import ParsedContent, SummarizePageState
 
 logger = get_logger(__name__)
 
-# logs 디렉토리 경로 (agent/logs/)
-LOGS_DIR = Path(__file__).parent.parent.parent.parent.parent / "logs"
-LOGS_DIR.mkdir(exist_ok=True)
-
 
 async def parse_content_node(state: SummarizePageState) -> dict:
     """
     HTML body에서 texts와 images를 추출하는 노드
 
-    HTMLContentExtractor를 사용하여:
+    HTMLContentExtractor를 사용하여 (파싱 실행기 워커에서 html_body를 1회만 파싱):
     - texts: Leaf node 방식으로 추출 (중복 자동 제거)
     - images: 모든 이미지 추출
 
@@ -31,25 +25,14 @@ async def parse_content_node(state: SummarizePageState) -> dict:
     """
     try:
         url = state["url"]
-        title = state["title"]
         html_body = state["html_body"]
 
         logger.info(f"━━━ Parse Content Node ━━━")
         logger.info(f"  URL: {url}")
         logger.info(f"  HTML body length: {len(html_body)} chars")
 
-        # 디버깅: Readability로 추출된 HTML을 logs/YYYY-MM-DD/parsed.html에 저장
-        today = datetime.now().strftime("%Y-%m-%d")
-        date_dir = LOGS_DIR / today
-        date_dir.mkdir(exist_ok=True)
-
-        parsed_html_path = date_dir / "parsed.html"
-        with open(parsed_html_path, "w", encoding="utf-8") as f:
-            f.write(f"<!-- URL: {url} -->\n")
-            f.write(f"<!-- Title: {title} -->\n")
-            f.write(f"<!-- Timestamp: {datetime.now().isoformat()} -->\n\n")
-            f.write(html_body)
-        logger.info(f"  Saved parsed HTML to: {parsed_html_path}")
+        # 디버그 캡처: Readability로 추출된 HTML (캡처 요청인 경우에만 보관)
+        capture_artifact("parsed.html", html_body)
 
         # 입력 데이터 검증
         if not html_body or len(html_body.strip()) < 100:
@@ -59,20 +42,9 @@ async def parse_content_node(state: SummarizePageState) -> dict:
                 "validation_error": "제품 정보를 찾을 수 없습니다",
             }
 
-        # 1. texts 추출 (Leaf Node 방식)
-        texts = HTMLContentExtractor.extract_texts(
-            html_body=html_body,
-            min_length=0,  # 길이 제한 제거하여 가격 등 짧은 텍스트 포함
-            base_url=url,
-        )
-
-        # 2. images 추출
-        images = HTMLContentExtractor.extract_images(
-            html_body=html_body,
-            base_url=url,
-            min_width=100,
-            min_height=100,
-        )
+        # 1. texts 추출 (Leaf Node 방식) + 2. images 추출
+        # CPU 바운드 파싱은 이벤트 루프를 막지 않도록 워커 풀에서 실행
+        texts, images = await get_parse_executor().extract_content(url, html_body)
 
         logger.info(f"  Extracted: {len(texts)} texts, {len(images)} images")
 
@@ -1,15 +1,16 @@
 """페이지 검증 노드 - LLM을 사용하여 texts CSV로 페이지가 제품 분석에 적합한지 검증"""
 
-from src.config.base import BaseSettings
 from src.prompts import validate_page
 from src.prompts.validate_page import ValidationResult
-from src.utils.llm.client import LLMClient
+from src.utils.llm.pool import get_llm_client
 from src.utils.logger import get_logger
 
+from ..config import SummarizePageSettings
+from ..prevalidator import PREVALIDATION_AMBIGUOUS, PREVALIDATION_VALID, get_page_prevalidator
 from ..state import SummarizePageState
 
 logger = get_logger(__name__)
-settings = BaseSettings()
+settings = SummarizePageSettings()
 
 
 async def validate_page_node(state: SummarizePageState) -> dict:
@@ -18,6 +19,7 @@ async def validate_page_node(state: SummarizePageState) -> dict:
 
     parse_content_node에서 추출된 texts를 CSV 형식으로 LLM에 전달하여
     단일 제품 상세 페이지인지 검증합니다.
+    휴리스틱 사전 검증으로 명확히 판정되는 페이지는 LLM을 호출하지 않습니다.
 
     Args:
         state: SummarizePageState (parsed_content 필요)
@@ -43,10 +45,31 @@ async def validate_page_node(state: SummarizePageState) -> dict:
                 "validation_error": "제품 정보를 찾을 수 없습니다",
             }
 
+        # 휴리스틱 사전 검증 (명확한 페이지는 LLM 호출 생략)
+        if settings.prevalidation_enabled:
+            prevalidation = get_page_prevalidator(settings).classify(
+                state.get("html_body", ""),
+                texts,
+                og_type=state.get("og_type"),
+                json_ld_types=state.get("json_ld_types", []),
+            )
+            logger.info(
+                f"  Prevalidation: {prevalidation.decision}",
+                extra={"signals": prevalidation.signals},
+            )
+            if prevalidation.decision != PREVALIDATION_AMBIGUOUS:
+                is_valid = prevalidation.decision == PREVALIDATION_VALID
+                return {
+                    "is_valid_page": is_valid,
+                    "validation_error": "" if is_valid else prevalidation.error_message,
+                }
+
         # LLM으로 페이지 검증 (CSV 입력)
-        messages = validate_page.build_messages(url, title, texts)
+        messages = validate_page.build_messages(
+            url, title, texts, encoding=settings.validate_prompt_encoding
+        )
 
-        llm_client = LLMClient(
+        llm_client = get_llm_client(
             provider=settings.default_llm_provider,
             model=settings.default_llm_model,
             temperature=0.3,  # 검증은 결정적이어야 하므로 낮은 temperature
@@ -57,6 +80,7 @@ async def validate_page_node(state: SummarizePageState) -> dict:
         result: ValidationResult = await llm_client.invoke(
             messages=messages,
             output_format=ValidationResult,
+            use_cache=True,
         )
 
         logger.info(
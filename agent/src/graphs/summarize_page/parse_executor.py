@@ -0,0 +1,313 @@
+"""HTML 파싱 실행기 - CPU 바운드 파싱을 이벤트 루프 밖의 워커 풀에서 실행
+
+parse_content_node / domain_parser_node는 async 노드지만 BeautifulSoup/lxml 파싱은
+동기 CPU 작업이라 대형 페이지에서는 수백 ms 동안 이벤트 루프를 점유합니다.
+파싱 작업을 워커 풀(기본: 프로세스 풀)로 보내 그동안 SSE 스트림 등 다른 요청이 진행되도록 합니다.
+
+- 워커 입력: url/title/html_body 문자열, 출력: 추출 결과 dict/list (파싱 트리는 워커 밖으로 나오지 않음)
+- 대기 작업 수 제한 (초과 시 ParseQueueFullError)
+- 대기 시간(queue wait, IPC 포함)과 파싱 시간(parse time)을 분리하여 집계
+- 워커 프로세스가 비정상 종료(OOM, lxml segfault 등)되면 풀을 새로 만들어 1회 재시도
+"""
+
+import asyncio
+import multiprocessing
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional
+
+from src.utils.logger import get_logger
+
+from .exceptions import ParseQueueFullError
+from .state import ExtractedImage, ExtractedText, ParsedContent
+
+logger = get_logger(__name__)
+
+# 통계용 최근 샘플 수
+_SAMPLE_SIZE = 1000
+
+SUPPORTED_EXECUTORS = ("process", "thread", "inline")
+
+
+def _percentile(samples: deque, percentile: float) -> float:
+    """최근 샘플의 백분위수 (ms)"""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(len(ordered) * percentile))
+    return round(ordered[index] * 1000, 2)
+
+
+# ========== Worker Functions (프로세스 풀에서 pickle 가능하도록 모듈 레벨 정의) ==========
+
+
+def _timed(fn: Callable, *args) -> tuple[Any, float]:
+    """워커 안에서 fn 실행 후 (결과, 파싱 소요 시간) 반환"""
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def _extract_content(url: str, html_body: str) -> tuple[list[ExtractedText], list[ExtractedImage]]:
+    """generic 경로 - html_body에서 texts/images 추출 (1회 파싱 공유)"""
+    from src.utils.html_document import HTMLDocument
+    from src.utils.html_parser import HTMLContentExtractor
+
+    document = HTMLDocument(html_body)
+    texts = HTMLContentExtractor.extract_texts(
+        html_body=document,
+        min_length=0,  # 길이 제한 제거하여 가격 등 짧은 텍스트 포함
+        base_url=url,
+    )
+    images = HTMLContentExtractor.extract_images(
+        html_body=document,
+        base_url=url,
+        min_width=100,
+        min_height=100,
+    )
+    return texts, images
+
+
+def _parse_domain(url: str, title: str, html_body: str, domain_type: str) -> ParsedContent:
+    """도메인 특화 경로 - 라우팅된 domain_type의 파서 실행"""
+    from src.utils.html_document import HTMLDocument
+
+    from .domain_parsers import get_parser_registry
+
+    parser = get_parser_registry().get_parser_by_domain_type(domain_type)
+    return parser.parse(url=url, title=title, html_body=HTMLDocument(html_body))
+
+
+def _noop() -> None:
+    """워커 기동용 빈 작업"""
+    return None
+
+
+# ========== Executor ==========
+
+
+class ParseExecutor:
+    """HTML 파싱 실행기 (싱글톤)"""
+
+    def __init__(self, mode: str = "process", workers: int = 2, max_queue_size: int = 32):
+        """
+        Args:
+            mode: "process" | "thread" | "inline"
+            workers: 워커 수
+            max_queue_size: 워커 대기 작업 최대 개수
+
+        Raises:
+            ValueError: 지원하지 않는 mode인 경우
+        """
+        if mode not in SUPPORTED_EXECUTORS:
+            raise ValueError(f"Unsupported parse executor: {mode} (supported: {SUPPORTED_EXECUTORS})")
+
+        self.mode = mode
+        self.workers = max(1, workers)
+        self.max_queue_size = max_queue_size
+        self._executor: Optional[Executor] = None
+        self._in_flight = 0
+
+        # 통계
+        self.peak_in_flight = 0
+        self.total_completed = 0
+        self.total_failed = 0
+        self.total_rejected = 0
+        self.pool_restarts = 0
+        self._queue_waits: deque[float] = deque(maxlen=_SAMPLE_SIZE)
+        self._parse_times: deque[float] = deque(maxlen=_SAMPLE_SIZE)
+
+    def _get_executor(self) -> Optional[Executor]:
+        """워커 풀 (최초 사용 시 생성, inline 모드는 None)"""
+        if self._executor is None and self.mode != "inline":
+            if self.mode == "process":
+                # fork는 부모의 스레드/이벤트 루프 상태를 복제하므로 spawn 사용
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="html-parse"
+                )
+        return self._executor
+
+    def _discard_broken_executor(self, executor: Executor):
+        """
+        비정상 종료된 워커 풀 폐기 (다음 _get_executor 호출에서 새 풀 생성)
+
+        같은 풀에서 동시에 실패한 요청이 이미 새로 만든 풀을 폐기하지 않도록 현재 풀인 경우에만 폐기합니다.
+        """
+        if self._executor is not executor:
+            return
+        executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = None
+        self.pool_restarts += 1
+
+    async def _execute(self, fn: Callable, *args) -> tuple[Any, float]:
+        """
+        워커 풀(inline 모드는 현재 스레드)에서 fn 실행 후 (결과, 파싱 시간) 반환
+
+        워커 풀이 깨진 경우(BrokenProcessPool) 새 풀로 1회 재시도합니다.
+        재시도도 실패하면(해당 페이지가 워커를 종료시키는 경우) 풀을 다시 폐기하고 예외를 전달합니다.
+        """
+        for attempt in range(2):
+            executor = self._get_executor()
+            if executor is None:
+                return _timed(fn, *args)
+            try:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(executor, _timed, fn, *args)
+            except BrokenProcessPool:
+                self._discard_broken_executor(executor)
+                logger.warning(
+                    "HTML parse worker pool is broken, restarting",
+                    extra={"attempt": attempt + 1, "pool_restarts": self.pool_restarts},
+                )
+                if attempt == 1:
+                    raise
+
+    async def _run(self, fn: Callable, *args) -> Any:
+        """
+        워커 풀에서 fn 실행
+
+        Raises:
+            ParseQueueFullError: 실행 + 대기 작업 수가 workers + max_queue_size에 도달한 경우
+        """
+        if self._in_flight >= self.workers + self.max_queue_size:
+            self.total_rejected += 1
+            raise ParseQueueFullError(
+                "HTML parse queue is full",
+                details={
+                    "in_flight": self._in_flight,
+                    "workers": self.workers,
+                    "max_queue_size": self.max_queue_size,
+                },
+            )
+
+        self._in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self._in_flight)
+        start = time.perf_counter()
+        try:
+            result, parse_time = await self._execute(fn, *args)
+        except Exception:
+            self.total_failed += 1
+            raise
+        finally:
+            self._in_flight -= 1
+
+        self.total_completed += 1
+        self._parse_times.append(parse_time)
+        self._queue_waits.append(max(0.0, time.perf_counter() - start - parse_time))
+        return result
+
+    async def extract_content(
+        self, url: str, html_body: str
+    ) -> tuple[list[ExtractedText], list[ExtractedImage]]:
+        """
+        generic 경로 texts/images 추출
+
+        Args:
+            url: 페이지 URL (상대 경로 처리용)
+            html_body: 정제된 HTML body
+
+        Returns:
+            tuple: (텍스트 목록, 이미지 목록)
+        """
+        return await self._run(_extract_content, url, html_body)
+
+    async def parse_domain(
+        self, url: str, title: str, html_body: str, domain_type: str
+    ) -> ParsedContent:
+        """
+        도메인 특화 파서 실행
+
+        Args:
+            url: 페이지 URL
+            title: 페이지 제목
+            html_body: HTML body
+            domain_type: route 노드가 선택한 파서의 domain_type
+
+        Returns:
+            ParsedContent: 파싱 결과
+        """
+        return await self._run(_parse_domain, url, title, html_body, domain_type)
+
+    async def warm_up(self):
+        """워커를 미리 기동 (프로세스 풀은 첫 요청의 spawn/import 비용 제거)"""
+        executor = self._get_executor()
+        if executor is None:
+            return
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            *(loop.run_in_executor(executor, _noop) for _ in range(self.workers))
+        )
+
+    def shutdown(self):
+        """워커 풀 종료"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> dict:
+        """
+        실행기 현황
+
+        Returns:
+            dict: 모드, 실행+대기 작업 수, 대기 시간/파싱 시간 백분위수(ms) 등
+        """
+        return {
+            "mode": self.mode,
+            "workers": self.workers,
+            "in_flight": self._in_flight,
+            "max_queue_size": self.max_queue_size,
+            "peak_in_flight": self.peak_in_flight,
+            "total_completed": self.total_completed,
+            "total_failed": self.total_failed,
+            "total_rejected": self.total_rejected,
+            "pool_restarts": self.pool_restarts,
+            "queue_wait_p50_ms": _percentile(self._queue_waits, 0.5),
+            "queue_wait_p95_ms": _percentile(self._queue_waits, 0.95),
+            "parse_time_p50_ms": _percentile(self._parse_times, 0.5),
+            "parse_time_p95_ms": _percentile(self._parse_times, 0.95),
+        }
+
+
+# 싱글톤 인스턴스
+_executor: Optional[ParseExecutor] = None
+
+
+def get_parse_executor(settings=None) -> ParseExecutor:
+    """
+    HTML 파싱 실행기 싱글톤 인스턴스 반환
+
+    Args:
+        settings: SummarizePageSettings 인스턴스 (최초 생성 시에만 사용, 생략 시 기본 설정)
+
+    Returns:
+        ParseExecutor: 실행기 인스턴스
+    """
+    global _executor
+    if _executor is None:
+        if settings is None:
+            from .config import SummarizePageSettings
+
+            settings = SummarizePageSettings()
+
+        _executor = ParseExecutor(
+            mode=settings.parse_executor,
+            workers=settings.parse_workers,
+            max_queue_size=settings.parse_queue_max_size,
+        )
+    return _executor
+
+
+def close_parse_executor():
+    """워커 풀 종료 (lifespan shutdown 시 호출)"""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown()
+        logger.info("Closed HTML parse executor", extra=_executor.stats())
+    _executor = None
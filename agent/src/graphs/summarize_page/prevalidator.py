@@ -0,0 +1,242 @@
+"""페이지 사전 검증 - LLM 호출 없이 명확한 페이지를 먼저 판정
+
+validate_page_node는 texts CSV 전체를 LLM에 보내 단일 제품 상세 페이지인지(bool)만 판단합니다.
+값싼 신호로 명확히 적합/부적합한 페이지는 로컬에서 판정하고, 애매한 페이지만 LLM 검증으로 넘깁니다.
+
+신호:
+- JSON-LD @type Product/Offer (목록: ItemList 등), og:type=product
+  (Extension이 html_body 정제 전에 수집하여 요청 필드로 전달 - 정제된 html_body에는 script/meta 태그가 없음)
+- HTML 내 가격 패턴, 장바구니/구매 버튼 문구 (텍스트 추출에서 빠지는 버튼/분리된 가격 span 포함)
+- 텍스트 중 가격 패턴 개수와 비율 (리스팅 페이지는 가격이 많이 반복됨)
+- 텍스트 개수, 비제품 유형(og:type=article, JSON-LD Article 등)
+  (신호를 찾지 못한 것만으로는 부적합 판정하지 않음 - 짧은 페이지이거나 비제품 유형일 때만 부적합)
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Optional, Sequence
+
+from .state import ExtractedText
+
+# 판정 결과
+PREVALIDATION_VALID = "valid"
+PREVALIDATION_INVALID = "invalid"
+PREVALIDATION_AMBIGUOUS = "ambiguous"
+
+# 제품 정보가 없는 페이지 에러 메시지 (LLM 검증 프롬프트의 "제품 정보 부족"과 동일)
+NO_PRODUCT_ERROR = "제품 정보를 찾을 수 없습니다"
+
+# ========== 신호 패턴 ==========
+
+# JSON-LD @type (Extension이 중첩 객체의 @type까지 수집)
+_PRODUCT_TYPES = frozenset({"Product", "ProductGroup", "Offer", "AggregateOffer"})
+_LISTING_TYPES = frozenset({"ItemList", "SearchResultsPage", "CollectionPage", "OfferCatalog"})
+
+# 비제품 페이지 유형 (뉴스/블로그/프로필 등 - 부적합 판정의 적극적 근거)
+_NON_PRODUCT_TYPES = frozenset(
+    {"Article", "NewsArticle", "BlogPosting", "Blog", "ProfilePage", "VideoObject"}
+)
+_NON_PRODUCT_OG_TYPES = ("article", "profile", "video", "music", "book")
+
+# 금액: 12,900 / 1.234,56 / 89,99 / 12.99 (천 단위 구분자 + 소수점 쉼표/마침표)
+_AMOUNT = r"\d+(?:[.,\u00a0\u202f ]\d{3})*(?:[.,]\d{1,2})?"
+# 금액 뒤에 오는 통화: 12,900원 / 89,99 € / 12.99 USD / 1,280円 / 99元
+_SUFFIX_CURRENCY = r"(?:원|円|元|[€£$¥￥₩]|(?:KRW|USD|EUR|JPY|CNY|RMB|GBP|CHF)\b)"
+# 금액 앞에 오는 통화: ₩12,900 / $12.99 / ¥12,800 / US$ 5 / EUR 19,90
+_PREFIX_CURRENCY = r"(?:[₩$€£¥￥]|US\$|(?:KRW|USD|EUR|JPY|CNY|RMB|GBP|CHF)\s?)"
+
+_PRICE = re.compile(
+    rf"{_AMOUNT}\s*{_SUFFIX_CURRENCY}|{_PREFIX_CURRENCY}\s*\d",
+    re.IGNORECASE,
+)
+
+# 숫자와 통화가 다른 태그로 나뉜 가격 (예: <span>22,000</span><span>원</span>)
+_HTML_PRICE = re.compile(
+    rf"{_AMOUNT}\s*(?:<[^>]{{0,200}}>\s*){{0,4}}{_SUFFIX_CURRENCY}|{_PREFIX_CURRENCY}\s*\d",
+    re.IGNORECASE,
+)
+
+# 장바구니/구매 버튼 문구 (한/영/독/불/서/이/포/일/중)
+_CART_MARKERS = re.compile(
+    r"장바구니|바로\s*구매|구매하기"
+    r"|add\s+to\s+(?:cart|bag|basket|trolley)|buy\s+(?:it\s+)?now"
+    r"|in\s+den\s+warenkorb|jetzt\s+kaufen|ajouter\s+au\s+panier"
+    r"|a[ñn]adir\s+al\s+carrito|agregar\s+al\s+carrito|aggiungi\s+al\s+carrello"
+    r"|adicionar\s+ao\s+carrinho"
+    r"|カートに(?:入れる|追加)|今すぐ購入|購入手続き"
+    r"|加入购物车|加入購物車|立即购买|立即購買",
+    re.IGNORECASE,
+)
+
+
+@dataclass
+class Prevalidation:
+    """사전 검증 결과"""
+
+    decision: str  # valid | invalid | ambiguous (LLM 검증 필요)
+    error_message: str = ""
+    signals: dict = field(default_factory=dict)
+
+
+class PagePrevalidator:
+    """휴리스틱 페이지 사전 검증기 (판정 경로별 통계 포함)"""
+
+    def __init__(
+        self, listing_min_prices: int, listing_price_ratio: float, invalid_max_texts: int
+    ):
+        """
+        Args:
+            listing_min_prices: 리스팅 페이지로 의심할 최소 가격 텍스트 수
+            listing_price_ratio: 리스팅 페이지로 의심할 가격 텍스트 비율 (가격 텍스트 수 / 전체 텍스트 수)
+            invalid_max_texts: 제품 신호가 없을 때 부적합으로 판정할 최대 텍스트 수
+        """
+        self.listing_min_prices = listing_min_prices
+        self.listing_price_ratio = listing_price_ratio
+        self.invalid_max_texts = invalid_max_texts
+
+        # 통계
+        self.valid = 0
+        self.invalid = 0
+        self.ambiguous = 0
+
+    def extract_signals(
+        self,
+        html_body: str,
+        texts: list[ExtractedText],
+        og_type: Optional[str] = None,
+        json_ld_types: Sequence[str] = (),
+    ) -> dict:
+        """
+        페이지 신호 추출 (정규표현식만 사용, HTML 파싱 없음)
+
+        Args:
+            html_body: 정제된 HTML body
+            texts: parse_content_node에서 추출된 텍스트
+            og_type: 요청으로 전달된 og:type 메타 태그 값
+            json_ld_types: 요청으로 전달된 JSON-LD @type 목록
+
+        Returns:
+            dict: 신호 값
+        """
+        # ProductGroup의 변형(hasVariant)은 각각 Product이므로 그룹 1개를 단일 제품으로 취급
+        if "ProductGroup" in json_ld_types:
+            json_ld_products = json_ld_types.count("ProductGroup")
+        else:
+            json_ld_products = json_ld_types.count("Product")
+
+        contents = [text.get("content", "") for text in texts]
+        price_texts = sum(1 for content in contents if _PRICE.search(content))
+        has_price = price_texts > 0 or _HTML_PRICE.search(html_body) is not None
+
+        return {
+            "json_ld_products": json_ld_products,
+            "json_ld_offer": any(t in _PRODUCT_TYPES for t in json_ld_types),
+            "json_ld_listing": any(t in _LISTING_TYPES for t in json_ld_types),
+            "og_product": "product" in (og_type or "").lower(),
+            "non_product_type": (
+                any(t in _NON_PRODUCT_TYPES for t in json_ld_types)
+                or (og_type or "").lower().startswith(_NON_PRODUCT_OG_TYPES)
+            ),
+            "has_price": has_price,
+            "price_texts": price_texts,
+            "price_ratio": round(price_texts / len(contents), 3) if contents else 0.0,
+            "cart_marker": _CART_MARKERS.search(html_body) is not None,
+            "text_count": len(contents),
+        }
+
+    def classify(
+        self,
+        html_body: str,
+        texts: list[ExtractedText],
+        og_type: Optional[str] = None,
+        json_ld_types: Sequence[str] = (),
+    ) -> Prevalidation:
+        """
+        페이지 사전 판정
+
+        - 적합: 단일 제품 구조화 데이터(JSON-LD 또는 og:type) + 가격/구매 버튼, 리스팅 신호 없음
+        - 부적합: 구조화 데이터, 가격, 구매 버튼이 모두 없고
+          비제품 유형(기사/프로필 등)이거나 텍스트가 invalid_max_texts 이하인 짧은 페이지
+        - 그 외(리스팅 의심, 일부 신호만 존재, 신호를 인식하지 못한 긴 페이지): LLM 검증 필요
+
+        Args:
+            html_body: 정제된 HTML body
+            texts: parse_content_node에서 추출된 텍스트
+            og_type: 요청으로 전달된 og:type 메타 태그 값
+            json_ld_types: 요청으로 전달된 JSON-LD @type 목록
+
+        Returns:
+            Prevalidation: 판정 결과와 신호
+        """
+        signals = self.extract_signals(html_body, texts, og_type, json_ld_types)
+
+        structured_product = signals["json_ld_offer"] or signals["og_product"]
+        listing_suspected = (
+            signals["json_ld_listing"]
+            or signals["json_ld_products"] > 1
+            or (
+                signals["price_texts"] >= self.listing_min_prices
+                and signals["price_ratio"] >= self.listing_price_ratio
+            )
+        )
+        purchasable = signals["has_price"] or signals["cart_marker"]
+        # 신호가 없다는 것만으로는 거부하지 않음 (인식하지 못한 통화/언어일 수 있음)
+        non_product = (
+            signals["non_product_type"] or signals["text_count"] <= self.invalid_max_texts
+        )
+
+        if structured_product and purchasable and not listing_suspected:
+            result = Prevalidation(PREVALIDATION_VALID, signals=signals)
+            self.valid += 1
+        elif (
+            not structured_product
+            and not purchasable
+            and not signals["json_ld_listing"]
+            and non_product
+        ):
+            result = Prevalidation(PREVALIDATION_INVALID, NO_PRODUCT_ERROR, signals)
+            self.invalid += 1
+        else:
+            result = Prevalidation(PREVALIDATION_AMBIGUOUS, signals=signals)
+            self.ambiguous += 1
+        return result
+
+    def stats(self) -> dict:
+        """판정 경로별 통계 (llm: 애매하여 LLM 검증으로 넘긴 페이지)"""
+        total = self.valid + self.invalid + self.ambiguous
+        return {
+            "heuristic_valid": self.valid,
+            "heuristic_invalid": self.invalid,
+            "llm": self.ambiguous,
+            "total": total,
+            "llm_ratio": round(self.ambiguous / total, 3) if total else 0.0,
+        }
+
+
+# 싱글톤 인스턴스
+_page_prevalidator: Optional[PagePrevalidator] = None
+
+
+def get_page_prevalidator(settings=None) -> PagePrevalidator:
+    """
+    페이지 사전 검증기 싱글톤 인스턴스 반환
+
+    Args:
+        settings: SummarizePageSettings 인스턴스 (최초 생성 시에만 사용, 생략 시 기본 설정)
+
+    Returns:
+        PagePrevalidator: 사전 검증기 인스턴스
+    """
+    global _page_prevalidator
+    if _page_prevalidator is None:
+        if settings is None:
+            from .config import SummarizePageSettings
+
+            settings = SummarizePageSettings()
+
+        _page_prevalidator = PagePrevalidator(
+            listing_min_prices=settings.prevalidation_listing_min_prices,
+            listing_price_ratio=settings.prevalidation_listing_price_ratio,
+            invalid_max_texts=settings.prevalidation_invalid_max_texts,
+        )
+    return _page_prevalidator
@@ -0,0 +1,196 @@
+"""SummarizePage 결과 캐시 - 동일 페이지 재요약 방지
+
+키 구성: "{PARSER_VERSION}|{PROMPT_VERSION}|{sha256(html_body)}|{정규화된 URL}"
+- 같은 URL이라도 html_body가 바뀌면(가격 변경 등) 다른 키
+- 파서/프롬프트 버전이 바뀌면 이전 결과는 자동으로 재사용되지 않음
+- URL이 키의 마지막에 위치하므로 URL 단위 무효화(delete_suffix)가 가능
+
+TTL이 지난 항목은 stale_seconds 동안 stale 응답으로 제공하고(stale-while-revalidate)
+호출 측에서 백그라운드로 재계산합니다.
+"""
+
+import hashlib
+import json
+import time
+from typing import Optional
+
+from src.prompts import PROMPT_VERSION
+from src.utils.cache import MemoryLRUCache, SQLiteTTLCache, TieredCache
+from src.utils.logger import get_logger
+from src.utils.url import normalize_url
+
+from .domain_parsers import PARSER_VERSION
+
+logger = get_logger(__name__)
+
+# 조회 결과 상태
+CACHE_HIT = "HIT"
+CACHE_STALE = "STALE"
+CACHE_MISS = "MISS"
+
+
+class SummarizePageResultCache:
+    """SummarizePage 응답 캐시 (메모리 LRU + SQLite TTL)"""
+
+    def __init__(self, cache: TieredCache, ttl_seconds: float, stale_seconds: float):
+        self._cache = cache
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self._refreshing: set[str] = set()
+
+        # 통계
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.bypassed = 0
+
+    @staticmethod
+    def make_key(url: str, html_body: str) -> str:
+        """캐시 키 생성"""
+        content_hash = hashlib.sha256(html_body.encode("utf-8")).hexdigest()
+        return "|".join((PARSER_VERSION, PROMPT_VERSION, content_hash, normalize_url(url)))
+
+    async def get(self, key: str) -> tuple[Optional[dict], str]:
+        """
+        캐시된 응답 조회
+
+        Args:
+            key: make_key()로 생성한 키
+
+        Returns:
+            tuple[Optional[dict], str]: (응답 dict, CACHE_HIT/CACHE_STALE/CACHE_MISS)
+        """
+        raw = await self._cache.get(key)
+        if raw is None:
+            self.misses += 1
+            return None, CACHE_MISS
+
+        entry = json.loads(raw)
+        age = time.time() - entry["stored_at"]
+
+        if age <= self.ttl_seconds:
+            self.hits += 1
+            return entry["response"], CACHE_HIT
+
+        if age <= self.ttl_seconds + self.stale_seconds:
+            self.stale_hits += 1
+            return entry["response"], CACHE_STALE
+
+        self.misses += 1
+        return None, CACHE_MISS
+
+    async def set(self, key: str, response: dict):
+        """
+        응답 저장
+
+        Args:
+            key: make_key()로 생성한 키
+            response: SummarizePageResponse.model_dump() 결과
+        """
+        entry = {"stored_at": time.time(), "response": response}
+        await self._cache.set(key, json.dumps(entry, ensure_ascii=False))
+
+    def try_begin_refresh(self, key: str) -> bool:
+        """
+        stale 항목 재계산 시작 표시 (같은 키의 중복 재계산 방지)
+
+        Returns:
+            bool: 재계산을 시작해도 되면 True (이미 진행 중이면 False)
+        """
+        if key in self._refreshing:
+            return False
+        self._refreshing.add(key)
+        return True
+
+    def end_refresh(self, key: str):
+        """stale 항목 재계산 종료 표시"""
+        self._refreshing.discard(key)
+
+    def record_bypass(self):
+        """캐시 우회 요청 기록"""
+        self.bypassed += 1
+
+    async def invalidate(self, url: Optional[str] = None) -> int:
+        """
+        캐시 무효화
+
+        Args:
+            url: 무효화할 페이지 URL (None이면 전체 삭제)
+
+        Returns:
+            int: 삭제된 항목 수 (메모리/디스크 합산)
+        """
+        if url is None:
+            deleted = await self._cache.clear()
+        else:
+            deleted = await self._cache.delete_suffix(f"|{normalize_url(url)}")
+
+        logger.info(
+            "SummarizePage cache invalidated",
+            extra={"page_url": url or "*", "deleted": deleted},
+        )
+        return deleted
+
+    def stats(self) -> dict:
+        """hit/stale/miss 통계"""
+        return {
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "bypassed": self.bypassed,
+            "refreshing": len(self._refreshing),
+            "storage": self._cache.stats(),
+        }
+
+    def close(self):
+        """디스크 계층 연결 종료"""
+        self._cache.close()
+
+
+# 싱글톤 인스턴스
+_result_cache: Optional[SummarizePageResultCache] = None
+
+
+def get_result_cache(settings=None) -> SummarizePageResultCache:
+    """
+    SummarizePage 결과 캐시 싱글톤 인스턴스 반환
+
+    Args:
+        settings: SummarizePageSettings 인스턴스 (최초 생성 시에만 사용, 생략 시 기본 설정)
+
+    Returns:
+        SummarizePageResultCache: 캐시 인스턴스
+    """
+    global _result_cache
+    if _result_cache is None:
+        if settings is None:
+            from .config import SummarizePageSettings
+
+            settings = SummarizePageSettings()
+
+        ttl = settings.summarize_cache_ttl_seconds
+        stale = settings.summarize_cache_stale_seconds
+
+        disk = None
+        if settings.summarize_cache_path:
+            # 디스크 계층은 stale 기간까지 보관
+            disk = SQLiteTTLCache(settings.summarize_cache_path, ttl + stale)
+
+        _result_cache = SummarizePageResultCache(
+            TieredCache(
+                MemoryLRUCache(settings.summarize_cache_memory_max_bytes),
+                disk,
+                ttl_seconds=ttl + stale,
+            ),
+            ttl_seconds=ttl,
+            stale_seconds=stale,
+        )
+    return _result_cache
+
+
+def close_result_cache():
+    """결과 캐시 종료 (lifespan shutdown 시 호출)"""
+    global _result_cache
+    if _result_cache is not None:
+        _result_cache.close()
+        _result_cache = None
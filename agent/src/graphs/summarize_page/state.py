@@ -55,8 +55,13 @@ class SummarizePageState(TypedDict, total=False):
     title: str
     html_body: str  # 정제된 HTML body
     og_image: str  # og:image 메타 태그에서 추출한 대표 이미지 URL
+    og_type: str  # og:type 메타 태그 값 (페이지 사전 검증 신호)
+    json_ld_types: list[str]  # JSON-LD @type 목록 (페이지 사전 검증 신호)
     timestamp: int
 
+    # 라우팅 결과 (route 노드에서 1회 결정, 선택된 파서의 domain_type)
+    domain_type: str
+
     # 페이지 검증 결과
     is_valid_page: bool
     validation_error: str
@@ -67,8 +72,14 @@ class SummarizePageState(TypedDict, total=False):
     # 이미지들 (OCR 결과 포함)
     images: list[ExtractedImage]
 
+    # OCR 마감 시간 초과로 결과 없이 분석에 전달된 이미지 URL
+    ocr_dropped_images: list[str]
+
     # 제품 분석 결과
     product_analysis: ProductAnalysis
 
+    # LLM 분석 실패로 기본값(unknown) 분석이 반환되었는지 여부
+    analysis_failed: bool
+
     # LLM input 텍스트 (Extension 저장용)
     llm_input_content: str
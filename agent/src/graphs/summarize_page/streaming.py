@@ -0,0 +1,111 @@
+"""SummarizePage 스트리밍 - 그래프 astream 청크를 진행 이벤트로 변환
+
+전체 분석(파싱 -> 검증 -> OCR -> LLM 분석)이 끝나기 전에
+라우팅 결과, 도메인 파서 결과, OCR 진행 상황을 먼저 전달하기 위한 이벤트를 생성합니다.
+
+이벤트 (type 필드로 구분):
+- route: 라우팅 결과 (domain_type)
+- parsed: 도메인 파서 결과 (product_name, price, thumbnail)
+- validated: 페이지 검증 결과 (is_valid_page, error)
+- ocr_progress: OCR 진행 상황 (completed, total) - ocr_node에서 custom 스트림으로 전송
+"""
+
+from typing import Any, AsyncIterator, Callable
+
+from langgraph.config import get_stream_writer
+
+from .state import SummarizePageState
+
+EVENT_ROUTE = "route"
+EVENT_PARSED = "parsed"
+EVENT_VALIDATED = "validated"
+EVENT_OCR_PROGRESS = "ocr_progress"
+
+
+def get_progress_writer() -> Callable[[dict], None]:
+    """
+    노드에서 진행 이벤트를 보낼 writer 반환
+
+    그래프 실행 컨텍스트 밖(노드 단위 테스트 등)에서는 아무 동작도 하지 않는 writer를 반환합니다.
+    ainvoke로 실행 중이면 LangGraph가 no-op writer를 반환하므로 별도 처리가 필요 없습니다.
+
+    Returns:
+        Callable[[dict], None]: 이벤트 dict를 받는 writer
+    """
+    try:
+        return get_stream_writer()
+    except RuntimeError:
+        return lambda _event: None
+
+
+def _events_from_update(node: str, update: dict) -> list[dict]:
+    """노드 업데이트(stream_mode="updates")를 진행 이벤트로 변환"""
+    events = []
+    if node == "route" and "domain_type" in update:
+        events.append({"type": EVENT_ROUTE, "domain_type": update["domain_type"]})
+
+    parsed_content = update.get("parsed_content")
+    if parsed_content:
+        events.append(
+            {
+                "type": EVENT_PARSED,
+                "domain_type": parsed_content.get("domain_type"),
+                "product_name": parsed_content.get("product_name"),
+                "price": parsed_content.get("price"),
+                "thumbnail": parsed_content.get("thumbnail"),
+            }
+        )
+
+    if "is_valid_page" in update:
+        events.append(
+            {
+                "type": EVENT_VALIDATED,
+                "is_valid_page": update["is_valid_page"],
+                "error": update.get("validation_error") or None,
+            }
+        )
+    return events
+
+
+class SummarizePageStream:
+    """SummarizePage 그래프 스트리밍 실행
+
+    events()로 진행 이벤트를 순서대로 전달하고, 실행이 끝나면 final_state에 최종 state가 남습니다.
+
+    Usage:
+        stream = SummarizePageStream(graph, state_input)
+        async for event in stream.events():
+            ...
+        result = stream.final_state
+    """
+
+    def __init__(self, graph: Any, state_input: dict):
+        """
+        Args:
+            graph: 컴파일된 SummarizePage 그래프
+            state_input: 그래프 입력 state
+        """
+        self.graph = graph
+        self.state_input = state_input
+        self.final_state: SummarizePageState = {}
+
+    async def events(self) -> AsyncIterator[dict]:
+        """
+        그래프를 astream으로 실행하며 진행 이벤트 생성
+
+        Yields:
+            dict: type 필드를 가진 진행 이벤트
+        """
+        async for mode, chunk in self.graph.astream(
+            self.state_input, stream_mode=["updates", "custom", "values"]
+        ):
+            if mode == "values":
+                self.final_state = chunk
+            elif mode == "custom":
+                if isinstance(chunk, dict) and "type" in chunk:
+                    yield chunk
+            elif mode == "updates":
+                for node, update in chunk.items():
+                    if isinstance(update, dict):
+                        for event in _events_from_update(node, update):
+                            yield event
@@ -5,4 +5,8 @@ LangGraph 노드에서 사용하는 프롬프트를 별도로 관리
 
 from . import analyze_product, validate_page
 
-__all__ = ["validate_page", "analyze_product"]
+# 프롬프트 버전 - summarize-page 프롬프트(validate_page, analyze_product) 변경 시 올려야
+# 이전 프롬프트로 생성된 결과 캐시가 재사용되지 않음
+PROMPT_VERSION = "2"
+
+__all__ = ["validate_page", "analyze_product", "PROMPT_VERSION"]
@@ -6,44 +6,56 @@ LLM을 사용하여 텍스트와 이미지 정보로부터 제품을 분석하
 from typing import List
 
 from ..graphs.summarize_page.state import ExtractedImage, ExtractedText
+from .encoders import get_encoder
 
 
 # ============================================================================
 # SYSTEM PROMPT
 # ============================================================================
 
-SYSTEM_PROMPT = """
+# 시스템 프롬프트 INPUT FORMAT 예시 데이터 (선택된 인코딩으로 직렬화)
+_EXAMPLE_TEXTS: List[ExtractedText] = [
+    {"content": "제품명", "tagName": "h1", "position": 0},
+    {"content": "제품 설명", "tagName": "p", "position": 100},
+    {"content": "가격 정보", "tagName": "span", "position": 200},
+]
+_EXAMPLE_IMAGES: List[ExtractedImage] = [
+    {"alt": "이미지1 설명", "ocr_result": "이미지에서 추출된 텍스트"},
+    {"alt": "이미지2 설명", "ocr_result": "이미지에서 추출된 텍스트"},
+]
+
+# 인코딩별 (입력 블록 이름, Text Information 설명, OCR Text Information 설명)
+_INPUT_FORMATS = {
+    "csv": (
+        "CSV 테이블로",
+        "HTML에서 추출된 텍스트 데이터 (tag: HTML 태그명, text: 텍스트 내용, position: DOM 순서)",
+        "이미지 OCR 결과 (alt: 이미지 대체 텍스트, ocr_text: OCR로 추출된 텍스트)",
+    ),
+    "grouped": (
+        "Markdown 블록으로",
+        "HTML에서 추출된 텍스트 데이터 (페이지 순서, position 없음). "
+        "h1~h6 제목은 Markdown 제목(`#`~`######`)으로 표시되며 제목 아래 줄은 해당 섹션에 속합니다. "
+        "연속된 리뷰는 `## 리뷰` 섹션의 `- ` 항목으로 묶입니다",
+        "이미지 OCR 결과 (`### 이미지 N: 이미지 대체 텍스트` 제목 아래에 OCR로 추출된 텍스트)",
+    ),
+    "compact": (
+        "텍스트 블록으로",
+        "HTML에서 추출된 텍스트 데이터 (페이지 순서, 한 줄에 한 항목, position 없음). "
+        "제목(h1~h6)과 리뷰는 `h1|`, `review|`처럼 태그가 앞에 붙고, 그 외 텍스트는 태그 없이 표시됩니다",
+        "이미지 OCR 결과 (`이미지 대체 텍스트|OCR로 추출된 텍스트` 한 줄, 이미지 안의 줄바꿈은 ` / `로 구분)",
+    ),
+}
+
+_SYSTEM_PROMPT_HEAD = """
 # PERSONA:
 당신은 이커머스 및 제품 비교에 특화된 전문 제품 분석가입니다.
 
 ## CONTEXT:
 당신은 사용자로부터 웹 페이지 콘텐츠(텍스트, 이미지 설명)를 입력받습니다. 이 콘텐츠에는 분석해야 할 단일 제품에 대한 정보가 포함되어 있습니다.
 
-## INPUT FORMAT:
-
-입력은 두 개의 CSV 테이블로 제공됩니다:
-
-1. **Text Information (CSV format):**
-```csv
-tag,text,position
-h1,제품명,0
-p,제품 설명,100
-span,가격 정보,200
-```
-
-2. **OCR Text Information (CSV format):**
-```csv
-alt,ocr_text
-이미지1 설명,이미지에서 추출된 텍스트
-이미지2 설명,이미지에서 추출된 텍스트
-```
-
-### INPUT FORMAT DESCRIPTION:
-
-  - **Text Information**: HTML에서 추출된 텍스트 데이터 (tag: HTML 태그명, text: 텍스트 내용, position: DOM 순서)
-  - **OCR Text Information**: 이미지 OCR 결과 (alt: 이미지 대체 텍스트, ocr_text: OCR로 추출된 텍스트)
+"""
 
-## TASK:
+_SYSTEM_PROMPT_TAIL = """## TASK:
 
 입력된 제품 정보를 분석하여, 포괄적이고 객관적이며 사실에 기반한 제품 분석 결과를 `OUTPUT FORMAT`에 정의된 JSON 형식으로 생성해야 합니다.
 
@@ -200,54 +212,70 @@ alt,ocr_text
 """
 
 
+def build_system_prompt(encoding: str = "csv") -> str:
+    """시스템 프롬프트 생성 (INPUT FORMAT 섹션은 인코딩별 형식과 예시 사용)
+
+    Args:
+        encoding: 텍스트/OCR 인코딩 ("csv", "grouped", "compact")
+
+    Returns:
+        시스템 프롬프트 문자열
+    """
+    encoder = get_encoder(encoding)
+    container, text_description, ocr_description = _INPUT_FORMATS[encoder.name]
+
+    input_format = f"""## INPUT FORMAT:
+
+입력은 두 개의 {container} 제공됩니다:
+
+1. **Text Information ({encoder.label}):**
+```{encoder.code_language}
+{encoder.encode_texts(_EXAMPLE_TEXTS)}
+```
+
+2. **OCR Text Information ({encoder.label}):**
+```{encoder.code_language}
+{encoder.encode_ocr(_EXAMPLE_IMAGES)}
+```
+
+### INPUT FORMAT DESCRIPTION:
+
+  - **Text Information**: {text_description}
+  - **OCR Text Information**: {ocr_description}
+
+"""
+    return _SYSTEM_PROMPT_HEAD + input_format + _SYSTEM_PROMPT_TAIL
+
+
+SYSTEM_PROMPT = build_system_prompt()
+
+
 # ============================================================================
 # USER PROMPT TEMPLATE
 # ============================================================================
 
-def build_user_prompt(texts: List[ExtractedText], images: List[ExtractedImage], page_title: str = "") -> str:
-    """사용자 프롬프트 생성 (CSV 형식)
+def build_user_prompt(
+    texts: List[ExtractedText], images: List[ExtractedImage], page_title: str = "", encoding: str = "csv"
+) -> str:
+    """사용자 프롬프트 생성
 
     Args:
         texts: 추출된 텍스트 리스트
         images: 추출된 이미지 리스트
         page_title: 페이지 제목 (document.title)
+        encoding: 텍스트/OCR 인코딩 ("csv", "grouped", "compact")
 
     Returns:
-        사용자 프롬프트 문자열 (CSV 형식)
+        사용자 프롬프트 문자열
     """
-    # 1. 텍스트 정보를 CSV 형식으로 변환
-    sorted_texts = sorted(texts, key=lambda t: t.get("position", 0))
-    text_csv_lines = ["tag,text,position"]  # CSV 헤더
-
-    for text in sorted_texts:
-        tag = text.get("tagName", "").strip()
-        content = text.get("content", "").strip()
-        position = text.get("position", 0)
-
-        if content:
-            # CSV 이스케이핑: 쉼표, 줄바꿈이 포함된 경우 따옴표로 감싸기
-            if "," in content or "\n" in content or '"' in content:
-                content = '"' + content.replace('"', '""') + '"'
-            text_csv_lines.append(f"{tag},{content},{position}")
+    encoder = get_encoder(encoding)
 
-    text_csv = "\n".join(text_csv_lines) if len(text_csv_lines) > 1 else "[No text information available]"
-
-    # 2. OCR 결과를 CSV 형식으로 변환
-    ocr_csv_lines = ["alt,ocr_text"]  # CSV 헤더
-
-    for img in images:
-        alt = img.get("alt", "").strip()
-        ocr = img.get("ocr_result", "").strip()
-
-        if ocr:  # OCR 결과가 있는 경우만 포함
-            # CSV 이스케이핑
-            if "," in alt or "\n" in alt or '"' in alt:
-                alt = '"' + alt.replace('"', '""') + '"'
-            if "," in ocr or "\n" in ocr or '"' in ocr:
-                ocr = '"' + ocr.replace('"', '""') + '"'
-            ocr_csv_lines.append(f"{alt},{ocr}")
+    # 1. 텍스트 정보 인코딩 (position 순)
+    sorted_texts = sorted(texts, key=lambda t: t.get("position", 0))
+    text_data = encoder.encode_texts(sorted_texts) or "[No text information available]"
 
-    ocr_csv = "\n".join(ocr_csv_lines) if len(ocr_csv_lines) > 1 else "[No OCR information available]"
+    # 2. OCR 결과 인코딩 (OCR 결과가 있는 이미지만)
+    ocr_data = encoder.encode_ocr(images) or "[No OCR information available]"
 
     # 페이지 제목 기반 집중 지시문
     title_instruction = ""
@@ -261,37 +289,40 @@ Ignore information about recommended products, related items, accessories, or ot
 
     return f"""{title_instruction}Analyze the following product page information and extract product analysis.
 
-**Text Information (CSV format):**
-```csv
-{text_csv}
+**Text Information ({encoder.label}):**
+```{encoder.code_language}
+{text_data}
 ```
 
-**OCR Text Information (CSV format):**
-```csv
-{ocr_csv}
+**OCR Text Information ({encoder.label}):**
+```{encoder.code_language}
+{ocr_data}
 ```
 
-Based on the above CSV data, provide a comprehensive product analysis. Pay special attention to price information which may appear in either Text Information or OCR Text Information. If any information is missing or unclear, use "unknown" for string fields or empty arrays for list fields."""
+Based on the above {encoder.data_name} data, provide a comprehensive product analysis. Pay special attention to price information which may appear in either Text Information or OCR Text Information. If any information is missing or unclear, use "unknown" for string fields or empty arrays for list fields."""
 
 
 # ============================================================================
 # PROMPT BUILDER
 # ============================================================================
 
-def build_messages(texts: List[ExtractedText], images: List[ExtractedImage], page_title: str = "") -> List[dict]:
+def build_messages(
+    texts: List[ExtractedText], images: List[ExtractedImage], page_title: str = "", encoding: str = "csv"
+) -> List[dict]:
     """LangChain 메시지 형식으로 프롬프트 구성
 
     Args:
         texts: 추출된 텍스트 리스트
         images: 추출된 이미지 리스트
         page_title: 페이지 제목 (document.title)
+        encoding: 텍스트/OCR 인코딩 ("csv", "grouped", "compact")
 
     Returns:
         메시지 리스트 [{"role": "system", "content": ...}, {"role": "user", "content": ...}]
     """
     return [
-        {"role": "system", "content": SYSTEM_PROMPT},
-        {"role": "user", "content": build_user_prompt(texts, images, page_title)},
+        {"role": "system", "content": build_system_prompt(encoding)},
+        {"role": "user", "content": build_user_prompt(texts, images, page_title, encoding)},
     ]
 
 
@@ -0,0 +1,51 @@
+"""프롬프트 인코더 모듈 및 팩토리
+
+프롬프트에 넣는 텍스트/OCR 데이터의 직렬화 형식을 교체할 수 있도록 분리
+- csv: tag,text,position 행 (기존 형식)
+- grouped: position 없이 제목 기준 섹션으로 묶은 형식
+- compact: 항목당 한 줄 형식
+"""
+
+from src.exceptions.base import ConfigurationError
+
+from .base import BasePromptEncoder
+from .compact import CompactPromptEncoder
+from .csv import CsvPromptEncoder
+from .grouped import GroupedPromptEncoder
+
+ENCODERS: dict[str, type[BasePromptEncoder]] = {
+    CsvPromptEncoder.name: CsvPromptEncoder,
+    GroupedPromptEncoder.name: GroupedPromptEncoder,
+    CompactPromptEncoder.name: CompactPromptEncoder,
+}
+
+__all__ = [
+    "BasePromptEncoder",
+    "CsvPromptEncoder",
+    "GroupedPromptEncoder",
+    "CompactPromptEncoder",
+    "ENCODERS",
+    "get_encoder",
+]
+
+
+def get_encoder(encoding: str = "csv") -> BasePromptEncoder:
+    """
+    encoding에 따라 프롬프트 인코더 반환
+
+    Args:
+        encoding: 인코딩 이름 ("csv", "grouped", "compact")
+
+    Returns:
+        BasePromptEncoder: 인코더 인스턴스
+
+    Raises:
+        ConfigurationError: 지원하지 않는 인코딩인 경우
+    """
+    encoder_cls = ENCODERS.get(encoding.lower())
+    if encoder_cls is None:
+        raise ConfigurationError(
+            f"Unsupported prompt encoding: {encoding}",
+            details={"supported_encodings": list(ENCODERS), "provided_encoding": encoding},
+        )
+    return encoder_cls()
@@ -0,0 +1,47 @@
+"""프롬프트 인코더 기본 추상 클래스"""
+
+from abc import ABC, abstractmethod
+from typing import List
+
+from ...graphs.summarize_page.state import ExtractedImage, ExtractedText
+
+
+class BasePromptEncoder(ABC):
+    """프롬프트 입력 데이터(텍스트/OCR)를 문자열로 직렬화하는 기본 추상 클래스"""
+
+    # 인코딩 식별자 (설정 값)
+    name: str = ""
+    # 프롬프트 섹션 제목에 표시할 형식 이름 (예: "Text Information (CSV format)")
+    label: str = ""
+    # 본문을 감싸는 코드 블록 언어
+    code_language: str = ""
+    # 프롬프트 본문에서 데이터를 지칭하는 이름 (예: "위 CSV 데이터를 바탕으로")
+    data_name: str = ""
+    # 텍스트가 없을 때도 표시하는 텍스트 헤더 (validate_page 빈 입력용, 헤더가 없는 형식은 빈 문자열)
+    text_header: str = ""
+
+    @abstractmethod
+    def encode_texts(self, texts: List[ExtractedText]) -> str:
+        """
+        텍스트 목록 인코딩 (전달된 순서 유지)
+
+        Args:
+            texts: 추출된 텍스트 리스트
+
+        Returns:
+            str: 인코딩된 문자열 (내용이 있는 텍스트가 없으면 빈 문자열)
+        """
+        pass
+
+    @abstractmethod
+    def encode_ocr(self, images: List[ExtractedImage]) -> str:
+        """
+        이미지 OCR 결과 인코딩 (OCR 결과가 있는 이미지만 포함)
+
+        Args:
+            images: OCR 결과가 포함된 이미지 리스트
+
+        Returns:
+            str: 인코딩된 문자열 (OCR 결과가 없으면 빈 문자열)
+        """
+        pass
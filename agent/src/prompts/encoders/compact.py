@@ -0,0 +1,39 @@
+"""한 줄 인코더 - 항목당 한 줄, 의미 있는 태그만 표시"""
+
+from typing import List
+
+from ...graphs.summarize_page.state import ExtractedImage, ExtractedText
+from .base import BasePromptEncoder
+
+# 줄 앞에 표시할 태그 (그 외 p/span/div 등은 생략)
+_MEANINGFUL_TAGS = frozenset({"h1", "h2", "h3", "h4", "h5", "h6", "review"})
+
+
+class CompactPromptEncoder(BasePromptEncoder):
+    """tag|text 한 줄 인코더 (따옴표 이스케이핑, position, 일반 태그 생략)"""
+
+    name = "compact"
+    label = "line format"
+    code_language = "text"
+    data_name = "line-format"
+
+    def encode_texts(self, texts: List[ExtractedText]) -> str:
+        lines: list[str] = []
+        for text in texts:
+            content = " ".join(text.get("content", "").split())
+            if not content:
+                continue
+            tag = text.get("tagName", "").strip().lower()
+            lines.append(f"{tag}|{content}" if tag in _MEANINGFUL_TAGS else content)
+        return "\n".join(lines)
+
+    def encode_ocr(self, images: List[ExtractedImage]) -> str:
+        lines: list[str] = []
+        for image in images:
+            # OCR 줄바꿈(표의 행 구분)은 " / "로 보존
+            ocr = " / ".join(line.strip() for line in image.get("ocr_result", "").splitlines() if line.strip())
+            if not ocr:
+                continue
+            alt = " ".join(image.get("alt", "").split())
+            lines.append(f"{alt}|{ocr}" if alt else ocr)
+        return "\n".join(lines)
@@ -0,0 +1,41 @@
+"""CSV 인코더 - tag,text,position 행 (기존 프롬프트 형식)"""
+
+from typing import List
+
+from ...graphs.summarize_page.state import ExtractedImage, ExtractedText
+from .base import BasePromptEncoder
+
+
+def escape_csv(value: str) -> str:
+    """CSV 이스케이핑: 쉼표, 줄바꿈, 따옴표가 포함된 경우 따옴표로 감싸기"""
+    if "," in value or "\n" in value or '"' in value:
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+class CsvPromptEncoder(BasePromptEncoder):
+    """tag,text,position CSV 인코더 (행마다 position 포함)"""
+
+    name = "csv"
+    label = "CSV format"
+    code_language = "csv"
+    data_name = "CSV"
+    text_header = "tag,text,position"
+
+    def encode_texts(self, texts: List[ExtractedText]) -> str:
+        lines = [self.text_header]
+        for text in texts:
+            tag = text.get("tagName", "").strip()
+            content = text.get("content", "").strip()
+            if content:
+                lines.append(f"{tag},{escape_csv(content)},{text.get('position', 0)}")
+        return "\n".join(lines) if len(lines) > 1 else ""
+
+    def encode_ocr(self, images: List[ExtractedImage]) -> str:
+        lines = ["alt,ocr_text"]
+        for image in images:
+            alt = image.get("alt", "").strip()
+            ocr = image.get("ocr_result", "").strip()
+            if ocr:
+                lines.append(f"{escape_csv(alt)},{escape_csv(ocr)}")
+        return "\n".join(lines) if len(lines) > 1 else ""
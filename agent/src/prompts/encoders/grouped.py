@@ -0,0 +1,55 @@
+"""섹션 그룹 인코더 - position 없이 제목(h1~h6) 기준으로 묶은 텍스트"""
+
+from typing import List
+
+from ...graphs.summarize_page.state import ExtractedImage, ExtractedText
+from .base import BasePromptEncoder
+
+_HEADING_LEVELS = {f"h{level}": level for level in range(1, 7)}
+
+
+class GroupedPromptEncoder(BasePromptEncoder):
+    """제목 태그를 Markdown 제목으로, 나머지 텍스트를 그 아래 줄로 배치하는 인코더
+
+    position 값과 태그 이름을 반복하지 않고 제목 구조로 섹션을 표현합니다.
+    연속된 리뷰는 "리뷰" 섹션 하나로 묶습니다.
+    """
+
+    name = "grouped"
+    label = "grouped by section"
+    code_language = "markdown"
+    data_name = "section-grouped"
+
+    def encode_texts(self, texts: List[ExtractedText]) -> str:
+        lines: list[str] = []
+        in_reviews = False
+        for text in texts:
+            content = " ".join(text.get("content", "").split())
+            if not content:
+                continue
+            tag = text.get("tagName", "").strip().lower()
+
+            if tag == "review":
+                if not in_reviews:
+                    lines.append("## 리뷰")
+                    in_reviews = True
+                lines.append(f"- {content}")
+                continue
+
+            in_reviews = False
+            if tag in _HEADING_LEVELS:
+                lines.append(f"{'#' * _HEADING_LEVELS[tag]} {content}")
+            else:
+                lines.append(content)
+        return "\n".join(lines)
+
+    def encode_ocr(self, images: List[ExtractedImage]) -> str:
+        blocks: list[str] = []
+        for image in images:
+            ocr = image.get("ocr_result", "").strip()
+            if not ocr:
+                continue
+            alt = image.get("alt", "").strip()
+            title = f"### 이미지 {len(blocks) + 1}" + (f": {alt}" if alt else "")
+            blocks.append(f"{title}\n{ocr}")
+        return "\n\n".join(blocks)
@@ -0,0 +1,157 @@
+"""프롬프트 토큰 예산 - 긴 상세 페이지의 LLM 입력 크기 제한
+
+analyze_product 프롬프트는 설명 텍스트, OCR, 리뷰를 모두 CSV로 직렬화하므로
+상세 페이지가 길면 입력 토큰이 제한 없이 늘어나 LLM 지연 시간이 커집니다.
+항목을 유용도 순으로 정렬하여 예산 안에서 채우고, 빠진 항목은 집계하여 반환합니다.
+
+우선순위 (같은 순위는 페이지 순서 유지):
+1. 제목/가격(h1, h2) 및 스펙 형태 텍스트 (예: "무게: 1.4kg", "16GB RAM")
+2. 그 외 설명 텍스트
+3. OCR 텍스트 (상세 이미지)
+4. 리뷰
+"""
+
+import math
+import re
+from dataclasses import dataclass, field
+from typing import List
+
+from ..graphs.summarize_page.state import ExtractedImage, ExtractedText
+
+# 우선순위
+PRIORITY_KEY = 0
+PRIORITY_DESCRIPTION = 1
+PRIORITY_OCR = 2
+PRIORITY_REVIEW = 3
+
+PRIORITY_NAMES = {
+    PRIORITY_KEY: "key",
+    PRIORITY_DESCRIPTION: "description",
+    PRIORITY_OCR: "ocr",
+    PRIORITY_REVIEW: "review",
+}
+
+# CSV 한 줄의 태그/위치/구분자 오버헤드 (토큰)
+ROW_OVERHEAD_TOKENS = 4
+
+# 한글/CJK 문자 (대부분의 토크나이저에서 1자당 약 1토큰)
+_CJK = re.compile(r"[\u1100-\u11ff\u3130-\u318f\uac00-\ud7af\u3040-\u30ff\u4e00-\u9fff]")
+
+# 스펙 형태 텍스트: "라벨: 값" 또는 숫자 + 단위
+_SPEC_LABEL = re.compile(r"^[^:：]{1,20}[:：]\s*\S")
+_SPEC_UNIT = re.compile(
+    r"\d+(?:\.\d+)?\s*(?:GB|TB|MB|mAh|Wh|W|V|Hz|GHz|mm|cm|m|kg|g|mg|ml|L|%|인치|개입|매|정)(?![A-Za-z])",
+    re.IGNORECASE,
+)
+_SPEC_MAX_CHARS = 120
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    텍스트 토큰 수 추정 (토크나이저 없이)
+
+    한글/CJK는 1자당 1토큰, 그 외(영문, 숫자, 기호)는 4자당 1토큰으로 계산합니다.
+    실제 토큰 수보다 약간 크게 추정되도록 올림합니다.
+
+    Args:
+        text: 텍스트
+
+    Returns:
+        int: 추정 토큰 수
+    """
+    if not text:
+        return 0
+    cjk = len(_CJK.findall(text))
+    others = len(text) - cjk - text.count(" ")
+    return cjk + math.ceil(max(others, 0) / 4)
+
+
+def text_priority(text: ExtractedText) -> int:
+    """
+    텍스트 항목 우선순위
+
+    Args:
+        text: 추출된 텍스트
+
+    Returns:
+        int: 우선순위 (작을수록 먼저 포함)
+    """
+    tag = text.get("tagName", "")
+    if tag == "review":
+        return PRIORITY_REVIEW
+    if tag in ("h1", "h2"):
+        return PRIORITY_KEY
+
+    content = text.get("content", "").strip()
+    if len(content) <= _SPEC_MAX_CHARS and (_SPEC_LABEL.search(content) or _SPEC_UNIT.search(content)):
+        return PRIORITY_KEY
+    return PRIORITY_DESCRIPTION
+
+
+@dataclass
+class BudgetedInput:
+    """토큰 예산 적용 결과"""
+
+    texts: List[ExtractedText]
+    images: List[ExtractedImage]
+    used_tokens: int = 0
+    dropped_tokens: int = 0
+    dropped: dict[str, int] = field(default_factory=dict)  # 우선순위 이름별 제외 항목 수
+
+    @property
+    def dropped_count(self) -> int:
+        """제외된 항목 수"""
+        return sum(self.dropped.values())
+
+
+def fit_to_budget(
+    texts: List[ExtractedText], images: List[ExtractedImage], max_tokens: int
+) -> BudgetedInput:
+    """
+    우선순위 순으로 텍스트/OCR 항목을 토큰 예산만큼 선택
+
+    예산에 들어가지 않는 항목은 건너뛰고 다음 항목(더 짧은 항목)을 계속 시도합니다.
+    선택된 항목은 원래 순서를 유지하며, 빈 텍스트와 OCR 결과가 없는 이미지는 계산에서 제외합니다.
+
+    Args:
+        texts: 추출된 텍스트 리스트
+        images: OCR 결과가 포함된 이미지 리스트
+        max_tokens: 입력 데이터 토큰 예산 (0 이하이면 제한 없음)
+
+    Returns:
+        BudgetedInput: 선택된 텍스트/이미지와 제외 통계
+    """
+    candidates: List[tuple[int, int, str, int]] = []  # (우선순위, 순서, 종류, 토큰)
+    for order, text in enumerate(texts):
+        content = text.get("content", "").strip()
+        if content:
+            candidates.append(
+                (text_priority(text), order, "text", estimate_tokens(content) + ROW_OVERHEAD_TOKENS)
+            )
+    for order, image in enumerate(images):
+        ocr = image.get("ocr_result", "").strip()
+        if ocr:
+            tokens = estimate_tokens(ocr) + estimate_tokens(image.get("alt", "")) + ROW_OVERHEAD_TOKENS
+            candidates.append((PRIORITY_OCR, order, "image", tokens))
+
+    if max_tokens <= 0:
+        return BudgetedInput(
+            texts=list(texts),
+            images=list(images),
+            used_tokens=sum(tokens for *_, tokens in candidates),
+        )
+
+    result = BudgetedInput(texts=[], images=[])
+    selected: dict[str, set[int]] = {"text": set(), "image": set()}
+    for priority, order, kind, tokens in sorted(candidates):
+        if result.used_tokens + tokens <= max_tokens:
+            selected[kind].add(order)
+            result.used_tokens += tokens
+        else:
+            name = PRIORITY_NAMES[priority]
+            result.dropped[name] = result.dropped.get(name, 0) + 1
+            result.dropped_tokens += tokens
+
+    result.texts = [text for order, text in enumerate(texts) if order in selected["text"]]
+    result.images = [image for order, image in enumerate(images) if order in selected["image"]]
+    return result
@@ -7,6 +7,8 @@ from typing import Any
 
 from pydantic import BaseModel, Field, field_validator
 
+from .encoders import get_encoder
+
 
 # ============================================================================
 # PYDANTIC MODELS
@@ -34,20 +36,29 @@ class ValidationResult(BaseModel):
 # SYSTEM PROMPT
 # ============================================================================
 
-SYSTEM_PROMPT = """
+# 인코딩별 (입력 형식 이름, 텍스트 구성 설명)
+_INPUT_FORMATS = {
+    "csv": ("CSV", "각 텍스트는 tag(HTML 태그명), text(내용), position(순서)로 구성됩니다."),
+    "grouped": (
+        "Markdown",
+        "텍스트는 페이지 순서대로 나열되며 position은 없습니다. "
+        "h1~h6 제목은 Markdown 제목(`#`~`######`)으로 표시되며 제목 아래 줄은 해당 섹션에 속합니다. "
+        "연속된 리뷰는 `## 리뷰` 섹션의 `- ` 항목으로 묶입니다.",
+    ),
+    "compact": (
+        "한 줄",
+        "텍스트는 페이지 순서대로 한 줄에 하나씩 나열되며 position은 없습니다. "
+        "제목(h1~h6)과 리뷰는 `h1|`, `review|`처럼 태그가 앞에 붙고, 그 외 텍스트는 태그 없이 표시됩니다.",
+    ),
+}
+
+_SYSTEM_PROMPT_HEAD = """
 # PERSONA:
 당신은 웹 페이지 콘텐츠를 분석하여, 해당 페이지가 **단일 제품 상세 페이지**인지 판단하는 검증 전문가입니다.
 
-## CONTEXT:
-사용자로부터 웹 페이지에서 추출된 텍스트 데이터를 CSV 형식으로 입력받습니다.
-각 텍스트는 tag(HTML 태그명), text(내용), position(순서)로 구성됩니다.
-당신의 임무는:
-- 이 페이지가 제품 분석에 적합한지 검증
-
-## TASK:
-입력된 CSV 텍스트 데이터를 분석하여, 단일 제품 상세 페이지인지 판단합니다.
+"""
 
-## OUTPUT FORMAT:
+_SYSTEM_PROMPT_TAIL = """## OUTPUT FORMAT:
 
 ```json
 {
@@ -145,38 +156,56 @@ SYSTEM_PROMPT = """
 """
 
 
+def build_system_prompt(encoding: str = "csv") -> str:
+    """
+    시스템 프롬프트 생성 (CONTEXT/TASK의 입력 형식 설명은 인코딩별로 다름)
+
+    Args:
+        encoding: 텍스트 인코딩 ("csv", "grouped", "compact")
+
+    Returns:
+        str: 시스템 프롬프트
+    """
+    encoder = get_encoder(encoding)
+    format_name, text_description = _INPUT_FORMATS[encoder.name]
+
+    context = f"""## CONTEXT:
+사용자로부터 웹 페이지에서 추출된 텍스트 데이터를 {format_name} 형식으로 입력받습니다.
+{text_description}
+당신의 임무는:
+- 이 페이지가 제품 분석에 적합한지 검증
+
+## TASK:
+입력된 {format_name} 텍스트 데이터를 분석하여, 단일 제품 상세 페이지인지 판단합니다.
+
+"""
+    return _SYSTEM_PROMPT_HEAD + context + _SYSTEM_PROMPT_TAIL
+
+
+SYSTEM_PROMPT = build_system_prompt()
+
+
 # ============================================================================
 # MESSAGE BUILDER
 # ============================================================================
 
 
-def build_messages(url: str, title: str, texts: list) -> list:
+def build_messages(url: str, title: str, texts: list, encoding: str = "csv") -> list:
     """
-    페이지 검증을 위한 LLM 메시지 구성 (CSV 입력)
+    페이지 검증을 위한 LLM 메시지 구성
 
     Args:
         url: 페이지 URL
         title: 페이지 제목
         texts: 추출된 텍스트 리스트 (ExtractedText TypedDict)
+        encoding: 텍스트 인코딩 ("csv", "grouped", "compact")
 
     Returns:
         list: LLM에 전달할 메시지 목록
     """
-    # texts를 CSV 형식으로 변환
-    csv_lines = ["tag,text,position"]
-
-    for text in texts:
-        tag = text.get("tagName", "").strip()
-        content = text.get("content", "").strip()
-        position = text.get("position", 0)
-
-        if content:
-            # CSV 이스케이핑: 쉼표, 줄바꿈, 따옴표 처리
-            if "," in content or "\n" in content or '"' in content:
-                content = '"' + content.replace('"', '""') + '"'
-            csv_lines.append(f"{tag},{content},{position}")
-
-    texts_csv = "\n".join(csv_lines)
+    encoder = get_encoder(encoding)
+    # 텍스트가 없으면 헤더만 표시 (헤더가 없는 형식은 안내 문구)
+    texts_data = encoder.encode_texts(texts) or encoder.text_header or "[텍스트 없음]"
 
     # 사용자 메시지 구성
     user_message = f"""아래 웹 페이지의 텍스트 정보를 분석하여, 이 페이지가 단일 제품 상세 페이지인지 검증해주세요.
@@ -185,14 +214,14 @@ def build_messages(url: str, title: str, texts: list) -> list:
 - URL: {url}
 - 제목: {title}
 
-# 페이지 텍스트 (CSV format):
-```csv
-{texts_csv}
+# 페이지 텍스트 ({encoder.label}):
+```{encoder.code_language}
+{texts_data}
 ```
 
-위 CSV 데이터를 바탕으로 이 페이지가 단일 제품 상세 페이지인지 검증 결과를 JSON 형식으로 반환해주세요."""
+위 {encoder.data_name} 데이터를 바탕으로 이 페이지가 단일 제품 상세 페이지인지 검증 결과를 JSON 형식으로 반환해주세요."""
 
     return [
-        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "system", "content": build_system_prompt(encoding)},
         {"role": "user", "content": user_message},
     ]
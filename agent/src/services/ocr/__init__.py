@@ -4,16 +4,65 @@ from src.exceptions.base import ConfigurationError
 from src.utils.logger import get_logger
 
 from .base import BaseOCRService
+from .cache import OCRResultCache, close_ocr_cache, get_ocr_cache
+from .circuit_breaker import CircuitBreaker
 from .clova import ClovaOCRService
+from .composite import FailoverOCRService
+from .concurrency import (
+    AIMDLimiter,
+    get_ocr_concurrency_limiter,
+    get_ocr_concurrency_stats,
+)
 from .ocrspace import OcrSpaceService
+from .scheduler import OCRScheduler, get_ocr_scheduler
 
 logger = get_logger(__name__)
 
+# provider별 서비스 인스턴스 (HTTP 커넥션 풀을 요청 간 공유)
+_services: dict[str, BaseOCRService] = {}
+# (primary, secondary) 조합별 failover 서비스
+_failover_services: dict[str, FailoverOCRService] = {}
+
+SUPPORTED_PROVIDERS = ["clova", "ocrspace"]
+
+
+def _get_provider_service(provider: str, settings) -> BaseOCRService:
+    """
+    단일 provider OCR 서비스 반환 (provider별로 1회만 생성하여 재사용)
+
+    Raises:
+        ConfigurationError: 지원하지 않는 OCR provider인 경우
+    """
+    service = _services.get(provider)
+    if service is not None:
+        return service
+
+    if provider == "clova":
+        logger.info("Using Clova OCR service")
+        service = ClovaOCRService(settings)
+    elif provider == "ocrspace":
+        logger.info("Using OcrSpace OCR service")
+        service = OcrSpaceService(settings)
+    else:
+        raise ConfigurationError(
+            f"Unsupported OCR provider: {provider}",
+            details={
+                "provider": provider,
+                "supported_providers": SUPPORTED_PROVIDERS,
+            },
+        )
+
+    _services[provider] = service
+    return service
+
 
 def get_ocr_service(settings) -> BaseOCRService:
     """
     설정에 따라 적절한 OCR 서비스 인스턴스를 반환
 
+    ocr_fallback_provider가 설정되어 있으면 서킷 브레이커/자동 전환/hedging을 수행하는
+    FailoverOCRService를 반환합니다. 인스턴스는 1회만 생성하여 재사용합니다.
+
     Args:
         settings: SummarizePageSettings 인스턴스
 
@@ -24,21 +73,73 @@ def get_ocr_service(settings) -> BaseOCRService:
         ConfigurationError: 지원하지 않는 OCR provider인 경우
     """
     ocr_provider = getattr(settings, "ocr_provider", "clova").lower()
+    fallback_provider = getattr(settings, "ocr_fallback_provider", "").lower()
 
-    if ocr_provider == "clova":
-        logger.info("Using Clova OCR service")
-        return ClovaOCRService(settings)
-    elif ocr_provider == "ocrspace":
-        logger.info("Using OcrSpace OCR service")
-        return OcrSpaceService(settings)
-    else:
-        raise ConfigurationError(
-            f"Unsupported OCR provider: {ocr_provider}",
-            details={
-                "provider": ocr_provider,
-                "supported_providers": ["clova", "ocrspace"],
-            },
+    if not fallback_provider or fallback_provider == ocr_provider:
+        return _get_provider_service(ocr_provider, settings)
+
+    key = f"{ocr_provider}+{fallback_provider}"
+    service = _failover_services.get(key)
+    if service is None:
+        logger.info(f"Using failover OCR service ({ocr_provider} -> {fallback_provider})")
+        service = FailoverOCRService(
+            settings,
+            primary=_get_provider_service(ocr_provider, settings),
+            secondary=_get_provider_service(fallback_provider, settings),
         )
+        _failover_services[key] = service
+    return service
+
+
+def get_ocr_pool_stats() -> dict[str, dict]:
+    """
+    생성된 OCR 서비스별 커넥션 풀 사용 현황
+
+    failover 서비스는 "primary+secondary" 키로 서킷 브레이커 상태(시험 요청 점유 여부 포함)와
+    전환/hedging 통계를 함께 포함합니다.
+
+    Returns:
+        dict[str, dict]: provider(또는 failover 조합)별 풀 통계
+    """
+    stats = {provider: service.pool_stats() for provider, service in _services.items()}
+    stats.update({key: service.pool_stats() for key, service in _failover_services.items()})
+    return stats
+
+
+def get_ocr_failover_stats() -> dict[str, dict]:
+    """
+    failover 서비스별 서킷 브레이커/전환/hedging 현황
+
+    Returns:
+        dict[str, dict]: "primary+secondary" 조합별 통계
+    """
+    return {key: service.failover_stats() for key, service in _failover_services.items()}
+
+
+async def close_ocr_services():
+    """생성된 모든 OCR 서비스의 HTTP 클라이언트 종료 (lifespan shutdown 시 호출)"""
+    for service in _services.values():
+        await service.aclose()
+    _services.clear()
+    _failover_services.clear()
 
 
-__all__ = ["BaseOCRService", "ClovaOCRService", "OcrSpaceService", "get_ocr_service"]
+__all__ = [
+    "AIMDLimiter",
+    "BaseOCRService",
+    "CircuitBreaker",
+    "ClovaOCRService",
+    "FailoverOCRService",
+    "OCRResultCache",
+    "OCRScheduler",
+    "OcrSpaceService",
+    "close_ocr_cache",
+    "close_ocr_services",
+    "get_ocr_cache",
+    "get_ocr_concurrency_limiter",
+    "get_ocr_concurrency_stats",
+    "get_ocr_failover_stats",
+    "get_ocr_pool_stats",
+    "get_ocr_scheduler",
+    "get_ocr_service",
+]
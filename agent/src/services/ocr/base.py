@@ -1,23 +1,73 @@
 """OCR 서비스 기본 추상 클래스"""
 
 import asyncio
+import time
+import uuid
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Any, Callable, List, Optional
 
-from src.exceptions.base import ConfigurationError
+import httpx
+
+from src.exceptions.base import ConfigurationError, HTTPError, TimeoutError
 from src.graphs.summarize_page.state import ExtractedImage
 from src.utils.logger import get_logger
 
+from .cache import canonicalize_image_url, get_ocr_cache
+from .concurrency import get_ocr_concurrency_limiter
+from .scheduler import SlotTiming, get_ocr_scheduler
+
 logger = get_logger(__name__)
 
 
+def _batch_outcomes(task: asyncio.Task, batch: List[tuple[int, ExtractedImage]]):
+    """
+    완료된 배치 태스크를 (원본 인덱스, 이미지, 결과) 목록으로 변환
+
+    배치 전체가 실패(예외/취소)하면 배치 내 모든 이미지의 결과가 해당 예외입니다.
+    """
+    if task.cancelled():
+        outcome: Any = asyncio.CancelledError()
+    else:
+        outcome = task.exception() or task.result()
+    return [
+        (index, image, outcome if isinstance(outcome, BaseException) else outcome[position])
+        for position, (index, image) in enumerate(batch)
+    ]
+
+
 class BaseOCRService(ABC):
-    """OCR 서비스 추상 클래스 - 모든 OCR 제공자가 상속해야 함"""
+    """OCR 서비스 추상 클래스 - 모든 OCR 제공자가 상속해야 함
+
+    서비스 인스턴스는 프로세스당 1개가 생성되어 요청 간 공유되며,
+    keep-alive 커넥션 풀을 가진 httpx.AsyncClient를 1개 보유합니다.
+    (이미지/재시도마다 TCP+TLS handshake가 발생하지 않도록)
+    """
+
+    # provider 식별자 (캐시 키에 사용) - 각 구현체에서 지정
+    provider: str = ""
 
     def __init__(self, settings):
         self.settings = settings
         self._validate_config()
 
+        self._client: Optional[httpx.AsyncClient] = None
+        self._http2_enabled = False
+
+        # 커넥션 풀 사용 현황 (풀 크기 산정용)
+        self._in_flight = 0
+        self._peak_in_flight = 0
+        self._total_requests = 0
+        self._failed_requests = 0
+
+        # 진행 중인 OCR (정규화된 이미지 URL -> 결과 Future)
+        # 동시에 처리 중인 요청 간 같은 이미지를 중복 OCR하지 않도록 결과를 공유
+        self._pending_images: dict[str, asyncio.Future] = {}
+        self._shared_images = 0
+
+        # 마감 시간 이후 백그라운드에서 실행 중인 OCR (GC 방지용 참조 유지)
+        self._late_tasks: set[asyncio.Task] = set()
+        self._late_images = 0
+
     @abstractmethod
     def _validate_config(self):
         """설정 검증 (fail fast) - 각 구현체에서 구현 필요"""
@@ -36,31 +86,467 @@ class BaseOCRService(ABC):
         """
         pass
 
-    async def process_images(self, images: List[ExtractedImage]) -> List[ExtractedImage]:
+    # ========== HTTP Client ==========
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """공유 HTTP 클라이언트 (최초 접근 시 생성)"""
+        if self._client is None or self._client.is_closed:
+            self._client = self._create_client()
+        return self._client
+
+    def _create_client(self) -> httpx.AsyncClient:
+        """커넥션 풀 설정이 적용된 httpx.AsyncClient 생성"""
+        limits = httpx.Limits(
+            max_connections=self.settings.ocr_pool_max_connections,
+            max_keepalive_connections=self.settings.ocr_pool_max_keepalive,
+            keepalive_expiry=self.settings.ocr_pool_keepalive_expiry,
+        )
+
+        # HTTP/2는 h2 패키지가 설치된 경우에만 사용 (없으면 HTTP/1.1 keep-alive)
+        http2 = self.settings.ocr_http2
+        if http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError:
+                logger.warning(
+                    "HTTP/2 requested for OCR but 'h2' is not installed, using HTTP/1.1"
+                )
+                http2 = False
+        self._http2_enabled = http2
+
+        logger.info(
+            f"Creating pooled HTTP client for {type(self).__name__}",
+            extra={
+                "http2": http2,
+                "max_connections": limits.max_connections,
+                "max_keepalive_connections": limits.max_keepalive_connections,
+                "keepalive_expiry": limits.keepalive_expiry,
+            },
+        )
+        return httpx.AsyncClient(
+            timeout=self.settings.http_timeout,
+            limits=limits,
+            http2=http2,
+        )
+
+    async def _post_with_retry(self, url: str, image_url: str, **kwargs) -> Any:
+        """
+        공유 클라이언트로 POST 요청 후 JSON 응답 반환 (지수 백오프 재시도)
+
+        Args:
+            url: 요청 URL (OCR API endpoint)
+            image_url: OCR 대상 이미지 URL (에러 details용)
+            **kwargs: httpx.AsyncClient.post 인자 (json, data, headers 등)
+
+        Returns:
+            Any: 응답 JSON
+
+        Raises:
+            TimeoutError: 모든 재시도가 타임아웃된 경우
+            HTTPError: 모든 재시도가 HTTP 오류로 실패한 경우
+        """
+        max_retries = self.settings.http_max_retries
+
+        for attempt in range(max_retries):
+            self._in_flight += 1
+            self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+            self._total_requests += 1
+            started_at = time.perf_counter()
+            try:
+                response = await self.client.post(url, **kwargs)
+                response.raise_for_status()
+                self._record_outcome(latency=time.perf_counter() - started_at)
+                return response.json()
+
+            except httpx.TimeoutException:
+                self._failed_requests += 1
+                self._record_outcome(overload_reason="timeout")
+                if attempt == max_retries - 1:
+                    raise TimeoutError(
+                        f"OCR request timed out after {max_retries} attempts",
+                        details={
+                            "url": image_url,
+                            "timeout": self.settings.http_timeout,
+                        },
+                    )
+
+            except httpx.HTTPStatusError as e:
+                self._failed_requests += 1
+                status_code = e.response.status_code
+                if status_code == 429 or status_code >= 500:
+                    self._record_outcome(overload_reason=f"http_{status_code}")
+                if attempt == max_retries - 1:
+                    raise HTTPError(
+                        f"HTTP error: {e.response.status_code}",
+                        details={
+                            "url": image_url,
+                            "status_code": e.response.status_code,
+                            "response_text": e.response.text,
+                        },
+                    )
+
+            finally:
+                self._in_flight -= 1
+
+            await asyncio.sleep(2**attempt)
+
+    def _record_outcome(
+        self, latency: Optional[float] = None, overload_reason: Optional[str] = None
+    ):
+        """
+        요청 결과를 적응형 동시 실행 제어기에 전달
+
+        Args:
+            latency: 성공 시 응답 시간 (초)
+            overload_reason: 과부하 신호 사유 (HTTP 429/5xx, 타임아웃)
+        """
+        if not self.settings.ocr_adaptive_concurrency:
+            return
+
+        limiter = get_ocr_concurrency_limiter(self.settings)
+        if overload_reason:
+            limiter.on_overload(overload_reason)
+        elif latency is not None:
+            limiter.on_success(latency)
+
+    def pool_stats(self) -> dict:
+        """
+        커넥션 풀 사용 현황
+
+        Returns:
+            dict: 풀 설정, 현재/최대 동시 요청 수, 누적 요청 수 등
+        """
+        stats = {
+            "provider": type(self).__name__,
+            "http2": self._http2_enabled,
+            "max_connections": self.settings.ocr_pool_max_connections,
+            "max_keepalive_connections": self.settings.ocr_pool_max_keepalive,
+            "in_flight": self._in_flight,
+            "peak_in_flight": self._peak_in_flight,
+            "total_requests": self._total_requests,
+            "failed_requests": self._failed_requests,
+            "shared_images": self._shared_images,
+            "late_images": self._late_images,
+            "open_connections": 0,
+        }
+
+        # httpx는 풀 상태를 공개 API로 노출하지 않으므로 transport 내부 풀을 조회
+        if self._client is not None and not self._client.is_closed:
+            pool = getattr(getattr(self._client, "_transport", None), "_pool", None)
+            stats["open_connections"] = len(getattr(pool, "connections", []))
+
+        return stats
+
+    @property
+    def endpoint_url(self) -> str:
+        """OCR API 엔드포인트 (warm-up 대상) - 각 구현체에서 재정의"""
+        return ""
+
+    async def warm_up(self):
+        """
+        공유 클라이언트를 미리 생성하고 엔드포인트에 커넥션을 열어 둠 (lifespan startup 시 호출)
+
+        클라이언트 생성(SSL 컨텍스트 로드), DNS 조회, TCP+TLS handshake를 첫 요청 전에 수행합니다.
+        응답 상태 코드는 확인하지 않으며(HEAD를 지원하지 않아도 커넥션은 풀에 남음),
+        열린 커넥션은 ocr_pool_keepalive_expiry 동안 유지됩니다.
+        """
+        client = self.client
+        if self.endpoint_url:
+            await client.head(self.endpoint_url)
+
+    async def aclose(self):
+        """공유 HTTP 클라이언트 종료 (lifespan shutdown 시 호출)"""
+        for task in list(self._late_tasks):
+            task.cancel()
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+
+    # ========== Batch Processing ==========
+
+    def batch_limits(self) -> tuple[int, int]:
+        """
+        배치 요청 제한 - 여러 이미지를 한 요청에 담을 수 있는 구현체에서 재정의
+
+        Returns:
+            tuple[int, int]: (배치당 최대 이미지 수, 배치당 최대 요청 바이트 - 0이면 제한 없음)
+        """
+        return 1, 0
+
+    def _estimate_request_bytes(self, image: ExtractedImage) -> int:
+        """배치 바이트 예산 계산용 이미지 항목 크기 (구현체에서 재정의 가능)"""
+        return len(image["src"].encode("utf-8"))
+
+    def _make_batches(
+        self, items: List[tuple[int, ExtractedImage]]
+    ) -> List[List[tuple[int, ExtractedImage]]]:
+        """
+        (원본 인덱스, 이미지) 목록을 batch_limits()에 맞게 분할
+
+        Args:
+            items: (원본 인덱스, 이미지) 목록
+
+        Returns:
+            List[List[tuple[int, ExtractedImage]]]: 배치 목록
+        """
+        max_images, max_bytes = self.batch_limits()
+        batches: List[List[tuple[int, ExtractedImage]]] = []
+        current: List[tuple[int, ExtractedImage]] = []
+        current_bytes = 0
+
+        for item in items:
+            size = self._estimate_request_bytes(item[1])
+            if current and (
+                len(current) >= max_images
+                or (max_bytes and current_bytes + size > max_bytes)
+            ):
+                batches.append(current)
+                current, current_bytes = [], 0
+            current.append(item)
+            current_bytes += size
+
+        if current:
+            batches.append(current)
+        return batches
+
+    async def perform_ocr_batch(self, images: List[ExtractedImage]) -> List[str | None]:
+        """
+        여러 이미지 OCR 수행 - 기본 구현은 이미지별 perform_ocr 호출
+
+        배치 요청을 지원하는 구현체에서 재정의합니다.
+        배치 내 개별 이미지 실패는 해당 위치의 None으로 반환해야 합니다.
+
+        Args:
+            images: OCR을 수행할 이미지 목록
+
+        Returns:
+            List[str | None]: 이미지 순서대로 추출된 텍스트 또는 None (실패 시)
+        """
+        return list(await asyncio.gather(*(self.perform_ocr(image) for image in images)))
+
+    async def _lookup_cache(self, images: List[ExtractedImage]) -> List[str | None]:
+        """이미지별 캐시된 OCR 결과 조회 (캐시 비활성화 시 모두 None)"""
+        if not self.settings.ocr_cache_enabled:
+            return [None] * len(images)
+
+        cache = get_ocr_cache(self.settings)
+        return [await cache.get(image["src"], self.provider, self.settings) for image in images]
+
+    async def _store_cache(self, image: ExtractedImage, result: str | None):
+        """
+        OCR 결과 캐시 저장
+
+        성공 결과(텍스트 없는 이미지의 빈 문자열 포함)만 캐시하며,
+        실패(None)는 다음 요청에서 다시 시도하도록 캐시하지 않습니다.
+        """
+        if self.settings.ocr_cache_enabled and isinstance(result, str):
+            await get_ocr_cache(self.settings).set(
+                image["src"], self.provider, self.settings, result
+            )
+
+    async def _finish_late_batches(
+        self,
+        late: dict[asyncio.Task, List[tuple[int, ExtractedImage]]],
+        owned: dict[int, tuple[str, asyncio.Future]],
+    ):
+        """
+        마감 시간 이후 끝난 배치 결과 처리 (분석에는 반영되지 않음)
+
+        결과를 캐시에 저장하고 같은 이미지를 기다리는 다른 요청에 전달하며,
+        마감 시간 산정용으로 늦게 끝난 이미지를 로깅합니다.
+        """
+        started_at = time.perf_counter()
+        try:
+            await asyncio.wait(late)
+            for task, batch in late.items():
+                for index, image, result in _batch_outcomes(task, batch):
+                    key, future = owned[index]
+                    if not future.done():
+                        future.set_result(result)
+                    if self._pending_images.get(key) is future:
+                        del self._pending_images[key]
+                    await self._store_cache(image, result)
+                    self._late_images += 1
+                    logger.info(
+                        f"OCR late result: {image['src']}",
+                        extra={
+                            "late_seconds": round(time.perf_counter() - started_at, 2),
+                            "success": isinstance(result, str) and bool(result),
+                        },
+                    )
+        finally:
+            # 종료 시 취소되어도 대기 중인 요청이 멈추지 않도록 실패(None)로 전달
+            for task, batch in late.items():
+                task.cancel()
+                for index, _ in batch:
+                    key, future = owned[index]
+                    if not future.done():
+                        future.set_result(None)
+                    if self._pending_images.get(key) is future:
+                        del self._pending_images[key]
+
+    async def process_images(
+        self,
+        images: List[ExtractedImage],
+        on_progress: Optional[Callable[[int, int], None]] = None,
+        deadline: Optional[float] = None,
+        on_dropped: Optional[Callable[[List[ExtractedImage]], None]] = None,
+    ) -> List[ExtractedImage]:
         """
         여러 이미지를 병렬로 OCR 처리하고 각 이미지에 ocr_result 필드 추가
 
+        캐시에 없는 이미지만 batch_limits()에 맞게 묶어 요청합니다.
+        다른 요청이 이미 OCR 중인 이미지는 다시 요청하지 않고 그 결과를 기다립니다.
         이 메서드는 공통 로직이므로 BaseOCRService에서 구현
+
+        Args:
+            images: OCR 대상 이미지 목록
+            on_progress: 진행 콜백 (처리 완료 이미지 수, 전체 이미지 수)
+                - 캐시 조회 직후와 배치 완료 시마다 호출 (실패한 배치도 완료로 집계)
+            deadline: OCR 마감 시간 (초, None이면 모든 이미지 대기)
+                - 마감 시간까지 끝나지 않은 이미지는 ocr_result 빈 문자열로 반환
+                - 남은 OCR은 ocr_deadline_background 설정에 따라 백그라운드에서 끝까지 실행 또는 취소
+            on_dropped: 마감 시간 초과로 결과 없이 반환된 이미지 목록 콜백
         """
         if not images:
             logger.info("  No images to process, skipping OCR")
             return images
 
-        logger.info(
-            f"  Processing {len(images)} images (max concurrent: {self.settings.ocr_max_concurrent})"
-        )
-        semaphore = asyncio.Semaphore(self.settings.ocr_max_concurrent)
+        logger.info(f"  Processing {len(images)} images")
+
+        # 1. 캐시 조회
+        results: List[str | None | BaseException] = list(await self._lookup_cache(images))
+        misses = [(index, image) for index, image in enumerate(images) if results[index] is None]
+        if len(misses) < len(images):
+            logger.info(
+                f"  OCR cache: {len(images) - len(misses)} hits, {len(misses)} misses"
+            )
+
+        # 캐시 miss 중 다른 요청(또는 같은 요청의 중복 이미지)이 처리 중인 이미지는 결과 공유
+        loop = asyncio.get_running_loop()
+        pending: List[tuple[int, ExtractedImage]] = []
+        shared: List[tuple[int, asyncio.Future]] = []
+        owned: dict[int, tuple[str, asyncio.Future]] = {}
+        for index, image in misses:
+            key = canonicalize_image_url(image["src"])
+            future = self._pending_images.get(key)
+            if future is not None:
+                shared.append((index, future))
+                continue
+            future = loop.create_future()
+            self._pending_images[key] = future
+            owned[index] = (key, future)
+            pending.append((index, image))
+        if shared:
+            self._shared_images += len(shared)
+            logger.info(f"  OCR in-flight: {len(shared)} images shared with concurrent requests")
+
+        # 2. 캐시 miss 이미지 배치 OCR (프로세스 전역 스케줄러에서 슬롯 할당)
+        batches = self._make_batches(pending)
+        if self.settings.ocr_adaptive_concurrency:
+            # 제어기 생성 시 스케줄러 상한을 제어기 값으로 맞춤
+            get_ocr_concurrency_limiter(self.settings)
+        scheduler = get_ocr_scheduler(self.settings)
+        request_id = uuid.uuid4().hex
+        timings: List[SlotTiming] = []
+        expires_at = loop.time() + deadline if deadline is not None else None
+
+        completed = len(images) - len(misses)
+        expired = False
+        if on_progress is not None:
+            on_progress(completed, len(images))
 
-        async def bounded_ocr(image: ExtractedImage):
-            async with semaphore:
-                return await self.perform_ocr(image)
+        async def bounded_ocr(batch: List[tuple[int, ExtractedImage]]):
+            nonlocal completed
+            try:
+                async with scheduler.slot(request_id) as timing:
+                    timings.append(timing)
+                    return await self.perform_ocr_batch([image for _, image in batch])
+            finally:
+                completed += len(batch)
+                # 마감 이후에는 진행 상황을 보내지 않음 (노드 실행이 이미 끝났을 수 있음)
+                if on_progress is not None and not expired:
+                    on_progress(completed, len(images))
 
-        logger.info(f"Starting OCR for {len(images)} images")
+        if pending:
+            logger.info(f"Starting OCR for {len(pending)} images ({len(batches)} requests)")
 
-        tasks = [bounded_ocr(img) for img in images]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        tasks = {asyncio.create_task(bounded_ocr(batch)): batch for batch in batches}
+        late: dict[asyncio.Task, List[tuple[int, ExtractedImage]]] = {}
+        try:
+            if tasks:
+                await asyncio.wait(tasks, timeout=deadline)
+            for task, batch in tasks.items():
+                if not task.done():
+                    late[task] = batch
+                    continue
+                for index, image, result in _batch_outcomes(task, batch):
+                    results[index] = result
+                    owned[index][1].set_result(result)
+                    await self._store_cache(image, result)
+        finally:
+            expired = True
+            # 마감 후 남은 배치는 백그라운드에서 끝까지 실행하거나 취소
+            background = late if late and self.settings.ocr_deadline_background else {}
+            for task in tasks:
+                if task not in background:
+                    task.cancel()
+            background_indices = {index for batch in background.values() for index, _ in batch}
+
+            # 취소 등으로 결과를 못 낸 이미지는 대기 중인 요청에 실패(None)로 전달
+            for index, (key, future) in owned.items():
+                if index in background_indices:
+                    continue
+                if not future.done():
+                    future.set_result(None)
+                if self._pending_images.get(key) is future:
+                    del self._pending_images[key]
+
+            if background:
+                late_task = asyncio.create_task(self._finish_late_batches(background, owned))
+                self._late_tasks.add(late_task)
+                late_task.add_done_callback(self._late_tasks.discard)
+
+        if timings:
+            logger.info(
+                f"  OCR scheduling: queue wait {max(t.queue_wait for t in timings):.2f}s (max), "
+                f"service {sum(t.service_time for t in timings) / len(timings):.2f}s (avg)",
+                extra={"request_id": request_id, "scheduler_limit": scheduler.limit},
+            )
+
+        # 다른 요청이 처리 중인 이미지 결과 (캐시 저장은 처리한 요청에서 수행)
+        late_shared: set[int] = set()
+        if shared:
+            remaining = max(0.0, expires_at - loop.time()) if expires_at is not None else None
+            await asyncio.wait({future for _, future in shared}, timeout=remaining)
+            for index, future in shared:
+                if future.done():
+                    results[index] = future.result()
+                else:
+                    late_shared.add(index)
+            if on_progress is not None:
+                on_progress(len(images), len(images))
+
+        # 마감 시간까지 결과가 없는 이미지 (OCR 결과 없이 분석 진행)
+        dropped_indices = sorted(
+            {index for batch in late.values() for index, _ in batch} | late_shared
+        )
+        if dropped_indices:
+            dropped_images = [images[index] for index in dropped_indices]
+            logger.warning(
+                f"  OCR deadline exceeded: {len(dropped_images)}/{len(images)} images dropped",
+                extra={
+                    "request_id": request_id,
+                    "deadline": deadline,
+                    "dropped_images": [image["src"] for image in dropped_images],
+                    "background": bool(late) and self.settings.ocr_deadline_background,
+                },
+            )
+            if on_dropped is not None:
+                on_dropped(dropped_images)
 
-        # 이미지에 OCR 결과 추가
+        # 3. 이미지에 OCR 결과 추가
         processed_images = []
         successful_count = 0
         failed_count = 0
@@ -73,7 +559,7 @@ class BaseOCRService(ABC):
                 # OCR 성공
                 processed_image["ocr_result"] = result
                 successful_count += 1
-            elif isinstance(result, Exception):
+            elif isinstance(result, BaseException):
                 # OCR 실패 (예외)
                 failed_count += 1
                 logger.error(
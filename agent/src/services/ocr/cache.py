@@ -0,0 +1,180 @@
+"""OCR 결과 캐시 - 동일 상세 이미지의 반복 OCR 방지
+
+키 구성: "{provider}|{설정 fingerprint}|{정규화된 이미지 URL}"
+- provider/설정이 바뀌면 결과가 달라질 수 있으므로 키에 포함
+- 이미지 URL이 키의 마지막에 위치하므로 URL 단위 무효화(delete_suffix)가 가능
+"""
+
+import hashlib
+from typing import Optional
+
+from src.utils.cache import MemoryLRUCache, SQLiteTTLCache, TieredCache
+from src.utils.logger import get_logger
+from src.utils.url import normalize_url
+
+logger = get_logger(__name__)
+
+# provider별로 OCR 결과에 영향을 주는 설정 항목
+_PROVIDER_SETTING_FIELDS = {
+    "clova": ("clova_lang",),
+    "ocrspace": (
+        "ocr_engine",
+        "ocr_language",
+        "ocr_detect_orientation",
+        "ocr_is_table",
+        "ocr_scale",
+    ),
+}
+
+
+def canonicalize_image_url(url: str) -> str:
+    """
+    이미지 URL 정규화 (동일 이미지가 같은 키를 갖도록)
+
+    - scheme/host 소문자화, 기본 포트 제거
+    - fragment 제거
+    - query 파라미터 정렬 (이미지 URL의 query는 모두 유지)
+    - 정규화할 수 없는 URL(예: 범위를 벗어난 포트)은 원본 문자열 그대로 사용
+
+    Args:
+        url: 원본 이미지 URL
+
+    Returns:
+        str: 정규화된 URL
+    """
+    try:
+        return normalize_url(url, drop_tracking_params=False)
+    except ValueError:
+        return url.strip()
+
+
+def settings_fingerprint(provider: str, settings) -> str:
+    """
+    provider별 OCR 결과에 영향을 주는 설정값의 fingerprint
+
+    Args:
+        provider: OCR provider ("clova", "ocrspace")
+        settings: SummarizePageSettings 인스턴스
+
+    Returns:
+        str: 설정값 해시 (12자리)
+    """
+    fields = _PROVIDER_SETTING_FIELDS.get(provider, ())
+    raw = "|".join(f"{name}={getattr(settings, name, '')}" for name in fields)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:12]
+
+
+class OCRResultCache:
+    """OCR 결과 2단 캐시 (메모리 LRU + SQLite TTL)"""
+
+    def __init__(self, cache: TieredCache):
+        self._cache = cache
+
+    @staticmethod
+    def make_key(image_url: str, provider: str, settings) -> str:
+        """캐시 키 생성"""
+        return "|".join(
+            (
+                provider,
+                settings_fingerprint(provider, settings),
+                canonicalize_image_url(image_url),
+            )
+        )
+
+    async def get(self, image_url: str, provider: str, settings) -> Optional[str]:
+        """
+        캐시된 OCR 결과 조회
+
+        Args:
+            image_url: 이미지 URL
+            provider: OCR provider
+            settings: SummarizePageSettings 인스턴스
+
+        Returns:
+            Optional[str]: OCR 결과 (캐시 miss면 None)
+        """
+        return await self._cache.get(self.make_key(image_url, provider, settings))
+
+    async def set(self, image_url: str, provider: str, settings, text: str):
+        """
+        OCR 결과 저장
+
+        Args:
+            image_url: 이미지 URL
+            provider: OCR provider
+            settings: SummarizePageSettings 인스턴스
+            text: OCR 결과 텍스트 (텍스트 없는 이미지는 빈 문자열)
+        """
+        await self._cache.set(self.make_key(image_url, provider, settings), text)
+
+    async def invalidate(self, image_url: Optional[str] = None) -> int:
+        """
+        캐시 무효화
+
+        Args:
+            image_url: 무효화할 이미지 URL (None이면 전체 삭제)
+
+        Returns:
+            int: 삭제된 항목 수 (메모리/디스크 합산)
+        """
+        if image_url is None:
+            deleted = await self._cache.clear()
+        else:
+            deleted = await self._cache.delete_suffix(f"|{canonicalize_image_url(image_url)}")
+
+        logger.info(
+            "OCR cache invalidated",
+            extra={"image_url": image_url or "*", "deleted": deleted},
+        )
+        return deleted
+
+    def stats(self) -> dict:
+        """hit/miss 통계"""
+        return self._cache.stats()
+
+    def close(self):
+        """디스크 계층 연결 종료"""
+        self._cache.close()
+
+
+# 싱글톤 인스턴스
+_ocr_cache: Optional[OCRResultCache] = None
+
+
+def get_ocr_cache(settings=None) -> OCRResultCache:
+    """
+    OCR 결과 캐시 싱글톤 인스턴스 반환
+
+    Args:
+        settings: SummarizePageSettings 인스턴스 (최초 생성 시에만 사용, 생략 시 기본 설정)
+
+    Returns:
+        OCRResultCache: 캐시 인스턴스
+    """
+    global _ocr_cache
+    if _ocr_cache is None:
+        if settings is None:
+            from src.graphs.summarize_page.config import SummarizePageSettings
+
+            settings = SummarizePageSettings()
+
+        disk = None
+        if settings.ocr_cache_path:
+            disk = SQLiteTTLCache(settings.ocr_cache_path, settings.ocr_cache_ttl_seconds)
+
+        _ocr_cache = OCRResultCache(
+            TieredCache(
+                MemoryLRUCache(settings.ocr_cache_memory_max_bytes),
+                disk,
+                ttl_seconds=settings.ocr_cache_ttl_seconds,
+            )
+        )
+    return _ocr_cache
+
+
+def close_ocr_cache():
+    """OCR 캐시 종료 (lifespan shutdown 시 호출)"""
+    global _ocr_cache
+    if _ocr_cache is not None:
+        _ocr_cache.close()
+        _ocr_cache = None
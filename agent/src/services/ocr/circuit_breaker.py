@@ -0,0 +1,103 @@
+"""OCR provider 서킷 브레이커
+
+연속 실패가 임계값에 도달하면 회로를 열어(open) 일정 시간 해당 provider 호출을 차단하고,
+복구 대기 시간이 지나면 시험 요청 1건(half-open)으로 회복 여부를 확인합니다.
+"""
+
+import time
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class CircuitBreaker:
+    """provider별 서킷 브레이커 (closed -> open -> half_open -> closed)"""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: int, recovery_timeout: float):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+
+        self._state = self.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+
+        # 통계
+        self.total_opened = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        """현재 상태 (open 상태에서 복구 대기 시간이 지나면 half_open으로 전환)"""
+        if (
+            self._state == self.OPEN
+            and time.monotonic() - self._opened_at >= self.recovery_timeout
+        ):
+            self._state = self.HALF_OPEN
+            self._trial_in_flight = False
+        return self._state
+
+    def allow_request(self) -> bool:
+        """
+        요청 허용 여부
+
+        Returns:
+            bool: closed이거나, half_open 상태의 시험 요청이면 True
+        """
+        state = self.state
+        if state == self.CLOSED:
+            return True
+        if state == self.HALF_OPEN and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return True
+
+        self.rejected += 1
+        return False
+
+    def record_success(self):
+        """요청 성공 기록 (회로 닫기)"""
+        if self._state != self.CLOSED:
+            logger.info(f"OCR circuit closed: {self.name}")
+        self._state = self.CLOSED
+        self._consecutive_failures = 0
+        self._trial_in_flight = False
+
+    def record_failure(self):
+        """요청 실패 기록 (임계값 도달 또는 시험 요청 실패 시 회로 열기)"""
+        self._consecutive_failures += 1
+        self._trial_in_flight = False
+
+        if self._state == self.HALF_OPEN or (
+            self._state == self.CLOSED
+            and self._consecutive_failures >= self.failure_threshold
+        ):
+            self._state = self.OPEN
+            self._opened_at = time.monotonic()
+            self.total_opened += 1
+            logger.warning(
+                f"OCR circuit opened: {self.name}",
+                extra={
+                    "consecutive_failures": self._consecutive_failures,
+                    "recovery_timeout": self.recovery_timeout,
+                },
+            )
+
+    def record_cancel(self):
+        """결과 없이 취소된 요청 기록 (hedging에서 진 요청 등) - 시험 요청 슬롯만 반납"""
+        self._trial_in_flight = False
+
+    def stats(self) -> dict:
+        """브레이커 현황"""
+        return {
+            "state": self.state,
+            "trial_in_flight": self._trial_in_flight,
+            "consecutive_failures": self._consecutive_failures,
+            "total_opened": self.total_opened,
+            "rejected": self.rejected,
+        }
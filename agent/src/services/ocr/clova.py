@@ -1,9 +1,9 @@
 """Naver Clova OCR 서비스 구현체"""
 
 import asyncio
+import json
 import time
-
-import httpx
+from typing import List
 
 from src.exceptions.base import ConfigurationError, HTTPError, TimeoutError
 from src.graphs.summarize_page.exceptions import ImageURLError, OCRAPIError, OCRParseError
@@ -18,6 +18,8 @@ logger = get_logger(__name__)
 class ClovaOCRService(BaseOCRService):
     """Naver Clova OCR API를 사용하는 OCR 서비스"""
 
+    provider = "clova"
+
     def _validate_config(self):
         """설정 검증 (fail fast)"""
         if not self.settings.clova_secret_key:
@@ -38,6 +40,16 @@ class ClovaOCRService(BaseOCRService):
                 details={"value": self.settings.ocr_max_concurrent},
             )
 
+        if self.settings.clova_batch_size <= 0:
+            raise ConfigurationError(
+                "Invalid batch size setting",
+                details={"value": self.settings.clova_batch_size},
+            )
+
+    @property
+    def endpoint_url(self) -> str:
+        return self.settings.clova_invoke_url
+
     async def perform_ocr(self, image: ExtractedImage) -> str | None:
         """단일 이미지 OCR 수행 - Clova OCR API V2 사용"""
         try:
@@ -47,66 +59,15 @@ class ClovaOCRService(BaseOCRService):
                     "Invalid image URL format", details={"url": image["src"]}
                 )
 
-            # Clova OCR API V2 요청 바디
-            request_body = {
-                "images": [
-                    {
-                        "format": self._detect_image_format(image["src"]),
-                        "name": "image",
-                        "url": image["src"],
-                    }
-                ],
-                "lang": self.settings.clova_lang,
-                "requestId": f"ocr_{int(time.time() * 1000)}",
-                "resultType": "string",
-                "timestamp": int(time.time() * 1000),
-                "version": "V2",
-            }
-
-            # 요청 헤더
-            headers = {
-                "Content-Type": "application/json",
-                "X-OCR-SECRET": self.settings.clova_secret_key,
-            }
-
-            # 재시도 로직
-            for attempt in range(self.settings.http_max_retries):
-                try:
-                    async with httpx.AsyncClient(
-                        timeout=self.settings.http_timeout
-                    ) as client:
-                        response = await client.post(
-                            self.settings.clova_invoke_url,
-                            json=request_body,
-                            headers=headers,
-                        )
-                        response.raise_for_status()
-                        result = response.json()
-
-                        return self._parse_ocr_result(result, image["src"])
-
-                except httpx.TimeoutException as e:
-                    if attempt == self.settings.http_max_retries - 1:
-                        raise TimeoutError(
-                            f"OCR request timed out after {self.settings.http_max_retries} attempts",
-                            details={
-                                "url": image["src"],
-                                "timeout": self.settings.http_timeout,
-                            },
-                        )
-                    await asyncio.sleep(2**attempt)
-
-                except httpx.HTTPStatusError as e:
-                    if attempt == self.settings.http_max_retries - 1:
-                        raise HTTPError(
-                            f"HTTP error: {e.response.status_code}",
-                            details={
-                                "url": image["src"],
-                                "status_code": e.response.status_code,
-                                "response_text": e.response.text,
-                            },
-                        )
-                    await asyncio.sleep(2**attempt)
+            # 공유 클라이언트로 요청 (재시도 포함)
+            result = await self._post_with_retry(
+                self.settings.clova_invoke_url,
+                image["src"],
+                json=self._build_request_body([self._build_image_entry(image, "image")]),
+                headers=self._headers(),
+            )
+
+            return self._parse_ocr_result(result, image["src"])
 
         except ImageURLError as e:
             logger.warning(f"Invalid image URL: {e.message}", extra=e.details)
@@ -128,6 +89,110 @@ class ClovaOCRService(BaseOCRService):
             )
             return None
 
+    def batch_limits(self) -> tuple[int, int]:
+        """Clova V2 images 배열에 담을 최대 이미지 수 / 요청 바이트"""
+        return self.settings.clova_batch_size, self.settings.clova_batch_max_bytes
+
+    def _estimate_request_bytes(self, image: ExtractedImage) -> int:
+        """요청 바디 images 배열 항목의 직렬화 크기"""
+        return len(json.dumps(self._build_image_entry(image, "image")).encode("utf-8"))
+
+    async def perform_ocr_batch(self, images: List[ExtractedImage]) -> List[str | None]:
+        """
+        여러 이미지를 한 번의 V2 요청(images 배열)으로 OCR 수행
+
+        - 응답 images 항목은 요청 시 지정한 name으로 원본 이미지와 매칭
+        - 개별 이미지 실패(inferResult != SUCCESS 등)는 해당 이미지만 None 처리
+        - 배치 요청 자체가 실패하면 이미지별 단건 요청으로 재시도
+
+        Args:
+            images: OCR을 수행할 이미지 목록
+
+        Returns:
+            List[str | None]: 이미지 순서대로 추출된 텍스트 또는 None (실패 시)
+        """
+        if len(images) == 1:
+            return [await self.perform_ocr(images[0])]
+
+        results: List[str | None] = [None] * len(images)
+
+        # 잘못된 URL은 요청에서 제외
+        entries = {}
+        for index, image in enumerate(images):
+            if not image["src"].startswith(("http://", "https://")):
+                logger.warning(
+                    "Invalid image URL: Invalid image URL format", extra={"url": image["src"]}
+                )
+                continue
+            entries[f"image_{index}"] = index
+
+        if not entries:
+            return results
+
+        try:
+            response = await self._post_with_retry(
+                self.settings.clova_invoke_url,
+                images[next(iter(entries.values()))]["src"],
+                json=self._build_request_body(
+                    [
+                        self._build_image_entry(images[index], name)
+                        for name, index in entries.items()
+                    ]
+                ),
+                headers=self._headers(),
+            )
+
+        except Exception as e:
+            # 배치 요청 실패 시 단건 요청으로 대체 (원인 이미지 외 나머지는 성공할 수 있도록)
+            logger.warning(
+                f"Batch OCR request failed, falling back to single requests: {str(e)}",
+                extra={"batch_size": len(entries)},
+            )
+            singles = await asyncio.gather(
+                *(self.perform_ocr(images[index]) for index in entries.values())
+            )
+            for index, result in zip(entries.values(), singles):
+                results[index] = result
+            return results
+
+        for image_result in response.get("images", []):
+            index = entries.get(image_result.get("name"))
+            if index is None:
+                continue
+            image_url = images[index]["src"]
+            try:
+                results[index] = self._parse_image_result(image_result, image_url)
+            except (OCRAPIError, OCRParseError) as e:
+                logger.error(f"OCR result parsing error: {e.message}", extra=e.details)
+
+        return results
+
+    def _build_image_entry(self, image: ExtractedImage, name: str) -> dict:
+        """요청 바디 images 배열 항목 생성"""
+        return {
+            "format": self._detect_image_format(image["src"]),
+            "name": name,
+            "url": image["src"],
+        }
+
+    def _build_request_body(self, image_entries: List[dict]) -> dict:
+        """Clova OCR API V2 요청 바디 생성"""
+        return {
+            "images": image_entries,
+            "lang": self.settings.clova_lang,
+            "requestId": f"ocr_{int(time.time() * 1000)}",
+            "resultType": "string",
+            "timestamp": int(time.time() * 1000),
+            "version": "V2",
+        }
+
+    def _headers(self) -> dict:
+        """요청 헤더"""
+        return {
+            "Content-Type": "application/json",
+            "X-OCR-SECRET": self.settings.clova_secret_key,
+        }
+
     def _detect_image_format(self, url: str) -> str:
         """
         이미지 URL에서 포맷 추출
@@ -196,13 +261,36 @@ class ClovaOCRService(BaseOCRService):
                     "No images in response", details={"url": image_url, "result": result}
                 )
 
-            first_image = images[0]
-            infer_result = first_image.get("inferResult")
+            return self._parse_image_result(images[0], image_url)
+
+        except (OCRAPIError, OCRParseError) as e:
+            logger.error(f"OCR result parsing error: {e.message}", extra=e.details)
+            raise
+
+        except Exception as e:
+            raise OCRParseError(
+                f"Unexpected error parsing OCR result: {str(e)}",
+                details={"url": image_url, "result": result},
+            )
+
+    def _parse_image_result(self, image_result: dict, image_url: str) -> str:
+        """
+        응답 images 배열의 개별 항목 파싱
+
+        Args:
+            image_result: 응답 images 배열의 항목 (inferResult, fields 등)
+            image_url: 이미지 URL
+
+        Returns:
+            str: 추출된 텍스트 (공백으로 결합)
+        """
+        try:
+            infer_result = image_result.get("inferResult")
 
             # 성공 여부 확인
             if infer_result != "SUCCESS":
                 # GIF 등 지원하지 않는 포맷은 조용히 스킵
-                error_message = first_image.get("message", "Unknown error")
+                error_message = image_result.get("message", "Unknown error")
                 if "unsupported" in error_message.lower() or "gif" in image_url.lower():
                     logger.debug(
                         f"    OCR unsupported format (likely GIF): {image_url[:50]}..."
@@ -214,12 +302,12 @@ class ClovaOCRService(BaseOCRService):
                     details={
                         "url": image_url,
                         "inferResult": infer_result,
-                        "message": error_message,
+                        "error_message": error_message,
                     },
                 )
 
             # 텍스트 추출
-            fields = first_image.get("fields", [])
+            fields = image_result.get("fields", [])
 
             if not fields:
                 # 텍스트가 없는 이미지는 빈 문자열 반환
@@ -238,12 +326,11 @@ class ClovaOCRService(BaseOCRService):
 
             return combined_text.strip()
 
-        except (OCRAPIError, OCRParseError) as e:
-            logger.error(f"OCR result parsing error: {e.message}", extra=e.details)
+        except (OCRAPIError, OCRParseError):
             raise
 
         except Exception as e:
             raise OCRParseError(
                 f"Unexpected error parsing OCR result: {str(e)}",
-                details={"url": image_url, "result": result},
+                details={"url": image_url, "result": image_result},
             )
@@ -0,0 +1,198 @@
+"""Failover OCR 서비스 - 서킷 브레이커, provider 자동 전환, hedged request
+
+primary provider가 느리거나 장애일 때 요청 전체가 지연되지 않도록
+- provider별 서킷 브레이커로 장애 provider 호출을 차단하고
+- primary 실패 시 secondary로 자동 전환하며
+- (선택) primary 응답이 p95 지연 시간을 넘기면 secondary에 중복 요청을 보내 먼저 온 결과를 사용합니다.
+"""
+
+import asyncio
+import time
+from collections import deque
+
+from src.graphs.summarize_page.state import ExtractedImage
+from src.utils.logger import get_logger
+
+from .base import BaseOCRService
+from .circuit_breaker import CircuitBreaker
+
+logger = get_logger(__name__)
+
+# hedge 지연 시간 계산에 사용할 최근 지연 시간 샘플 수
+_LATENCY_SAMPLE_SIZE = 200
+# p95 추정에 필요한 최소 샘플 수 (미만이면 ocr_hedge_min_delay_seconds 사용)
+_MIN_LATENCY_SAMPLES = 20
+
+
+class FailoverOCRService(BaseOCRService):
+    """primary/secondary OCR 서비스를 조합한 OCR 서비스
+
+    캐시 키에는 primary provider를 사용합니다.
+    개별 이미지 단위로 전환/hedging을 수행하므로 배치 요청은 사용하지 않습니다.
+    (batch_limits 기본값 1 -> perform_ocr_batch 기본 구현이 이미지별 perform_ocr 호출)
+    """
+
+    def __init__(self, settings, primary: BaseOCRService, secondary: BaseOCRService):
+        self.primary = primary
+        self.secondary = secondary
+        self.provider = primary.provider
+        super().__init__(settings)
+
+        self._breakers = {
+            service.provider: CircuitBreaker(
+                service.provider,
+                failure_threshold=settings.ocr_breaker_failure_threshold,
+                recovery_timeout=settings.ocr_breaker_recovery_seconds,
+            )
+            for service in (primary, secondary)
+        }
+        self._latencies: dict[str, deque[float]] = {
+            service.provider: deque(maxlen=_LATENCY_SAMPLE_SIZE)
+            for service in (primary, secondary)
+        }
+
+        # 통계
+        self.failovers = 0
+        self.hedged_requests = 0
+        self.hedge_wins = 0
+
+    def _validate_config(self):
+        """설정 검증 - 하위 서비스 생성 시 각자 검증됨"""
+        pass
+
+    async def perform_ocr(self, image: ExtractedImage) -> str | None:
+        """서킷 브레이커 상태에 따라 primary -> secondary 순으로 OCR 수행"""
+        if not image["src"].startswith(("http://", "https://")):
+            logger.warning(
+                "Invalid image URL: Invalid image URL format", extra={"url": image["src"]}
+            )
+            return None
+
+        # 서킷 브레이커 허용 여부는 실제로 호출하기 직전에만 확인
+        # (half_open 상태의 시험 요청 슬롯을 호출하지 않을 provider가 점유하지 않도록)
+        primary, secondary = self.primary, self.secondary
+        primary_allowed = self._breakers[primary.provider].allow_request()
+        if primary_allowed:
+            if self.settings.ocr_hedging_enabled:
+                return await self._perform_hedged(image, primary, secondary)
+            result = await self._call(primary, image)
+            if result is not None:
+                return result
+
+        if not self._breakers[secondary.provider].allow_request():
+            if not primary_allowed:
+                logger.error(
+                    "All OCR providers are unavailable (circuit open)",
+                    extra={"url": image["src"]},
+                )
+            return None
+
+        if primary_allowed:
+            self.failovers += 1
+            logger.info(
+                f"OCR failover: {primary.provider} -> {secondary.provider}",
+                extra={"url": image["src"]},
+            )
+        return await self._call(secondary, image)
+
+    async def _call(self, service: BaseOCRService, image: ExtractedImage) -> str | None:
+        """하위 서비스 호출 + 서킷 브레이커/지연 시간 기록"""
+        breaker = self._breakers[service.provider]
+        started_at = time.perf_counter()
+
+        try:
+            result = await service.perform_ocr(image)
+        except asyncio.CancelledError:
+            breaker.record_cancel()
+            raise
+
+        if result is None:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+            self._latencies[service.provider].append(time.perf_counter() - started_at)
+        return result
+
+    def _hedge_delay(self, service: BaseOCRService) -> float:
+        """hedge 요청까지 대기 시간 (해당 provider의 최근 성공 지연 시간 p95)"""
+        samples = self._latencies[service.provider]
+        if len(samples) < _MIN_LATENCY_SAMPLES:
+            return self.settings.ocr_hedge_min_delay_seconds
+
+        ordered = sorted(samples)
+        p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+        return max(p95, self.settings.ocr_hedge_min_delay_seconds)
+
+    async def _perform_hedged(
+        self, image: ExtractedImage, primary: BaseOCRService, secondary: BaseOCRService
+    ) -> str | None:
+        """
+        hedged request - primary가 p95 안에 응답하지 않으면 secondary에도 요청
+
+        primary 서킷 브레이커 허용은 호출 측에서 확인하며, secondary는 요청 직전에 확인합니다.
+        먼저 성공한 결과를 사용하고 나머지 요청은 취소합니다.
+        """
+        primary_task = asyncio.create_task(self._call(primary, image))
+        tasks = [primary_task]
+
+        # 호출 측이 취소되어도 완료되지 않은 요청이 남지 않도록 생성 직후부터 정리 범위에 포함
+        try:
+            done, _ = await asyncio.wait({primary_task}, timeout=self._hedge_delay(primary))
+
+            if done and primary_task.result() is not None:
+                return primary_task.result()
+
+            # primary 실패(None) 또는 지연 -> secondary 요청 (secondary 회로가 열려 있으면 primary 결과 대기)
+            if not self._breakers[secondary.provider].allow_request():
+                return None if done else await primary_task
+
+            self.hedged_requests += 1
+            secondary_task = asyncio.create_task(self._call(secondary, image))
+            tasks.append(secondary_task)
+            pending = {secondary_task} if done else {primary_task, secondary_task}
+
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    result = task.result()
+                    if result is not None:
+                        if task is secondary_task:
+                            self.hedge_wins += 1
+                        return result
+            return None
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    def failover_stats(self) -> dict:
+        """서킷 브레이커 상태 및 전환/hedging 통계"""
+        return {
+            "primary": self.primary.provider,
+            "secondary": self.secondary.provider,
+            "breakers": {name: breaker.stats() for name, breaker in self._breakers.items()},
+            "failovers": self.failovers,
+            "hedged_requests": self.hedged_requests,
+            "hedge_wins": self.hedge_wins,
+        }
+
+    def pool_stats(self) -> dict:
+        """하위 서비스 커넥션 풀 현황 및 서킷 브레이커/전환/hedging 통계"""
+        return {
+            "primary": self.primary.pool_stats(),
+            "secondary": self.secondary.pool_stats(),
+            "shared_images": self._shared_images,
+            "late_images": self._late_images,
+            "failover": self.failover_stats(),
+        }
+
+    async def warm_up(self):
+        """하위 서비스 커넥션 warm-up (한쪽 실패가 다른 쪽 warm-up을 막지 않음)"""
+        await asyncio.gather(self.primary.warm_up(), self.secondary.warm_up(), return_exceptions=True)
+
+    async def aclose(self):
+        """하위 서비스 HTTP 클라이언트 종료"""
+        for task in list(self._late_tasks):
+            task.cancel()
+        await self.primary.aclose()
+        await self.secondary.aclose()
@@ -0,0 +1,177 @@
+"""OCR 동시 실행 수 적응형 제어 (AIMD)
+
+고정된 ocr_max_concurrent 대신 provider 응답을 관찰하여 스케줄러 상한을 조정합니다.
+- Additive Increase: 지연 시간이 안정적이면 성공 1회당 1/limit 씩 증가 (왕복 1회당 약 +1)
+- Multiplicative Decrease: HTTP 429/5xx, 타임아웃, 지연 시간 급증 시 decrease_factor 배로 감소
+- 상한은 항상 [min_limit, max_limit] 범위로 유지
+"""
+
+import time
+from typing import Callable, Optional
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 지연 시간 기준선(EWMA)이 안정될 때까지 급증 판정을 하지 않는 최소 샘플 수
+_WARMUP_SAMPLES = 10
+
+
+class AIMDLimiter:
+    """AIMD 방식 동시 실행 상한 제어기"""
+
+    def __init__(
+        self,
+        initial_limit: int,
+        min_limit: int,
+        max_limit: int,
+        decrease_factor: float = 0.5,
+        latency_spike_ratio: float = 2.0,
+        ewma_alpha: float = 0.1,
+        on_change: Optional[Callable[[int], None]] = None,
+    ):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.decrease_factor = decrease_factor
+        self.latency_spike_ratio = latency_spike_ratio
+        self.ewma_alpha = ewma_alpha
+        self.on_change = on_change
+
+        self._limit = float(min(max(initial_limit, min_limit), max_limit))
+        self._latency_ewma: Optional[float] = None
+        self._samples = 0
+        self._last_decrease_at = 0.0
+
+        # 통계
+        self.increases = 0
+        self.decreases = 0
+        self.last_decrease_reason = ""
+
+    @property
+    def limit(self) -> int:
+        """현재 동시 실행 상한"""
+        return int(self._limit)
+
+    def on_success(self, latency: float):
+        """
+        요청 성공 기록
+
+        Args:
+            latency: 응답 시간 (초)
+        """
+        baseline = self._latency_ewma
+        self._samples += 1
+
+        if (
+            baseline is not None
+            and self._samples > _WARMUP_SAMPLES
+            and latency > baseline * self.latency_spike_ratio
+        ):
+            # 급증한 샘플은 기준선에 반영하지 않음 (기준선이 같이 올라가 감지가 무뎌지지 않도록)
+            self._decrease("latency_spike")
+            return
+
+        self._latency_ewma = (
+            latency
+            if baseline is None
+            else baseline + self.ewma_alpha * (latency - baseline)
+        )
+
+        previous = self.limit
+        self._limit = min(self.max_limit, self._limit + 1 / self._limit)
+        if self.limit != previous:
+            self.increases += 1
+            self._notify()
+
+    def on_overload(self, reason: str):
+        """
+        과부하 신호 기록 (HTTP 429/5xx, 타임아웃)
+
+        Args:
+            reason: 감소 사유 (예: "http_429", "timeout")
+        """
+        self._decrease(reason)
+
+    def _decrease(self, reason: str):
+        """상한을 multiplicative decrease (연속 신호는 기준 지연 시간 동안 1회만 반영)"""
+        now = time.monotonic()
+        cooldown = self._latency_ewma or 0.0
+        if now - self._last_decrease_at < cooldown:
+            return
+
+        self._last_decrease_at = now
+        previous = self.limit
+        self._limit = max(float(self.min_limit), self._limit * self.decrease_factor)
+        self.decreases += 1
+        self.last_decrease_reason = reason
+
+        if self.limit != previous:
+            logger.info(
+                f"OCR concurrency decreased: {previous} -> {self.limit}",
+                extra={"reason": reason},
+            )
+            self._notify()
+
+    def _notify(self):
+        if self.on_change is not None:
+            self.on_change(self.limit)
+
+    def stats(self) -> dict:
+        """제어기 현황"""
+        return {
+            "limit": self.limit,
+            "min_limit": self.min_limit,
+            "max_limit": self.max_limit,
+            "latency_ewma_ms": round((self._latency_ewma or 0.0) * 1000, 2),
+            "increases": self.increases,
+            "decreases": self.decreases,
+            "last_decrease_reason": self.last_decrease_reason,
+        }
+
+
+# 싱글톤 인스턴스
+_limiter: Optional[AIMDLimiter] = None
+
+
+def get_ocr_concurrency_limiter(settings=None) -> AIMDLimiter:
+    """
+    OCR 동시 실행 제어기 싱글톤 인스턴스 반환
+
+    생성 시 OCR 스케줄러 상한을 초기값으로 맞추고, 이후 변경 사항을 스케줄러에 반영합니다.
+
+    Args:
+        settings: SummarizePageSettings 인스턴스 (최초 생성 시에만 사용, 생략 시 기본 설정)
+
+    Returns:
+        AIMDLimiter: 제어기 인스턴스
+    """
+    global _limiter
+    if _limiter is None:
+        if settings is None:
+            from src.graphs.summarize_page.config import SummarizePageSettings
+
+            settings = SummarizePageSettings()
+
+        from .scheduler import get_ocr_scheduler
+
+        scheduler = get_ocr_scheduler(settings)
+        _limiter = AIMDLimiter(
+            initial_limit=settings.ocr_max_concurrent,
+            min_limit=settings.ocr_concurrency_min,
+            max_limit=settings.ocr_concurrency_max,
+            decrease_factor=settings.ocr_concurrency_decrease_factor,
+            latency_spike_ratio=settings.ocr_latency_spike_ratio,
+            on_change=scheduler.set_limit,
+        )
+        scheduler.set_limit(_limiter.limit)
+    return _limiter
+
+
+def get_ocr_concurrency_stats() -> dict:
+    """
+    제어기 현황 (제어기가 아직 생성되지 않았거나 비활성화된 경우 빈 dict)
+
+    Returns:
+        dict: AIMDLimiter.stats()
+    """
+    return _limiter.stats() if _limiter is not None else {}
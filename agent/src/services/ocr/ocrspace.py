@@ -1,9 +1,5 @@
 """OcrSpace OCR 서비스 구현체"""
 
-import asyncio
-
-import httpx
-
 from src.exceptions.base import ConfigurationError, HTTPError, TimeoutError
 from src.graphs.summarize_page.exceptions import ImageURLError, OCRAPIError, OCRParseError
 from src.graphs.summarize_page.state import ExtractedImage
@@ -17,6 +13,8 @@ logger = get_logger(__name__)
 class OcrSpaceService(BaseOCRService):
     """OcrSpace API를 사용하는 OCR 서비스"""
 
+    provider = "ocrspace"
+
     def _validate_config(self):
         """설정 검증 (fail fast)"""
         if not self.settings.ocr_api_key:
@@ -30,6 +28,10 @@ class OcrSpaceService(BaseOCRService):
                 details={"value": self.settings.ocr_max_concurrent},
             )
 
+    @property
+    def endpoint_url(self) -> str:
+        return self.settings.ocr_api_endpoint
+
     async def perform_ocr(self, image: ExtractedImage) -> str | None:
         """단일 이미지 OCR 수행 - OcrSpace API 사용"""
         try:
@@ -49,41 +51,12 @@ class OcrSpaceService(BaseOCRService):
                 "isTable": str(self.settings.ocr_is_table).lower(),
             }
 
-            # 재시도 로직
-            for attempt in range(self.settings.http_max_retries):
-                try:
-                    async with httpx.AsyncClient(
-                        timeout=self.settings.http_timeout
-                    ) as client:
-                        response = await client.post(
-                            self.settings.ocr_api_endpoint, data=params
-                        )
-                        response.raise_for_status()
-                        result = response.json()
-
-                        return self._parse_ocr_result(result, image["src"])
-
-                except httpx.TimeoutException as e:
-                    if attempt == self.settings.http_max_retries - 1:
-                        raise TimeoutError(
-                            f"OCR request timed out after {self.settings.http_max_retries} attempts",
-                            details={
-                                "url": image["src"],
-                                "timeout": self.settings.http_timeout,
-                            },
-                        )
-                    await asyncio.sleep(2**attempt)
-
-                except httpx.HTTPStatusError as e:
-                    if attempt == self.settings.http_max_retries - 1:
-                        raise HTTPError(
-                            f"HTTP error: {e.response.status_code}",
-                            details={
-                                "url": image["src"],
-                                "status_code": e.response.status_code,
-                            },
-                        )
-                    await asyncio.sleep(2**attempt)
+            # 공유 클라이언트로 요청 (재시도 포함)
+            result = await self._post_with_retry(
+                self.settings.ocr_api_endpoint, image["src"], data=params
+            )
+
+            return self._parse_ocr_result(result, image["src"])
 
         except ImageURLError as e:
             logger.warning(f"Invalid image URL: {e.message}", extra=e.details)
@@ -0,0 +1,228 @@
+"""OCR 스케줄러 - 프로세스 전체 OCR 동시 실행 수 제한 및 요청 간 공정 분배
+
+process_images 호출(= summarize 요청)마다 Semaphore를 만들면
+동시 요청 N개일 때 provider로 ocr_max_concurrent x N개의 호출이 나가므로,
+프로세스 전체에서 하나의 스케줄러가 실행 슬롯을 관리합니다.
+
+- 전역 동시 실행 상한 (limit)
+- 요청(request_id)별 대기열을 round-robin으로 순회하여 슬롯 할당 (공정 분배)
+- 전체 대기 작업 수 제한 (초과 시 OCRQueueFullError)
+- 대기 시간(queue wait)과 실행 시간(service time)을 분리하여 집계
+"""
+
+import asyncio
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+from src.graphs.summarize_page.exceptions import OCRQueueFullError
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 통계용 최근 샘플 수
+_SAMPLE_SIZE = 1000
+
+
+def _percentile(samples: deque, percentile: float) -> float:
+    """최근 샘플의 백분위수 (ms)"""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(len(ordered) * percentile))
+    return round(ordered[index] * 1000, 2)
+
+
+class SlotTiming:
+    """슬롯 1회 사용의 대기/실행 시간 (초)"""
+
+    def __init__(self):
+        self.queue_wait = 0.0
+        self.service_time = 0.0
+
+
+class OCRScheduler:
+    """프로세스 전역 OCR 스케줄러 (싱글톤)"""
+
+    def __init__(self, limit: int, max_queue_size: int):
+        self._limit = limit
+        self.max_queue_size = max_queue_size
+
+        self._active = 0
+        # request_id -> 대기 중인 슬롯 요청(Future) 목록, 순서가 곧 round-robin 순서
+        self._queues: OrderedDict[str, deque[asyncio.Future]] = OrderedDict()
+        self._queued = 0
+
+        # 통계
+        self.peak_active = 0
+        self.peak_queued = 0
+        self.total_completed = 0
+        self.total_rejected = 0
+        self._queue_waits: deque[float] = deque(maxlen=_SAMPLE_SIZE)
+        self._service_times: deque[float] = deque(maxlen=_SAMPLE_SIZE)
+
+    @property
+    def limit(self) -> int:
+        """현재 전역 동시 실행 상한"""
+        return self._limit
+
+    def set_limit(self, limit: int):
+        """
+        전역 동시 실행 상한 변경 (늘어난 만큼 대기 작업을 즉시 시작)
+
+        Args:
+            limit: 새 상한 (1 이상)
+        """
+        self._limit = max(1, limit)
+        self._dispatch()
+
+    @asynccontextmanager
+    async def slot(self, request_id: str) -> AsyncIterator[SlotTiming]:
+        """
+        실행 슬롯 획득 (async with 블록 동안 슬롯 점유)
+
+        Args:
+            request_id: 요청 식별자 (같은 요청의 작업끼리 대기열을 공유)
+
+        Yields:
+            SlotTiming: 대기/실행 시간 (블록 종료 후 service_time이 채워짐)
+
+        Raises:
+            OCRQueueFullError: 대기 작업 수가 max_queue_size에 도달한 경우
+        """
+        timing = SlotTiming()
+        enqueued_at = time.perf_counter()
+        await self._acquire(request_id)
+        started_at = time.perf_counter()
+        timing.queue_wait = started_at - enqueued_at
+
+        try:
+            yield timing
+        finally:
+            timing.service_time = time.perf_counter() - started_at
+            self._queue_waits.append(timing.queue_wait)
+            self._service_times.append(timing.service_time)
+            self.total_completed += 1
+            self._release()
+
+    async def _acquire(self, request_id: str):
+        """슬롯이 할당될 때까지 대기"""
+        if self._active < self._limit and not self._queued:
+            self._start()
+            return
+
+        if self._queued >= self.max_queue_size:
+            self.total_rejected += 1
+            raise OCRQueueFullError(
+                "OCR queue is full",
+                details={
+                    "queued": self._queued,
+                    "max_queue_size": self.max_queue_size,
+                    "limit": self._limit,
+                },
+            )
+
+        ticket: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._queues.setdefault(request_id, deque()).append(ticket)
+        self._queued += 1
+        self.peak_queued = max(self.peak_queued, self._queued)
+
+        try:
+            await ticket
+        except asyncio.CancelledError:
+            if ticket.done() and not ticket.cancelled():
+                # 슬롯을 받은 직후 취소된 경우 슬롯 반납
+                self._release()
+            else:
+                self._remove_ticket(request_id, ticket)
+            raise
+
+    def _start(self):
+        """슬롯 점유"""
+        self._active += 1
+        self.peak_active = max(self.peak_active, self._active)
+
+    def _release(self):
+        """슬롯 반납 후 다음 대기 작업 시작"""
+        self._active -= 1
+        self._dispatch()
+
+    def _dispatch(self):
+        """빈 슬롯만큼 round-robin 순서로 대기 작업 시작"""
+        while self._active < self._limit and self._queues:
+            request_id, queue = next(iter(self._queues.items()))
+            ticket = queue.popleft()
+            self._queued -= 1
+
+            # 해당 요청을 대기열 맨 뒤로 보내 다음 슬롯은 다른 요청에 할당
+            if queue:
+                self._queues.move_to_end(request_id)
+            else:
+                del self._queues[request_id]
+
+            if ticket.done():
+                continue
+            self._start()
+            ticket.set_result(None)
+
+    def _remove_ticket(self, request_id: str, ticket: asyncio.Future):
+        """취소된 대기 작업을 대기열에서 제거"""
+        queue = self._queues.get(request_id)
+        if queue is None or ticket not in queue:
+            return
+        queue.remove(ticket)
+        self._queued -= 1
+        if not queue:
+            del self._queues[request_id]
+
+    def stats(self) -> dict:
+        """
+        스케줄러 현황
+
+        Returns:
+            dict: 상한, 실행/대기 작업 수, 대기 시간/실행 시간 백분위수(ms) 등
+        """
+        return {
+            "limit": self._limit,
+            "active": self._active,
+            "queued": self._queued,
+            "queued_requests": len(self._queues),
+            "max_queue_size": self.max_queue_size,
+            "peak_active": self.peak_active,
+            "peak_queued": self.peak_queued,
+            "total_completed": self.total_completed,
+            "total_rejected": self.total_rejected,
+            "queue_wait_p50_ms": _percentile(self._queue_waits, 0.5),
+            "queue_wait_p95_ms": _percentile(self._queue_waits, 0.95),
+            "service_time_p50_ms": _percentile(self._service_times, 0.5),
+            "service_time_p95_ms": _percentile(self._service_times, 0.95),
+        }
+
+
+# 싱글톤 인스턴스
+_scheduler: Optional[OCRScheduler] = None
+
+
+def get_ocr_scheduler(settings=None) -> OCRScheduler:
+    """
+    OCR 스케줄러 싱글톤 인스턴스 반환
+
+    Args:
+        settings: SummarizePageSettings 인스턴스 (최초 생성 시에만 사용, 생략 시 기본 설정)
+
+    Returns:
+        OCRScheduler: 스케줄러 인스턴스
+    """
+    global _scheduler
+    if _scheduler is None:
+        if settings is None:
+            from src.graphs.summarize_page.config import SummarizePageSettings
+
+            settings = SummarizePageSettings()
+
+        _scheduler = OCRScheduler(
+            limit=settings.ocr_max_concurrent,
+            max_queue_size=settings.ocr_queue_max_size,
+        )
+    return _scheduler
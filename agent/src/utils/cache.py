@@ -0,0 +1,308 @@
+"""범용 캐시 유틸리티
+
+- MemoryLRUCache: 바이트 크기 기준으로 제한되는 인메모리 LRU (항목별 만료 시각 지원)
+- SQLiteTTLCache: TTL이 적용되는 SQLite 기반 영속 캐시
+- TieredCache: 메모리 -> 디스크 순으로 조회하는 2단 캐시 (hit/miss 통계 포함)
+
+값은 문자열로 저장하며, 구조화된 데이터는 호출 측에서 JSON 직렬화하여 사용합니다.
+"""
+
+import asyncio
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def _sizeof(key: str, value: str) -> int:
+    """캐시 항목의 대략적인 크기 (UTF-8 바이트 기준)"""
+    return len(key.encode("utf-8")) + len(value.encode("utf-8"))
+
+
+class MemoryLRUCache:
+    """바이트 크기 제한 인메모리 LRU 캐시
+
+    전체 항목 크기의 합이 max_bytes를 넘으면 가장 오래 사용되지 않은 항목부터 제거합니다.
+    만료 시각이 지난 항목은 조회 시 삭제합니다.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        # key -> (value, size, expires_at) (expires_at이 None이면 만료 없음)
+        self._items: OrderedDict[str, tuple[str, int, Optional[float]]] = OrderedDict()
+        self._current_bytes = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @property
+    def current_bytes(self) -> int:
+        """현재 저장된 항목 크기 합계"""
+        return self._current_bytes
+
+    def get(self, key: str) -> Optional[str]:
+        """항목 조회 (조회된 항목은 최근 사용으로 갱신, 만료된 항목은 삭제 후 None 반환)"""
+        item = self._items.get(key)
+        if item is None:
+            return None
+        if item[2] is not None and item[2] < time.time():
+            self.delete(key)
+            return None
+        self._items.move_to_end(key)
+        return item[0]
+
+    def set(self, key: str, value: str, ttl_seconds: Optional[float] = None):
+        """항목 저장 (ttl_seconds 미지정 시 만료 없음, 단일 항목이 max_bytes보다 크면 저장하지 않음)"""
+        size = _sizeof(key, value)
+        self.delete(key)
+        if size > self.max_bytes:
+            return
+
+        expires_at = time.time() + ttl_seconds if ttl_seconds is not None else None
+        self._items[key] = (value, size, expires_at)
+        self._current_bytes += size
+
+        while self._current_bytes > self.max_bytes:
+            _, (_, evicted_size, _) = self._items.popitem(last=False)
+            self._current_bytes -= evicted_size
+            self.evictions += 1
+
+    def delete(self, key: str) -> bool:
+        """항목 삭제"""
+        item = self._items.pop(key, None)
+        if item is None:
+            return False
+        self._current_bytes -= item[1]
+        return True
+
+    def delete_suffix(self, suffix: str) -> int:
+        """키가 suffix로 끝나는 모든 항목 삭제"""
+        keys = [key for key in self._items if key.endswith(suffix)]
+        for key in keys:
+            self.delete(key)
+        return len(keys)
+
+    def clear(self) -> int:
+        """모든 항목 삭제"""
+        count = len(self._items)
+        self._items.clear()
+        self._current_bytes = 0
+        return count
+
+
+class SQLiteTTLCache:
+    """TTL이 적용되는 SQLite 영속 캐시
+
+    동기 API이므로 이벤트 루프에서는 asyncio.to_thread로 호출해야 합니다.
+    (TieredCache가 이를 대신 처리)
+    """
+
+    def __init__(self, path: str | Path, ttl_seconds: float):
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        """항목 조회 (만료된 항목은 삭제 후 None 반환)"""
+        entry = self.get_entry(key)
+        return entry[0] if entry is not None else None
+
+    def get_entry(self, key: str) -> Optional[tuple[str, float]]:
+        """항목과 만료 시각 조회 (만료된 항목은 삭제 후 None 반환)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] < time.time():
+                self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+            return row[0], row[1]
+
+    def set(self, key: str, value: str, ttl_seconds: Optional[float] = None):
+        """항목 저장 (ttl_seconds 미지정 시 기본 TTL 사용)"""
+        expires_at = time.time() + (ttl_seconds or self.ttl_seconds)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, expires_at),
+            )
+            self._conn.commit()
+
+    def delete(self, key: str) -> bool:
+        """항목 삭제"""
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+            self._conn.commit()
+            return cursor.rowcount > 0
+
+    def delete_suffix(self, suffix: str) -> int:
+        """키가 suffix로 끝나는 모든 항목 삭제"""
+        escaped = suffix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM cache WHERE key LIKE ? ESCAPE '\\'", (f"%{escaped}",)
+            )
+            self._conn.commit()
+            return cursor.rowcount
+
+    def purge_expired(self) -> int:
+        """만료된 항목 일괄 삭제"""
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM cache WHERE expires_at < ?", (time.time(),)
+            )
+            self._conn.commit()
+            return cursor.rowcount
+
+    def clear(self) -> int:
+        """모든 항목 삭제"""
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM cache")
+            self._conn.commit()
+            return cursor.rowcount
+
+    def count(self) -> int:
+        """저장된 항목 수 (만료 항목 포함)"""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+
+    def close(self):
+        """DB 연결 종료"""
+        with self._lock:
+            self._conn.close()
+
+
+class TieredCache:
+    """메모리 LRU + SQLite 2단 캐시
+
+    조회 순서: 메모리 -> 디스크 (디스크 hit은 남은 TTL로 메모리에 승격)
+    저장 시 두 계층에 모두 기록합니다. disk가 None이면 메모리 전용으로 동작합니다.
+    메모리 계층에도 같은 TTL을 적용합니다 (ttl_seconds 미지정 시 디스크 TTL, 디스크도 없으면 만료 없음).
+    """
+
+    def __init__(
+        self,
+        memory: MemoryLRUCache,
+        disk: Optional[SQLiteTTLCache] = None,
+        ttl_seconds: Optional[float] = None,
+    ):
+        self.memory = memory
+        self.disk = disk
+        if ttl_seconds is None and disk is not None:
+            ttl_seconds = disk.ttl_seconds
+        self.ttl_seconds = ttl_seconds
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.sets = 0
+
+    async def get(self, key: str) -> Optional[str]:
+        """
+        캐시 조회
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            Optional[str]: 캐시된 값 (없으면 None)
+        """
+        value = self.memory.get(key)
+        if value is not None:
+            self.memory_hits += 1
+            return value
+
+        if self.disk is not None:
+            try:
+                entry = await asyncio.to_thread(self.disk.get_entry, key)
+            except sqlite3.Error as e:
+                logger.warning(f"Disk cache read failed: {str(e)}")
+                entry = None
+
+            if entry is not None:
+                value, expires_at = entry
+                self.disk_hits += 1
+                self.memory.set(key, value, ttl_seconds=expires_at - time.time())
+                return value
+
+        self.misses += 1
+        return None
+
+    async def set(self, key: str, value: str):
+        """
+        캐시 저장 (메모리 + 디스크)
+
+        Args:
+            key: 캐시 키
+            value: 저장할 값
+        """
+        self.sets += 1
+        self.memory.set(key, value, ttl_seconds=self.ttl_seconds)
+
+        if self.disk is not None:
+            try:
+                await asyncio.to_thread(self.disk.set, key, value)
+            except sqlite3.Error as e:
+                logger.warning(f"Disk cache write failed: {str(e)}")
+
+    async def delete(self, key: str) -> int:
+        """단일 키 삭제 (삭제된 항목 수 반환, 계층별 합산)"""
+        deleted = int(self.memory.delete(key))
+        if self.disk is not None:
+            deleted += int(await asyncio.to_thread(self.disk.delete, key))
+        return deleted
+
+    async def delete_suffix(self, suffix: str) -> int:
+        """키가 suffix로 끝나는 항목 삭제 (삭제된 항목 수 반환, 계층별 합산)"""
+        deleted = self.memory.delete_suffix(suffix)
+        if self.disk is not None:
+            deleted += await asyncio.to_thread(self.disk.delete_suffix, suffix)
+        return deleted
+
+    async def clear(self) -> int:
+        """모든 항목 삭제 (삭제된 항목 수 반환, 계층별 합산)"""
+        deleted = self.memory.clear()
+        if self.disk is not None:
+            deleted += await asyncio.to_thread(self.disk.clear)
+        return deleted
+
+    def stats(self) -> dict:
+        """hit/miss 통계 및 계층별 사용량"""
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        hits = self.memory_hits + self.disk_hits
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "sets": self.sets,
+            "hit_ratio": round(hits / lookups, 4) if lookups else 0.0,
+            "memory_items": len(self.memory),
+            "memory_bytes": self.memory.current_bytes,
+            "memory_max_bytes": self.memory.max_bytes,
+            "memory_evictions": self.memory.evictions,
+            "disk_enabled": self.disk is not None,
+        }
+
+    def close(self):
+        """디스크 계층 연결 종료"""
+        if self.disk is not None:
+            self.disk.close()
@@ -0,0 +1,273 @@
+"""디버그 캡처 - 요청 단위 디버그 산출물(파싱된 HTML, LLM 입력 등)을 메모리 링 버퍼에 보관
+
+기본값은 비활성화이며, debug_capture_enabled 설정이 켜진 경우 다음 요청의 산출물만 수집합니다.
+- 요청 헤더 X-Debug-Capture: 1
+- debug_capture_sample_rate 비율로 샘플링된 요청
+
+수집된 캡처는 최근 N개만 메모리에 유지하고, 선택적으로 백그라운드 스레드에서
+logs/debug_captures/<날짜>/<capture_id>/ 로 기록합니다 (요청 경로에서 디스크 I/O 없음).
+노드에서는 capture_artifact()만 호출하면 되며, 캡처 중이 아닐 때는 아무 작업도 하지 않습니다.
+"""
+
+import asyncio
+import random
+import re
+import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, Optional
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 기본 디스크 기록 경로 (agent/logs/debug_captures)
+CAPTURES_DIR = Path(__file__).parents[2] / "logs" / "debug_captures"
+
+# 파일명으로 사용할 수 없는 문자
+_UNSAFE_NAME = re.compile(r"[^A-Za-z0-9._-]")
+
+
+@dataclass
+class DebugCapture:
+    """요청 1건의 디버그 캡처"""
+
+    capture_id: str
+    url: str
+    created_at: str
+    artifacts: dict[str, str] = field(default_factory=dict)
+
+    def summary(self) -> dict:
+        """산출물 본문을 제외한 메타데이터"""
+        return {
+            "capture_id": self.capture_id,
+            "url": self.url,
+            "created_at": self.created_at,
+            "artifacts": {name: len(content) for name, content in self.artifacts.items()},
+        }
+
+
+# 현재 요청의 캡처 (LangGraph 노드 태스크에도 컨텍스트가 전파됨)
+_current_capture: ContextVar[Optional[DebugCapture]] = ContextVar(
+    "debug_capture", default=None
+)
+
+
+class DebugCaptureStore:
+    """최근 캡처를 보관하는 링 버퍼 (+ 선택적 디스크 기록)"""
+
+    def __init__(
+        self,
+        max_entries: int = 20,
+        sample_rate: float = 0.0,
+        spill_dir: Optional[Path] = None,
+        enabled: bool = True,
+    ):
+        self.enabled = enabled
+        self.max_entries = max_entries
+        self.sample_rate = sample_rate
+        self.spill_dir = Path(spill_dir) if spill_dir else None
+
+        self._captures: OrderedDict[str, DebugCapture] = OrderedDict()
+        self._spill_tasks: set[asyncio.Task] = set()
+
+        # 통계
+        self.started = 0
+        self.evicted = 0
+        self.spilled = 0
+        self.spill_errors = 0
+
+    def should_capture(self, force: bool = False) -> bool:
+        """헤더 강제 또는 샘플링 여부 판단 (저장소가 비활성화되어 있으면 항상 False)"""
+        if not self.enabled:
+            return False
+        return force or (self.sample_rate > 0 and random.random() < self.sample_rate)
+
+    def start(self, url: str) -> DebugCapture:
+        """새 캡처 생성"""
+        self.started += 1
+        return DebugCapture(
+            capture_id=uuid.uuid4().hex,
+            url=url,
+            created_at=datetime.now().isoformat(),
+        )
+
+    def finish(self, capture: DebugCapture):
+        """
+        완료된 캡처를 링 버퍼에 저장하고 디스크 기록 예약
+
+        Args:
+            capture: 완료된 캡처
+        """
+        self._captures[capture.capture_id] = capture
+        while len(self._captures) > self.max_entries:
+            self._captures.popitem(last=False)
+            self.evicted += 1
+
+        if self.spill_dir is None or not capture.artifacts:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._spill(capture)
+            return
+        task = loop.create_task(asyncio.to_thread(self._spill, capture))
+        self._spill_tasks.add(task)
+        task.add_done_callback(self._spill_tasks.discard)
+
+    def _spill(self, capture: DebugCapture):
+        """캡처 산출물을 파일로 기록 (워커 스레드에서 실행)"""
+        try:
+            capture_dir = self._capture_dir(capture.capture_id, capture.created_at[:10])
+            capture_dir.mkdir(parents=True, exist_ok=True)
+            for name, content in capture.artifacts.items():
+                (capture_dir / name).write_text(content, encoding="utf-8")
+            (capture_dir / "meta.txt").write_text(
+                f"URL: {capture.url}\nTimestamp: {capture.created_at}\n", encoding="utf-8"
+            )
+            self.spilled += 1
+        except Exception as e:
+            # 디버그 기록 실패는 메인 작업에 영향 주지 않음
+            self.spill_errors += 1
+            logger.warning(f"Failed to spill debug capture: {str(e)}")
+
+    def _capture_dir(self, capture_id: str, date: str) -> Path:
+        return self.spill_dir / date / capture_id
+
+    def recent(self) -> list[dict]:
+        """메모리에 보관 중인 캡처 목록 (최신순)"""
+        return [capture.summary() for capture in reversed(self._captures.values())]
+
+    def get(self, capture_id: str) -> Optional[DebugCapture]:
+        """
+        캡처 조회 (링 버퍼에서 밀려난 경우 디스크 기록본 조회)
+
+        디스크 조회는 동기 파일 I/O이므로 이벤트 루프에서는 aget()을 사용해야 합니다.
+
+        Args:
+            capture_id: 캡처 ID
+
+        Returns:
+            Optional[DebugCapture]: 캡처 (없으면 None)
+        """
+        capture = self._captures.get(capture_id)
+        if capture is not None or self.spill_dir is None:
+            return capture
+        return self._load_spilled(capture_id)
+
+    async def aget(self, capture_id: str) -> Optional[DebugCapture]:
+        """
+        캡처 조회 (비동기 - 디스크 기록본은 워커 스레드에서 읽음)
+
+        Args:
+            capture_id: 캡처 ID
+
+        Returns:
+            Optional[DebugCapture]: 캡처 (없으면 None)
+        """
+        capture = self._captures.get(capture_id)
+        if capture is not None or self.spill_dir is None:
+            return capture
+        return await asyncio.to_thread(self._load_spilled, capture_id)
+
+    def _load_spilled(self, capture_id: str) -> Optional[DebugCapture]:
+        """디스크 기록본에서 캡처 복원 (동기 파일 I/O)"""
+        if _UNSAFE_NAME.search(capture_id):
+            return None
+
+        for capture_dir in self.spill_dir.glob(f"*/{capture_id}"):
+            artifacts = {
+                path.name: path.read_text(encoding="utf-8")
+                for path in capture_dir.iterdir()
+                if path.name != "meta.txt"
+            }
+            meta = dict(
+                line.split(": ", 1)
+                for line in (capture_dir / "meta.txt").read_text(encoding="utf-8").splitlines()
+                if ": " in line
+            )
+            return DebugCapture(
+                capture_id=capture_id,
+                url=meta.get("URL", ""),
+                created_at=meta.get("Timestamp", ""),
+                artifacts=artifacts,
+            )
+        return None
+
+    def stats(self) -> dict:
+        """캡처 현황"""
+        return {
+            "entries": len(self._captures),
+            "started": self.started,
+            "evicted": self.evicted,
+            "spilled": self.spilled,
+            "spill_errors": self.spill_errors,
+        }
+
+
+# 싱글톤 인스턴스
+_store: Optional[DebugCaptureStore] = None
+
+
+def get_debug_capture_store() -> DebugCaptureStore:
+    """
+    디버그 캡처 저장소 싱글톤 인스턴스 반환
+
+    Returns:
+        DebugCaptureStore: 저장소 인스턴스
+    """
+    global _store
+    if _store is None:
+        from src.config.base import BaseSettings
+
+        settings = BaseSettings()
+        _store = DebugCaptureStore(
+            max_entries=settings.debug_capture_max_entries,
+            sample_rate=settings.debug_capture_sample_rate,
+            spill_dir=CAPTURES_DIR if settings.debug_capture_spill_to_disk else None,
+            enabled=settings.debug_capture_enabled,
+        )
+    return _store
+
+
+@contextmanager
+def debug_capture(url: str, force: bool = False) -> Iterator[Optional[DebugCapture]]:
+    """
+    요청 단위 디버그 캡처 범위 설정
+
+    Args:
+        url: 요청 URL
+        force: True면 샘플링과 관계없이 캡처 (X-Debug-Capture 헤더)
+
+    Yields:
+        Optional[DebugCapture]: 캡처 중이면 캡처 객체, 아니면 None
+    """
+    store = get_debug_capture_store()
+    if not store.should_capture(force):
+        yield None
+        return
+
+    capture = store.start(url)
+    token = _current_capture.set(capture)
+    try:
+        yield capture
+    finally:
+        _current_capture.reset(token)
+        store.finish(capture)
+
+
+def capture_artifact(name: str, content: str):
+    """
+    현재 요청의 디버그 산출물 기록 (캡처 중이 아니면 아무 작업도 하지 않음)
+
+    Args:
+        name: 산출물 이름 (예: "parsed.html")
+        content: 산출물 내용
+    """
+    capture = _current_capture.get()
+    if capture is not None:
+        capture.artifacts[_UNSAFE_NAME.sub("_", name)] = content
@@ -0,0 +1,147 @@
+"""요청 단위 HTML 문서 - html_body를 1회만 파싱하여 모든 추출기가 공유"""
+
+from typing import Optional, Union
+
+from bs4 import BeautifulSoup
+from lxml import etree
+
+# get_text()에서 제외되는 태그 (BeautifulSoup은 Script/Stylesheet/TemplateString으로 분류하여 제외)
+_NON_TEXT_TAGS = frozenset({"script", "style", "template"})
+
+
+class HTMLDocument:
+    """파싱된 HTML 문서 (요청당 1개)
+
+    텍스트/이미지 추출기와 도메인 파서가 각자 BeautifulSoup(html_body, 'lxml')을
+    다시 생성하지 않도록 최초 접근 시 1회 파싱한 트리를 공유합니다.
+    - soup: 페이지 전체를 순회하는 범용 추출기용 BeautifulSoup 트리
+    - tree: 필요한 영역만 XPath로 조회하는 도메인 파서용 lxml 트리
+    추출기는 트리를 읽기만 해야 하며 요소를 변경(decompose, extract 등)하면 안 됩니다.
+    """
+
+    def __init__(self, html: str, features: str = "lxml"):
+        """
+        Args:
+            html: HTML 문자열
+            features: BeautifulSoup 파서 (기본: lxml)
+        """
+        self.html = html
+        self.features = features
+        self._soup: Optional[BeautifulSoup] = None
+        self._tree: Optional[etree._Element] = None
+
+    @property
+    def soup(self) -> BeautifulSoup:
+        """파싱된 트리 (최초 접근 시 1회 파싱)"""
+        if self._soup is None:
+            self._soup = BeautifulSoup(self.html, self.features)
+        return self._soup
+
+    @property
+    def tree(self) -> Optional[etree._Element]:
+        """lxml 트리 (최초 접근 시 1회 파싱, 빈 문서면 None)
+
+        트리는 C 구조체로만 생성되고 XPath로 찾은 요소만 Python 객체가 되므로,
+        필요한 영역만 읽는 도메인 파서는 BeautifulSoup 트리 대신 이 트리를 사용합니다.
+        """
+        if self._tree is None and self.html.strip():
+            self._tree = etree.fromstring(self.html.encode("utf-8"), etree.HTMLParser(encoding="utf-8"))
+        return self._tree
+
+    @classmethod
+    def of(cls, source: Union[str, "HTMLDocument"]) -> "HTMLDocument":
+        """
+        HTML 문자열 또는 HTMLDocument를 HTMLDocument로 변환
+
+        Args:
+            source: HTML 문자열 또는 이미 생성된 문서
+
+        Returns:
+            HTMLDocument: 전달된 문서 그대로 또는 새 문서
+        """
+        if isinstance(source, HTMLDocument):
+            return source
+        return cls(source)
+
+    def __len__(self) -> int:
+        return len(self.html)
+
+
+# ========== lxml 영역 탐색 헬퍼 ==========
+
+
+def xpath_has_class(class_name: str) -> str:
+    """
+    class 속성에 토큰이 포함되었는지 검사하는 XPath 조건식 (BeautifulSoup class_= 매칭과 동일)
+
+    Args:
+        class_name: 클래스 이름
+
+    Returns:
+        str: XPath 조건식 (예: f"//div[{xpath_has_class('price')}]")
+    """
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')"
+
+
+def xpath_all(xpath: etree.XPath, tree: Optional[etree._Element]) -> list[etree._Element]:
+    """
+    컴파일된 XPath로 요소 목록 조회
+
+    Args:
+        xpath: 컴파일된 XPath
+        tree: HTMLDocument.tree (None이면 빈 목록)
+
+    Returns:
+        list[etree._Element]: 매칭된 요소 (문서 순서)
+    """
+    if tree is None:
+        return []
+    return [element for element in xpath(tree) if isinstance(element, etree._Element)]
+
+
+def xpath_first(xpath: etree.XPath, tree: Optional[etree._Element]) -> Optional[etree._Element]:
+    """
+    컴파일된 XPath로 첫 번째 요소 조회
+
+    Args:
+        xpath: 컴파일된 XPath
+        tree: HTMLDocument.tree (None이면 None)
+
+    Returns:
+        Optional[etree._Element]: 첫 번째 매칭 요소
+    """
+    matches = xpath_all(xpath, tree)
+    return matches[0] if matches else None
+
+
+def element_text(element: etree._Element) -> str:
+    """
+    요소의 텍스트 (BeautifulSoup get_text(strip=True)와 동일한 결과)
+
+    주석과 script/style/template 내부 텍스트는 제외하고,
+    각 텍스트 노드를 strip한 뒤 빈 문자열을 제외하고 이어 붙입니다.
+
+    Args:
+        element: lxml 요소
+
+    Returns:
+        str: 텍스트
+    """
+    parts: list[str] = []
+    # 요소는 방문 시 text를, 하위 요소 처리 후 tail을 추가 (문서 순서 유지)
+    stack: list[Union[etree._Element, str]] = [element]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, str):
+            parts.append(node)
+            continue
+        if node.tag in _NON_TEXT_TAGS:
+            continue
+        # 주석/처리 지시문은 tag가 문자열이 아님 (tail은 부모 텍스트로 포함)
+        if isinstance(node.tag, str) and node.text:
+            parts.append(node.text)
+        for child in reversed(node):
+            if child.tail:
+                stack.append(child.tail)
+            stack.append(child)
+    return "".join(stripped for stripped in (part.strip() for part in parts) if stripped)
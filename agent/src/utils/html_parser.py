@@ -4,17 +4,18 @@ Extension의 textParser.ts와 imageParser.ts 로직을 Python으로 이식
 BeautifulSoup을 사용하여 HTML body에서 텍스트와 이미지를 추출
 """
 
-from typing import List
-from bs4 import BeautifulSoup, Tag
+from typing import Iterable, Iterator, List, Union
+from bs4 import Tag
 from urllib.parse import urljoin
 
 from ..graphs.summarize_page.state import ExtractedText, ExtractedImage
+from .html_document import HTMLDocument
 
 
 class HTMLContentExtractor:
     """HTML에서 텍스트와 이미지를 추출하는 유틸리티 클래스
 
-    텍스트 추출: CSS Selector를 사용한 Leaf Node 방식
+    텍스트 추출: 단일 DFS 순회 기반 Leaf Node 방식
     - 태그 하드코딩 불필요 (자동으로 모든 태그 처리)
     - 부모-자식 중복 자동 방지
     """
@@ -34,17 +35,26 @@ class HTMLContentExtractor:
         '#cookie-notice', '#cookie-banner',
     ]
 
+    # _iter_extractable_leaves용 판정 테이블 (Extension의 textFilter.ts 규칙에서 파생)
+    # 모든 선택자를 태그명으로 변환해 조상 검사하므로 실제로는 nav/header/footer/role 태그만 해당
+    _EXCLUDE_TAG_SET = frozenset(EXCLUDE_TAGS)
+    _PRUNE_PARENT_TAGS = frozenset(
+        selector.lstrip('[').rstrip(']').split('=')[0] for selector in EXCLUDE_SELECTORS
+    )
+    _EXCLUDE_CLASSES = frozenset(s[1:] for s in EXCLUDE_SELECTORS if s.startswith('.'))
+    _EXCLUDE_IDS = frozenset(s[1:] for s in EXCLUDE_SELECTORS if s.startswith('#'))
+
     @staticmethod
     def extract_texts(
-        html_body: str,
+        html_body: Union[str, HTMLDocument],
         min_length: int = 10,
         base_url: str = ""
     ) -> List[ExtractedText]:
         """HTML body에서 텍스트 추출 - Leaf Node 방식
 
-        CSS Selector ':not(:has(*))'를 사용하여 자식 태그가 없는 요소(leaf node)만 추출.
-        부모-자식 중복을 자동으로 방지하며, 태그 하드코딩이 불필요합니다.
-        (BeautifulSoup best practice - 2024)
+        자식 태그가 없는 요소(leaf node)만 추출하여 부모-자식 중복을 방지합니다.
+        트리를 1회 DFS로 순회하면서 제외 대상 서브트리(nav/header/footer)는 진입 시 건너뛰고,
+        leaf를 문서 순서대로 방출합니다.
 
         동작 원리:
         - <div><p><span>텍스트</span></p></div> 구조에서
@@ -52,57 +62,21 @@ class HTMLContentExtractor:
         - 구조적으로 중복 불가능
 
         Args:
-            html_body: 정제된 HTML body 문자열
+            html_body: 정제된 HTML body 문자열 또는 파싱된 HTMLDocument
             min_length: 최소 텍스트 길이 (기본: 10)
             base_url: 기본 URL (상대 경로 처리용, 선택사항)
 
         Returns:
             추출된 텍스트 목록 (중복 제거됨)
         """
-        soup = BeautifulSoup(html_body, 'lxml')
-        texts: List[ExtractedText] = []
-        seen_texts = set()  # 텍스트 내용 기반 중복 제거 (안전장치)
-        position = 0
-
-        # CSS Selector로 leaf node만 선택 (자식 태그가 없는 요소)
-        leaf_elements = soup.select("*:not(:has(*))")
-
-        for element in leaf_elements:
-            # 추출 대상인지 확인
-            if not HTMLContentExtractor._should_extract_text(element):
-                continue
-
-            # 텍스트 추출
-            text_content = element.get_text(strip=True)
-            if not text_content:
-                continue
-
-            # 텍스트 유효성 검사
-            if not HTMLContentExtractor._is_valid_text(text_content, min_length):
-                continue
-
-            # 텍스트 정리
-            cleaned_text = HTMLContentExtractor._clean_text(text_content)
-
-            # 중복 텍스트 제거 (안전장치)
-            if cleaned_text in seen_texts:
-                continue
-
-            # 텍스트 추가
-            texts.append(ExtractedText(
-                content=cleaned_text,
-                tagName=element.name,
-                position=position
-            ))
-
-            seen_texts.add(cleaned_text)
-            position += 100  # DOM 순서 기반 position
-
-        return texts
+        soup = HTMLDocument.of(html_body).soup
+        return HTMLContentExtractor._collect_texts(
+            HTMLContentExtractor._iter_extractable_leaves(soup), min_length
+        )
 
     @staticmethod
     def extract_images(
-        html_body: str,
+        html_body: Union[str, HTMLDocument],
         base_url: str = "",
         min_width: int = 100,
         min_height: int = 100
@@ -110,7 +84,7 @@ class HTMLContentExtractor:
         """HTML body에서 이미지 추출 (Extension의 imageParser.ts 로직 이식)
 
         Args:
-            html_body: 정제된 HTML body 문자열
+            html_body: 정제된 HTML body 문자열 또는 파싱된 HTMLDocument
             base_url: 기본 URL (상대 경로를 절대 경로로 변환)
             min_width: 최소 이미지 너비 (기본: 100)
             min_height: 최소 이미지 높이 (기본: 100)
@@ -118,7 +92,7 @@ class HTMLContentExtractor:
         Returns:
             추출된 이미지 목록
         """
-        soup = BeautifulSoup(html_body, 'lxml')
+        soup = HTMLDocument.of(html_body).soup
         images: List[ExtractedImage] = []
         seen_urls = set()
         position = 0
@@ -173,29 +147,73 @@ class HTMLContentExtractor:
     # ========== Private Helper Methods ==========
 
     @staticmethod
-    def _should_extract_text(element: Tag) -> bool:
-        """텍스트 추출 대상 여부 확인 (Extension의 textFilter.ts 이식)"""
-        # 제외 태그 확인
-        if element.name in HTMLContentExtractor.EXCLUDE_TAGS:
-            return False
+    def _collect_texts(leaf_elements: Iterable[Tag], min_length: int) -> List[ExtractedText]:
+        """추출 대상 leaf 요소들에서 유효한 텍스트 수집 (정리 + 중복 제거)"""
+        texts: List[ExtractedText] = []
+        seen_texts = set()  # 텍스트 내용 기반 중복 제거 (안전장치)
+        position = 0
 
-        # 제외 선택자 확인
-        for selector in HTMLContentExtractor.EXCLUDE_SELECTORS:
-            try:
-                # CSS 선택자로 부모 찾기
-                if element.find_parent(selector.lstrip('[').rstrip(']').split('=')[0]):
-                    return False
-                # 클래스/ID 선택자
-                if selector.startswith('.'):
-                    if selector[1:] in element.get('class', []):
-                        return False
-                elif selector.startswith('#'):
-                    if element.get('id') == selector[1:]:
-                        return False
-            except:
-                pass  # 잘못된 선택자는 무시
+        for element in leaf_elements:
+            # 텍스트 추출
+            text_content = element.get_text(strip=True)
+            if not text_content:
+                continue
 
-        return True
+            # 텍스트 유효성 검사
+            if not HTMLContentExtractor._is_valid_text(text_content, min_length):
+                continue
+
+            # 텍스트 정리
+            cleaned_text = HTMLContentExtractor._clean_text(text_content)
+
+            # 중복 텍스트 제거 (안전장치)
+            if cleaned_text in seen_texts:
+                continue
+
+            # 텍스트 추가
+            texts.append(ExtractedText(
+                content=cleaned_text,
+                tagName=element.name,
+                position=position
+            ))
+
+            seen_texts.add(cleaned_text)
+            position += 100  # DOM 순서 기반 position
+
+        return texts
+
+    @staticmethod
+    def _iter_extractable_leaves(root: Tag) -> Iterator[Tag]:
+        """추출 대상 leaf 요소를 문서 순서(pre-order)로 순회
+
+        Extension의 textFilter.ts 제외 규칙을 1회 DFS로 판정합니다.
+        - 조상 태그명 검사(nav, header, footer 등): 해당 태그의 자손은 진입하지 않음
+          (태그 자신은 leaf인 경우 그대로 추출 대상 - find_parent는 자기 자신을 제외)
+        - 클래스/ID 선택자: leaf 요소 자신의 class/id만 검사
+        """
+        exclude_tags = HTMLContentExtractor._EXCLUDE_TAG_SET
+        prune_tags = HTMLContentExtractor._PRUNE_PARENT_TAGS
+        exclude_classes = HTMLContentExtractor._EXCLUDE_CLASSES
+        exclude_ids = HTMLContentExtractor._EXCLUDE_IDS
+
+        stack = [child for child in reversed(root.contents) if isinstance(child, Tag)]
+        while stack:
+            element = stack.pop()
+            children = [child for child in element.contents if isinstance(child, Tag)]
+
+            if children:
+                if element.name not in prune_tags:
+                    stack.extend(reversed(children))
+                continue
+
+            # leaf 요소 판정
+            if element.name in exclude_tags:
+                continue
+            if exclude_classes and not exclude_classes.isdisjoint(element.get('class', [])):
+                continue
+            if element.get('id') in exclude_ids:
+                continue
+            yield element
 
     @staticmethod
     def _should_extract_image(element: Tag) -> bool:
@@ -329,16 +347,16 @@ class HTMLContentExtractor:
 # ========== Convenience Functions ==========
 
 def extract_content_from_html(
-    html_body: str,
+    html_body: Union[str, HTMLDocument],
     base_url: str = "",
     min_text_length: int = 10,
     min_image_width: int = 100,
     min_image_height: int = 100
 ) -> tuple[List[ExtractedText], List[ExtractedImage]]:
-    """HTML body에서 텍스트와 이미지를 한번에 추출
+    """HTML body에서 텍스트와 이미지를 한번에 추출 (HTML은 1회만 파싱)
 
     Args:
-        html_body: 정제된 HTML body
+        html_body: 정제된 HTML body 문자열 또는 파싱된 HTMLDocument
         base_url: 기본 URL (상대 경로 처리용)
         min_text_length: 최소 텍스트 길이
         min_image_width: 최소 이미지 너비
@@ -347,14 +365,16 @@ def extract_content_from_html(
     Returns:
         (텍스트 목록, 이미지 목록) 튜플
     """
+    document = HTMLDocument.of(html_body)
+
     texts = HTMLContentExtractor.extract_texts(
-        html_body=html_body,
+        html_body=document,
         min_length=min_text_length,
         base_url=base_url
     )
 
     images = HTMLContentExtractor.extract_images(
-        html_body=html_body,
+        html_body=document,
         base_url=base_url,
         min_width=min_image_width,
         min_height=min_image_height
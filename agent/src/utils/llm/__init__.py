@@ -1,5 +1,14 @@
 """LLM 유틸리티 모듈"""
 
+from .cache import LLMResponseCache, get_llm_cache
 from .client import LLMClient
+from .pool import LLMClientPool, get_llm_client, get_llm_pool
 
-__all__ = ["LLMClient"]
+__all__ = [
+    "LLMClient",
+    "LLMClientPool",
+    "LLMResponseCache",
+    "get_llm_cache",
+    "get_llm_client",
+    "get_llm_pool",
+]
@@ -0,0 +1,225 @@
+"""LLM 감사 로그 백그라운드 writer
+
+LLM 호출마다 이벤트 루프 안에서 동기 json.dump(indent=2)를 수행하지 않도록
+로그 항목을 bounded queue에 넣고 별도 스레드가 일괄 기록합니다.
+
+- 저장 형식: logs/<YYYY-MM-DD>/llm_audit.jsonl (append-only, 한 줄에 호출 1건)
+- 선택적 gzip 압축 (llm_audit.jsonl.gz, gzip multi-member append)
+- 크기 기반 rotation: llm_audit.1.jsonl, llm_audit.2.jsonl, ...
+- 샘플링: 성공 로그만 sample_rate 비율로 기록 (실패 로그는 항상 기록)
+- 큐가 가득 차면 호출 측을 막지 않고 항목을 버림 (dropped 통계)
+"""
+
+import gzip
+import json
+import queue
+import random
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 기본 로그 루트 (agent/logs)
+LOGS_DIR = Path(__file__).parents[3] / "logs"
+
+# 종료 신호
+_STOP = object()
+
+
+class AuditLogWriter:
+    """bounded queue + 백그라운드 스레드 기반 JSONL 로그 writer"""
+
+    def __init__(
+        self,
+        log_dir: Path,
+        max_queue_size: int = 1000,
+        sample_rate: float = 1.0,
+        max_file_bytes: int = 50 * 1024 * 1024,
+        compress: bool = False,
+        batch_size: int = 100,
+        flush_interval: float = 1.0,
+    ):
+        self.log_dir = Path(log_dir)
+        self.sample_rate = sample_rate
+        self.max_file_bytes = max_file_bytes
+        self.compress = compress
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self._thread = threading.Thread(target=self._run, name="llm-audit-log", daemon=True)
+        self._started = False
+        self._lock = threading.Lock()
+
+        # 통계
+        self.written = 0
+        self.dropped = 0
+        self.sampled_out = 0
+        self.write_errors = 0
+
+    def submit(self, entry: Dict[str, Any]) -> bool:
+        """
+        로그 항목 제출 (non-blocking)
+
+        Args:
+            entry: 기록할 로그 데이터
+
+        Returns:
+            bool: 큐에 들어갔으면 True (샘플링 제외/큐 초과 시 False)
+        """
+        if entry.get("status") == "success" and random.random() >= self.sample_rate:
+            self.sampled_out += 1
+            return False
+
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(entry)
+            return True
+        except queue.Full:
+            self.dropped += 1
+            return False
+
+    def _ensure_started(self):
+        """최초 제출 시 writer 스레드 시작"""
+        if self._started:
+            return
+        with self._lock:
+            if not self._started:
+                self._thread.start()
+                self._started = True
+
+    def _run(self):
+        """writer 스레드 - 큐에서 항목을 모아 batch_size/flush_interval 단위로 기록"""
+        while True:
+            batch = []
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+
+            stop = item is _STOP
+            if not stop:
+                batch.append(item)
+
+            while not stop and len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                else:
+                    batch.append(item)
+
+            if batch:
+                self._write_batch(batch)
+            for _ in range(len(batch) + int(stop)):
+                self._queue.task_done()
+            if stop:
+                return
+
+    def _write_batch(self, batch: list):
+        """항목들을 오늘 날짜 파일에 JSONL로 append"""
+        try:
+            lines = "".join(
+                json.dumps(entry, ensure_ascii=False, default=str) + "\n" for entry in batch
+            ).encode("utf-8")
+
+            path = self._current_path()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            if self.compress:
+                with gzip.open(path, "ab") as f:
+                    f.write(lines)
+            else:
+                with open(path, "ab") as f:
+                    f.write(lines)
+
+            self.written += len(batch)
+
+        except Exception as e:
+            # 로그 저장 실패는 메인 작업에 영향 주지 않음
+            self.write_errors += len(batch)
+            logger.warning(f"Failed to write LLM audit log: {str(e)}")
+
+    def _current_path(self) -> Path:
+        """오늘 날짜의 기록 대상 파일 (max_file_bytes를 넘은 파일은 다음 번호로 rotation)"""
+        date_dir = self.log_dir / datetime.now().strftime("%Y-%m-%d")
+        suffix = ".jsonl.gz" if self.compress else ".jsonl"
+
+        part = 0
+        while True:
+            name = "llm_audit" if part == 0 else f"llm_audit.{part}"
+            path = date_dir / f"{name}{suffix}"
+            if not path.exists() or path.stat().st_size < self.max_file_bytes:
+                return path
+            part += 1
+
+    def flush(self):
+        """큐에 쌓인 항목이 모두 기록될 때까지 대기"""
+        if self._started:
+            self._queue.join()
+
+    def close(self, timeout: float = 5.0):
+        """
+        남은 항목을 기록하고 writer 스레드 종료
+
+        Args:
+            timeout: 스레드 종료 대기 시간 (초)
+        """
+        if not self._started:
+            return
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+
+    def stats(self) -> dict:
+        """writer 현황"""
+        return {
+            "queued": self._queue.qsize(),
+            "written": self.written,
+            "dropped": self.dropped,
+            "sampled_out": self.sampled_out,
+            "write_errors": self.write_errors,
+        }
+
+
+# 싱글톤 인스턴스
+_writer: Optional[AuditLogWriter] = None
+_initialized = False
+
+
+def get_audit_log_writer() -> Optional[AuditLogWriter]:
+    """
+    감사 로그 writer 싱글톤 인스턴스 반환
+
+    Returns:
+        Optional[AuditLogWriter]: writer 인스턴스 (llm_audit_log_enabled=False면 None)
+    """
+    global _writer, _initialized
+    if not _initialized:
+        from src.config.base import BaseSettings
+
+        settings = BaseSettings()
+        if settings.llm_audit_log_enabled:
+            _writer = AuditLogWriter(
+                log_dir=LOGS_DIR,
+                max_queue_size=settings.llm_audit_log_queue_size,
+                sample_rate=settings.llm_audit_log_sample_rate,
+                max_file_bytes=settings.llm_audit_log_max_file_bytes,
+                compress=settings.llm_audit_log_compress,
+            )
+        _initialized = True
+    return _writer
+
+
+def close_audit_log_writer():
+    """남은 로그를 기록하고 writer 종료 (lifespan shutdown 시 호출)"""
+    global _writer, _initialized
+    if _writer is not None:
+        _writer.close()
+        logger.info("Closed LLM audit log writer", extra=_writer.stats())
+    _writer = None
+    _initialized = False
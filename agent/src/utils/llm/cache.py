@@ -0,0 +1,202 @@
+"""LLM 응답 캐시 - 동일 프롬프트의 반복 호출 및 동시 중복 호출 방지
+
+- 키: 정규화된 messages + provider/model/temperature/max_tokens + 출력 스키마 + 호출 옵션의 해시
+- 저장: 메모리 LRU + SQLite TTL (src.utils.cache.TieredCache)
+- single-flight: 같은 키의 동시 호출은 하나의 upstream 요청 결과를 공유
+  (upstream 요청을 보낸 호출이 취소되면 대기 중인 호출 중 하나가 다시 요청)
+
+캐시는 opt-in입니다. (설정 llm_cache_enabled + invoke(use_cache=True))
+"""
+
+import asyncio
+import hashlib
+import json
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Type, Union
+
+from langchain_core.messages import BaseMessage
+from pydantic import BaseModel
+
+from src.utils.cache import MemoryLRUCache, SQLiteTTLCache, TieredCache
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 조회 결과 상태 (감사 로그의 "cache" 필드 값)
+CACHE_HIT = "hit"
+CACHE_COALESCED = "coalesced"
+CACHE_MISS = "miss"
+CACHE_DISABLED = "disabled"
+
+# BaseMessage.type -> role 이름 (dict 메시지와 같은 키를 갖도록)
+_ROLE_ALIASES = {"human": "user", "ai": "assistant"}
+
+
+def _normalize_messages(messages: Union[List[Dict[str, str]], List[BaseMessage]]) -> list:
+    """role/content만 남기고 줄바꿈/앞뒤 공백을 정규화"""
+    normalized = []
+    for msg in messages:
+        if isinstance(msg, dict):
+            role, content = msg.get("role", "unknown"), msg.get("content", "")
+        else:
+            role, content = getattr(msg, "type", "unknown"), getattr(msg, "content", "")
+        if isinstance(content, str):
+            content = content.replace("\r\n", "\n").strip()
+        normalized.append([_ROLE_ALIASES.get(role, role), content])
+    return normalized
+
+
+def _schema_fingerprint(output_format: Optional[Union[str, Type[BaseModel]]]) -> Any:
+    """출력 포맷 식별자 (Pydantic 모델은 JSON schema 전체를 사용)"""
+    if isinstance(output_format, type) and issubclass(output_format, BaseModel):
+        return output_format.model_json_schema()
+    return output_format
+
+
+class _OwnerCancelledError(Exception):
+    """upstream 요청을 보낸 호출이 취소됨 (대기자는 취소되지 않고 다시 시도)"""
+
+
+class LLMResponseCache:
+    """LLM 응답 캐시 + single-flight"""
+
+    def __init__(self, cache: TieredCache):
+        self._cache = cache
+        self._inflight: dict[str, asyncio.Future] = {}
+
+        # 통계
+        self.coalesced = 0
+
+    @staticmethod
+    def make_key(
+        provider: str,
+        model: str,
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        messages: Union[List[Dict[str, str]], List[BaseMessage]],
+        output_format: Optional[Union[str, Type[BaseModel]]] = None,
+        invoke_options: Optional[dict] = None,
+    ) -> str:
+        """캐시 키 생성 (sha256)"""
+        payload = {
+            "provider": provider,
+            "model": model,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "messages": _normalize_messages(messages),
+            "output_format": _schema_fingerprint(output_format),
+            "invoke_options": invoke_options or {},
+        }
+        raw = json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    async def get_or_call(
+        self, key: str, call: Callable[[], Awaitable[dict]]
+    ) -> tuple[dict, str]:
+        """
+        캐시 조회 후 없으면 call() 실행 (같은 키의 동시 호출은 결과 공유)
+
+        Args:
+            key: make_key()로 생성한 키
+            call: upstream 호출 함수 ({"content": ..., "usage": ...} 반환)
+
+        Returns:
+            tuple[dict, str]: (응답 dict, CACHE_HIT/CACHE_COALESCED/CACHE_MISS)
+        """
+        while True:
+            cached = await self._cache.get(key)
+            if cached is not None:
+                return json.loads(cached), CACHE_HIT
+
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                return await self._call_owner(key, call)
+
+            self.coalesced += 1
+            try:
+                return await asyncio.shield(inflight), CACHE_COALESCED
+            except _OwnerCancelledError:
+                # 요청을 보낸 호출만 취소된 경우 -> 처음부터 다시 (먼저 재시도한 대기자가 새 요청을 보냄)
+                continue
+
+    async def _call_owner(self, key: str, call: Callable[[], Awaitable[dict]]) -> tuple[dict, str]:
+        """upstream 호출 후 결과를 대기자와 공유하고 캐시에 저장"""
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await call()
+        except asyncio.CancelledError:
+            # 공유 Future를 취소하면 취소되지 않은 대기자까지 CancelledError를 받으므로 일반 예외로 알림
+            future.set_exception(_OwnerCancelledError())
+            future.exception()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # 대기자가 없으면 "exception was never retrieved" 경고 방지
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            # 빈 응답은 저장하지 않음 (다음 호출에서 재시도)
+            if result.get("content"):
+                await self._cache.set(key, json.dumps(result, ensure_ascii=False))
+            return result, CACHE_MISS
+        finally:
+            self._inflight.pop(key, None)
+
+    async def discard(self, key: str):
+        """
+        캐시 항목 삭제 (파싱/검증에 실패한 응답이 재사용되지 않도록)
+
+        Args:
+            key: make_key()로 생성한 키
+        """
+        await self._cache.delete(key)
+
+    def stats(self) -> dict:
+        """hit/miss/coalesced 통계"""
+        return {**self._cache.stats(), "coalesced": self.coalesced, "inflight": len(self._inflight)}
+
+    def close(self):
+        """디스크 계층 연결 종료"""
+        self._cache.close()
+
+
+# 싱글톤 인스턴스 (설정에서 비활성화된 경우 None 유지)
+_llm_cache: Optional[LLMResponseCache] = None
+_initialized = False
+
+
+def get_llm_cache() -> Optional[LLMResponseCache]:
+    """
+    LLM 응답 캐시 싱글톤 인스턴스 반환
+
+    Returns:
+        Optional[LLMResponseCache]: 캐시 인스턴스 (llm_cache_enabled=False면 None)
+    """
+    global _llm_cache, _initialized
+    if not _initialized:
+        from src.config.base import BaseSettings
+
+        settings = BaseSettings()
+        if settings.llm_cache_enabled:
+            disk = None
+            if settings.llm_cache_path:
+                disk = SQLiteTTLCache(settings.llm_cache_path, settings.llm_cache_ttl_seconds)
+            _llm_cache = LLMResponseCache(
+                TieredCache(
+                    MemoryLRUCache(settings.llm_cache_memory_max_bytes),
+                    disk,
+                    ttl_seconds=settings.llm_cache_ttl_seconds,
+                )
+            )
+        _initialized = True
+    return _llm_cache
+
+
+def close_llm_cache():
+    """LLM 응답 캐시 종료 (lifespan shutdown 시 호출)"""
+    global _llm_cache, _initialized
+    if _llm_cache is not None:
+        _llm_cache.close()
+    _llm_cache = None
+    _initialized = False
@@ -5,19 +5,20 @@ import os
 import time
 import uuid
 from datetime import datetime
-from pathlib import Path
 from typing import Any, Dict, List, Optional, Type, Union
 
 import json_repair
 from dotenv import load_dotenv
 from langchain.chat_models import init_chat_model
 from langchain_core.language_models import BaseChatModel
-from langchain_core.messages import BaseMessage
+from langchain_core.messages import AIMessage, BaseMessage
 from pydantic import BaseModel, ValidationError
 
 from src.exceptions.llm import LLMConfigurationError, LLMInvocationError, LLMProviderError
 from src.utils.logger import get_logger
 
+from .audit_log import get_audit_log_writer
+from .cache import CACHE_DISABLED, CACHE_MISS, get_llm_cache
 from .formatters import get_formatter
 
 # .env 파일 로드
@@ -29,39 +30,17 @@ os.environ["GRPC_TRACE"] = ""
 
 logger = get_logger(__name__)
 
-# Logs 디렉토리 경로
-LOGS_DIR = Path(__file__).parents[3] / "logs"
-
 
 def _save_llm_log(log_data: Dict[str, Any]) -> None:
     """
-    LLM input/output을 로그 파일로 저장
+    LLM input/output 감사 로그 제출 (백그라운드 writer가 기록, 호출 측은 대기하지 않음)
 
     Args:
         log_data: 저장할 로그 데이터
     """
-    try:
-        # 날짜별 디렉토리 생성
-        today = datetime.now().strftime("%Y-%m-%d")
-        log_dir = LOGS_DIR / today
-        log_dir.mkdir(parents=True, exist_ok=True)
-
-        # 파일명: timestamp_requestId.json
-        timestamp = datetime.now().strftime("%H%M%S")
-        request_id = log_data.get("request_id", "unknown")
-        filename = f"{timestamp}_{request_id[:8]}.json"
-
-        log_file = log_dir / filename
-
-        # JSON으로 저장
-        with open(log_file, "w", encoding="utf-8") as f:
-            json.dump(log_data, f, ensure_ascii=False, indent=2)
-
-        logger.debug(f"Saved LLM log to {log_file}")
-
-    except Exception as e:
-        # 로그 저장 실패는 메인 작업에 영향 주지 않음
-        logger.warning(f"Failed to save LLM log: {str(e)}")
+    writer = get_audit_log_writer()
+    if writer is not None:
+        writer.submit(log_data)
 
 
 class LLMClient:
@@ -175,6 +154,7 @@ class LLMClient:
         self,
         messages: Union[List[Dict[str, str]], List[BaseMessage]],
         output_format: Optional[Union[str, Type[BaseModel]]] = None,
+        use_cache: bool = False,
         **invoke_options,
     ) -> Any:
         """
@@ -188,6 +168,8 @@ class LLMClient:
                 - None: 원본 텍스트 반환
                 - "json", "markdown", "csv": 해당 포맷 적용
                 - Pydantic 클래스: with_structured_output() 사용
+            use_cache: 응답 캐시 사용 여부 (설정 llm_cache_enabled가 켜져 있을 때만 적용)
+                - 동일 입력의 반복 호출은 캐시에서 응답, 동시 호출은 하나의 요청 결과를 공유
             **invoke_options: 호출 시점 옵션 (temperature 오버라이드 등)
 
         Returns:
@@ -229,6 +211,8 @@ class LLMClient:
             }
         }
 
+        cache_key: Optional[str] = None
+
         try:
             start_time = time.time()
 
@@ -247,8 +231,12 @@ class LLMClient:
                 )
 
                 # LLM 호출 (with_structured_output 사용하지 않음)
-                raw_response = await self._model.ainvoke(messages, **invoke_options)
-                raw_content = raw_response.content if hasattr(raw_response, 'content') else str(raw_response)
+                cache_key = await self._prepare_cache(
+                    use_cache, messages, output_format, invoke_options, log_data
+                )
+                raw_content, _ = await self._call_model(
+                    messages, invoke_options, cache_key, log_data
+                )
 
                 elapsed = time.time() - start_time
 
@@ -268,7 +256,6 @@ class LLMClient:
                             "model": self.model_name,
                             "prompt_size": f"{prompt_size:,} chars",
                             "elapsed": f"{round(elapsed, 2)}s",
-                            "response_type": type(raw_response).__name__,
                             "request_id": request_id,
                         },
                     )
@@ -400,21 +387,17 @@ class LLMClient:
                 },
             )
 
-            response = await self._model.ainvoke(messages, **invoke_options)
+            cache_key = await self._prepare_cache(
+                use_cache, messages, output_format, invoke_options, log_data
+            )
+            response_content, usage_metadata = await self._call_model(
+                messages, invoke_options, cache_key, log_data
+            )
+            response = AIMessage(content=response_content)
 
             elapsed = time.time() - start_time
 
-            # 토큰 사용량 로깅 (가능한 경우)
-            usage_metadata = {}
-            if hasattr(response, "usage_metadata") and response.usage_metadata:
-                usage_metadata = {
-                    "input_tokens": response.usage_metadata.get("input_tokens"),
-                    "output_tokens": response.usage_metadata.get("output_tokens"),
-                    "total_tokens": response.usage_metadata.get("total_tokens"),
-                }
-
             # 응답 내용 추가
-            response_content = response.content if hasattr(response, 'content') else str(response)
             log_data["output"] = {
                 "content": response_content,
                 "content_length": len(response_content) if response_content else 0,
@@ -441,6 +424,9 @@ class LLMClient:
             return self._apply_format(response, output_format)
 
         except Exception as e:
+            # 파싱/검증에 실패한 응답은 캐시에서 제거
+            await self._discard_cached(cache_key)
+
             # 에러 로그 저장
             if "status" not in log_data:
                 log_data["status"] = "error"
@@ -460,6 +446,79 @@ class LLMClient:
                 },
             )
 
+    async def _prepare_cache(
+        self,
+        use_cache: bool,
+        messages: Union[List[Dict[str, str]], List[BaseMessage]],
+        output_format: Optional[Union[str, Type[BaseModel]]],
+        invoke_options: Dict[str, Any],
+        log_data: Dict[str, Any],
+    ) -> Optional[str]:
+        """
+        응답 캐시 키 생성 (캐시 미사용 시 None)
+
+        Returns:
+            Optional[str]: 캐시 키
+        """
+        cache = get_llm_cache() if use_cache else None
+        if cache is None:
+            log_data["cache"] = CACHE_DISABLED
+            return None
+
+        return cache.make_key(
+            provider=self.provider,
+            model=self.model_name,
+            temperature=self.temperature,
+            max_tokens=self.max_tokens,
+            messages=messages,
+            output_format=output_format,
+            invoke_options=invoke_options,
+        )
+
+    async def _call_model(
+        self,
+        messages: Union[List[Dict[str, str]], List[BaseMessage]],
+        invoke_options: Dict[str, Any],
+        cache_key: Optional[str],
+        log_data: Dict[str, Any],
+    ) -> tuple[Any, Dict[str, Any]]:
+        """
+        모델 호출 (cache_key가 있으면 캐시/single-flight 경유)
+
+        Returns:
+            tuple[Any, Dict[str, Any]]: (응답 content, 토큰 사용량)
+        """
+
+        async def call() -> dict:
+            response = await self._model.ainvoke(messages, **invoke_options)
+
+            # 토큰 사용량 (가능한 경우)
+            usage_metadata = {}
+            if hasattr(response, "usage_metadata") and response.usage_metadata:
+                usage_metadata = {
+                    "input_tokens": response.usage_metadata.get("input_tokens"),
+                    "output_tokens": response.usage_metadata.get("output_tokens"),
+                    "total_tokens": response.usage_metadata.get("total_tokens"),
+                }
+
+            content = response.content if hasattr(response, "content") else str(response)
+            return {"content": content, "usage": usage_metadata}
+
+        if cache_key is None:
+            result = await call()
+        else:
+            result, status = await get_llm_cache().get_or_call(cache_key, call)
+            log_data["cache"] = status
+            if status != CACHE_MISS:
+                logger.info(f"  LLM response served from cache ({status})")
+
+        return result["content"], result["usage"]
+
+    async def _discard_cached(self, cache_key: Optional[str]):
+        """파싱/검증에 실패한 응답을 캐시에서 삭제"""
+        if cache_key is not None:
+            await get_llm_cache().discard(cache_key)
+
     def _apply_format(
         self, response: BaseMessage, output_format: Optional[str]
     ) -> Union[str, dict, list]:
@@ -0,0 +1,247 @@
+"""LLM 클라이언트 풀 - 모델 객체와 하위 HTTP/gRPC 채널을 요청 간 재사용"""
+
+import inspect
+import os
+from typing import Any, Hashable, Optional
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.runnables import Runnable
+
+from src.exceptions.llm import LLMConfigurationError
+from src.utils.logger import get_logger
+
+from .client import LLMClient
+
+logger = get_logger(__name__)
+
+# Google Search grounding 도구 식별자 (풀 키에 사용)
+GOOGLE_SEARCH_TOOL = "google_search"
+
+
+class LLMClientPool:
+    """LLM 클라이언트 풀 (싱글톤)
+
+    (provider, model, temperature, max_tokens, timeout, tools, 기타 옵션) 조합별로
+    init_chat_model / ChatGoogleGenerativeAI 인스턴스를 1회만 생성하고 재사용합니다.
+    모델 객체가 내부적으로 보유한 HTTP/gRPC 채널도 함께 재사용되므로
+    요청마다 발생하던 클라이언트 생성 및 TLS handshake 비용이 제거됩니다.
+    """
+
+    def __init__(self):
+        self._clients: dict[tuple, LLMClient] = {}
+        self._search_models: dict[tuple, Runnable] = {}
+
+    @staticmethod
+    def _make_key(
+        provider: str,
+        model: str,
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        timeout: Optional[float],
+        tools: tuple[str, ...],
+        extra_options: dict[str, Any],
+    ) -> tuple:
+        """풀 키 생성 (해시 불가능한 옵션 값은 repr로 대체)"""
+        options = tuple(
+            sorted(
+                (name, value if isinstance(value, Hashable) else repr(value))
+                for name, value in extra_options.items()
+            )
+        )
+        return (provider, model, temperature, max_tokens, timeout, tools, options)
+
+    def get_client(
+        self,
+        provider: str,
+        model: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        timeout: Optional[float] = None,
+        **kwargs,
+    ) -> LLMClient:
+        """
+        풀에서 LLMClient 조회 (없으면 생성 후 등록)
+
+        Args:
+            provider: 모델 제공자 (예: "google_genai")
+            model: 모델 이름
+            temperature: 샘플링 온도
+            max_tokens: 최대 출력 토큰 수
+            timeout: 요청 타임아웃 (초)
+            **kwargs: 기타 모델별 옵션
+
+        Returns:
+            LLMClient: 재사용 가능한 클라이언트
+        """
+        key = self._make_key(provider, model, temperature, max_tokens, timeout, (), kwargs)
+        client = self._clients.get(key)
+        if client is None:
+            client = LLMClient(
+                provider=provider,
+                model=model,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                timeout=timeout,
+                **kwargs,
+            )
+            self._clients[key] = client
+        return client
+
+    def get_search_model(self, model: str, temperature: float) -> Runnable:
+        """
+        Google Search grounding이 활성화된 Gemini 모델 조회 (없으면 생성 후 등록)
+
+        google_search tool이 바인딩된 Runnable을 반환하므로
+        호출 측에서는 tools 인자 없이 ainvoke/astream만 호출하면 됩니다.
+
+        Args:
+            model: Gemini 모델 이름
+            temperature: 샘플링 온도
+
+        Returns:
+            Runnable: 검색 도구가 바인딩된 모델 (도구 미지원 환경이면 모델 그대로)
+        """
+        key = self._make_key(
+            "google_genai", model, temperature, None, None, (GOOGLE_SEARCH_TOOL,), {}
+        )
+        search_model = self._search_models.get(key)
+        if search_model is None:
+            search_model = self._create_search_model(model, temperature)
+            self._search_models[key] = search_model
+        return search_model
+
+    @staticmethod
+    def _create_search_model(model: str, temperature: float) -> Runnable:
+        """ChatGoogleGenerativeAI 생성 + google_search tool 바인딩"""
+        from langchain_google_genai import (
+            ChatGoogleGenerativeAI,
+            HarmBlockThreshold,
+            HarmCategory,
+        )
+
+        google_api_key = os.getenv("GOOGLE_API_KEY")
+        if not google_api_key:
+            raise LLMConfigurationError(
+                "GOOGLE_API_KEY not found in environment variables",
+                details={"provider": "google_genai"},
+            )
+
+        # Safety filters 해제
+        safety_settings = {
+            HarmCategory.HARM_CATEGORY_HARASSMENT: HarmBlockThreshold.BLOCK_NONE,
+            HarmCategory.HARM_CATEGORY_HATE_SPEECH: HarmBlockThreshold.BLOCK_NONE,
+            HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT: HarmBlockThreshold.BLOCK_NONE,
+            HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: HarmBlockThreshold.BLOCK_NONE,
+        }
+
+        llm = ChatGoogleGenerativeAI(
+            model=model,
+            api_key=google_api_key,
+            temperature=temperature,
+            safety_settings=safety_settings,
+        )
+
+        # Gemini 2.0 이상에서는 google_search tool 사용
+        try:
+            from google.ai.generativelanguage_v1beta.types import Tool as GenAITool
+
+            logger.info(
+                "Initializing search LLM (Google Search grounding enabled)",
+                extra={"model": model, "temperature": temperature},
+            )
+            return llm.bind(tools=[GenAITool(google_search={})])
+        except ImportError:
+            logger.warning("Google Search grounding not available, using LLM only")
+            return llm
+
+    def stats(self) -> dict:
+        """풀 사용 현황"""
+        return {
+            "clients": len(self._clients),
+            "search_models": len(self._search_models),
+        }
+
+    async def aclose(self):
+        """풀에 등록된 모든 모델의 하위 클라이언트(HTTP/gRPC 채널) 정리"""
+        models: list[Any] = [client._model for client in self._clients.values()]
+        for search_model in self._search_models.values():
+            models.append(getattr(search_model, "bound", search_model))
+
+        for model in models:
+            if model is not None:
+                await _close_model(model)
+
+        logger.info("Closed LLM client pool", extra=self.stats())
+        self._clients.clear()
+        self._search_models.clear()
+
+
+async def _close_model(model: BaseChatModel):
+    """
+    모델이 보유한 하위 클라이언트 종료
+
+    provider/버전마다 클라이언트 속성 이름과 종료 메서드가 달라
+    알려진 속성들을 순서대로 확인하여 가능한 종료 메서드를 호출합니다.
+    """
+    for attr in ("async_client", "client"):
+        client = getattr(model, attr, None)
+        if client is None:
+            continue
+
+        # google-genai Client: 동기(client.close)/비동기(client.aio.aclose) 채널을 각각 보유
+        closers = [
+            getattr(getattr(client, "aio", None), "aclose", None),
+            getattr(client, "aclose", None),
+            getattr(client, "close", None),
+            getattr(getattr(client, "transport", None), "close", None),
+        ]
+        for closer in closers:
+            if closer is None:
+                continue
+            try:
+                result = closer()
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.debug(f"Failed to close LLM client ({attr}): {str(e)}")
+
+
+# 싱글톤 인스턴스
+_pool: Optional[LLMClientPool] = None
+
+
+def get_llm_pool() -> LLMClientPool:
+    """
+    LLM 클라이언트 풀 싱글톤 인스턴스 반환
+
+    Returns:
+        LLMClientPool: 풀 인스턴스
+    """
+    global _pool
+    if _pool is None:
+        _pool = LLMClientPool()
+    return _pool
+
+
+def get_llm_client(
+    provider: str,
+    model: str,
+    temperature: Optional[float] = None,
+    max_tokens: Optional[int] = None,
+    timeout: Optional[float] = None,
+    **kwargs,
+) -> LLMClient:
+    """
+    풀에서 LLMClient 조회 (get_llm_pool().get_client() 단축 함수)
+
+    Returns:
+        LLMClient: 재사용 가능한 클라이언트
+    """
+    return get_llm_pool().get_client(
+        provider=provider,
+        model=model,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        timeout=timeout,
+        **kwargs,
+    )
@@ -0,0 +1,127 @@
+"""근사 중복 텍스트 제거 - 리뷰/OCR처럼 거의 같은 문장이 반복되는 입력 정리
+
+정확히 같은 문자열만 제거하면(seen_texts) 공백, 문장부호, 단어 한두 개만 다른 리뷰나
+반복 배너 이미지의 OCR 결과가 그대로 LLM 입력에 남습니다.
+
+방식 (hash/set/sort 등 C 구현 연산 위주로 처리하여 문장 수천 개도 수 ms 단위로 처리):
+1. 소문자화 + 문장부호 제거 후 단어 단위로 분리
+2. 특징 집합 = 단어 bigram의 hash
+3. 특징 hash 중 가장 작은 sketch_size개(bottom-k MinHash)를 색인하여 2개 이상 공유하는 후보만 조회
+   (Jaccard 유사도가 높을수록 최솟값들을 공유할 확률이 높음)
+4. 후보와 실제 Jaccard 유사도를 계산하여 threshold 이상이면 근사 중복으로 판정
+"""
+
+import re
+from collections import Counter
+from itertools import chain
+
+# 단어 이외의 문자 (문장부호, 이모지 등)
+_NON_WORD = re.compile(r"[^\w\s]+")
+
+
+def word_shingles(text: str) -> frozenset[int]:
+    """
+    텍스트 특징 집합 (단어 bigram hash, 한 단어 텍스트는 unigram)
+
+    Args:
+        text: 텍스트
+
+    Returns:
+        frozenset[int]: 특징 hash 집합 (단어가 없으면 빈 집합)
+    """
+    words = _NON_WORD.sub(" ", text.lower()).split()
+    if len(words) < 2:
+        return frozenset(map(hash, words))
+    return frozenset(map(hash, zip(words, words[1:])))
+
+
+def jaccard(a: frozenset, b: frozenset) -> float:
+    """두 특징 집합의 Jaccard 유사도"""
+    if not a or not b:
+        return 0.0
+    intersection = len(a & b)
+    return intersection / (len(a) + len(b) - intersection)
+
+
+class NearDuplicateFilter:
+    """순서대로 들어오는 텍스트 중 앞서 본 텍스트와 근사 중복인 텍스트 판별
+
+    먼저 들어온 텍스트를 남기므로 중요한 출처(설명 텍스트)를 먼저 넣고
+    덜 중요한 출처(OCR, 리뷰)를 나중에 넣어야 합니다.
+
+    Usage:
+        near_duplicates = NearDuplicateFilter(threshold=0.7)
+        kept = [text for text in texts if near_duplicates.add(text)]
+    """
+
+    def __init__(self, threshold: float = 0.7, min_words: int = 4, sketch_size: int = 4):
+        """
+        Args:
+            threshold: 근사 중복으로 판정할 Jaccard 유사도 (0~1, 단어 bigram 기준)
+            min_words: 근사 중복 비교 대상 최소 단어 수
+                - 더 짧은 텍스트(스펙 한 줄 등)는 값 하나만 달라도 의미가 다르므로 정확히 같은 경우만 제거
+            sketch_size: 후보 조회용 bottom-k sketch 크기 (클수록 후보 누락이 줄고 비교가 늘어남)
+        """
+        self.threshold = threshold
+        self.min_words = min_words
+        self.sketch_size = sketch_size
+
+        self._exact: set[str] = set()
+        self._features: list[frozenset[int]] = []
+        self._index: dict[int, list[int]] = {}
+
+        # 통계
+        self.kept = 0
+        self.exact_duplicates = 0
+        self.near_duplicates = 0
+
+    def add(self, text: str) -> bool:
+        """
+        텍스트 추가
+
+        Args:
+            text: 텍스트
+
+        Returns:
+            bool: 새 텍스트이면 True (남길 텍스트), 중복이면 False
+        """
+        normalized = " ".join(text.split())
+        if normalized in self._exact:
+            self.exact_duplicates += 1
+            return False
+        self._exact.add(normalized)
+
+        features = word_shingles(normalized)
+        # 단어 n개 -> bigram 최대 n-1개
+        if len(features) < self.min_words - 1:
+            self.kept += 1
+            return True
+
+        sketch = sorted(features)[: self.sketch_size]
+        if self._has_similar(features, sketch):
+            self.near_duplicates += 1
+            return False
+
+        position = len(self._features)
+        self._features.append(features)
+        for value in sketch:
+            self._index.setdefault(value, []).append(position)
+        self.kept += 1
+        return True
+
+    def _has_similar(self, features: frozenset[int], sketch: list[int]) -> bool:
+        """sketch 값을 2개 이상 공유하는 후보 중 threshold 이상 유사한 텍스트 존재 여부"""
+        index = self._index
+        shared = Counter(chain.from_iterable(index.get(value, ()) for value in sketch))
+        return any(
+            count >= 2 and jaccard(features, self._features[position]) >= self.threshold
+            for position, count in shared.items()
+        )
+
+    def stats(self) -> dict:
+        """남긴/제거한 텍스트 수"""
+        return {
+            "kept": self.kept,
+            "exact_duplicates": self.exact_duplicates,
+            "near_duplicates": self.near_duplicates,
+        }
@@ -0,0 +1,38 @@
+"""URL 유틸리티"""
+
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+# 페이지/이미지 내용과 무관한 추적용 query 파라미터 prefix
+_TRACKING_PARAM_PREFIXES = ("utm_",)
+
+
+def normalize_url(url: str, drop_tracking_params: bool = True) -> str:
+    """
+    URL 정규화 (같은 리소스가 같은 문자열을 갖도록)
+
+    - scheme/host 소문자화, 기본 포트 제거
+    - fragment 제거
+    - 추적용 query 파라미터(utm_*) 제거 후 정렬
+
+    Args:
+        url: 원본 URL
+        drop_tracking_params: 추적용 query 파라미터 제거 여부
+
+    Returns:
+        str: 정규화된 URL
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and parts.port != _DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+
+    params = [
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not (drop_tracking_params and name.lower().startswith(_TRACKING_PARAM_PREFIXES))
+    ]
+    query = urlencode(sorted(params))
+    return urlunsplit((scheme, host, parts.path or "/", query, ""))
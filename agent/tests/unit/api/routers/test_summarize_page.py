@@ -0,0 +1,157 @@
+"""SummarizePage 라우터 결과 캐시 저장/조회 테스트"""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import Response
+
+from src.api.routers import summarize_page as router
+from src.api.schemas import SummarizePageRequest
+from src.graphs.summarize_page.nodes.analyze_product_node import create_default_analysis
+from src.graphs.summarize_page.result_cache import CACHE_HIT, SummarizePageResultCache
+from src.utils import debug_capture as debug_capture_module
+from src.utils.cache import MemoryLRUCache, TieredCache
+from src.utils.debug_capture import DebugCaptureStore
+
+ANALYSIS = {**create_default_analysis(), "product_name": "노트북", "price": "1,290,000원"}
+
+
+def _request(url: str = "https://shop.example.com/p/1", timestamp: int = 1) -> SummarizePageRequest:
+    return SummarizePageRequest(
+        url=url, title="노트북", html_body="<p>노트북</p>", og_image=None, timestamp=timestamp
+    )
+
+
+def _final_state(**overrides) -> dict:
+    state = {
+        "url": "https://shop.example.com/p/1",
+        "title": "노트북",
+        "timestamp": 1,
+        "is_valid_page": True,
+        "product_analysis": ANALYSIS,
+        "analysis_failed": False,
+        "ocr_dropped_images": [],
+        "valid_images": [],
+        "parsed_content": {},
+    }
+    state.update(overrides)
+    return state
+
+
+@pytest.fixture
+def result_cache():
+    cache = SummarizePageResultCache(
+        TieredCache(MemoryLRUCache(max_bytes=1024 * 1024)), ttl_seconds=60, stale_seconds=60
+    )
+    with patch.object(router, "get_result_cache", return_value=cache):
+        yield cache
+
+
+def _patch_graph(state: dict):
+    graph = MagicMock()
+    graph.ainvoke = AsyncMock(return_value=state)
+    return patch.object(router, "get_graph", return_value=graph)
+
+
+def test_is_cacheable_rejects_incomplete_results():
+    """검증 실패, LLM 분석 실패, OCR 마감으로 이미지가 빠진 결과는 저장하지 않음"""
+    assert router._is_cacheable(_final_state())
+    assert not router._is_cacheable(_final_state(is_valid_page=False))
+    assert not router._is_cacheable(
+        _final_state(analysis_failed=True, product_analysis=create_default_analysis())
+    )
+    assert not router._is_cacheable(_final_state(ocr_dropped_images=["https://cdn.example.com/a.jpg"]))
+
+
+def test_state_input_carries_structured_page_signals():
+    """정제된 html_body에 없는 og:type/JSON-LD 신호는 요청 필드로 그래프에 전달"""
+    request = SummarizePageRequest(
+        url="https://shop.example.com/p/1",
+        title="노트북",
+        html_body="<p>노트북</p>",
+        og_type="product",
+        json_ld_types=["Product", "Offer"],
+        timestamp=1,
+    )
+
+    state = router._build_state_input(request)
+
+    assert (state["og_type"], state["json_ld_types"]) == ("product", ["Product", "Offer"])
+    assert router._build_state_input(_request())["json_ld_types"] == []
+
+
+async def test_degraded_result_is_not_cached(result_cache):
+    """LLM 분석 실패 결과는 응답하되 캐시에 저장하지 않아야 함"""
+    request = _request()
+    with _patch_graph(_final_state(analysis_failed=True, product_analysis=create_default_analysis())):
+        result, _ = await router._summarize_cached(request, bypass_cache=False)
+
+    assert result.product_analysis.product_name == "unknown"
+    assert await result_cache.get(result_cache.make_key(request.url, request.html_body)) == (None, "MISS")
+
+
+async def test_cache_hit_uses_current_request_url_and_timestamp(result_cache):
+    """캐시 hit 응답의 url/timestamp는 저장된 값이 아니라 현재 요청 값이어야 함"""
+    with _patch_graph(_final_state()):
+        await router._summarize_cached(_request(), bypass_cache=False)
+
+    # 같은 페이지를 추적 파라미터가 붙은 URL로 나중에 다시 요청
+    later = _request(url="https://shop.example.com/p/1?utm_source=mail", timestamp=99)
+    result, status = await router._summarize_cached(later, bypass_cache=False)
+
+    assert status == CACHE_HIT
+    assert (result.url, result.timestamp) == (later.url, 99)
+    assert result.product_analysis.product_name == "노트북"
+
+
+async def test_unnormalizable_url_runs_uncached(result_cache):
+    """URL 정규화에 실패하는 요청(범위를 벗어난 포트)은 500 대신 캐시 없이 실행"""
+    request = _request(url="https://shop.example.com:99999/p/1")
+    response = Response()
+    with _patch_graph(_final_state(url=request.url)):
+        result = await router.execute_summarize_page(request, response, None, None, None)
+        batch_result, cache_status = await router._summarize_cached(request, bypass_cache=False)
+
+    assert result.product_analysis.product_name == batch_result.product_analysis.product_name == "노트북"
+    assert "X-Cache" not in response.headers
+    assert cache_status is None
+
+
+async def test_forced_debug_capture_bypasses_cache_hit(result_cache, monkeypatch):
+    """X-Debug-Capture 요청은 캐시 hit이어도 그래프를 실행하여 캡처를 남김"""
+    monkeypatch.setattr(router.settings, "debug_capture_enabled", True)
+    monkeypatch.setattr(debug_capture_module, "_store", DebugCaptureStore(max_entries=2))
+    request = _request()
+    with _patch_graph(_final_state()) as get_graph:
+        await router._summarize_cached(request, bypass_cache=False)
+        response = Response()
+        await router.execute_summarize_page(request, response, None, None, "1")
+
+    assert response.headers["X-Cache"] == "BYPASS"
+    assert "X-Debug-Capture-Id" in response.headers
+    assert get_graph.return_value.ainvoke.await_count == 2
+
+
+async def test_batch_groups_by_url_and_html_body(result_cache):
+    """같은 URL이라도 html_body가 다르면 따로 분석하고, 정규화할 수 없는 URL은 해당 항목만 실패"""
+    items = [
+        _request(),
+        SummarizePageRequest(
+            url="https://shop.example.com/p/1",
+            title="노트북",
+            html_body="<p>다른 옵션</p>",
+            og_image=None,
+            timestamp=2,
+        ),
+        _request(url="https://shop.example.com/p/1?utm_source=mail", timestamp=3),
+        _request(url="https://shop.example.com:99999/p/1"),
+    ]
+    with _patch_graph(_final_state()) as get_graph:
+        frames = [frame async for frame in router._generate_batch_events(items, bypass_cache=True)]
+
+    events = [json.loads(frame.removeprefix("data: ")) for frame in frames]
+    assert sorted(event["indices"] for event in events if event["type"] == "item") == [[0, 2], [1]]
+    assert [event["indices"] for event in events if event["type"] == "item_error"] == [[3]]
+    assert events[-1] == {"type": "done", "total": 4, "unique": 2, "failed": 1}
+    assert get_graph.return_value.ainvoke.await_count == 2
@@ -0,0 +1,13 @@
+"""FastAPI 앱 라우터 등록 테스트"""
+
+from fastapi.testclient import TestClient
+
+from src.api.main import app
+
+
+def test_debug_routes_not_registered_by_default():
+    """debug_capture_enabled 기본값(False)에서는 캡처 조회 API를 노출하지 않음"""
+    client = TestClient(app)
+
+    assert client.get("/debug/captures").status_code == 404
+    assert client.get("/health").status_code == 200
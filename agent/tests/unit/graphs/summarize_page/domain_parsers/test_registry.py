@@ -0,0 +1,85 @@
+"""ParserRegistry 라우팅 테스트"""
+
+import pytest
+
+from src.graphs.summarize_page.domain_parsers.base import BaseDomainParser
+from src.graphs.summarize_page.domain_parsers.registry import ParserRegistry, get_parser_registry
+
+
+class _StubParser(BaseDomainParser):
+    """테스트용 파서"""
+
+    def __init__(self, name: str, hosts=(), path_prefixes=(), match: str = ""):
+        self._name = name
+        self.hosts = hosts
+        self.path_prefixes = path_prefixes
+        self._match = match
+        self.can_parse_calls = 0
+
+    @property
+    def domain_type(self) -> str:
+        return self._name
+
+    def can_parse(self, url: str) -> bool:
+        self.can_parse_calls += 1
+        return bool(self._match) and self._match in url
+
+    def parse(self, url, title, html_body):
+        return {"domain_type": self._name}
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("https://brand.naver.com/melkin/products/7514837282", "naver_brand"),
+        ("https://m.brand.naver.com/melkin/products/1", "naver_brand"),
+        ("https://smartstore.naver.com/test/products/123", "naver_smartstore"),
+        ("https://www.coupang.com/vp/products/123456?itemId=1", "coupang"),
+        ("https://coupang.com/vp/products/789", "coupang"),
+        ("https://www.coupang.com/np/search?q=vp/products", "generic"),
+        ("https://www.google.com/search?q=brand.naver.com", "generic"),
+        ("not a url", "generic"),
+    ],
+)
+def test_default_routing(url: str, expected: str):
+    """기본 등록 파서의 호스트/경로 라우팅"""
+    assert get_parser_registry().get_parser(url).domain_type == expected
+
+
+def test_generic_parser_is_singleton():
+    """매칭이 없으면 매번 같은 GenericParser 인스턴스 반환"""
+    registry = get_parser_registry()
+    first = registry.get_parser("https://example.com/a")
+    second = registry.get_parser("https://example.org/b")
+    assert first is second
+    assert registry.get_parser_by_domain_type("generic") is first
+
+
+def test_longest_path_prefix_wins():
+    """같은 호스트에서는 가장 긴 경로 prefix의 파서 선택"""
+    registry = ParserRegistry()
+    registry.register(_StubParser("shop", hosts=("shop.example.com",)))
+    registry.register(_StubParser("shop_product", hosts=("shop.example.com",), path_prefixes=("/p",)))
+
+    assert registry.get_parser("https://shop.example.com/p/1").domain_type == "shop_product"
+    assert registry.get_parser("https://shop.example.com/pp/1").domain_type == "shop"
+    assert registry.get_parser("https://shop.example.com/").domain_type == "shop"
+
+
+def test_unindexed_parser_and_memoization():
+    """hosts 미선언 파서는 can_parse로 검사하고, 같은 URL은 재검사하지 않음"""
+    registry = ParserRegistry()
+    legacy = _StubParser("legacy", match="legacy-shop")
+    registry.register(legacy)
+
+    url = "https://www.legacy-shop.com/item/1"
+    assert registry.get_parser(url).domain_type == "legacy"
+    assert registry.get_parser(url).domain_type == "legacy"
+    assert legacy.can_parse_calls == 1
+
+
+def test_get_parser_by_domain_type():
+    """라우팅 결과(domain_type)로 파서 조회, 미등록 타입은 GenericParser"""
+    registry = get_parser_registry()
+    assert registry.get_parser_by_domain_type("coupang").domain_type == "coupang"
+    assert registry.get_parser_by_domain_type("unknown").domain_type == "generic"
@@ -7,6 +7,7 @@ from src.graphs.summarize_page.nodes.analyze_product_node import (
     ProductAnalysisOutput,
     analyze_product_node,
     create_default_analysis,
+    remove_near_duplicates,
 )
 
 
@@ -77,11 +78,11 @@ async def test_analyze_product_node_with_data(mock_state_with_data):
     )
 
     with patch(
-        "src.graphs.summarize_page.nodes.analyze_product_node.LLMClient"
-    ) as MockLLMClient:
+        "src.graphs.summarize_page.nodes.analyze_product_node.get_llm_client"
+    ) as MockGetLLMClient:
         mock_llm = AsyncMock()
         mock_llm.invoke = AsyncMock(return_value=mock_output)
-        MockLLMClient.return_value = mock_llm
+        MockGetLLMClient.return_value = mock_llm
 
         result = await analyze_product_node(mock_state_with_data)
 
@@ -132,11 +133,11 @@ async def test_analyze_product_node_error_handling(mock_state_with_data):
     """LLM 오류 발생 시 기본값 반환"""
     # LLM이 예외를 발생시키도록 모킹
     with patch(
-        "src.graphs.summarize_page.nodes.analyze_product_node.LLMClient"
-    ) as MockLLMClient:
+        "src.graphs.summarize_page.nodes.analyze_product_node.get_llm_client"
+    ) as MockGetLLMClient:
         mock_llm = AsyncMock()
         mock_llm.invoke = AsyncMock(side_effect=Exception("LLM API error"))
-        MockLLMClient.return_value = mock_llm
+        MockGetLLMClient.return_value = mock_llm
 
         result = await analyze_product_node(mock_state_with_data)
 
@@ -166,11 +167,11 @@ async def test_analyze_product_node_partial_data(mock_state_with_data):
     )
 
     with patch(
-        "src.graphs.summarize_page.nodes.analyze_product_node.LLMClient"
-    ) as MockLLMClient:
+        "src.graphs.summarize_page.nodes.analyze_product_node.get_llm_client"
+    ) as MockGetLLMClient:
         mock_llm = AsyncMock()
         mock_llm.invoke = AsyncMock(return_value=mock_output)
-        MockLLMClient.return_value = mock_llm
+        MockGetLLMClient.return_value = mock_llm
 
         result = await analyze_product_node(mock_state_with_data)
 
@@ -232,3 +233,23 @@ async def test_analyze_product_node_real_llm(mock_state_with_data):
     assert (
         analysis["product_name"] != "unknown" or analysis["summary"] != "unknown"
     )
+
+
+def test_remove_near_duplicates_keeps_texts_before_ocr():
+    """텍스트와 겹치는 OCR 결과, 반복 배너 OCR 결과는 제거"""
+    banner = "전 상품 무료 배송 이벤트 진행 중 지금 바로 확인하세요"
+    texts = [{"content": banner, "tagName": "p", "position": 0}]
+    images = [
+        {"src": "https://cdn.example.com/1.jpg", "ocr_result": banner + "!"},
+        {"src": "https://cdn.example.com/2.jpg", "ocr_result": "방수 등급 IP68 지원으로 비 오는 날에도 안심"},
+        {"src": "https://cdn.example.com/3.jpg", "ocr_result": ""},
+    ]
+
+    kept_texts, kept_images, stats = remove_near_duplicates(texts, images, threshold=0.7)
+
+    assert kept_texts == texts
+    assert [image["src"] for image in kept_images] == [
+        "https://cdn.example.com/2.jpg",
+        "https://cdn.example.com/3.jpg",
+    ]
+    assert stats["near_duplicates"] == 1
@@ -0,0 +1,120 @@
+"""HTML 파싱 실행기 테스트"""
+
+import asyncio
+import os
+import signal
+import threading
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from src.graphs.summarize_page.exceptions import ParseQueueFullError
+from src.graphs.summarize_page.parse_executor import ParseExecutor
+
+HTML = """
+<html><body>
+  <h1>Amazing Laptop Pro 16</h1>
+  <p>The best laptop for professionals</p>
+  <img src="/product.jpg" alt="Product">
+</body></html>
+"""
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mode", ["thread", "inline"])
+async def test_extract_content(mode: str):
+    """워커에서 texts/images를 추출하고 대기/파싱 시간을 집계"""
+    executor = ParseExecutor(mode=mode, workers=1, max_queue_size=4)
+    try:
+        texts, images = await executor.extract_content("https://example.com/p", HTML)
+    finally:
+        executor.shutdown()
+
+    assert [text["content"] for text in texts] == [
+        "Amazing Laptop Pro 16",
+        "The best laptop for professionals",
+    ]
+    assert images[0]["src"] == "https://example.com/product.jpg"
+
+    stats = executor.stats()
+    assert stats["total_completed"] == 1
+    assert stats["in_flight"] == 0
+    assert stats["parse_time_p50_ms"] >= 0
+
+
+@pytest.mark.asyncio
+async def test_parse_domain_uses_matching_parser():
+    """라우팅된 domain_type의 파서로 파싱"""
+    executor = ParseExecutor(mode="thread", workers=1)
+    try:
+        parsed = await executor.parse_domain(
+            "https://www.coupang.com/vp/products/1", "Test Title", HTML, "coupang"
+        )
+    finally:
+        executor.shutdown()
+
+    assert parsed["domain_type"] == "coupang"
+
+
+@pytest.mark.asyncio
+async def test_rejects_when_queue_full():
+    """workers + max_queue_size를 넘는 작업은 ParseQueueFullError"""
+    executor = ParseExecutor(mode="thread", workers=1, max_queue_size=0)
+    release = threading.Event()
+    running = asyncio.create_task(executor._run(release.wait))
+    await asyncio.sleep(0)
+
+    try:
+        with pytest.raises(ParseQueueFullError):
+            await executor.extract_content("https://example.com", HTML)
+    finally:
+        release.set()
+        await running
+        executor.shutdown()
+
+    assert executor.stats()["total_rejected"] == 1
+
+
+def test_unsupported_mode():
+    """지원하지 않는 mode는 ValueError"""
+    with pytest.raises(ValueError):
+        ParseExecutor(mode="gpu")
+
+
+@pytest.mark.asyncio
+async def test_recovers_after_worker_process_dies():
+    """워커 프로세스가 종료되어 풀이 깨지면 새 풀로 재시도하고 이후 요청도 처리"""
+    executor = ParseExecutor(mode="process", workers=1)
+    try:
+        await executor.warm_up()
+        # 워커 비정상 종료 (OOM kill / segfault 상황)
+        for process in list(executor._executor._processes.values()):
+            os.kill(process.pid, signal.SIGKILL)
+            process.join(timeout=5)
+
+        texts, _ = await executor.extract_content("https://example.com/p", HTML)
+        assert texts[0]["content"] == "Amazing Laptop Pro 16"
+
+        # 이후 요청은 새 풀에서 바로 처리
+        texts, _ = await executor.extract_content("https://example.com/p", HTML)
+        assert texts[0]["content"] == "Amazing Laptop Pro 16"
+    finally:
+        executor.shutdown()
+
+    stats = executor.stats()
+    assert (stats["pool_restarts"], stats["total_completed"], stats["total_failed"]) == (1, 2, 0)
+
+
+@pytest.mark.asyncio
+async def test_gives_up_when_page_kills_workers_repeatedly():
+    """재시도에서도 워커가 종료되면 실패를 전달하되, 다음 요청은 새 풀에서 처리"""
+    executor = ParseExecutor(mode="process", workers=1)
+    try:
+        with pytest.raises(BrokenProcessPool):
+            await executor._run(os._exit, 1)
+        texts, _ = await executor.extract_content("https://example.com/p", HTML)
+    finally:
+        executor.shutdown()
+
+    assert texts[0]["content"] == "Amazing Laptop Pro 16"
+    assert executor.stats()["pool_restarts"] == 2
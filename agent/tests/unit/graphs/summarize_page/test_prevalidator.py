@@ -0,0 +1,128 @@
+"""페이지 사전 검증 테스트"""
+
+from src.graphs.summarize_page.prevalidator import (
+    NO_PRODUCT_ERROR,
+    PREVALIDATION_AMBIGUOUS,
+    PREVALIDATION_INVALID,
+    PREVALIDATION_VALID,
+    PagePrevalidator,
+)
+
+# Extension이 JSON-LD {"@type": "Product", "offers": {"@type": "Offer", ...}}에서 수집하는 @type 목록
+PRODUCT_JSON_LD_TYPES = ["Product", "Offer"]
+
+
+def _texts(*contents: str) -> list[dict]:
+    return [{"content": content, "tagName": "p", "position": float(i)} for i, content in enumerate(contents)]
+
+
+def _prevalidator() -> PagePrevalidator:
+    return PagePrevalidator(listing_min_prices=5, listing_price_ratio=0.3, invalid_max_texts=5)
+
+
+def test_structured_product_page_is_valid():
+    """JSON-LD Product + 가격이 있는 페이지는 LLM 없이 적합"""
+    html = "<h1>노트북</h1><span>1,290,000</span><span>원</span><button>장바구니</button>"
+    result = _prevalidator().classify(
+        html, _texts("노트북", "16GB RAM", "1.4kg"), json_ld_types=PRODUCT_JSON_LD_TYPES
+    )
+
+    assert result.decision == PREVALIDATION_VALID
+    assert result.signals["has_price"] and result.signals["cart_marker"]
+
+
+def test_og_product_page_is_valid():
+    """og:type=product + 가격 텍스트가 있으면 적합"""
+    result = _prevalidator().classify(
+        "<h1>이어폰</h1>", _texts("이어폰", "59,000원", "노이즈 캔슬링"), og_type="product.item"
+    )
+
+    assert result.decision == PREVALIDATION_VALID
+
+
+def test_product_group_variants_are_single_product():
+    """ProductGroup의 변형 Product 여러 개는 리스팅이 아닌 단일 제품으로 취급"""
+    result = _prevalidator().classify(
+        "<h1>티셔츠</h1>",
+        _texts("티셔츠", "19,900원", "S/M/L"),
+        json_ld_types=["ProductGroup", "Product", "Offer", "Product", "Offer"],
+    )
+
+    assert result.signals["json_ld_products"] == 1
+    assert result.decision == PREVALIDATION_VALID
+
+
+def test_non_krw_product_pages_are_not_invalid():
+    """원화/한국어가 아닌 가격과 구매 버튼도 제품 신호로 인식"""
+    prevalidator = _prevalidator()
+    euro = prevalidator.classify(
+        "<span>89,99 €</span><button>In den Warenkorb</button>", _texts("Kopfhörer", "Bluetooth 5.3", "Schwarz")
+    )
+    yen = prevalidator.classify("<p>¥12,800 / カートに入れる</p>", _texts("イヤホン", "ワイヤレス", "ブラック"))
+    yen_valid = prevalidator.classify(
+        "<span>12,800</span><span>円</span>", _texts("イヤホン", "ワイヤレス", "ブラック"), og_type="product"
+    )
+
+    assert euro.decision == PREVALIDATION_AMBIGUOUS
+    assert euro.signals["has_price"] and euro.signals["cart_marker"]
+    assert yen.decision == PREVALIDATION_AMBIGUOUS
+    assert yen.signals["has_price"] and yen.signals["cart_marker"]
+    assert yen_valid.decision == PREVALIDATION_VALID
+
+
+def test_long_page_without_recognized_signals_is_ambiguous():
+    """신호를 인식하지 못했더라도 긴 페이지는 거부하지 않고 LLM 검증으로 넘김"""
+    result = _prevalidator().classify("<h1>Produkt</h1>", _texts(*(f"Abschnitt {i}" for i in range(10))))
+
+    assert result.decision == PREVALIDATION_AMBIGUOUS
+
+
+def test_page_without_product_signals_is_invalid():
+    """제품 신호가 없고 비제품 유형이거나 짧은 페이지면 부적합"""
+    result = _prevalidator().classify(
+        "<h1>오늘의 뉴스</h1>", _texts("오늘의 뉴스", "기사 본문입니다", "댓글"), og_type="article"
+    )
+
+    # og:type=article 등 비제품 유형은 텍스트가 많아도 부적합
+    article = _prevalidator().classify(
+        "<h1>오늘의 뉴스</h1>", _texts(*(f"문단 {i}" for i in range(10))), og_type="article"
+    )
+
+    assert result.decision == PREVALIDATION_INVALID
+    assert result.error_message == NO_PRODUCT_ERROR
+    assert article.decision == PREVALIDATION_INVALID
+
+
+def test_listing_or_partial_signals_are_ambiguous():
+    """리스팅 의심 또는 일부 신호만 있는 페이지는 LLM 검증으로 넘김"""
+    prevalidator = _prevalidator()
+
+    # 구조화 데이터가 있어도 가격이 반복되면 리스팅 의심
+    listing = prevalidator.classify(
+        "", _texts(*(f"노트북 {i} - {i},000원" for i in range(1, 9))), json_ld_types=PRODUCT_JSON_LD_TYPES
+    )
+    # ItemList 구조화 데이터
+    item_list = prevalidator.classify("", _texts("a", "b", "c"), json_ld_types=["ItemList"])
+    # 구조화 데이터 없이 가격만 존재
+    price_only = prevalidator.classify("<h1>노트북</h1>", _texts("노트북", "1,290,000원", "스펙"))
+
+    assert listing.decision == PREVALIDATION_AMBIGUOUS
+    assert item_list.decision == PREVALIDATION_AMBIGUOUS
+    assert price_only.decision == PREVALIDATION_AMBIGUOUS
+
+
+def test_stats_count_each_route():
+    """판정 경로별 횟수와 LLM 검증 비율 집계"""
+    prevalidator = _prevalidator()
+    prevalidator.classify("<b>$12.99</b>", _texts("a", "b", "c"), json_ld_types=PRODUCT_JSON_LD_TYPES)
+    prevalidator.classify("<h1>뉴스</h1>", _texts("a", "b", "c"))
+    prevalidator.classify("<h1>노트북</h1>", _texts("노트북", "1,290,000원", "스펙"))
+    prevalidator.classify("<h1>노트북</h1>", _texts("노트북", "2,290,000원", "스펙"))
+
+    assert prevalidator.stats() == {
+        "heuristic_valid": 1,
+        "heuristic_invalid": 1,
+        "llm": 2,
+        "total": 4,
+        "llm_ratio": 0.5,
+    }
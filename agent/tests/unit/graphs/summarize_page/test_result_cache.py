@@ -0,0 +1,73 @@
+"""SummarizePage 결과 캐시 테스트"""
+
+from unittest.mock import patch
+
+from src.graphs.summarize_page.result_cache import (
+    CACHE_HIT,
+    CACHE_MISS,
+    CACHE_STALE,
+    SummarizePageResultCache,
+)
+from src.utils.cache import MemoryLRUCache, TieredCache
+
+RESPONSE = {"url": "https://shop.example.com/p/1", "title": "Laptop", "timestamp": 1}
+
+
+def _cache(ttl: float = 60, stale: float = 60) -> SummarizePageResultCache:
+    return SummarizePageResultCache(
+        TieredCache(MemoryLRUCache(max_bytes=1024 * 1024)), ttl_seconds=ttl, stale_seconds=stale
+    )
+
+
+def test_key_depends_on_url_and_content():
+    """URL 정규화 결과가 같고 html_body가 같을 때만 같은 키"""
+    key = SummarizePageResultCache.make_key
+    assert key("https://Shop.example.com/p/1?utm_source=x", "<p>a</p>") == key(
+        "https://shop.example.com/p/1", "<p>a</p>"
+    )
+    assert key("https://shop.example.com/p/1", "<p>a</p>") != key(
+        "https://shop.example.com/p/1", "<p>b</p>"
+    )
+
+
+async def test_hit_stale_miss():
+    """TTL 이내 HIT, stale 기간 STALE, 그 이후 MISS"""
+    cache = _cache(ttl=60, stale=60)
+    key = cache.make_key(RESPONSE["url"], "<p>a</p>")
+
+    assert await cache.get(key) == (None, CACHE_MISS)
+
+    with patch("src.graphs.summarize_page.result_cache.time.time", return_value=1000.0):
+        await cache.set(key, RESPONSE)
+
+    with patch("src.graphs.summarize_page.result_cache.time.time", return_value=1030.0):
+        assert await cache.get(key) == (RESPONSE, CACHE_HIT)
+    with patch("src.graphs.summarize_page.result_cache.time.time", return_value=1090.0):
+        assert await cache.get(key) == (RESPONSE, CACHE_STALE)
+    with patch("src.graphs.summarize_page.result_cache.time.time", return_value=1200.0):
+        assert await cache.get(key) == (None, CACHE_MISS)
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["stale_hits"], stats["misses"]) == (1, 1, 2)
+
+
+def test_refresh_is_single_flight():
+    """같은 키의 stale 재계산은 한 번만 시작"""
+    cache = _cache()
+
+    assert cache.try_begin_refresh("key")
+    assert not cache.try_begin_refresh("key")
+    cache.end_refresh("key")
+    assert cache.try_begin_refresh("key")
+
+
+async def test_invalidate_by_url():
+    """URL 단위 무효화는 해당 페이지의 모든 html_body 버전을 삭제"""
+    cache = _cache()
+    await cache.set(cache.make_key(RESPONSE["url"], "<p>a</p>"), RESPONSE)
+    await cache.set(cache.make_key(RESPONSE["url"], "<p>b</p>"), RESPONSE)
+    other_key = cache.make_key("https://shop.example.com/p/2", "<p>a</p>")
+    await cache.set(other_key, RESPONSE)
+
+    assert await cache.invalidate("https://shop.example.com/p/1#reviews") == 2
+    assert (await cache.get(other_key))[1] == CACHE_HIT
@@ -0,0 +1,84 @@
+"""SummarizePage 스트리밍 이벤트 테스트"""
+
+import pytest
+from langgraph.graph import END, StateGraph
+
+from src.graphs.summarize_page.state import SummarizePageState
+from src.graphs.summarize_page.streaming import (
+    EVENT_OCR_PROGRESS,
+    SummarizePageStream,
+    get_progress_writer,
+)
+
+
+def _route(state: SummarizePageState) -> dict:
+    return {"domain_type": "naver_smartstore"}
+
+
+def _domain_parser(state: SummarizePageState) -> dict:
+    return {
+        "is_valid_page": True,
+        "validation_error": "",
+        "parsed_content": {
+            "domain_type": "naver_smartstore",
+            "product_name": "무선 이어폰",
+            "price": "22,000원",
+            "thumbnail": "https://example.com/main.jpg",
+            "description_texts": [],
+            "description_images": [],
+        },
+    }
+
+
+async def _ocr(state: SummarizePageState) -> dict:
+    write_progress = get_progress_writer()
+    for completed in range(3):
+        write_progress({"type": EVENT_OCR_PROGRESS, "completed": completed, "total": 2})
+    return {"images": []}
+
+
+def _analyze(state: SummarizePageState) -> dict:
+    return {"product_analysis": {"product_name": "무선 이어폰"}}
+
+
+@pytest.fixture
+def graph():
+    """실제 그래프와 같은 노드 이름/업데이트를 갖는 축약 그래프"""
+    workflow = StateGraph(SummarizePageState)
+    workflow.add_node("route", _route)
+    workflow.add_node("domain_parser", _domain_parser)
+    workflow.add_node("ocr", _ocr)
+    workflow.add_node("analyze_product", _analyze)
+    workflow.set_entry_point("route")
+    workflow.add_edge("route", "domain_parser")
+    workflow.add_edge("domain_parser", "ocr")
+    workflow.add_edge("ocr", "analyze_product")
+    workflow.add_edge("analyze_product", END)
+    return workflow.compile()
+
+
+async def test_events_are_emitted_in_progress_order(graph):
+    """route -> parsed -> validated -> ocr_progress 순서로 이벤트를 전달하고 최종 state를 보관"""
+    stream = SummarizePageStream(graph, {"url": "https://smartstore.naver.com/a/products/1"})
+
+    events = [event async for event in stream.events()]
+
+    assert [event["type"] for event in events] == [
+        "route",
+        "parsed",
+        "validated",
+        "ocr_progress",
+        "ocr_progress",
+        "ocr_progress",
+    ]
+    assert events[0]["domain_type"] == "naver_smartstore"
+    assert events[1]["product_name"] == "무선 이어폰"
+    assert events[1]["price"] == "22,000원"
+    assert events[2] == {"type": "validated", "is_valid_page": True, "error": None}
+    assert events[-1]["completed"] == 2
+    assert stream.final_state["product_analysis"] == {"product_name": "무선 이어폰"}
+
+
+async def test_progress_writer_is_noop_outside_graph():
+    """그래프 실행 컨텍스트 밖에서는 writer 호출이 무시되어야 함"""
+    get_progress_writer()({"type": EVENT_OCR_PROGRESS, "completed": 1, "total": 1})
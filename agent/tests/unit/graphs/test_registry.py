@@ -0,0 +1,40 @@
+"""GraphRegistry 테스트"""
+
+import pytest
+
+from src.graphs.registry import GraphRegistry, get_graph_registry
+
+
+class TestGraphRegistry:
+    """GraphRegistry 테스트"""
+
+    def test_get_compiles_once(self):
+        """같은 이름으로 여러 번 조회해도 팩토리는 1회만 호출되어야 함"""
+        calls = []
+
+        def factory():
+            calls.append(1)
+            return object()
+
+        registry = GraphRegistry()
+        registry.register("dummy", factory)
+
+        first = registry.get("dummy")
+        second = registry.get("dummy")
+
+        assert first is second
+        assert len(calls) == 1
+
+    def test_unknown_graph_raises(self):
+        """등록되지 않은 그래프는 KeyError"""
+        with pytest.raises(KeyError):
+            GraphRegistry().get("unknown")
+
+    def test_warm_up_compiles_all_graphs(self):
+        """warm_up()은 등록된 모든 그래프를 컴파일해야 함"""
+        registry = get_graph_registry()
+        timings = registry.warm_up()
+
+        assert set(timings) == {"summarize_page", "compare_products", "chatbot"}
+        for name in registry.names:
+            assert registry.get(name) is registry.get(name)
@@ -0,0 +1,95 @@
+"""프롬프트 인코더 테스트"""
+
+import pytest
+
+import src.graphs.summarize_page  # noqa: F401  (state 순환 import 방지용 선행 로드)
+from src.exceptions.base import ConfigurationError
+from src.prompts import analyze_product, validate_page
+from src.prompts.encoders import ENCODERS, get_encoder
+
+TEXTS = [
+    {"content": "노트북 Pro", "tagName": "h1", "position": 0},
+    {"content": "16GB RAM, 512GB SSD", "tagName": "p", "position": 1},
+    {"content": "가볍고 좋아요", "tagName": "review", "position": 2},
+    {"content": '배송이 "빨라요"', "tagName": "review", "position": 3},
+]
+IMAGES = [
+    {"src": "https://cdn.example.com/a.jpg", "alt": "스펙", "ocr_result": "무게 1.4kg\n배터리 70Wh"},
+    {"src": "https://cdn.example.com/b.jpg", "alt": "배너", "ocr_result": ""},
+]
+
+
+def test_csv_encoder_escapes_and_keeps_positions():
+    """CSV 인코더는 기존 tag,text,position 형식과 이스케이핑 유지"""
+    encoder = get_encoder("csv")
+
+    assert encoder.encode_texts(TEXTS) == (
+        "tag,text,position\n"
+        "h1,노트북 Pro,0\n"
+        'p,"16GB RAM, 512GB SSD",1\n'
+        "review,가볍고 좋아요,2\n"
+        'review,"배송이 ""빨라요""",3'
+    )
+    assert encoder.encode_ocr(IMAGES) == 'alt,ocr_text\n스펙,"무게 1.4kg\n배터리 70Wh"'
+    assert encoder.encode_texts([]) == ""
+
+
+def test_grouped_encoder_groups_headings_and_reviews():
+    """grouped 인코더는 제목을 Markdown 제목으로, 연속 리뷰를 한 섹션으로 묶음"""
+    encoder = get_encoder("grouped")
+
+    assert encoder.encode_texts(TEXTS) == (
+        "# 노트북 Pro\n16GB RAM, 512GB SSD\n## 리뷰\n- 가볍고 좋아요\n- 배송이 \"빨라요\""
+    )
+    assert encoder.encode_ocr(IMAGES) == "### 이미지 1: 스펙\n무게 1.4kg\n배터리 70Wh"
+
+
+def test_compact_encoder_one_line_per_item():
+    """compact 인코더는 의미 있는 태그만 표시하고 OCR 줄바꿈을 ' / '로 보존"""
+    encoder = get_encoder("compact")
+
+    assert encoder.encode_texts(TEXTS) == (
+        "h1|노트북 Pro\n16GB RAM, 512GB SSD\nreview|가볍고 좋아요\nreview|배송이 \"빨라요\""
+    )
+    assert encoder.encode_ocr(IMAGES) == "스펙|무게 1.4kg / 배터리 70Wh"
+
+
+def test_build_messages_uses_encoding():
+    """analyze_product 프롬프트의 코드 블록 언어와 시스템 프롬프트 입력 형식이 인코딩을 따름"""
+    csv_messages = analyze_product.build_messages(TEXTS, IMAGES, "노트북 Pro")
+    compact_messages = analyze_product.build_messages(TEXTS, IMAGES, "노트북 Pro", "compact")
+
+    assert csv_messages[0]["content"] == analyze_product.SYSTEM_PROMPT
+    assert "```csv\ntag,text,position" in csv_messages[1]["content"]
+    assert "```text\nh1|노트북 Pro" in compact_messages[1]["content"]
+    assert "tag,text,position" not in compact_messages[0]["content"]
+    assert "```text\nh1|제품명" in compact_messages[0]["content"]
+
+
+@pytest.mark.parametrize("encoding", list(ENCODERS))
+def test_system_prompts_describe_selected_encoding(encoding):
+    """시스템 프롬프트는 선택된 인코딩 형식만 설명 (CSV 설명은 csv에서만)"""
+    analyze_system = analyze_product.build_system_prompt(encoding)
+    validate_system = validate_page.build_system_prompt(encoding)
+
+    describes_csv = encoding == "csv"
+    assert ("tag,text,position" in analyze_system) is describes_csv
+    assert ("position(순서)" in validate_system) is describes_csv
+    assert f"({get_encoder(encoding).label})" in analyze_system
+
+
+def test_validate_page_csv_keeps_header_for_empty_texts():
+    """validate_page는 텍스트가 없어도 CSV 헤더를 유지하고, 헤더가 없는 형식은 안내 문구 사용"""
+    csv_prompt = validate_page.build_messages("https://example.com", "제목", [])[1]["content"]
+    compact_prompt = validate_page.build_messages("https://example.com", "제목", [], "compact")[1]["content"]
+
+    assert "```csv\ntag,text,position\n```" in csv_prompt
+    assert "```text\n[텍스트 없음]\n```" in compact_prompt
+
+
+def test_unknown_encoding_raises_configuration_error():
+    """지원하지 않는 인코딩은 ConfigurationError"""
+    with pytest.raises(ConfigurationError) as exc_info:
+        get_encoder("xml")
+
+    assert exc_info.value.details["provided_encoding"] == "xml"
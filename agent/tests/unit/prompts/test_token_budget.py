@@ -0,0 +1,71 @@
+"""프롬프트 토큰 예산 테스트"""
+
+import src.graphs.summarize_page  # noqa: F401  (state 순환 import 방지용 선행 로드)
+from src.prompts.token_budget import (
+    PRIORITY_DESCRIPTION,
+    PRIORITY_KEY,
+    PRIORITY_REVIEW,
+    estimate_tokens,
+    fit_to_budget,
+    text_priority,
+)
+
+
+def _text(content: str, tag: str = "p", position: float = 0) -> dict:
+    return {"content": content, "tagName": tag, "position": position}
+
+
+def _image(ocr: str) -> dict:
+    return {"src": "https://cdn.example.com/a.jpg", "alt": "", "ocr_result": ocr}
+
+
+def test_estimate_tokens_korean_and_english():
+    """한글은 1자당 1토큰, 영문/숫자는 4자당 1토큰 (공백 제외, 올림)"""
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("가성비 좋아요") == 6
+    assert estimate_tokens("battery life") == 3
+    assert estimate_tokens("배터리 16GB") == 4
+
+
+def test_text_priority():
+    """제목/가격/스펙 형태 텍스트 우선, 리뷰는 마지막"""
+    assert text_priority(_text("제품명: 노트북", "h1")) == PRIORITY_KEY
+    assert text_priority(_text("무게: 1.4kg")) == PRIORITY_KEY
+    assert text_priority(_text("16GB LPDDR5 RAM")) == PRIORITY_KEY
+    assert text_priority(_text("가볍고 튼튼한 노트북입니다")) == PRIORITY_DESCRIPTION
+    assert text_priority(_text("배송이 빠르고 16GB라 좋아요", "review")) == PRIORITY_REVIEW
+
+
+def test_fit_to_budget_keeps_priority_order_and_records_dropped():
+    """예산 안에서 스펙 -> 설명 -> OCR -> 리뷰 순으로 채우고, 선택 항목은 원래 순서 유지"""
+    texts = [
+        _text("정말 만족스러운 제품입니다 추천해요", "review", 300),
+        _text("가볍고 튼튼한 노트북", position=200),
+        _text("제품명: 노트북", "h1", 0),
+        _text("무게: 1.4kg", position=100),
+    ]
+    images = [_image("상세 스펙 표 " * 5)]
+
+    budgeted = fit_to_budget(texts, images, max_tokens=35)
+
+    assert [text["content"] for text in budgeted.texts] == [
+        "가볍고 튼튼한 노트북",
+        "제품명: 노트북",
+        "무게: 1.4kg",
+    ]
+    assert budgeted.images == []
+    assert budgeted.dropped == {"ocr": 1, "review": 1}
+    assert budgeted.used_tokens == 32
+    assert budgeted.dropped_count == 2
+
+
+def test_fit_to_budget_without_limit_keeps_everything():
+    """예산 0이면 모든 항목 유지"""
+    texts = [_text("리뷰 " * 100, "review")]
+    images = [_image("OCR")]
+
+    budgeted = fit_to_budget(texts, images, max_tokens=0)
+
+    assert budgeted.texts == texts
+    assert budgeted.images == images
+    assert budgeted.dropped == {}
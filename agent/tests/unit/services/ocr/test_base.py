@@ -0,0 +1,262 @@
+"""OCR 서비스 공유 HTTP 클라이언트 테스트"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from src.graphs.summarize_page.config import SummarizePageSettings
+from src.services.ocr import ClovaOCRService
+
+CLOVA_SUCCESS = {
+    "images": [
+        {
+            "inferResult": "SUCCESS",
+            "fields": [{"inferText": "16GB"}, {"inferText": "RAM"}],
+        }
+    ]
+}
+
+
+@pytest.fixture
+def settings() -> SummarizePageSettings:
+    return SummarizePageSettings(
+        google_api_key="dummy",
+        clova_secret_key="secret",
+        clova_invoke_url="https://ocr.example.com/general",
+        http_max_retries=2,
+        ocr_http2=False,
+        ocr_cache_enabled=False,
+    )
+
+
+def _image(src: str) -> dict:
+    return {"src": src, "alt": "", "width": 0, "height": 0, "position": 0, "ocr_result": ""}
+
+
+def _install_transport(service: ClovaOCRService, handler) -> list[httpx.Request]:
+    """MockTransport를 사용하는 클라이언트로 교체하고 요청 기록 리스트 반환"""
+    requests: list[httpx.Request] = []
+
+    def record(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return handler(request)
+
+    service._client = httpx.AsyncClient(transport=httpx.MockTransport(record))
+    return requests
+
+
+async def test_client_is_reused_across_images(settings):
+    """여러 이미지를 처리해도 하나의 클라이언트를 재사용해야 함"""
+    service = ClovaOCRService(settings)
+    requests = _install_transport(service, lambda _: httpx.Response(200, json=CLOVA_SUCCESS))
+    client = service.client
+
+    results = await service.process_images(
+        [_image(f"https://cdn.example.com/{i}.jpg") for i in range(5)]
+    )
+
+    assert service.client is client
+    assert len(requests) == 5
+    assert all(img["ocr_result"] == "16GB RAM" for img in results)
+
+    stats = service.pool_stats()
+    assert stats["total_requests"] == 5
+    assert stats["in_flight"] == 0
+    assert 1 <= stats["peak_in_flight"] <= 5
+
+    await service.aclose()
+
+
+async def test_retry_uses_shared_client(settings):
+    """5xx 응답 후 재시도도 같은 클라이언트로 수행해야 함"""
+    service = ClovaOCRService(settings)
+    responses = iter([httpx.Response(503), httpx.Response(200, json=CLOVA_SUCCESS)])
+    requests = _install_transport(service, lambda _: next(responses))
+
+    with patch("src.services.ocr.base.asyncio.sleep", new=AsyncMock()):
+        result = await service.perform_ocr(_image("https://cdn.example.com/a.jpg"))
+
+    assert result == "16GB RAM"
+    assert len(requests) == 2
+    assert service.pool_stats()["failed_requests"] == 1
+
+    await service.aclose()
+
+
+async def test_aclose_recreates_client_lazily(settings):
+    """aclose() 후 다시 접근하면 새 클라이언트를 생성해야 함"""
+    service = ClovaOCRService(settings)
+    first = service.client
+
+    await service.aclose()
+
+    assert first.is_closed
+    assert service.client is not first
+    await service.aclose()
+
+
+async def test_clova_batch_splits_per_image_results(settings):
+    """배치 응답을 이미지별 결과로 분리하고, 개별 실패는 해당 이미지만 비워야 함"""
+    settings.clova_batch_size = 3
+    service = ClovaOCRService(settings)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        names = [entry["name"] for entry in body["images"]]
+        images = [
+            {"name": name, "inferResult": "SUCCESS", "fields": [{"inferText": name}]}
+            for name in names
+        ]
+        images[1] = {"name": names[1], "inferResult": "ERROR", "message": "bad image"}
+        return httpx.Response(200, json={"images": images})
+
+    requests = _install_transport(service, handler)
+
+    results = await service.process_images(
+        [_image(f"https://cdn.example.com/{i}.jpg") for i in range(5)]
+    )
+
+    # 5개 이미지 -> 3개 + 2개 배치
+    assert len(requests) == 2
+    assert [img["ocr_result"] for img in results] == ["image_0", "", "image_2", "image_0", ""]
+
+    await service.aclose()
+
+
+async def test_clova_batch_respects_byte_budget(settings):
+    """요청 바이트 예산을 넘으면 배치를 분할해야 함"""
+    settings.clova_batch_size = 10
+    service = ClovaOCRService(settings)
+    image = _image("https://cdn.example.com/0.jpg")
+    settings.clova_batch_max_bytes = service._estimate_request_bytes(image) * 2
+
+    batches = service._make_batches(list(enumerate([image] * 5)))
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+
+
+async def test_clova_batch_falls_back_to_single_requests(settings):
+    """배치 요청 자체가 실패하면 이미지별 단건 요청으로 재시도해야 함"""
+    settings.clova_batch_size = 3
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        if len(body["images"]) > 1:
+            return httpx.Response(400)
+        return httpx.Response(200, json=CLOVA_SUCCESS)
+
+    service = ClovaOCRService(settings)
+    requests = _install_transport(service, handler)
+
+    with patch("src.services.ocr.base.asyncio.sleep", new=AsyncMock()):
+        results = await service.process_images(
+            [_image(f"https://cdn.example.com/{i}.jpg") for i in range(3)]
+        )
+
+    assert all(img["ocr_result"] == "16GB RAM" for img in results)
+    # 배치 요청(재시도 포함 2회) + 단건 요청 3회
+    assert len(requests) == 5
+
+    await service.aclose()
+
+
+async def test_process_images_reports_progress_per_batch(settings):
+    """배치가 끝날 때마다 (완료 수, 전체 수)로 진행 콜백을 호출해야 함"""
+    settings.clova_batch_size = 2
+    service = ClovaOCRService(settings)
+    _install_transport(service, lambda _: httpx.Response(200, json=CLOVA_SUCCESS))
+    progress: list[tuple[int, int]] = []
+
+    await service.process_images(
+        [_image(f"https://cdn.example.com/{i}.jpg") for i in range(5)],
+        on_progress=lambda completed, total: progress.append((completed, total)),
+    )
+
+    # 시작(캐시 hit 0) + 배치 3개 (2 + 2 + 1)
+    assert progress[0] == (0, 5)
+    assert [completed for completed, _ in progress] == sorted(completed for completed, _ in progress)
+    assert progress[-1] == (5, 5)
+    assert len(progress) == 4
+
+    await service.aclose()
+
+
+async def test_concurrent_requests_share_in_flight_images(settings):
+    """동시에 처리 중인 요청 간 같은 이미지는 1번만 OCR하고 결과를 공유해야 함"""
+    service = ClovaOCRService(settings)
+    requests = _install_transport(service, lambda _: httpx.Response(200, json=CLOVA_SUCCESS))
+
+    first = [_image(f"https://cdn.example.com/{i}.jpg") for i in range(4)]
+    # 2개 겹침 + 요청 내 중복 1개
+    second = [_image(f"https://cdn.example.com/{i}.jpg") for i in (2, 3, 4, 4)]
+
+    results = await asyncio.gather(service.process_images(first), service.process_images(second))
+
+    assert len(requests) == 5
+    assert all(img["ocr_result"] == "16GB RAM" for batch in results for img in batch)
+    assert service.pool_stats()["shared_images"] == 3
+    assert service._pending_images == {}
+
+    await service.aclose()
+
+
+async def _slow_batch(images: list[dict]) -> list[str]:
+    """slow 이미지만 오래 걸리는 OCR 배치"""
+    if any("slow" in image["src"] for image in images):
+        await asyncio.sleep(0.5)
+    return ["text" for _ in images]
+
+
+async def test_deadline_returns_completed_results_and_finishes_late_in_background(settings):
+    """마감 시간까지 끝난 결과만 반환하고, 남은 OCR은 백그라운드에서 끝까지 실행해야 함"""
+    service = ClovaOCRService(settings)
+    service.perform_ocr_batch = _slow_batch
+    images = [_image("https://cdn.example.com/fast.jpg"), _image("https://cdn.example.com/slow.jpg")]
+    dropped: list[dict] = []
+
+    results = await service.process_images(images, deadline=0.05, on_dropped=dropped.extend)
+
+    assert [img["ocr_result"] for img in results] == ["text", ""]
+    assert [img["src"] for img in dropped] == ["https://cdn.example.com/slow.jpg"]
+    # 늦게 끝나는 이미지는 다른 요청이 계속 공유할 수 있음
+    assert len(service._pending_images) == 1
+
+    await asyncio.gather(*service._late_tasks)
+    assert service._pending_images == {}
+    assert service.pool_stats()["late_images"] == 1
+
+    await service.aclose()
+
+
+async def test_deadline_cancels_stragglers_without_background(settings):
+    """백그라운드 실행 비활성화 시 마감 시간을 넘긴 OCR은 취소해야 함"""
+    settings.ocr_deadline_background = False
+    service = ClovaOCRService(settings)
+    service.perform_ocr_batch = _slow_batch
+    dropped: list[dict] = []
+
+    results = await service.process_images(
+        [_image("https://cdn.example.com/slow.jpg")], deadline=0.05, on_dropped=dropped.extend
+    )
+
+    assert results[0]["ocr_result"] == ""
+    assert len(dropped) == 1
+    assert service._late_tasks == set()
+    assert service._pending_images == {}
+
+    await service.aclose()
+
+
+async def test_warm_up_opens_connection_to_endpoint(settings):
+    """warm-up은 공유 클라이언트로 OCR 엔드포인트에 요청하여 커넥션을 열어야 함"""
+    service = ClovaOCRService(settings)
+    requests = _install_transport(service, lambda _: httpx.Response(405))
+    client = service.client
+
+    await service.warm_up()
+
+    assert service.client is client
+    assert [(r.method, str(r.url)) for r in requests] == [("HEAD", "https://ocr.example.com/general")]
@@ -0,0 +1,164 @@
+"""OCR 결과 캐시 테스트"""
+
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.graphs.summarize_page.config import SummarizePageSettings
+from src.services.ocr import ClovaOCRService
+from src.services.ocr import cache as ocr_cache_module
+from src.services.ocr.cache import OCRResultCache, canonicalize_image_url
+from src.utils import cache as cache_module
+from src.utils.cache import MemoryLRUCache, SQLiteTTLCache, TieredCache
+
+
+@pytest.fixture
+def settings(tmp_path) -> SummarizePageSettings:
+    return SummarizePageSettings(
+        google_api_key="dummy",
+        clova_secret_key="secret",
+        clova_invoke_url="https://ocr.example.com/general",
+        ocr_cache_path=str(tmp_path / "ocr_cache.sqlite3"),
+    )
+
+
+@pytest.fixture(autouse=True)
+def reset_cache_singleton():
+    ocr_cache_module.close_ocr_cache()
+    yield
+    ocr_cache_module.close_ocr_cache()
+
+
+def _image(src: str) -> dict:
+    return {"src": src, "alt": "", "width": 0, "height": 0, "position": 0, "ocr_result": ""}
+
+
+def test_canonicalize_image_url():
+    """대소문자/기본 포트/fragment/query 순서 차이는 같은 URL로 정규화"""
+    assert canonicalize_image_url(
+        "HTTPS://Shop.Example.com:443/img/a.jpg?w=800&type=f#top"
+    ) == canonicalize_image_url("https://shop.example.com/img/a.jpg?type=f&w=800")
+
+    # 정규화할 수 없는 URL은 예외 대신 원본 그대로 키로 사용
+    assert canonicalize_image_url(" https://cdn.example.com:99999/a.jpg ") == "https://cdn.example.com:99999/a.jpg"
+
+
+def test_memory_lru_evicts_by_bytes():
+    """바이트 한도를 넘으면 가장 오래된 항목부터 제거"""
+    memory = MemoryLRUCache(max_bytes=30)
+    memory.set("a", "x" * 10)
+    memory.set("b", "y" * 10)
+    memory.get("a")
+    memory.set("c", "z" * 10)
+
+    assert memory.get("b") is None
+    assert memory.get("a") == "x" * 10
+    assert memory.current_bytes <= 30
+    assert memory.evictions == 1
+
+
+def test_sqlite_ttl_expires(tmp_path):
+    """TTL이 지난 항목은 조회되지 않음"""
+    disk = SQLiteTTLCache(tmp_path / "cache.sqlite3", ttl_seconds=60)
+    disk.set("fresh", "value")
+    disk.set("stale", "value", ttl_seconds=-1)
+
+    assert disk.get("fresh") == "value"
+    assert disk.get("stale") is None
+    disk.close()
+
+
+async def test_disk_hit_is_promoted_to_memory(tmp_path):
+    """디스크 hit은 메모리 계층으로 승격"""
+    disk = SQLiteTTLCache(tmp_path / "cache.sqlite3", ttl_seconds=60)
+    disk.set("key", "value")
+    cache = TieredCache(MemoryLRUCache(max_bytes=1024), disk)
+
+    assert await cache.get("key") == "value"
+    assert await cache.get("key") == "value"
+    assert await cache.get("missing") is None
+
+    stats = cache.stats()
+    assert (stats["disk_hits"], stats["memory_hits"], stats["misses"]) == (1, 1, 1)
+    cache.close()
+
+
+def test_memory_lru_expires_entries():
+    """TTL을 지정한 메모리 항목은 만료 후 조회되지 않고 삭제됨"""
+    memory = MemoryLRUCache(max_bytes=1024)
+    memory.set("fresh", "value", ttl_seconds=60)
+    memory.set("stale", "value", ttl_seconds=-1)
+    memory.set("forever", "value")
+
+    assert memory.get("fresh") == "value"
+    assert memory.get("stale") is None
+    assert memory.get("forever") == "value"
+    assert len(memory) == 2
+
+
+async def test_memory_tier_applies_ttl(monkeypatch):
+    """메모리 전용 TieredCache도 TTL이 지나면 miss"""
+    cache = TieredCache(MemoryLRUCache(max_bytes=1024), ttl_seconds=60)
+    await cache.set("key", "value")
+    assert await cache.get("key") == "value"
+
+    now = time.time()
+    monkeypatch.setattr(cache_module.time, "time", lambda: now + 61)
+
+    assert await cache.get("key") is None
+    assert cache.stats()["memory_items"] == 0
+
+
+async def test_promoted_disk_hit_keeps_remaining_ttl(tmp_path, monkeypatch):
+    """디스크에서 승격된 항목은 디스크의 남은 TTL까지만 메모리에 유지"""
+    disk = SQLiteTTLCache(tmp_path / "cache.sqlite3", ttl_seconds=3600)
+    disk.set("key", "value", ttl_seconds=10)
+    cache = TieredCache(MemoryLRUCache(max_bytes=1024), disk)
+    assert await cache.get("key") == "value"
+
+    now = time.time()
+    monkeypatch.setattr(cache_module.time, "time", lambda: now + 11)
+
+    assert await cache.get("key") is None
+    assert cache.stats()["misses"] == 1
+    cache.close()
+
+
+async def test_process_images_uses_cache(settings):
+    """같은 이미지는 두 번째 요청부터 OCR API를 호출하지 않음"""
+    service = ClovaOCRService(settings)
+    service.perform_ocr = AsyncMock(side_effect=["16GB RAM", None])
+    images = [_image("https://cdn.example.com/detail.jpg")]
+
+    first = await service.process_images(images)
+    second = await service.process_images(images)
+
+    assert first[0]["ocr_result"] == second[0]["ocr_result"] == "16GB RAM"
+    assert service.perform_ocr.await_count == 1
+
+
+async def test_failed_ocr_is_not_cached(settings):
+    """OCR 실패(None)는 캐시하지 않음"""
+    service = ClovaOCRService(settings)
+    service.perform_ocr = AsyncMock(side_effect=[None, "retry ok"])
+    images = [_image("https://cdn.example.com/detail.jpg")]
+
+    await service.process_images(images)
+    result = await service.process_images(images)
+
+    assert result[0]["ocr_result"] == "retry ok"
+    assert service.perform_ocr.await_count == 2
+
+
+async def test_invalidate_by_url(settings):
+    """URL 단위 무효화는 해당 이미지의 모든 provider/설정 항목을 삭제"""
+    cache = OCRResultCache(TieredCache(MemoryLRUCache(max_bytes=1024)))
+    await cache.set("https://cdn.example.com/a.jpg", "clova", settings, "A")
+    await cache.set("https://cdn.example.com/a.jpg", "ocrspace", settings, "A")
+    await cache.set("https://cdn.example.com/b.jpg", "clova", settings, "B")
+
+    deleted = await cache.invalidate("https://CDN.example.com/a.jpg")
+
+    assert deleted == 2
+    assert await cache.get("https://cdn.example.com/b.jpg", "clova", settings) == "B"
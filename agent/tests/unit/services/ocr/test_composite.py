@@ -0,0 +1,188 @@
+"""서킷 브레이커 / Failover OCR 서비스 테스트"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.graphs.summarize_page.config import SummarizePageSettings
+from src.services.ocr.circuit_breaker import CircuitBreaker
+from src.services.ocr.composite import FailoverOCRService
+
+IMAGE = {
+    "src": "https://cdn.example.com/detail.jpg",
+    "alt": "",
+    "width": 0,
+    "height": 0,
+    "position": 0,
+    "ocr_result": "",
+}
+
+
+@pytest.fixture
+def settings() -> SummarizePageSettings:
+    return SummarizePageSettings(
+        google_api_key="dummy",
+        ocr_breaker_failure_threshold=2,
+        ocr_breaker_recovery_seconds=60,
+        ocr_hedge_min_delay_seconds=0.05,
+    )
+
+
+def _service(provider: str, perform_ocr) -> MagicMock:
+    service = MagicMock()
+    service.provider = provider
+    service.perform_ocr = perform_ocr
+    return service
+
+
+def test_circuit_breaker_opens_and_recovers():
+    """연속 실패 시 open, 복구 대기 후 시험 요청 1건만 허용"""
+    breaker = CircuitBreaker("clova", failure_threshold=2, recovery_timeout=0)
+
+    breaker.record_failure()
+    assert breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.stats()["total_opened"] == 1
+
+    # recovery_timeout=0 이므로 즉시 half_open
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+async def test_failover_to_secondary(settings):
+    """primary 실패 시 secondary 결과를 사용해야 함"""
+    primary = _service("clova", AsyncMock(return_value=None))
+    secondary = _service("ocrspace", AsyncMock(return_value="fallback text"))
+    service = FailoverOCRService(settings, primary, secondary)
+
+    assert await service.perform_ocr(IMAGE) == "fallback text"
+    assert service.failover_stats()["failovers"] == 1
+
+
+async def test_open_circuit_skips_primary(settings):
+    """회로가 열린 provider는 호출하지 않아야 함"""
+    primary = _service("clova", AsyncMock(return_value=None))
+    secondary = _service("ocrspace", AsyncMock(return_value="ok"))
+    service = FailoverOCRService(settings, primary, secondary)
+
+    for _ in range(2):
+        await service.perform_ocr(IMAGE)
+    assert service.failover_stats()["breakers"]["clova"]["state"] == "open"
+
+    primary.perform_ocr.reset_mock()
+    assert await service.perform_ocr(IMAGE) == "ok"
+    primary.perform_ocr.assert_not_awaited()
+
+
+async def test_hedged_request_uses_faster_secondary(settings):
+    """primary가 hedge 지연 시간을 넘기면 secondary 결과를 먼저 사용해야 함"""
+    settings.ocr_hedging_enabled = True
+
+    async def slow_primary(image):
+        await asyncio.sleep(1)
+        return "primary"
+
+    primary = _service("clova", slow_primary)
+    secondary = _service("ocrspace", AsyncMock(return_value="secondary"))
+    service = FailoverOCRService(settings, primary, secondary)
+
+    result = await asyncio.wait_for(service.perform_ocr(IMAGE), timeout=0.5)
+
+    assert result == "secondary"
+    stats = service.failover_stats()
+    assert (stats["hedged_requests"], stats["hedge_wins"]) == (1, 1)
+    # 취소된 primary 요청은 실패로 기록되지 않음
+    assert stats["breakers"]["clova"]["consecutive_failures"] == 0
+
+
+async def test_hedging_skipped_when_primary_is_fast(settings):
+    """primary가 hedge 지연 시간 안에 성공하면 secondary를 호출하지 않아야 함"""
+    settings.ocr_hedging_enabled = True
+    primary = _service("clova", AsyncMock(return_value="primary"))
+    secondary = _service("ocrspace", AsyncMock(return_value="secondary"))
+    service = FailoverOCRService(settings, primary, secondary)
+
+    assert await service.perform_ocr(IMAGE) == "primary"
+    secondary.perform_ocr.assert_not_awaited()
+
+
+@pytest.mark.parametrize("cancel_after", [0.02, 0.1])
+async def test_cancelled_hedged_request_cancels_provider_calls(settings, cancel_after):
+    """hedge 대기 중 호출 측이 취소되면 진행 중인 primary/secondary 요청도 모두 취소되어야 함"""
+    settings.ocr_hedging_enabled = True
+    started, cancelled = [], []
+
+    def slow(provider):
+        async def perform_ocr(image):
+            started.append(provider)
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(provider)
+                raise
+            return provider
+
+        return perform_ocr
+
+    primary = _service("clova", slow("clova"))
+    secondary = _service("ocrspace", slow("ocrspace"))
+    service = FailoverOCRService(settings, primary, secondary)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(service.perform_ocr(IMAGE), timeout=cancel_after)
+    await asyncio.sleep(0)
+
+    # 0.02초: hedge 전 (primary만 시작), 0.1초: hedge 후 (둘 다 시작)
+    assert len(started) == (1 if cancel_after < settings.ocr_hedge_min_delay_seconds else 2)
+    assert sorted(cancelled) == sorted(started)
+
+
+@pytest.mark.parametrize("hedging", [False, True])
+async def test_primary_success_keeps_half_open_secondary_trial(settings, hedging):
+    """primary가 성공하는 동안 half_open secondary의 시험 요청 슬롯을 점유하지 않아야 함"""
+    settings.ocr_hedging_enabled = hedging
+    primary = _service("clova", AsyncMock(return_value="primary"))
+    secondary = _service("ocrspace", AsyncMock(return_value="secondary"))
+    service = FailoverOCRService(settings, primary, secondary)
+
+    # secondary 회로를 열고 즉시 half_open으로 전환
+    breaker = service._breakers["ocrspace"]
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.recovery_timeout = 0
+
+    for _ in range(3):
+        assert await service.perform_ocr(IMAGE) == "primary"
+
+    stats = service.failover_stats()["breakers"]["ocrspace"]
+    assert (stats["state"], stats["trial_in_flight"], stats["rejected"]) == ("half_open", False, 0)
+
+    # primary 실패 시 시험 요청으로 secondary 호출 -> 성공하면 회로 닫힘
+    primary.perform_ocr.return_value = None
+    assert await service.perform_ocr(IMAGE) == "secondary"
+    assert breaker.state == "closed"
+
+
+async def test_ocr_pool_stats_include_failover_breakers(settings):
+    """OCR 풀 통계에 failover 조합별 서킷 브레이커 상태가 포함되어야 함"""
+    from src.services.ocr import close_ocr_services, get_ocr_pool_stats, get_ocr_service
+
+    settings.ocr_fallback_provider = "ocrspace"
+    settings.clova_secret_key = "secret"
+    settings.clova_invoke_url = "https://ocr.example.com/general"
+    settings.ocr_api_key = "key"
+    try:
+        get_ocr_service(settings)
+        stats = get_ocr_pool_stats()
+    finally:
+        await close_ocr_services()
+
+    failover = stats["clova+ocrspace"]["failover"]
+    assert set(failover["breakers"]) == {"clova", "ocrspace"}
+    assert failover["breakers"]["ocrspace"]["state"] == "closed"
+    assert {"clova", "ocrspace"} <= set(stats)
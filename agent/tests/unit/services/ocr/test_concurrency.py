@@ -0,0 +1,60 @@
+"""적응형 OCR 동시 실행 제어 (AIMD) 테스트"""
+
+from src.services.ocr.concurrency import AIMDLimiter
+
+
+def test_additive_increase_while_latency_is_flat():
+    """지연 시간이 안정적이면 상한이 점진적으로 증가해야 함"""
+    changes: list[int] = []
+    limiter = AIMDLimiter(initial_limit=4, min_limit=2, max_limit=8, on_change=changes.append)
+
+    for _ in range(20):
+        limiter.on_success(0.2)
+
+    assert 4 < limiter.limit <= 8
+    assert changes and changes[-1] == limiter.limit
+
+
+def test_limit_never_exceeds_max():
+    """상한은 max_limit을 넘지 않아야 함"""
+    limiter = AIMDLimiter(initial_limit=4, min_limit=2, max_limit=6)
+
+    for _ in range(500):
+        limiter.on_success(0.2)
+
+    assert limiter.limit == 6
+
+
+def test_multiplicative_decrease_on_429():
+    """429 수신 시 상한이 decrease_factor 배로 감소해야 함"""
+    limiter = AIMDLimiter(initial_limit=20, min_limit=2, max_limit=40)
+
+    limiter.on_overload("http_429")
+
+    assert limiter.limit == 10
+    assert limiter.stats()["last_decrease_reason"] == "http_429"
+
+
+def test_decrease_respects_min_limit():
+    """연속 과부하에도 상한은 min_limit 아래로 내려가지 않아야 함"""
+    limiter = AIMDLimiter(initial_limit=8, min_limit=3, max_limit=40)
+
+    for _ in range(10):
+        limiter._last_decrease_at = 0.0
+        limiter.on_overload("http_503")
+
+    assert limiter.limit == 3
+
+
+def test_latency_spike_triggers_decrease():
+    """기준선 대비 지연 시간이 급증하면 상한이 감소해야 함"""
+    limiter = AIMDLimiter(initial_limit=10, min_limit=2, max_limit=10, latency_spike_ratio=2.0)
+    for _ in range(20):
+        limiter.on_success(0.2)
+    before = limiter.limit
+
+    limiter._last_decrease_at = 0.0
+    limiter.on_success(1.0)
+
+    assert limiter.limit < before
+    assert limiter.stats()["last_decrease_reason"] == "latency_spike"
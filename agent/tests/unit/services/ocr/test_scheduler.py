@@ -0,0 +1,109 @@
+"""OCR 스케줄러 테스트"""
+
+import asyncio
+
+import pytest
+
+from src.graphs.summarize_page.exceptions import OCRQueueFullError
+from src.services.ocr.scheduler import OCRScheduler
+
+
+async def _run(scheduler: OCRScheduler, request_id: str, order: list, release: asyncio.Event):
+    async with scheduler.slot(request_id):
+        order.append(request_id)
+        await release.wait()
+
+
+async def test_global_limit_is_enforced():
+    """여러 요청이 있어도 동시 실행 수는 전역 상한을 넘지 않아야 함"""
+    scheduler = OCRScheduler(limit=2, max_queue_size=100)
+    release = asyncio.Event()
+    order: list[str] = []
+
+    tasks = [
+        asyncio.create_task(_run(scheduler, f"req-{i % 3}", order, release)) for i in range(6)
+    ]
+    await asyncio.sleep(0)
+
+    assert scheduler.stats()["active"] == 2
+    assert scheduler.stats()["queued"] == 4
+
+    release.set()
+    await asyncio.gather(*tasks)
+
+    stats = scheduler.stats()
+    assert stats["active"] == 0
+    assert stats["peak_active"] == 2
+    assert stats["total_completed"] == 6
+
+
+async def test_round_robin_across_requests():
+    """먼저 많은 작업을 넣은 요청이 있어도 슬롯은 요청 간 번갈아 할당되어야 함"""
+    scheduler = OCRScheduler(limit=1, max_queue_size=100)
+    gate = asyncio.Event()
+    order: list[str] = []
+
+    # 슬롯을 점유한 상태에서 요청 A 4개, 요청 B 2개를 대기시킴
+    blocker = asyncio.create_task(_run(scheduler, "blocker", [], gate))
+    await asyncio.sleep(0)
+
+    release = asyncio.Event()
+    release.set()
+    tasks = [asyncio.create_task(_run(scheduler, "A", order, release)) for _ in range(4)]
+    tasks += [asyncio.create_task(_run(scheduler, "B", order, release)) for _ in range(2)]
+    await asyncio.sleep(0)
+
+    gate.set()
+    await asyncio.gather(blocker, *tasks)
+
+    assert order == ["A", "B", "A", "B", "A", "A"]
+
+
+async def test_queue_full_raises():
+    """대기열이 가득 차면 OCRQueueFullError를 발생시켜야 함"""
+    scheduler = OCRScheduler(limit=1, max_queue_size=1)
+    release = asyncio.Event()
+
+    running = asyncio.create_task(_run(scheduler, "A", [], release))
+    queued = asyncio.create_task(_run(scheduler, "B", [], release))
+    await asyncio.sleep(0)
+
+    with pytest.raises(OCRQueueFullError):
+        async with scheduler.slot("C"):
+            pass
+
+    release.set()
+    await asyncio.gather(running, queued)
+    assert scheduler.stats()["total_rejected"] == 1
+
+
+async def test_cancelled_waiter_leaves_queue():
+    """대기 중 취소된 작업은 대기열에서 제거되어야 함"""
+    scheduler = OCRScheduler(limit=1, max_queue_size=10)
+    release = asyncio.Event()
+
+    running = asyncio.create_task(_run(scheduler, "A", [], release))
+    waiting = asyncio.create_task(_run(scheduler, "B", [], release))
+    await asyncio.sleep(0)
+
+    waiting.cancel()
+    await asyncio.gather(waiting, return_exceptions=True)
+    assert scheduler.stats()["queued"] == 0
+
+    release.set()
+    await running
+    assert scheduler.stats()["active"] == 0
+
+
+async def test_set_limit_starts_waiting_jobs():
+    """상한을 올리면 대기 작업이 즉시 시작되어야 함"""
+    scheduler = OCRScheduler(limit=1, max_queue_size=10)
+    release = asyncio.Event()
+
+    tasks = [asyncio.create_task(_run(scheduler, "A", [], release)) for _ in range(3)]
+    await asyncio.sleep(0)
+    scheduler.set_limit(3)
+
+    assert scheduler.stats()["active"] == 3
+    release.set()
+    await asyncio.gather(*tasks)
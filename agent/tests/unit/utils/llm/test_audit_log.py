@@ -0,0 +1,72 @@
+"""LLM 감사 로그 writer 테스트"""
+
+import gzip
+import json
+
+from src.utils.llm.audit_log import AuditLogWriter
+
+
+def _read_lines(path, compress=False):
+    opener = gzip.open if compress else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_writes_daily_jsonl(tmp_path):
+    """제출한 항목이 날짜 디렉토리의 JSONL 파일에 한 줄씩 기록"""
+    writer = AuditLogWriter(tmp_path)
+    for i in range(3):
+        assert writer.submit({"request_id": str(i), "status": "success"})
+    writer.close()
+
+    files = list(tmp_path.glob("*/llm_audit.jsonl"))
+    assert len(files) == 1
+    assert [entry["request_id"] for entry in _read_lines(files[0])] == ["0", "1", "2"]
+    assert writer.stats()["written"] == 3
+
+
+def test_compressed_output(tmp_path):
+    """compress=True면 gzip으로 append (multi-member도 정상 복원)"""
+    writer = AuditLogWriter(tmp_path, compress=True)
+    writer.submit({"request_id": "a", "status": "success"})
+    writer.flush()
+    writer.submit({"request_id": "b", "status": "success"})
+    writer.close()
+
+    path = next(tmp_path.glob("*/llm_audit.jsonl.gz"))
+    assert [entry["request_id"] for entry in _read_lines(path, compress=True)] == ["a", "b"]
+
+
+def test_rotation_by_size(tmp_path):
+    """파일 크기가 max_file_bytes를 넘으면 다음 번호 파일로 기록"""
+    writer = AuditLogWriter(tmp_path, max_file_bytes=10)
+    writer.submit({"request_id": "first", "status": "success"})
+    writer.flush()
+    writer.submit({"request_id": "second", "status": "success"})
+    writer.close()
+
+    date_dir = next(tmp_path.iterdir())
+    assert _read_lines(date_dir / "llm_audit.jsonl")[0]["request_id"] == "first"
+    assert _read_lines(date_dir / "llm_audit.1.jsonl")[0]["request_id"] == "second"
+
+
+def test_sampling_keeps_errors(tmp_path):
+    """sample_rate=0이면 성공 로그는 버리고 실패 로그만 기록"""
+    writer = AuditLogWriter(tmp_path, sample_rate=0.0)
+    assert not writer.submit({"request_id": "ok", "status": "success"})
+    assert writer.submit({"request_id": "err", "status": "error"})
+    writer.close()
+
+    path = next(tmp_path.glob("*/llm_audit.jsonl"))
+    assert [entry["request_id"] for entry in _read_lines(path)] == ["err"]
+    assert writer.stats()["sampled_out"] == 1
+
+
+def test_drops_when_queue_full(tmp_path):
+    """큐가 가득 차면 대기하지 않고 항목을 버림"""
+    writer = AuditLogWriter(tmp_path, max_queue_size=1)
+    # writer 스레드 시작 전 큐를 채워 초과 상황 재현
+    writer._started = True
+    assert writer.submit({"request_id": "kept", "status": "error"})
+    assert not writer.submit({"request_id": "dropped", "status": "error"})
+    assert writer.stats()["dropped"] == 1
@@ -0,0 +1,119 @@
+"""LLM 응답 캐시 테스트"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+from pydantic import BaseModel
+
+from src.utils.cache import MemoryLRUCache, TieredCache
+from src.utils.llm.cache import CACHE_COALESCED, CACHE_HIT, CACHE_MISS, LLMResponseCache
+from src.utils.llm.client import LLMClient
+
+
+class Verdict(BaseModel):
+    is_valid: bool
+
+
+@pytest.fixture
+def cache() -> LLMResponseCache:
+    return LLMResponseCache(TieredCache(MemoryLRUCache(max_bytes=1024 * 1024)))
+
+
+def _key(messages, output_format=None, temperature=0.3):
+    return LLMResponseCache.make_key(
+        "google_genai", "gemini-2.0-flash", temperature, 2048, messages, output_format
+    )
+
+
+def test_key_normalizes_messages():
+    """dict/BaseMessage 형식과 줄바꿈/앞뒤 공백 차이는 같은 키"""
+    assert _key([{"role": "user", "content": "hello\r\nworld "}]) == _key(
+        [HumanMessage(content="hello\nworld")]
+    )
+    assert _key([{"role": "user", "content": "a"}]) != _key(
+        [{"role": "user", "content": "a"}], temperature=0.7
+    )
+    assert _key([{"role": "user", "content": "a"}]) != _key(
+        [{"role": "user", "content": "a"}], output_format=Verdict
+    )
+
+
+async def test_second_call_is_served_from_cache(cache):
+    """같은 키의 두 번째 호출은 upstream을 호출하지 않음"""
+    call = AsyncMock(return_value={"content": "ok", "usage": {}})
+
+    assert await cache.get_or_call("k", call) == ({"content": "ok", "usage": {}}, CACHE_MISS)
+    assert await cache.get_or_call("k", call) == ({"content": "ok", "usage": {}}, CACHE_HIT)
+    assert call.await_count == 1
+
+
+async def test_concurrent_calls_are_coalesced(cache):
+    """동시에 들어온 같은 키의 호출은 하나의 upstream 요청을 공유"""
+    calls = 0
+
+    async def call():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"content": "shared", "usage": {}}
+
+    results = await asyncio.gather(*(cache.get_or_call("k", call) for _ in range(5)))
+
+    assert calls == 1
+    assert sorted(status for _, status in results) == [CACHE_COALESCED] * 4 + [CACHE_MISS]
+
+
+async def test_failure_is_not_cached(cache):
+    """upstream 실패는 캐시하지 않고 대기자에게도 전달"""
+    call = AsyncMock(side_effect=[RuntimeError("boom"), {"content": "ok", "usage": {}}])
+
+    with pytest.raises(RuntimeError):
+        await cache.get_or_call("k", call)
+    assert (await cache.get_or_call("k", call))[1] == CACHE_MISS
+
+
+async def test_owner_cancellation_does_not_cancel_waiters(cache):
+    """요청을 보낸 호출이 취소되어도 대기자는 취소되지 않고 새 요청으로 결과를 받음"""
+    calls = 0
+
+    async def call():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return {"content": f"result {calls}", "usage": {}}
+
+    owner = asyncio.create_task(cache.get_or_call("k", call))
+    await asyncio.sleep(0)
+    waiters = [asyncio.create_task(cache.get_or_call("k", call)) for _ in range(3)]
+    await asyncio.sleep(0.01)
+
+    owner.cancel()
+    results = await asyncio.gather(*waiters)
+
+    assert owner.cancelled()
+    assert calls == 2
+    assert {result["content"] for result, _ in results} == {"result 2"}
+    assert sorted(status for _, status in results) == [CACHE_COALESCED] * 2 + [CACHE_MISS]
+
+
+async def test_client_records_cache_status(cache):
+    """LLMClient.invoke(use_cache=True)는 캐시 상태를 감사 로그에 기록"""
+    model = MagicMock()
+    model.ainvoke = AsyncMock(return_value=AIMessage(content='{"is_valid": true}'))
+    saved_logs = []
+
+    with patch("src.utils.llm.client.init_chat_model", return_value=model), patch(
+        "src.utils.llm.client.get_llm_cache", return_value=cache
+    ), patch("src.utils.llm.client._save_llm_log", side_effect=saved_logs.append):
+        client = LLMClient(provider="openai", model="test-model", temperature=0.3)
+        messages = [{"role": "user", "content": "validate"}]
+
+        first = await client.invoke(messages, output_format=Verdict, use_cache=True)
+        second = await client.invoke(messages, output_format=Verdict, use_cache=True)
+        await client.invoke(messages, output_format=Verdict)
+
+    assert first.is_valid and second.is_valid
+    assert model.ainvoke.await_count == 2
+    assert [log["cache"] for log in saved_logs] == ["miss", "hit", "disabled"]
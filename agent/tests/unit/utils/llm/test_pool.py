@@ -0,0 +1,56 @@
+"""LLMClientPool 테스트"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.utils.llm.pool import LLMClientPool
+
+
+@pytest.fixture
+def pool() -> LLMClientPool:
+    return LLMClientPool()
+
+
+class TestLLMClientPool:
+    """LLMClientPool 테스트"""
+
+    def test_same_key_reuses_client(self, pool: LLMClientPool):
+        """동일한 설정이면 같은 클라이언트를 재사용해야 함"""
+        with patch("src.utils.llm.pool.LLMClient") as MockLLMClient:
+            MockLLMClient.side_effect = lambda **kwargs: MagicMock()
+
+            first = pool.get_client("google_genai", "gemini-2.0-flash", temperature=0.3)
+            second = pool.get_client("google_genai", "gemini-2.0-flash", temperature=0.3)
+
+        assert first is second
+        assert MockLLMClient.call_count == 1
+
+    def test_different_key_creates_new_client(self, pool: LLMClientPool):
+        """temperature/max_tokens가 다르면 별도 클라이언트를 생성해야 함"""
+        with patch("src.utils.llm.pool.LLMClient") as MockLLMClient:
+            MockLLMClient.side_effect = lambda **kwargs: MagicMock()
+
+            base = pool.get_client("google_genai", "gemini-2.0-flash", temperature=0.3)
+            other_temperature = pool.get_client("google_genai", "gemini-2.0-flash", temperature=0.5)
+            other_max_tokens = pool.get_client(
+                "google_genai", "gemini-2.0-flash", temperature=0.3, max_tokens=1024
+            )
+
+        assert base is not other_temperature
+        assert base is not other_max_tokens
+        assert pool.stats()["clients"] == 3
+
+    async def test_aclose_closes_underlying_clients(self, pool: LLMClientPool):
+        """aclose()는 모델의 하위 클라이언트를 닫고 풀을 비워야 함"""
+        model = MagicMock(spec=["client"])
+        model.client = MagicMock(spec=["close"])
+
+        with patch("src.utils.llm.pool.LLMClient") as MockLLMClient:
+            MockLLMClient.side_effect = lambda **kwargs: MagicMock(_model=model)
+            pool.get_client("google_genai", "gemini-2.0-flash")
+
+        await pool.aclose()
+
+        model.client.close.assert_called_once()
+        assert pool.stats() == {"clients": 0, "search_models": 0}
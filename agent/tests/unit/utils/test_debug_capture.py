@@ -0,0 +1,80 @@
+"""디버그 캡처 테스트"""
+
+import pytest
+
+from src.utils import debug_capture as debug_capture_module
+from src.utils.debug_capture import DebugCaptureStore, capture_artifact, debug_capture
+
+
+@pytest.fixture
+def store(monkeypatch):
+    """디스크 기록 없는 저장소로 싱글톤 교체"""
+    store = DebugCaptureStore(max_entries=2)
+    monkeypatch.setattr(debug_capture_module, "_store", store)
+    return store
+
+
+def test_disabled_by_default(store):
+    """헤더/샘플링 없이는 캡처하지 않고 capture_artifact는 무시"""
+    with debug_capture("https://example.com") as capture:
+        capture_artifact("parsed.html", "<html></html>")
+
+    assert capture is None
+    assert store.recent() == []
+
+
+def test_disabled_store_ignores_forced_capture(monkeypatch):
+    """debug_capture_enabled가 꺼진 저장소는 헤더 강제 요청도 캡처하지 않음"""
+    store = DebugCaptureStore(max_entries=2, sample_rate=1.0, enabled=False)
+    monkeypatch.setattr(debug_capture_module, "_store", store)
+
+    with debug_capture("https://example.com", force=True) as capture:
+        capture_artifact("parsed.html", "<html></html>")
+
+    assert capture is None
+    assert store.recent() == []
+
+
+def test_forced_capture_collects_artifacts(store):
+    """force=True면 범위 안에서 기록한 산출물을 보관"""
+    with debug_capture("https://example.com", force=True) as capture:
+        capture_artifact("parsed.html", "<html></html>")
+
+    stored = store.get(capture.capture_id)
+    assert stored.artifacts == {"parsed.html": "<html></html>"}
+    assert store.recent()[0]["artifacts"] == {"parsed.html": 13}
+
+    # 범위 밖에서는 기록되지 않음
+    capture_artifact("late.txt", "x")
+    assert "late.txt" not in stored.artifacts
+
+
+def test_ring_buffer_evicts_oldest(store):
+    """max_entries를 넘으면 가장 오래된 캡처부터 제거"""
+    ids = []
+    for _ in range(3):
+        with debug_capture("https://example.com", force=True) as capture:
+            ids.append(capture.capture_id)
+
+    assert store.get(ids[0]) is None
+    assert [entry["capture_id"] for entry in store.recent()] == [ids[2], ids[1]]
+    assert store.stats()["evicted"] == 1
+
+
+@pytest.mark.asyncio
+async def test_spill_to_disk(tmp_path, monkeypatch):
+    """링 버퍼에서 밀려난 캡처도 디스크 기록본으로 조회 (워커 스레드에서 읽음)"""
+    store = DebugCaptureStore(max_entries=1, spill_dir=tmp_path)
+    monkeypatch.setattr(debug_capture_module, "_store", store)
+
+    with debug_capture("https://example.com/a", force=True) as first:
+        capture_artifact("processed_source.txt", "input")
+    for task in list(store._spill_tasks):
+        await task
+    with debug_capture("https://example.com/b", force=True):
+        pass
+
+    restored = await store.aget(first.capture_id)
+    assert restored.url == "https://example.com/a"
+    assert restored.artifacts == {"processed_source.txt": "input"}
+    assert store.stats()["spilled"] == 1
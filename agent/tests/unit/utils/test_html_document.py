@@ -0,0 +1,68 @@
+"""HTMLDocument 테스트"""
+
+from unittest.mock import patch
+
+from bs4 import BeautifulSoup
+from lxml import etree
+
+import src.graphs.summarize_page  # noqa: F401  (html_parser 순환 import 방지용 선행 로드)
+from src.utils.html_document import HTMLDocument, element_text, xpath_all, xpath_first, xpath_has_class
+from src.utils.html_parser import extract_content_from_html
+
+HTML = """
+<html><body>
+  <h1>Amazing Laptop Pro 16 for professionals</h1>
+  <p>The best laptop for professionals and creators</p>
+  <img src="/product.jpg" alt="Product">
+</body></html>
+"""
+
+
+def test_soup_is_parsed_once():
+    """soup는 최초 접근 시 1회만 생성"""
+    document = HTMLDocument(HTML)
+    assert document.soup is document.soup
+
+
+def test_of_returns_same_document():
+    """이미 생성된 문서는 그대로 반환, 문자열은 새 문서로 변환"""
+    document = HTMLDocument(HTML)
+    assert HTMLDocument.of(document) is document
+    assert HTMLDocument.of(HTML).html == HTML
+
+
+def test_extract_content_parses_html_once():
+    """텍스트/이미지 추출이 하나의 파싱 트리를 공유"""
+    with patch("src.utils.html_document.BeautifulSoup", wraps=BeautifulSoup) as soup_cls:
+        texts, images = extract_content_from_html(HTML, base_url="https://example.com")
+
+    assert soup_cls.call_count == 1
+    assert texts[0]["content"] == "Amazing Laptop Pro 16 for professionals"
+    assert images[0]["src"] == "https://example.com/product.jpg"
+
+
+def test_tree_is_parsed_once_and_empty_document_has_no_tree():
+    """lxml tree는 최초 접근 시 1회만 생성, 빈 문서는 None"""
+    document = HTMLDocument(HTML)
+    assert document.tree is document.tree
+    assert HTMLDocument("  ").tree is None
+    assert xpath_all(etree.XPath("//img"), None) == []
+    assert xpath_first(etree.XPath("//img"), None) is None
+
+
+def test_xpath_has_class_matches_class_token():
+    """class 토큰 단위 매칭 (BeautifulSoup class_= 와 동일)"""
+    tree = HTMLDocument('<div class="a price-amount"></div><div class="final-price-amount"></div>').tree
+    matches = xpath_all(etree.XPath(f"//div[{xpath_has_class('price-amount')}]"), tree)
+    assert [element.get("class") for element in matches] == ["a price-amount"]
+
+
+def test_element_text_matches_beautifulsoup_get_text():
+    """element_text는 get_text(strip=True)와 동일 (주석/script/style/template 제외)"""
+    html = (
+        '<div id="target"> 상품 <!-- 주석 --> 이름<script>var a = 1;</script> 입니다'
+        "<style>.a{}</style><b> 굵게 </b>&amp; <br>끝<template>숨김<i>숨김</i></template> </div>"
+    )
+    element = xpath_first(etree.XPath('//*[@id="target"]'), HTMLDocument(html).tree)
+    expected = BeautifulSoup(html, "lxml").find(id="target").get_text(strip=True)
+    assert element_text(element) == expected == "상품이름입니다굵게&끝"
@@ -0,0 +1,116 @@
+"""HTMLContentExtractor 텍스트 추출 테스트 (단일 DFS 방식과 legacy 방식 출력 동일성)"""
+
+from pathlib import Path
+from typing import List, Union
+
+import pytest
+from bs4 import Tag
+
+import src.graphs.summarize_page  # noqa: F401  (html_parser 순환 import 방지용 선행 로드)
+from src.utils.html_document import HTMLDocument
+from src.utils.html_parser import HTMLContentExtractor
+
+FIXTURES_DIR = Path(__file__).parents[2] / "fixtures" / "html"
+
+# 제외 규칙 경계 사례 모음
+EDGE_CASE_HTML = """
+<html><head><title>Page title text</title><style>.a { color: red; }</style></head>
+<body>
+  <nav>Leaf nav text is extracted</nav>
+  <nav><ul><li>Nested menu item text</li></ul></nav>
+  <header><div><span>Header nested text</span></div></header>
+  <footer><p>Footer paragraph text</p></footer>
+  <div role="navigation"><span>Role attribute is not checked</span></div>
+  <div class="ad"><span>Child of ad container</span></div>
+  <span class="ad">Leaf with ad class</span>
+  <span class="product ads">Leaf with ads class</span>
+  <p id="cookie-notice">Cookie notice leaf text</p>
+  <div id="cookie-banner"><p>Inside cookie banner</p></div>
+  <script>var longScriptText = 1;</script>
+  <noscript><p>Noscript paragraph text</p></noscript>
+  <svg><text>Svg text element content</text></svg>
+  <main>
+    <h1>Amazing Laptop Pro 16</h1>
+    <p>Mixed <b>bold part</b> tail text</p>
+    <p>Amazing Laptop Pro 16</p>
+    <p>12345678901</p>
+    <p>!!!!!!!!!!!!</p>
+    <p><!-- comment only --></p>
+    <span>  spaced    out     text  </span>
+  </main>
+</body></html>
+"""
+
+
+def _legacy_should_extract_text(element: Tag) -> bool:
+    """이전 방식의 텍스트 추출 대상 판정 (leaf마다 제외 선택자별 find_parent 반복)"""
+    if element.name in HTMLContentExtractor.EXCLUDE_TAGS:
+        return False
+
+    for selector in HTMLContentExtractor.EXCLUDE_SELECTORS:
+        try:
+            if element.find_parent(selector.lstrip('[').rstrip(']').split('=')[0]):
+                return False
+            if selector.startswith('.'):
+                if selector[1:] in element.get('class', []):
+                    return False
+            elif selector.startswith('#'):
+                if element.get('id') == selector[1:]:
+                    return False
+        except Exception:
+            pass
+
+    return True
+
+
+def _legacy_extract_texts(html_body: Union[str, HTMLDocument], min_length: int = 10) -> List[dict]:
+    """이전 방식의 텍스트 추출 (CSS Selector로 leaf 선택) - 단일 DFS 방식 출력 비교 기준"""
+    soup = HTMLDocument.of(html_body).soup
+    leaf_elements = (
+        element for element in soup.select("*:not(:has(*))") if _legacy_should_extract_text(element)
+    )
+    return HTMLContentExtractor._collect_texts(leaf_elements, min_length)
+
+
+def _fixture_htmls() -> list[str]:
+    return [path.read_text(encoding="utf-8") for path in sorted(FIXTURES_DIR.glob("*.html"))]
+
+
+@pytest.mark.parametrize("min_length", [0, 10])
+def test_matches_legacy_on_edge_cases(min_length: int):
+    """제외 규칙 경계 사례에서 legacy 방식과 동일한 출력"""
+    document = HTMLDocument(EDGE_CASE_HTML)
+
+    expected = _legacy_extract_texts(document, min_length=min_length)
+    actual = HTMLContentExtractor.extract_texts(document, min_length=min_length)
+
+    assert actual == expected
+
+
+@pytest.mark.parametrize("min_length", [0, 10])
+def test_matches_legacy_on_fixtures(min_length: int):
+    """fixture 페이지에서 legacy 방식과 동일한 출력"""
+    htmls = _fixture_htmls()
+    if not htmls:
+        pytest.skip(f"Fixtures not found: {FIXTURES_DIR}")
+
+    for html in htmls:
+        document = HTMLDocument(html)
+        expected = _legacy_extract_texts(document, min_length=min_length)
+        assert HTMLContentExtractor.extract_texts(document, min_length=min_length) == expected
+
+
+def test_excluded_subtrees_are_skipped():
+    """nav/header/footer 자손과 제외 클래스/ID leaf는 추출하지 않음"""
+    contents = [
+        text["content"] for text in HTMLContentExtractor.extract_texts(EDGE_CASE_HTML, min_length=0)
+    ]
+
+    assert "Nested menu item text" not in contents
+    assert "Header nested text" not in contents
+    assert "Footer paragraph text" not in contents
+    assert "Leaf with ad class" not in contents
+    assert "Cookie notice leaf text" not in contents
+    assert "Leaf nav text is extracted" in contents
+    assert "Child of ad container" in contents
+    assert contents.count("Amazing Laptop Pro 16") == 1
@@ -0,0 +1,54 @@
+"""근사 중복 텍스트 제거 테스트"""
+
+from src.utils.near_duplicates import NearDuplicateFilter, jaccard, word_shingles
+
+REVIEW = "배송도 빠르고 포장도 꼼꼼해서 정말 만족스러운 구매였어요 재구매 의사 있습니다"
+
+
+def test_word_shingles_ignore_case_and_punctuation():
+    """대소문자, 문장부호, 공백 차이는 같은 특징 집합"""
+    assert word_shingles("Great  battery, LIFE!!") == word_shingles("great battery life")
+    assert word_shingles("16GB") == frozenset({hash("16gb")})
+    assert jaccard(word_shingles("a b c"), frozenset()) == 0.0
+
+
+def test_filter_drops_exact_and_near_duplicates():
+    """완전 중복과 단어 한두 개만 다른 텍스트는 제거하고 먼저 들어온 텍스트를 남김"""
+    near_duplicates = NearDuplicateFilter(threshold=0.7)
+
+    kept = [
+        text
+        for text in [
+            REVIEW,
+            REVIEW,
+            REVIEW.replace("정말 ", "") + "!!",
+            "화면이 밝고 선명해서 영상 볼 때 아주 좋습니다 배터리도 오래가요",
+        ]
+        if near_duplicates.add(text)
+    ]
+
+    assert kept == [REVIEW, "화면이 밝고 선명해서 영상 볼 때 아주 좋습니다 배터리도 오래가요"]
+    assert near_duplicates.stats() == {"kept": 2, "exact_duplicates": 1, "near_duplicates": 1}
+
+
+def test_short_texts_are_only_exact_deduplicated():
+    """min_words보다 짧은 텍스트(스펙 등)는 값이 다르면 모두 유지"""
+    near_duplicates = NearDuplicateFilter(threshold=0.5, min_words=4)
+
+    assert near_duplicates.add("무게: 1.4kg")
+    assert near_duplicates.add("무게: 1.5kg")
+    assert not near_duplicates.add("무게: 1.4kg")
+
+
+def test_threshold_controls_similarity():
+    """threshold가 낮을수록 덜 비슷한 텍스트도 중복으로 판정"""
+    variant = REVIEW.replace("꼼꼼해서", "튼튼해서")
+    similarity = jaccard(word_shingles(REVIEW), word_shingles(variant))
+
+    strict = NearDuplicateFilter(threshold=similarity + 0.01)
+    loose = NearDuplicateFilter(threshold=similarity - 0.01)
+    for near_duplicates in (strict, loose):
+        near_duplicates.add(REVIEW)
+
+    assert strict.add(variant)
+    assert not loose.add(variant)
@@ -1,6 +1,47 @@
 import type { ExtractedContent } from '@/types/content';
 import { sanitizeHTML } from '@/utils/htmlSanitizer';
 
+/** JSON-LD에서 수집할 최대 @type 수 */
+const MAX_JSON_LD_TYPES = 50;
+
+/**
+ * JSON-LD 구조화 데이터의 @type 목록 추출 (중첩 객체, @graph 포함)
+ *
+ * html_body 정제 시 script 태그가 제거되므로 정제 전에 수집하여
+ * Agent의 페이지 사전 검증(단일 제품 / 목록 페이지 판별)에 전달
+ */
+function extractJsonLdTypes(): string[] {
+  const types: string[] = [];
+
+  const collect = (node: unknown): void => {
+    if (types.length >= MAX_JSON_LD_TYPES || node === null || typeof node !== 'object') {
+      return;
+    }
+    if (Array.isArray(node)) {
+      node.forEach(collect);
+      return;
+    }
+
+    const record = node as Record<string, unknown>;
+    const type = record['@type'];
+    for (const value of Array.isArray(type) ? type : [type]) {
+      if (typeof value === 'string' && types.length < MAX_JSON_LD_TYPES) {
+        types.push(value);
+      }
+    }
+    Object.values(record).forEach(collect);
+  };
+
+  document.querySelectorAll('script[type="application/ld+json"]').forEach((script) => {
+    try {
+      collect(JSON.parse(script.textContent || ''));
+    } catch {
+      // 잘못된 JSON-LD는 무시
+    }
+  });
+  return types;
+}
+
 /**
  * 페이지의 body 콘텐츠 추출
  *
@@ -11,12 +52,17 @@ export function extractPageContent(): ExtractedContent {
   // og:image 메타 태그에서 대표 이미지 추출
   const ogImage =
     document.querySelector('meta[property="og:image"]')?.getAttribute('content') || undefined;
+  // og:type 메타 태그 (정제된 html_body에는 meta 태그가 없으므로 별도 전달)
+  const ogType =
+    document.querySelector('meta[property="og:type"]')?.getAttribute('content') || undefined;
 
   return {
     url: window.location.href,
     title: document.title,
     html_body: sanitizeHTML(document.body.innerHTML),
     og_image: ogImage,
+    og_type: ogType,
+    json_ld_types: extractJsonLdTypes(),
     timestamp: Date.now(),
   };
 }
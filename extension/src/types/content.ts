@@ -30,6 +30,10 @@ export interface ExtractedContent {
   html_body: string;
   /** og:image 메타 태그에서 추출한 대표 이미지 URL */
   og_image?: string;
+  /** og:type 메타 태그 값 (예: product) */
+  og_type?: string;
+  /** JSON-LD 구조화 데이터의 @type 목록 (정제된 html_body에는 script 태그가 없으므로 별도 전달) */
+  json_ld_types?: string[];
   /** 추출 시점 */
   timestamp: number;
 }
@@ -59,6 +63,8 @@ export interface ProductAnalysisRequest {
   title: string;
   html_body: string;
   og_image?: string;
+  og_type?: string;
+  json_ld_types?: string[];
   timestamp: number;
 }
 